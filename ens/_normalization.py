@@ -1,10 +1,7 @@
 from enum import (
     Enum,
 )
-import json
-import os
 from typing import (
-    Any,
     Literal,
 )
 
@@ -13,41 +10,25 @@ from pyunormalize import (
     NFD,
 )
 
+from ._normalization_tables import (
+    NormalizationTables,
+    load_normalization_tables,
+)
 from .exceptions import (
     InvalidName,
 )
 
 # -- setup -- #
 
+# the ENSIP-15 tables are loaded on first use, see ``_normalization_tables``
+_tables: NormalizationTables | None = None
 
-def _json_list_mapping_to_dict(
-    f: dict[str, Any],
-    list_mapped_key: str,
-) -> dict[str, Any]:
-    """
-    Takes a `[key, [value]]` mapping from the original ENS spec json files and turns it
-    into a `{key: value}` mapping.
-    """
-    f[list_mapped_key] = {k: v for k, v in f[list_mapped_key]}
-    return f
-
-
-# get the normalization spec json files downloaded from links in ENSIP-15
-# https://docs.ens.domains/ens-improvement-proposals/ensip-15-normalization-standard
-specs_dir_path = os.path.abspath(os.path.join(os.path.dirname(__file__), "specs"))
-with open(os.path.join(specs_dir_path, "normalization_spec.json")) as spec:
-    f = json.load(spec)
 
-    NORMALIZATION_SPEC = _json_list_mapping_to_dict(f, "mapped")
-    # clean `FE0F` (65039) from entries since it's optional
-    for e in NORMALIZATION_SPEC["emoji"]:
-        if 65039 in e:
-            for _ in range(e.count(65039)):
-                e.remove(65039)
-
-with open(os.path.join(specs_dir_path, "nf.json")) as nf:
-    f = json.load(nf)
-    NF = _json_list_mapping_to_dict(f, "decomp")
+def _get_tables() -> NormalizationTables:
+    global _tables
+    if _tables is None:
+        _tables = load_normalization_tables()
+    return _tables
 
 
 # --- Classes -- #
@@ -124,83 +105,9 @@ class ENSNormalizedName:
 
 # -----
 
-GROUP_COMBINED_VALID_CPS = []
-for d in NORMALIZATION_SPEC["groups"]:
-    GROUP_COMBINED_VALID_CPS.extend(d["primary"])
-    GROUP_COMBINED_VALID_CPS.extend(d["secondary"])
-
-VALID_BY_GROUPS = {
-    d["name"]: set(d["primary"] + d["secondary"]) for d in NORMALIZATION_SPEC["groups"]
-}
-
-
-def _extract_valid_codepoints() -> set[int]:
-    all_valid = set()
-    for _name, valid_cps in VALID_BY_GROUPS.items():
-        all_valid.update(valid_cps)
-    all_valid.update(map(ord, NFD("".join(map(chr, all_valid)))))
-    return all_valid
-
-
-def _construct_whole_confusable_map() -> dict[int, set[str]]:
-    """
-    Create a mapping, per confusable, that contains all the groups in the cp's whole
-    confusable excluding the confusable extent of the cp itself - as per the spec at
-    https://docs.ens.domains/ens-improvement-proposals/ensip-15-normalization-standard
-    """
-    whole_map: dict[int, set[str]] = {}
-    for whole in NORMALIZATION_SPEC["wholes"]:
-        whole_confusables: set[int] = set(whole["valid"] + whole["confused"])
-        confusable_extents: list[tuple[set[int], set[str]]] = []
-
-        for confusable_cp in whole_confusables:
-            # create confusable extents for all whole confusables
-            groups: set[str] = set()
-            for gn, gv in VALID_BY_GROUPS.items():
-                if confusable_cp in gv:
-                    groups.add(gn)
-
-            if len(confusable_extents) == 0:
-                confusable_extents.append(({confusable_cp}, groups))
-            else:
-                extent_exists = False
-                for entry in confusable_extents:
-                    if any(g in entry[1] for g in groups):
-                        extent_exists = True
-                        entry[0].update({confusable_cp})
-                        entry[1].update(groups)
-                        break
-
-                if not extent_exists:
-                    confusable_extents.append(({confusable_cp}, groups))
-
-        for confusable_cp in whole_confusables:
-            confusable_cp_extent_groups: set[str] = set()
-
-            if confusable_cp in whole["confused"]:
-                whole_map[confusable_cp] = set()
-                for ce in confusable_extents:
-                    if confusable_cp in ce[0]:
-                        confusable_cp_extent_groups.update(ce[1])
-                    else:
-                        whole_map[confusable_cp].update(ce[1])
-
-                # remove the groups from confusable_cp's confusable extent
-                whole_map[confusable_cp] = whole_map[confusable_cp].difference(
-                    confusable_cp_extent_groups
-                )
-
-    return whole_map
-
-
-WHOLE_CONFUSABLE_MAP = _construct_whole_confusable_map()
-VALID_CODEPOINTS = _extract_valid_codepoints()
-MAX_LEN_EMOJI_PATTERN = max(len(e) for e in NORMALIZATION_SPEC["emoji"])
-NSM_MAX = NORMALIZATION_SPEC["nsm_max"]
-
 
 def _is_fenced(cp: int) -> bool:
-    return cp in [fenced[0] for fenced in NORMALIZATION_SPEC["fenced"]]
+    return cp in _get_tables().fenced
 
 
 def _codepoints_to_text(cps: list[list[int]] | list[int]) -> str:
@@ -219,6 +126,8 @@ def _validate_tokens_and_get_label_type(tokens: list[Token]) -> str:
     if all(token.type == TokenType.EMOJI for token in tokens):
         return "emoji"
 
+    tables = _get_tables()
+
     label_text = "".join(token.text for token in tokens)
     concat_text_tokens_as_str = "".join(
         t.text for t in tokens if t.type == TokenType.TEXT
@@ -264,11 +173,7 @@ def _validate_tokens_and_get_label_type(tokens: list[Token]) -> str:
                 f"Label cannot contain two fenced codepoints in a row: '{label_text}'"
             )
 
-    if any(
-        t.codepoints[0] in NORMALIZATION_SPEC["cm"]
-        for t in tokens
-        if t.type == TokenType.TEXT
-    ):
+    if any(t.codepoints[0] in tables.cm for t in tokens if t.type == TokenType.TEXT):
         raise InvalidName(
             "At least one text token in label starts with a "
             f"combining mark: '{label_text}'"
@@ -283,8 +188,8 @@ def _validate_tokens_and_get_label_type(tokens: list[Token]) -> str:
     }
 
     chars_group_name = None
-    for group_name, group_cps in VALID_BY_GROUPS.items():
-        if text_token_cps_set.issubset(group_cps):
+    for group_name, group_cps in tables.groups.items():
+        if all(cp in group_cps for cp in text_token_cps_set):
             chars_group_name = group_name
             break
 
@@ -294,52 +199,47 @@ def _validate_tokens_and_get_label_type(tokens: list[Token]) -> str:
         )
 
     # apply NFD and check contiguous NSM sequences
-    for group in NORMALIZATION_SPEC["groups"]:
-        if group["name"] == chars_group_name:
-            if "cm" not in group:
-                nfd_cps = [
-                    ord(nfd_c) for c in concat_text_tokens_as_str for nfd_c in NFD(c)
-                ]
-
-                next_index = -1
-                for cp_i, cp in enumerate(nfd_cps):
-                    if cp_i <= next_index:
-                        continue
-
-                    if cp in NORMALIZATION_SPEC["nsm"]:
-                        if cp_i == len(nfd_cps) - 1:
-                            break
-
-                        contiguous_nsm_cps = [cp]
-                        next_index = cp_i + 1
-                        next_cp = nfd_cps[next_index]
-                        while next_cp in NORMALIZATION_SPEC["nsm"]:
-                            contiguous_nsm_cps.append(next_cp)
-                            if len(contiguous_nsm_cps) > NSM_MAX:
-                                raise InvalidName(
-                                    "Contiguous NSM sequence for label greater than NSM"
-                                    f" max of {NSM_MAX}: '{label_text}'"
-                                )
-                            next_index += 1
-                            if next_index == len(nfd_cps):
-                                break
-                            next_cp = nfd_cps[next_index]
-
-                        if not len(contiguous_nsm_cps) == len(set(contiguous_nsm_cps)):
-                            raise InvalidName(
-                                "Contiguous NSM sequence for label contains duplicate "
-                                f"codepoints: '{label_text}'"
-                            )
-            break
+    if chars_group_name not in tables.groups_with_cm:
+        nfd_cps = [ord(nfd_c) for c in concat_text_tokens_as_str for nfd_c in NFD(c)]
+
+        next_index = -1
+        for cp_i, cp in enumerate(nfd_cps):
+            if cp_i <= next_index:
+                continue
+
+            if cp in tables.nsm:
+                if cp_i == len(nfd_cps) - 1:
+                    break
+
+                contiguous_nsm_cps = [cp]
+                next_index = cp_i + 1
+                next_cp = nfd_cps[next_index]
+                while next_cp in tables.nsm:
+                    contiguous_nsm_cps.append(next_cp)
+                    if len(contiguous_nsm_cps) > tables.nsm_max:
+                        raise InvalidName(
+                            "Contiguous NSM sequence for label greater than NSM"
+                            f" max of {tables.nsm_max}: '{label_text}'"
+                        )
+                    next_index += 1
+                    if next_index == len(nfd_cps):
+                        break
+                    next_cp = nfd_cps[next_index]
+
+                if not len(contiguous_nsm_cps) == len(set(contiguous_nsm_cps)):
+                    raise InvalidName(
+                        "Contiguous NSM sequence for label contains duplicate "
+                        f"codepoints: '{label_text}'"
+                    )
 
     # check wholes
     # start with set of all groups with confusables
-    retained_groups = set(VALID_BY_GROUPS.keys())
+    retained_groups = set(tables.groups.keys())
     confused_chars = set()
     buffer = set()
 
     for char_cp in text_token_cps_set:
-        groups_excluding_ce = WHOLE_CONFUSABLE_MAP.get(char_cp)
+        groups_excluding_ce = tables.whole_confusables.get(char_cp)
 
         if groups_excluding_ce and len(groups_excluding_ce) > 0:
             if len(retained_groups) == 0:
@@ -348,7 +248,7 @@ def _validate_tokens_and_get_label_type(tokens: list[Token]) -> str:
                 retained_groups = retained_groups.intersection(groups_excluding_ce)
                 confused_chars.add(char_cp)
 
-        elif GROUP_COMBINED_VALID_CPS.count(char_cp) == 1:
+        elif char_cp in tables.single_group:
             return chars_group_name
 
         else:
@@ -356,7 +256,7 @@ def _validate_tokens_and_get_label_type(tokens: list[Token]) -> str:
 
     if len(confused_chars) > 0:
         for retained_group_name in retained_groups:
-            if all(cp in VALID_BY_GROUPS[retained_group_name] for cp in buffer):
+            if all(cp in tables.groups[retained_group_name] for cp in buffer):
                 # Though the spec doesn't mention this explicitly, if the buffer is
                 # empty, the label is confusable. This allows for using ``all()`` here
                 # since that yields ``True`` on empty sets.
@@ -386,8 +286,7 @@ def _build_and_validate_label_from_tokens(tokens: list[Token]) -> Label:
     for token in tokens:
         if token.type == TokenType.TEXT:
             # apply NFC normalization to text tokens
-            chars = [chr(cp) for cp in token._original_codepoints]
-            nfc = NFC(chars)
+            nfc = NFC("".join(chr(cp) for cp in token._original_codepoints))
             token._normalized_codepoints = [ord(c) for c in nfc]
 
     label_type = _validate_tokens_and_get_label_type(tokens)
@@ -422,6 +321,7 @@ def normalize_name_ensip15(name: str) -> ENSNormalizedName:
         name = name.decode("utf-8")
 
     raw_labels = name.split(".")
+    tables = _get_tables()
 
     if any(len(label) == 0 for label in raw_labels):
         raise InvalidName("Labels cannot be empty")
@@ -441,7 +341,7 @@ def normalize_name_ensip15(name: str) -> ENSNormalizedName:
             while end_index <= len(_input):
                 current_emoji_sequence = _input[:end_index]
 
-                if len(current_emoji_sequence) > MAX_LEN_EMOJI_PATTERN:
+                if len(current_emoji_sequence) > tables.max_emoji_len:
                     # if we've reached the max length of all known emoji patterns
                     break
 
@@ -453,7 +353,7 @@ def normalize_name_ensip15(name: str) -> ENSNormalizedName:
                         raise InvalidName("Empty name after removing 65039 (0xFE0F)")
                     end_index -= 1  # reset end_index after removing 0xFE0F
 
-                if current_emoji_sequence in NORMALIZATION_SPEC["emoji"]:
+                if tuple(current_emoji_sequence) in tables.emoji:
                     emoji_codepoint = current_emoji_sequence
                 end_index += 1
 
@@ -470,16 +370,16 @@ def normalize_name_ensip15(name: str) -> ENSNormalizedName:
             else:
                 leading_codepoint = _input.pop(0)
 
-                if leading_codepoint in NORMALIZATION_SPEC["ignored"]:
+                if leading_codepoint in tables.ignored:
                     pass
 
-                elif leading_codepoint in NORMALIZATION_SPEC["mapped"]:
-                    mapped = NORMALIZATION_SPEC["mapped"][leading_codepoint]
+                elif leading_codepoint in tables.mapped:
+                    mapped = tables.mapped[leading_codepoint]
                     for cp in mapped:
                         buffer.append(cp)
 
                 else:
-                    if leading_codepoint in VALID_CODEPOINTS:
+                    if leading_codepoint in tables.valid:
                         buffer.append(leading_codepoint)
                     else:
                         raise InvalidName(
@@ -0,0 +1,313 @@
+"""
+Compact, precompiled ENSIP-15 normalization tables.
+
+The tables are compiled from the ``normalization_spec.json`` file downloaded from
+the links in ENSIP-15 into ``specs/normalization_tables.bin``, which is loaded the
+first time a name is normalized. Codepoint sets from the spec that are too large to
+hold as python sets, such as the valid codepoints of each script group, are stored as
+sorted codepoint ranges that are searched by bisection.
+
+Recompile the tables after updating the spec with:
+
+    python -m ens._normalization_tables
+"""
+from array import (
+    array,
+)
+from bisect import (
+    bisect_right,
+)
+import json
+import os
+import struct
+import sys
+from typing import (
+    Any,
+    Iterable,
+    Sequence,
+)
+
+from pyunormalize import (
+    NFD,
+)
+
+from .exceptions import (
+    ENSValueError,
+)
+
+SPECS_DIR_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), "specs"))
+NORMALIZATION_SPEC_PATH = os.path.join(SPECS_DIR_PATH, "normalization_spec.json")
+NORMALIZATION_TABLES_PATH = os.path.join(SPECS_DIR_PATH, "normalization_tables.bin")
+
+TABLES_MAGIC = b"ENSIP15\x01"
+# the variation selector 0xFE0F is optional within emoji sequences
+FE0F = 65039
+
+
+class CodepointRanges:
+    """
+    A set of codepoints stored as sorted, non-overlapping ``[start, stop)`` ranges.
+    """
+
+    __slots__ = ("starts", "stops")
+
+    def __init__(self, starts: Sequence[int], stops: Sequence[int]) -> None:
+        self.starts = starts
+        self.stops = stops
+
+    @classmethod
+    def from_codepoints(cls, codepoints: Iterable[int]) -> "CodepointRanges":
+        starts = array("I")
+        stops = array("I")
+        for cp in sorted(set(codepoints)):
+            if stops and stops[-1] == cp:
+                stops[-1] = cp + 1
+            else:
+                starts.append(cp)
+                stops.append(cp + 1)
+        return cls(starts, stops)
+
+    def __contains__(self, cp: int) -> bool:
+        index = bisect_right(self.starts, cp) - 1
+        return index >= 0 and cp < self.stops[index]
+
+
+class NormalizationTables:
+    def __init__(
+        self,
+        valid: CodepointRanges,
+        single_group: CodepointRanges,
+        groups: dict[str, CodepointRanges],
+        groups_with_cm: frozenset[str],
+        ignored: frozenset[int],
+        mapped: dict[int, tuple[int, ...]],
+        emoji: frozenset[tuple[int, ...]],
+        cm: frozenset[int],
+        nsm: frozenset[int],
+        nsm_max: int,
+        fenced: frozenset[int],
+        whole_confusables: dict[int, frozenset[str]],
+    ) -> None:
+        # valid codepoints of all groups, and their NFD decompositions
+        self.valid = valid
+        # codepoints that are valid in exactly one group
+        self.single_group = single_group
+        # valid codepoints by group, in the spec's order
+        self.groups = groups
+        self.groups_with_cm = groups_with_cm
+        self.ignored = ignored
+        self.mapped = mapped
+        # emoji sequences, without the optional 0xFE0F
+        self.emoji = emoji
+        self.max_emoji_len = max(len(sequence) for sequence in emoji)
+        self.cm = cm
+        self.nsm = nsm
+        self.nsm_max = nsm_max
+        self.fenced = fenced
+        # the groups each whole confusable codepoint is confusable with, excluding
+        # the groups of its own confusable extent
+        self.whole_confusables = whole_confusables
+
+
+# -- compilation -- #
+
+
+def _construct_whole_confusable_map(
+    spec: dict[str, Any], valid_by_groups: dict[str, set[int]]
+) -> dict[int, set[str]]:
+    """
+    Create a mapping, per confusable, that contains all the groups in the cp's whole
+    confusable excluding the confusable extent of the cp itself - as per the spec at
+    https://docs.ens.domains/ens-improvement-proposals/ensip-15-normalization-standard
+    """
+    whole_map: dict[int, set[str]] = {}
+    for whole in spec["wholes"]:
+        whole_confusables: set[int] = set(whole["valid"] + whole["confused"])
+        confusable_extents: list[tuple[set[int], set[str]]] = []
+
+        for confusable_cp in whole_confusables:
+            # create confusable extents for all whole confusables
+            groups: set[str] = set()
+            for gn, gv in valid_by_groups.items():
+                if confusable_cp in gv:
+                    groups.add(gn)
+
+            if len(confusable_extents) == 0:
+                confusable_extents.append(({confusable_cp}, groups))
+            else:
+                extent_exists = False
+                for entry in confusable_extents:
+                    if any(g in entry[1] for g in groups):
+                        extent_exists = True
+                        entry[0].update({confusable_cp})
+                        entry[1].update(groups)
+                        break
+
+                if not extent_exists:
+                    confusable_extents.append(({confusable_cp}, groups))
+
+        for confusable_cp in whole_confusables:
+            confusable_cp_extent_groups: set[str] = set()
+
+            if confusable_cp in whole["confused"]:
+                whole_map[confusable_cp] = set()
+                for ce in confusable_extents:
+                    if confusable_cp in ce[0]:
+                        confusable_cp_extent_groups.update(ce[1])
+                    else:
+                        whole_map[confusable_cp].update(ce[1])
+
+                # remove the groups from confusable_cp's confusable extent
+                whole_map[confusable_cp] = whole_map[confusable_cp].difference(
+                    confusable_cp_extent_groups
+                )
+
+    return whole_map
+
+
+def _pack_sequences(sequences: Sequence[Sequence[int]]) -> tuple[list[int], list[int]]:
+    offsets = [0]
+    values: list[int] = []
+    for sequence in sequences:
+        values.extend(sequence)
+        offsets.append(len(values))
+    return offsets, values
+
+
+def _unpack_sequences(
+    offsets: Sequence[int], values: Sequence[int]
+) -> list[tuple[int, ...]]:
+    return [tuple(values[start:stop]) for start, stop in zip(offsets[:-1], offsets[1:])]
+
+
+def compile_normalization_tables(spec: dict[str, Any]) -> bytes:
+    """
+    Compile the parsed ENSIP-15 ``normalization_spec.json`` into the binary format
+    read by ``load_normalization_tables``: the magic bytes, the length of a JSON
+    header, the header, then the little-endian uint32 arrays it describes.
+    """
+    group_names = [group["name"] for group in spec["groups"]]
+    valid_by_groups = {
+        group["name"]: set(group["primary"] + group["secondary"])
+        for group in spec["groups"]
+    }
+
+    all_valid: set[int] = set().union(*valid_by_groups.values())
+    all_valid.update(map(ord, NFD("".join(map(chr, all_valid)))))
+
+    group_counts: dict[int, int] = {}
+    for group in spec["groups"]:
+        for cp in group["primary"] + group["secondary"]:
+            group_counts[cp] = group_counts.get(cp, 0) + 1
+
+    mapped = sorted(spec["mapped"])
+    emoji = [[cp for cp in sequence if cp != FE0F] for sequence in spec["emoji"]]
+    whole_map = sorted(_construct_whole_confusable_map(spec, valid_by_groups).items())
+
+    arrays: dict[str, list[int]] = {}
+
+    def add_ranges(name: str, codepoints: Iterable[int]) -> None:
+        ranges = CodepointRanges.from_codepoints(codepoints)
+        arrays[f"{name}_starts"] = list(ranges.starts)
+        arrays[f"{name}_stops"] = list(ranges.stops)
+
+    add_ranges("valid", all_valid)
+    add_ranges("single_group", (cp for cp, count in group_counts.items() if count == 1))
+    for index, name in enumerate(group_names):
+        add_ranges(f"group_{index}", valid_by_groups[name])
+
+    arrays["ignored"] = sorted(spec["ignored"])
+    arrays["mapped_keys"] = [cp for cp, _ in mapped]
+    arrays["mapped_offsets"], arrays["mapped_values"] = _pack_sequences(
+        [cps for _, cps in mapped]
+    )
+    arrays["emoji_offsets"], arrays["emoji_values"] = _pack_sequences(emoji)
+    arrays["cm"] = sorted(spec["cm"])
+    arrays["nsm"] = sorted(spec["nsm"])
+    arrays["fenced"] = sorted(cp for cp, _ in spec["fenced"])
+    arrays["whole_keys"] = [cp for cp, _ in whole_map]
+    arrays["whole_offsets"], arrays["whole_values"] = _pack_sequences(
+        [sorted(group_names.index(name) for name in names) for _, names in whole_map]
+    )
+
+    header = json.dumps(
+        {
+            "unicode": spec["unicode"],
+            "nsm_max": spec["nsm_max"],
+            "groups": group_names,
+            "groups_with_cm": [
+                group["name"] for group in spec["groups"] if "cm" in group
+            ],
+            "arrays": [[name, len(values)] for name, values in arrays.items()],
+        },
+        separators=(",", ":"),
+    ).encode()
+    packed = array("I", (value for values in arrays.values() for value in values))
+    if sys.byteorder == "big":
+        packed.byteswap()
+    return TABLES_MAGIC + struct.pack("<I", len(header)) + header + packed.tobytes()
+
+
+# -- loading -- #
+
+
+def load_normalization_tables(
+    path: str = NORMALIZATION_TABLES_PATH,
+) -> NormalizationTables:
+    with open(path, "rb") as tables_file:
+        data = tables_file.read()
+
+    if not data.startswith(TABLES_MAGIC):
+        raise ENSValueError(f"Not an ENSIP-15 normalization tables file: {path}")
+    offset = len(TABLES_MAGIC)
+    (header_length,) = struct.unpack_from("<I", data, offset)
+    offset += 4
+    header = json.loads(data[offset : offset + header_length])
+    offset += header_length
+
+    packed = array("I")
+    packed.frombytes(data[offset:])
+    if sys.byteorder == "big":
+        packed.byteswap()
+
+    arrays: dict[str, array[int]] = {}
+    position = 0
+    for name, length in header["arrays"]:
+        arrays[name] = packed[position : position + length]
+        position += length
+
+    def ranges(name: str) -> CodepointRanges:
+        return CodepointRanges(arrays[f"{name}_starts"], arrays[f"{name}_stops"])
+
+    group_names = header["groups"]
+    mapped_values = _unpack_sequences(arrays["mapped_offsets"], arrays["mapped_values"])
+    whole_values = _unpack_sequences(arrays["whole_offsets"], arrays["whole_values"])
+
+    return NormalizationTables(
+        valid=ranges("valid"),
+        single_group=ranges("single_group"),
+        groups={
+            name: ranges(f"group_{index}") for index, name in enumerate(group_names)
+        },
+        groups_with_cm=frozenset(header["groups_with_cm"]),
+        ignored=frozenset(arrays["ignored"]),
+        mapped=dict(zip(arrays["mapped_keys"], mapped_values)),
+        emoji=frozenset(
+            _unpack_sequences(arrays["emoji_offsets"], arrays["emoji_values"])
+        ),
+        cm=frozenset(arrays["cm"]),
+        nsm=frozenset(arrays["nsm"]),
+        nsm_max=header["nsm_max"],
+        fenced=frozenset(arrays["fenced"]),
+        whole_confusables={
+            cp: frozenset(group_names[index] for index in group_indices)
+            for cp, group_indices in zip(arrays["whole_keys"], whole_values)
+        },
+    )
+
+
+if __name__ == "__main__":
+    with open(NORMALIZATION_SPEC_PATH) as spec_file:
+        compiled_tables = compile_normalization_tables(json.load(spec_file))
+    with open(NORMALIZATION_TABLES_PATH, "wb") as tables_file:
+        tables_file.write(compiled_tables)
@@ -1,3 +1,4 @@
+import asyncio
 from copy import (
     deepcopy,
 )
@@ -34,6 +35,7 @@ from ens import (
 )
 from ens.base_ens import (
     BaseENS,
+    clears_resolution_cache,
 )
 from ens.constants import (
     EMPTY_ADDR_HEX,
@@ -121,6 +123,7 @@ class AsyncENS(BaseENS):
         self._reverse_resolver_contract = self.w3.eth.contract(
             abi=abis.REVERSE_RESOLVER
         )
+        self._init_resolution_cache()
 
     @classmethod
     def from_web3(
@@ -176,6 +179,23 @@ class AsyncENS(BaseENS):
                 return None
             return to_checksum_address(address_as_bytes)
 
+    async def addresses(self, names: Sequence[str]) -> list[ChecksumAddress | None]:
+        """
+        Look up the Ethereum addresses that each of `names` currently points to.
+
+        When the provider supports batching, the lookups for all names are sent
+        together in a fixed number of JSON-RPC batches, rather than one round trip
+        per contract call for each name.
+
+        :param names: ENS names to look up
+        :return: the address for each name, or ``None`` if it does not resolve
+        :raises InvalidName: if any name has invalid syntax
+        """
+        return cast(
+            list[ChecksumAddress | None], await self._resolve_many(names, "addr")
+        )
+
+    @clears_resolution_cache
     async def setup_address(
         self,
         name: str,
@@ -250,6 +270,23 @@ class AsyncENS(BaseENS):
             name if to_checksum_address(address) == await self.address(name) else None
         )
 
+    async def names(self, addresses: Sequence[ChecksumAddress]) -> list[str | None]:
+        """
+        Look up the names that each of `addresses` points to, using reverse lookups
+        that are batched like in :meth:`~ens.AsyncENS.addresses`.
+
+        :param addresses: addresses to look up
+        :return: the name for each address, or ``None`` if the forward resolution
+            of the name does not match the address
+        """
+        names = await self._resolve_many(
+            [address_to_reverse_domain(address) for address in addresses], "name"
+        )
+        return self._forward_verified_names(
+            addresses, names, await self.addresses([name for name in names if name])
+        )
+
+    @clears_resolution_cache
     async def setup_name(
         self,
         name: str,
@@ -314,6 +351,7 @@ class AsyncENS(BaseENS):
         node = raw_name_to_hash(name)
         return await self.ens.caller.owner(node)
 
+    @clears_resolution_cache
     async def setup_owner(
         self,
         name: str,
@@ -374,7 +412,7 @@ class AsyncENS(BaseENS):
         :param str name: The ENS name
         """
         normal_name = normalize_name(name)
-        resolver = await self._get_resolver(normal_name)
+        resolver = await self._get_resolver(normal_name, memoize_names=False)
         return resolver[0]
 
     async def reverser(
@@ -405,6 +443,7 @@ class AsyncENS(BaseENS):
         )
         return await r.caller.text(node, key)
 
+    @clears_resolution_cache
     async def set_text(
         self,
         name: str,
@@ -438,34 +477,129 @@ class AsyncENS(BaseENS):
 
     # -- private methods -- #
 
+    async def _call_all(
+        self, calls: Sequence[Optional["AsyncContractFunction"]]
+    ) -> list[Any]:
+        """
+        Call each of the contract functions, in a single JSON-RPC batch when the
+        provider supports batching. ``None`` entries are skipped and return ``None``.
+        """
+        # defer import to avoid a circular import with web3
+        from web3.exceptions import (
+            Web3Exception,
+        )
+        from web3.providers.async_base import (
+            AsyncJSONBaseProvider,
+        )
+
+        functions = [call for call in calls if call is not None]
+        if len(functions) > 1 and isinstance(self.w3.provider, AsyncJSONBaseProvider):
+            try:
+                async with self.w3.batch_requests() as batch:
+                    for function in functions:
+                        batch.add(function)
+                    results = iter(await batch.async_execute())
+                return [None if call is None else next(results) for call in calls]
+            except Web3Exception:
+                # reverts and offchain lookups abort the whole batch, so make the
+                # calls one by one to handle them as for a single lookup
+                pass
+
+        results = iter(
+            await asyncio.gather(*(function.call() for function in functions))
+        )
+        return [None if call is None else next(results) for call in calls]
+
+    async def _get_resolvers(
+        self,
+        normal_names: Sequence[str],
+        fn_name: str = "addr",
+        memoize_names: bool = True,
+    ) -> list[tuple[Optional["AsyncContract"], str]]:
+        name_to_hash = (
+            self._normal_name_to_hash if memoize_names else normal_name_to_hash
+        )
+        found: dict[str, tuple[ChecksumAddress | None, str]] = {}
+        # the name whose resolver is looked up next, for each name not yet resolved
+        current_names: dict[str, str] = {}
+        for normal_name in normal_names:
+            is_cached, cached = self._get_cached(f"resolver:{normal_name}")
+            if is_cached:
+                found[normal_name] = cached
+            else:
+                current_names[normal_name] = normal_name
+
+        # look for resolvers, starting at the full names and taking the parent
+        # each time that no resolver is found, one batch per level
+        while current_names:
+            for normal_name, current_name in list(current_names.items()):
+                if is_empty_name(current_name):
+                    # no resolver found across all levels
+                    found[normal_name] = (None, current_name)
+                    self._set_cached(f"resolver:{normal_name}", found[normal_name])
+                    del current_names[normal_name]
+
+            lookups = sorted(set(current_names.values()))
+            resolver_calls = [
+                cast(
+                    "AsyncContractFunction",
+                    self.ens.functions.resolver(name_to_hash(name)),
+                )
+                for name in lookups
+            ]
+            resolver_addrs = dict(zip(lookups, await self._call_all(resolver_calls)))
+            for normal_name, current_name in list(current_names.items()):
+                resolver_addr = resolver_addrs[current_name]
+                if is_none_or_zero_address(resolver_addr):
+                    current_names[normal_name] = self.parent(current_name)
+                else:
+                    found[normal_name] = (resolver_addr, current_name)
+                    self._set_cached(f"resolver:{normal_name}", found[normal_name])
+                    del current_names[normal_name]
+
+        return [
+            (
+                cast("AsyncContract", self._type_aware_resolver(resolver_addr, fn_name))
+                if resolver_addr
+                else None,
+                current_name,
+            )
+            for resolver_addr, current_name in (found[name] for name in normal_names)
+        ]
+
     async def _get_resolver(
         self,
         normal_name: str,
         fn_name: str = "addr",
+        memoize_names: bool = True,
     ) -> tuple[Optional["AsyncContract"], str]:
-        current_name = normal_name
-
-        # look for a resolver, starting at the full name and taking the
-        # parent each time that no resolver is found
-        while True:
-            if is_empty_name(current_name):
-                # if no resolver found across all iterations, current_name
-                # will eventually be the empty string '' which returns here
-                return None, current_name
-
-            resolver_addr = await self.ens.caller.resolver(
-                normal_name_to_hash(current_name)
-            )
-            if not is_none_or_zero_address(resolver_addr):
-                # if resolver found, return it
-                resolver = cast(
-                    "AsyncContract",
-                    self._type_aware_resolver(resolver_addr, fn_name),
-                )
-                return resolver, current_name
-
-            # set current_name to parent and try again
-            current_name = self.parent(current_name)
+        return (await self._get_resolvers([normal_name], fn_name, memoize_names))[0]
+
+    async def _extended_resolver_support(
+        self, resolvers: Sequence["AsyncContract"]
+    ) -> dict[ChecksumAddress, bool]:
+        supported: dict[ChecksumAddress, bool] = {}
+        lookups: dict[ChecksumAddress, "AsyncContract"] = {}
+        for resolver in resolvers:
+            if not self._has_supports_interface(resolver):
+                supported[resolver.address] = False
+                continue
+            is_cached, cached = self._get_cached(f"interface:{resolver.address}")
+            if is_cached:
+                supported[resolver.address] = cached
+            else:
+                lookups[resolver.address] = resolver
+
+        results = await self._call_all(
+            [
+                resolver.functions.supportsInterface(ENS_EXTENDED_RESOLVER_INTERFACE_ID)
+                for resolver in lookups.values()
+            ]
+        )
+        for address, is_supported in zip(lookups, results):
+            supported[address] = is_supported
+            self._set_cached(f"interface:{address}", is_supported)
+        return supported
 
     async def _set_resolver(
         self,
@@ -489,41 +623,65 @@ class AsyncENS(BaseENS):
             await coro
         return cast("AsyncContract", self._resolver_contract(address=resolver_addr))
 
+    async def _resolve_many(
+        self, names: Sequence[str], fn_name: str = "addr"
+    ) -> list[ChecksumAddress | str | None]:
+        normal_names = [self._normalize_name(name) for name in names]
+        results: dict[str, ChecksumAddress | str | None] = {}
+        lookups: list[str] = []
+        for normal_name in dict.fromkeys(normal_names):
+            is_cached, cached = self._get_cached(f"{fn_name}:{normal_name}")
+            if is_cached:
+                results[normal_name] = cached
+            else:
+                lookups.append(normal_name)
+        if not lookups:
+            return [results[normal_name] for normal_name in normal_names]
+
+        resolvers = await self._get_resolvers(lookups, fn_name)
+        extended = await self._extended_resolver_support(
+            [resolver for resolver, _ in resolvers if resolver]
+        )
+
+        calls: list[Optional["AsyncContractFunction"]] = []
+        for normal_name, (resolver, current_name) in zip(lookups, resolvers):
+            node = self._normal_name_to_hash(normal_name)
+            if not resolver:
+                calls.append(None)
+            elif extended[resolver.address]:
+                # handle extended resolver case
+                calldata = resolver.encode_abi(fn_name, [node])
+                calls.append(
+                    resolver.functions.resolve(dns_encode_name(normal_name), calldata)
+                )
+            elif normal_name == current_name:
+                calls.append(getattr(resolver.functions, fn_name)(node))
+            else:
+                calls.append(None)
+
+        for normal_name, (resolver, _), call, result in zip(
+            lookups, resolvers, calls, await self._call_all(calls)
+        ):
+            if call is None:
+                result = None
+            elif extended[resolver.address]:
+                result = self._decode_ensip10_resolve_data(result, resolver, fn_name)
+            elif is_none_or_zero_address(result):
+                result = None
+
+            if is_address(result):
+                result = to_checksum_address(result)
+            results[normal_name] = result
+            self._set_cached(f"{fn_name}:{normal_name}", result)
+
+        return [results[normal_name] for normal_name in normal_names]
+
     async def _resolve(
         self,
         name: str,
         fn_name: str = "addr",
     ) -> ChecksumAddress | str | None:
-        normal_name = normalize_name(name)
-
-        resolver, current_name = await self._get_resolver(normal_name, fn_name)
-        if not resolver:
-            return None
-
-        node = self.namehash(normal_name)
-
-        # handle extended resolver case
-        if await _async_resolver_supports_interface(
-            resolver, ENS_EXTENDED_RESOLVER_INTERFACE_ID
-        ):
-            contract_func_with_args = (fn_name, [node])
-
-            calldata = resolver.encode_abi(*contract_func_with_args)
-            contract_call_result = await resolver.caller.resolve(
-                dns_encode_name(normal_name),
-                calldata,
-            )
-            result = self._decode_ensip10_resolve_data(
-                contract_call_result, resolver, fn_name
-            )
-            return to_checksum_address(result) if is_address(result) else result
-        elif normal_name == current_name:
-            lookup_function = getattr(resolver.functions, fn_name)
-            result = await lookup_function(node).call()
-            if is_none_or_zero_address(result):
-                return None
-            return to_checksum_address(result) if is_address(result) else result
-        return None
+        return (await self._resolve_many([name], fn_name))[0]
 
     async def _assert_control(
         self,
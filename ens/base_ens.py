@@ -1,15 +1,31 @@
+from collections import (
+    OrderedDict,
+)
 from functools import (
+    lru_cache,
     wraps,
 )
+from inspect import (
+    iscoroutinefunction,
+)
+import threading
+import time
 from typing import (
     TYPE_CHECKING,
     Any,
+    Callable,
+    Sequence,
+    TypeVar,
     Union,
+    cast,
 )
 
 from eth_typing import (
     ChecksumAddress,
 )
+from eth_utils import (
+    to_checksum_address,
+)
 from eth_utils.abi import (
     get_abi_output_types,
 )
@@ -17,10 +33,15 @@ from hexbytes import (
     HexBytes,
 )
 
+from .constants import (
+    NAME_CACHE_SIZE,
+    RESOLUTION_CACHE_SIZE,
+)
 from .utils import (
     address_to_reverse_domain,
     is_valid_name,
     label_to_hash,
+    normal_name_to_hash,
     normalize_name,
     raw_name_to_hash,
 )
@@ -35,6 +56,46 @@ if TYPE_CHECKING:
         Contract,
     )
 
+TFunc = TypeVar("TFunc", bound=Callable[..., Any])
+
+
+# names and namehashes never change, so the ones resolved are always memoized,
+# unlike the resolvers and records they resolve to
+@lru_cache(maxsize=NAME_CACHE_SIZE)
+def _cached_normalize_name(name: str) -> str:
+    return normalize_name(name)
+
+
+@lru_cache(maxsize=NAME_CACHE_SIZE)
+def _cached_normal_name_to_hash(normal_name: str) -> HexBytes:
+    return normal_name_to_hash(normal_name)
+
+
+def clears_resolution_cache(func: TFunc) -> TFunc:
+    """
+    Drop the cached resolvers and records once ``func``, a method that changes ENS
+    state, has returned or raised.
+    """
+    if iscoroutinefunction(func):
+
+        @wraps(func)
+        async def async_wrapper(self: "BaseENS", *args: Any, **kwargs: Any) -> Any:
+            try:
+                return await func(self, *args, **kwargs)
+            finally:
+                self.clear_cache()
+
+        return cast(TFunc, async_wrapper)
+
+    @wraps(func)
+    def wrapper(self: "BaseENS", *args: Any, **kwargs: Any) -> Any:
+        try:
+            return func(self, *args, **kwargs)
+        finally:
+            self.clear_cache()
+
+    return cast(TFunc, wrapper)
+
 
 class BaseENS:
     w3: Union["AsyncWeb3[Any]", "Web3"] = None
@@ -42,6 +103,11 @@ class BaseENS:
     _resolver_contract: type["Contract"] | type["AsyncContract"] = None
     _reverse_resolver_contract: type["Contract"] | type["AsyncContract"] = None
 
+    # seconds for which resolvers and resolved records are reused, 0 disables caching
+    cache_ttl: float = 0
+    _resolution_cache: "OrderedDict[str, tuple[float, Any]]"
+    _resolution_cache_lock: threading.Lock
+
     @property
     def strict_bytes_type_checking(self) -> bool:
         return self.w3.strict_bytes_type_checking
@@ -50,6 +116,51 @@ class BaseENS:
     def strict_bytes_type_checking(self, strict_bytes_type_check: bool) -> None:
         self.w3.strict_bytes_type_checking = strict_bytes_type_check
 
+    def _init_resolution_cache(self) -> None:
+        self._resolution_cache = OrderedDict()
+        self._resolution_cache_lock = threading.Lock()
+
+    def clear_cache(self) -> None:
+        """
+        Drop all cached resolvers and resolved records.
+        """
+        with self._resolution_cache_lock:
+            self._resolution_cache.clear()
+
+    def _get_cached(self, key: str) -> tuple[bool, Any]:
+        if self.cache_ttl <= 0:
+            return False, None
+
+        with self._resolution_cache_lock:
+            entry = self._resolution_cache.get(key)
+            if entry is None:
+                return False, None
+
+            expires_at, value = entry
+            if time.monotonic() >= expires_at:
+                del self._resolution_cache[key]
+                return False, None
+            self._resolution_cache.move_to_end(key)
+            return True, value
+
+    def _set_cached(self, key: str, value: Any) -> None:
+        if self.cache_ttl <= 0:
+            return
+
+        with self._resolution_cache_lock:
+            self._resolution_cache[key] = (time.monotonic() + self.cache_ttl, value)
+            self._resolution_cache.move_to_end(key)
+            while len(self._resolution_cache) > RESOLUTION_CACHE_SIZE:
+                self._resolution_cache.popitem(last=False)
+
+    @staticmethod
+    def _normalize_name(name: str) -> str:
+        return _cached_normalize_name(name)
+
+    @staticmethod
+    def _normal_name_to_hash(normal_name: str) -> HexBytes:
+        return _cached_normal_name_to_hash(normal_name)
+
     @staticmethod
     @wraps(label_to_hash)
     def labelhash(label: str) -> HexBytes:
@@ -97,6 +208,21 @@ class BaseENS:
         labels = name.split(".")
         return "" if len(labels) == 1 else ".".join(labels[1:])
 
+    @staticmethod
+    def _forward_verified_names(
+        addresses: Sequence[ChecksumAddress],
+        names: Sequence[Any],
+        forward_addresses: Sequence[ChecksumAddress | None],
+    ) -> list[str | None]:
+        # To be absolutely certain of each name, via reverse resolution, the address
+        # must match in the forward resolution. ``forward_addresses`` holds the
+        # forward resolutions of the names that were found, in order.
+        forward = iter(forward_addresses)
+        return [
+            name if name and to_checksum_address(address) == next(forward) else None
+            for address, name in zip(addresses, names)
+        ]
+
     def _decode_ensip10_resolve_data(
         self,
         contract_call_result: bytes,
@@ -115,6 +241,12 @@ class BaseENS:
         # if decoding a single value, return that value - else, return the tuple
         return decoded[0] if len(decoded) == 1 else decoded
 
+    @staticmethod
+    def _has_supports_interface(resolver: Union["Contract", "AsyncContract"]) -> bool:
+        return any(
+            "supportsInterface" in repr(func) for func in resolver.all_functions()
+        )
+
     def _type_aware_resolver(
         self,
         address: ChecksumAddress,
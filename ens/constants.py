@@ -17,6 +17,11 @@ EMPTY_ADDR_HEX = HexAddress(HexStr("0x" + "00" * 20))
 
 REVERSE_REGISTRAR_DOMAIN = "addr.reverse"
 
+# the number of normalized names and namehashes memoized for resolution
+NAME_CACHE_SIZE = 4096
+# the number of resolvers and records kept when resolution caching is enabled
+RESOLUTION_CACHE_SIZE = 4096
+
 ENS_MAINNET_ADDR = ChecksumAddress(
     HexAddress(HexStr("0x00000000000C2E074eC69A0dFb2997BA6C7d2e1e"))
 )
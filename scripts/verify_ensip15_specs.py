@@ -17,6 +17,11 @@ import sys
 
 import requests
 
+from ens._normalization_tables import (
+    NORMALIZATION_TABLES_PATH,
+    compile_normalization_tables,
+)
+
 REPO_ROOT = os.path.join(os.path.dirname(__file__), "..")
 ENSIP15_BASE = "https://raw.githubusercontent.com/adraffy/ens-normalize.js/main"
 
@@ -52,6 +57,18 @@ for name, paths in FILES.items():
         print(f"  {name}: OUT OF DATE — update from {paths['upstream']}")
         all_match = False
 
+with open(FILES["spec.json"]["local"]) as f:
+    compiled_tables = compile_normalization_tables(json.load(f))
+with open(NORMALIZATION_TABLES_PATH, "rb") as f:
+    if f.read() == compiled_tables:
+        print("  normalization_tables.bin: up to date")
+    else:
+        print(
+            "  normalization_tables.bin: OUT OF DATE — recompile with "
+            "`python -m ens._normalization_tables`"
+        )
+        all_match = False
+
 if all_match:
     print("\nAll ENSIP-15 files match upstream.")
 else:
@@ -331,6 +331,36 @@ def test_blockhash_validation_against_validation_threshold_when_caching_mainnet(
         assert cached_items == 1 if should_cache else cached_items == 0
 
 
+@pytest.mark.parametrize(
+    "threshold",
+    (RequestCacheValidationThreshold.FINALIZED, RequestCacheValidationThreshold.SAFE),
+)
+@pytest.mark.parametrize(
+    "blocknum,should_cache", (("0x1", True), ("0x2", True), ("0x3", False))
+)
+def test_block_receipts_by_blockhash_validation_when_caching_mainnet(
+    threshold, blocknum, should_cache, sync_provider, request_mocker
+):
+    w3 = Web3(
+        sync_provider(
+            cache_allowed_requests=True, request_cache_validation_threshold=threshold
+        )
+    )
+    with request_mocker(
+        w3,
+        mock_results={
+            "eth_chainId": "0x1",  # mainnet
+            "eth_getBlockByNumber": {"number": "0x2", "timestamp": "0x0"},
+            "eth_getBlockByHash": {"number": blocknum, "timestamp": "0x0"},
+            "eth_getBlockReceipts": [],
+        },
+    ):
+        # eth_getBlockReceipts takes a block hash as well as a block number
+        w3.manager.request_blocking("eth_getBlockReceipts", ["0x" + "00" * 32])
+        cached_items = len(w3.provider._request_cache.items())
+        assert cached_items == 1 if should_cache else cached_items == 0
+
+
 @pytest.mark.parametrize(
     "chain_id,expected_threshold",
     (
@@ -7,6 +7,13 @@ from hexbytes import (
     HexBytes,
 )
 
+from web3 import (
+    Web3,
+)
+from web3.providers import (
+    JSONBaseProvider,
+)
+
 
 @pytest.fixture(autouse=True)
 def wait_for_first_block(w3, wait_for_block):
@@ -176,3 +183,72 @@ def test_get_block_formatters_with_pre_formatted_values(w3, request_mocker):
         ),
         "requestsHash": HexBytes(unformatted_values_block["requestsHash"]),
     }
+
+
+def test_get_block_receipts_bulk_falls_back_to_transaction_receipts(w3):
+    txn_hashes = [
+        w3.eth.send_transaction(
+            {"from": w3.eth.default_account, "to": w3.eth.accounts[1], "value": value}
+        )
+        for value in range(1, 3)
+    ]
+    txn_receipts = [w3.eth.get_transaction_receipt(txn) for txn in txn_hashes]
+    block_numbers = [receipt["blockNumber"] for receipt in txn_receipts]
+
+    receipts = w3.eth.get_block_receipts_bulk([0, *block_numbers])
+
+    # eth-tester does not support eth_getBlockReceipts
+    assert w3.eth._block_receipts_supported is False
+    assert receipts == [[], *([receipt] for receipt in txn_receipts)]
+
+
+class BlockReceiptsProvider(JSONBaseProvider):
+    def __init__(self):
+        super().__init__()
+        self.requests = []
+
+    def _block_receipts(self, block_number):
+        return [{"blockNumber": block_number, "transactionIndex": "0x0"}]
+
+    def make_request(self, method, params):
+        assert method == "eth_getBlockReceipts"
+        self.requests.append([params[0]])
+        return {"jsonrpc": "2.0", "id": 0, "result": self._block_receipts(params[0])}
+
+    def make_batch_request(self, requests):
+        self.requests.append([params[0] for _method, params in requests])
+        return [
+            {"jsonrpc": "2.0", "id": i, "result": self._block_receipts(params[0])}
+            for i, (_method, params) in enumerate(requests)
+        ]
+
+
+def test_get_block_receipts_bulk_batches_block_receipts():
+    provider = BlockReceiptsProvider()
+    w3 = Web3(provider)
+
+    receipts = w3.eth.get_block_receipts_bulk([1, 2, 3])
+    assert [receipt["blockNumber"] for (receipt,) in receipts] == [1, 2, 3]
+    assert w3.eth.get_block_receipts_bulk([4, 5]) == [
+        [{"blockNumber": 4, "transactionIndex": 0}],
+        [{"blockNumber": 5, "transactionIndex": 0}],
+    ]
+
+    # support for eth_getBlockReceipts is found out with the first block only
+    assert provider.requests == [["0x1"], ["0x2", "0x3"], ["0x4", "0x5"]]
+
+
+@pytest.mark.asyncio
+async def test_async_get_block_receipts_bulk_falls_back_to_transaction_receipts(
+    async_w3,
+):
+    accounts = await async_w3.eth.accounts
+    txn_hash = await async_w3.eth.send_transaction(
+        {"from": accounts[0], "to": accounts[1], "value": 1}
+    )
+    txn_receipt = await async_w3.eth.get_transaction_receipt(txn_hash)
+
+    receipts = await async_w3.eth.get_block_receipts_bulk([0, txn_receipt["blockHash"]])
+
+    assert async_w3.eth._block_receipts_supported is False
+    assert receipts == [[], [txn_receipt]]
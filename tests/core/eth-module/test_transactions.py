@@ -1,6 +1,7 @@
 import pytest
 import collections
 import itertools
+import time
 
 from eth_account import (
     Account,
@@ -238,6 +239,126 @@ def test_eth_wait_for_transaction_receipt_transaction_indexing_in_progress(
         assert receipt == {"status": 1}
 
 
+class BlockNumberResponses:
+    def __init__(self, start):
+        self.block_number = start
+
+    def __call__(self, _method, _params):
+        self.block_number += 1
+        return hex(self.block_number)
+
+
+def _block_receipts_result(transaction_hashes):
+    def block_receipts(_method, params):
+        return [
+            {
+                "blockNumber": params[0],
+                "status": "0x1",
+                "transactionHash": transaction_hashes[int(params[0], 16) % 3],
+            }
+        ]
+
+    return block_receipts
+
+
+def test_wait_for_transaction_receipts(w3):
+    txn_hashes = [
+        w3.eth.send_transaction(
+            {"from": w3.eth.default_account, "to": w3.eth.accounts[1], "value": value}
+        )
+        for value in range(1, 4)
+    ]
+    missing_hash = HexBytes("0x" + "01" * 32)
+
+    receipts = []
+    with pytest.raises(TimeExhausted, match=missing_hash.to_0x_hex()):
+        for receipt in w3.eth.wait_for_transaction_receipts(
+            [*txn_hashes, missing_hash], timeout=RECEIPT_TIMEOUT
+        ):
+            receipts.append(receipt)
+
+    assert [receipt["transactionHash"] for receipt in receipts] == txn_hashes
+
+
+def test_wait_for_transaction_receipts_scans_new_blocks(w3, request_mocker):
+    txn_hashes = ["0x" + f"{index:02x}" * 32 for index in range(3)]
+    receipt_calls = collections.Counter()
+
+    def transaction_receipt(_method, params):
+        receipt_calls[params[0]] += 1
+        return None
+
+    with request_mocker(
+        w3,
+        mock_results={
+            "eth_blockNumber": BlockNumberResponses(10),
+            "eth_getTransactionReceipt": transaction_receipt,
+            "eth_getBlockReceipts": _block_receipts_result(txn_hashes),
+        },
+    ):
+        receipts = list(
+            w3.eth.wait_for_transaction_receipts(txn_hashes, poll_latency=0)
+        )
+
+    assert [receipt["blockNumber"] for receipt in receipts] == [12, 13, 14]
+    assert sorted(receipt["transactionHash"].to_0x_hex() for receipt in receipts) == (
+        txn_hashes
+    )
+    # each receipt was only requested directly once, before scanning new blocks
+    assert set(receipt_calls.values()) == {1}
+
+
+def test_wait_for_transaction_receipts_keeps_scanning_after_errors(w3, request_mocker):
+    txn_hashes = ["0x" + f"{index:02x}" * 32 for index in range(3)]
+    block_receipts = _block_receipts_result(txn_hashes)
+    block_receipts_calls = []
+
+    def flaky_block_receipts(method, params):
+        block_receipts_calls.append(params[0])
+        if len(block_receipts_calls) == 1:
+            return {"error": {"code": -32000, "message": "header not found"}}
+        return {"result": block_receipts(method, params)}
+
+    with request_mocker(
+        w3,
+        mock_results={
+            "eth_blockNumber": BlockNumberResponses(10),
+            "eth_getTransactionReceipt": lambda *_: None,
+        },
+        mock_responses={"eth_getBlockReceipts": flaky_block_receipts},
+    ):
+        receipts = list(
+            w3.eth.wait_for_transaction_receipts(txn_hashes, timeout=5, poll_latency=0)
+        )
+
+    # the block that failed to be scanned had none of the receipts
+    assert [receipt["blockNumber"] for receipt in receipts] == [13, 14, 15]
+    assert len(block_receipts_calls) == 4
+
+
+def test_wait_for_transaction_receipts_timeout_excludes_the_callers_time(
+    w3, request_mocker
+):
+    txn_hashes = ["0x" + f"{index:02x}" * 32 for index in range(3)]
+
+    receipts = []
+    with request_mocker(
+        w3,
+        mock_results={
+            "eth_blockNumber": BlockNumberResponses(10),
+            "eth_getTransactionReceipt": lambda *_: None,
+            "eth_getBlockReceipts": _block_receipts_result(txn_hashes),
+        },
+    ):
+        for receipt in w3.eth.wait_for_transaction_receipts(
+            txn_hashes, timeout=0.5, poll_latency=0
+        ):
+            receipts.append(receipt)
+            time.sleep(0.3)
+
+    assert [receipt["blockNumber"] for receipt in receipts] == [12, 13, 14]
+
+
 def test_get_transaction_formatters(w3, request_mocker):
     non_checksummed_addr = "0xB2930B35844A230F00E51431ACAE96FE543A0347"  # all uppercase
     unformatted_transaction = {
@@ -588,3 +709,43 @@ async def test_async_send_set_code_transaction(async_w3, async_math_contract):
 
     reset_code = await async_w3.eth.get_code(acct.address)
     assert reset_code == HexBytes("0x")
+
+
+@pytest.mark.asyncio
+async def test_async_wait_for_transaction_receipts(async_w3, request_mocker):
+    txn_hashes = ["0x" + f"{index:02x}" * 32 for index in range(3)]
+
+    async with request_mocker(
+        async_w3,
+        mock_results={
+            "eth_blockNumber": BlockNumberResponses(10),
+            "eth_getTransactionReceipt": lambda *_: None,
+            "eth_getBlockReceipts": _block_receipts_result(txn_hashes),
+        },
+    ):
+        receipts = [
+            receipt
+            async for receipt in async_w3.eth.wait_for_transaction_receipts(
+                txn_hashes, poll_latency=0
+            )
+        ]
+
+    assert [receipt["blockNumber"] for receipt in receipts] == [12, 13, 14]
+
+
+@pytest.mark.asyncio
+async def test_async_wait_for_transaction_receipts_times_out(async_w3):
+    accounts = await async_w3.eth.accounts
+    txn_hash = await async_w3.eth.send_transaction(
+        {"from": accounts[0], "to": accounts[1], "value": 1}
+    )
+    missing_hash = HexBytes("0x" + "01" * 32)
+
+    receipts = []
+    with pytest.raises(TimeExhausted, match=missing_hash.to_0x_hex()):
+        async for receipt in async_w3.eth.wait_for_transaction_receipts(
+            [txn_hash, missing_hash], timeout=RECEIPT_TIMEOUT
+        ):
+            receipts.append(receipt)
+
+    assert [receipt["transactionHash"] for receipt in receipts] == [txn_hash]
@@ -1,5 +1,9 @@
 import pytest
 
+from hexbytes import (
+    HexBytes,
+)
+
 from web3 import (
     Web3,
     constants,
@@ -8,6 +12,7 @@ from web3.exceptions import (
     Web3ValidationError,
 )
 from web3.gas_strategies.time_based import (
+    TimeBasedFeeOracle,
     construct_time_based_gas_price_strategy,
 )
 from web3.providers.base import (
@@ -122,31 +127,31 @@ def _get_block_by_something(method, params):
         raise AssertionError
 
 
-@pytest.mark.parametrize(
-    "strategy_params,expected",
-    (
-        # 80 second wait times
-        (dict(max_wait_seconds=80, sample_size=5, probability=98), 70),
-        (dict(max_wait_seconds=80, sample_size=5, probability=90), 25),
-        (dict(max_wait_seconds=80, sample_size=5, probability=50), 11),
-        # 60 second wait times
-        (dict(max_wait_seconds=60, sample_size=5, probability=98), 92),
-        (dict(max_wait_seconds=60, sample_size=5, probability=90), 49),
-        (dict(max_wait_seconds=60, sample_size=5, probability=50), 11),
-        # 40 second wait times
-        (dict(max_wait_seconds=40, sample_size=5, probability=98), 100),
-        (dict(max_wait_seconds=40, sample_size=5, probability=90), 81),
-        (dict(max_wait_seconds=40, sample_size=5, probability=50), 11),
-        # 20 second wait times
-        (dict(max_wait_seconds=20, sample_size=5, probability=98), 100),
-        (dict(max_wait_seconds=20, sample_size=5, probability=90), 100),
-        (dict(max_wait_seconds=20, sample_size=5, probability=50), 36),
-        # 80 second wait times, weighted
-        (dict(max_wait_seconds=80, sample_size=5, probability=98, weighted=True), 92),
-        (dict(max_wait_seconds=80, sample_size=5, probability=90, weighted=True), 49),
-        (dict(max_wait_seconds=80, sample_size=5, probability=50, weighted=True), 11),
-    ),
+TIME_BASED_STRATEGY_CASES = (
+    # 80 second wait times
+    (dict(max_wait_seconds=80, sample_size=5, probability=98), 70),
+    (dict(max_wait_seconds=80, sample_size=5, probability=90), 25),
+    (dict(max_wait_seconds=80, sample_size=5, probability=50), 11),
+    # 60 second wait times
+    (dict(max_wait_seconds=60, sample_size=5, probability=98), 92),
+    (dict(max_wait_seconds=60, sample_size=5, probability=90), 49),
+    (dict(max_wait_seconds=60, sample_size=5, probability=50), 11),
+    # 40 second wait times
+    (dict(max_wait_seconds=40, sample_size=5, probability=98), 100),
+    (dict(max_wait_seconds=40, sample_size=5, probability=90), 81),
+    (dict(max_wait_seconds=40, sample_size=5, probability=50), 11),
+    # 20 second wait times
+    (dict(max_wait_seconds=20, sample_size=5, probability=98), 100),
+    (dict(max_wait_seconds=20, sample_size=5, probability=90), 100),
+    (dict(max_wait_seconds=20, sample_size=5, probability=50), 36),
+    # 80 second wait times, weighted
+    (dict(max_wait_seconds=80, sample_size=5, probability=98, weighted=True), 92),
+    (dict(max_wait_seconds=80, sample_size=5, probability=90, weighted=True), 49),
+    (dict(max_wait_seconds=80, sample_size=5, probability=50, weighted=True), 11),
 )
+
+
+@pytest.mark.parametrize("strategy_params,expected", TIME_BASED_STRATEGY_CASES)
 def test_time_based_gas_price_strategy(strategy_params, expected, request_mocker):
     w3 = Web3(provider=BaseProvider())
 
@@ -277,3 +282,144 @@ def test_time_based_gas_price_strategy_zero_sample(
         ):
             w3.eth.generate_gas_price()
     assert str(excinfo.value) == expected_exception_message
+
+
+@pytest.mark.parametrize("strategy_params,expected", TIME_BASED_STRATEGY_CASES)
+def test_time_based_fee_oracle(strategy_params, expected, request_mocker):
+    w3 = Web3(provider=BaseProvider())
+    w3.eth.set_gas_price_strategy(TimeBasedFeeOracle(**strategy_params))
+    with request_mocker(
+        w3,
+        mock_results={
+            "eth_blockNumber": "0x5",
+            "eth_getBlockByHash": _get_block_by_something,
+            "eth_getBlockByNumber": _get_block_by_something,
+        },
+    ):
+        assert w3.eth.generate_gas_price() == expected
+
+
+class Chain:
+    def __init__(self, head):
+        self.head = head
+        self.fetched_blocks = []
+        self.fee_history_block_counts = []
+        # blocks from this height on are replaced by those of another branch
+        self.reorg_height = None
+
+    def block_number(self, _method, _params):
+        return hex(self.head)
+
+    def get_block_by_number(self, _method, params):
+        number = self.head if params[0] == "latest" else int(params[0], 16)
+        self.fetched_blocks.append(number)
+        return self.block(number)
+
+    def get_block_by_hash(self, _method, params):
+        return self.block(int(params[0][4:], 16) - 1)
+
+    def block_hash(self, number):
+        branch = int(self.reorg_height is not None and number >= self.reorg_height)
+        return f"0x{branch:02x}{number + 1:062x}"
+
+    def block(self, number):
+        return {
+            "hash": self.block_hash(number),
+            "number": number,
+            "parentHash": self.block_hash(number - 1),
+            "transactions": [{"gasPrice": 10 * number + index} for index in range(3)],
+            "miner": "0x" + f"{number % 3 + 1:02x}" * 20,
+            "timestamp": 12 * number,
+        }
+
+    def fee_history(self, _method, params):
+        block_count, newest = int(params[0], 16), int(params[1], 16)
+        self.fee_history_block_counts.append(block_count)
+        oldest = newest - block_count + 1
+        return {
+            "baseFeePerGas": [],
+            "gasUsedRatio": [],
+            "oldestBlock": hex(oldest),
+            "reward": [
+                [hex(10**9 + 10**7 * number)]
+                for number in range(oldest, newest + 1)
+            ],
+        }
+
+    def mock_results(self):
+        return {
+            "eth_blockNumber": self.block_number,
+            "eth_getBlockByNumber": self.get_block_by_number,
+            "eth_getBlockByHash": self.get_block_by_hash,
+            "eth_feeHistory": self.fee_history,
+        }
+
+
+def test_time_based_fee_oracle_only_fetches_new_blocks(request_mocker):
+    w3 = Web3(provider=BaseProvider())
+    oracle = TimeBasedFeeOracle(max_wait_seconds=60, sample_size=10)
+    chain = Chain(head=20)
+
+    with request_mocker(w3, mock_results=chain.mock_results()):
+        gas_price = oracle.generate_gas_price(w3)
+        assert chain.fetched_blocks == list(range(10, 21))
+
+        # no new block, only the latest block is fetched to compare its hash
+        assert oracle.generate_gas_price(w3) == gas_price
+        assert chain.fetched_blocks == [*range(10, 21), 20]
+
+        chain.head = 22
+        chain.fetched_blocks.clear()
+        incremental_gas_price = oracle.generate_gas_price(w3)
+        assert chain.fetched_blocks == [21, 22]
+
+    # the same gas price is computed from scratch
+    with request_mocker(w3, mock_results=chain.mock_results()):
+        strategy = construct_time_based_gas_price_strategy(60, sample_size=10)
+        w3.eth.set_gas_price_strategy(strategy)
+        assert w3.eth.generate_gas_price() == incremental_gas_price
+
+
+@pytest.mark.parametrize(
+    "new_head,expected_fetched_blocks",
+    (
+        # the new block's parent isn't the sampled tip
+        (21, [21, *range(11, 21)]),
+        # the sampled tip was replaced by a block at the same height
+        (20, [20, *range(10, 21)]),
+    ),
+)
+def test_time_based_fee_oracle_resamples_blocks_after_a_reorg(
+    request_mocker, new_head, expected_fetched_blocks
+):
+    w3 = Web3(provider=BaseProvider())
+    oracle = TimeBasedFeeOracle(max_wait_seconds=60, sample_size=10)
+    chain = Chain(head=20)
+
+    with request_mocker(w3, mock_results=chain.mock_results()):
+        oracle.generate_gas_price(w3)
+
+        chain.head = new_head
+        chain.reorg_height = 20
+        chain.fetched_blocks.clear()
+        oracle.generate_gas_price(w3)
+
+    assert chain.fetched_blocks == expected_fetched_blocks
+    assert [block.hash for block in oracle._blocks] == [
+        HexBytes(chain.block_hash(number))
+        for number in range(new_head - 10, new_head + 1)
+    ]
+
+
+def test_time_based_fee_oracle_max_priority_fee(request_mocker):
+    w3 = Web3(provider=BaseProvider())
+    oracle = TimeBasedFeeOracle(max_wait_seconds=60, sample_size=4)
+    chain = Chain(head=20)
+
+    with request_mocker(w3, mock_results=chain.mock_results()):
+        # average of the 5th percentile rewards of blocks 17 to 20
+        assert oracle.max_priority_fee(w3) == 10**9 + 10**7 * 18.5
+        chain.head = 21
+        assert oracle.max_priority_fee(w3) == 10**9 + 10**7 * 19.5
+
+    assert chain.fee_history_block_counts == [4, 1]
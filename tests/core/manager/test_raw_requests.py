@@ -0,0 +1,138 @@
+import pytest
+import asyncio
+
+from web3 import (
+    AsyncWeb3,
+    Web3,
+)
+from web3.datastructures import (
+    AttributeDict,
+)
+from web3.exceptions import (
+    BlockNotFound,
+)
+from web3.middleware import (
+    ExtraDataToPOAMiddleware,
+    PythonicMiddleware,
+)
+from web3.providers.eth_tester import (
+    AsyncEthereumTesterProvider,
+    EthereumTesterProvider,
+)
+from web3.tools.benchmark.payloads import (
+    build_block,
+    build_logs,
+)
+
+RAW_BLOCK = build_block(num_transactions=2)
+RAW_LOGS = build_logs(num_logs=3)
+MOCK_RESULTS = {
+    "eth_getBlockByNumber": lambda _method, params: (
+        # eth-tester request formatters convert block numbers to integers
+        None
+        if params[0] == 1000
+        else RAW_BLOCK
+    ),
+    "eth_getLogs": RAW_LOGS,
+    "eth_chainId": "0x1",
+}
+
+
+@pytest.fixture
+def w3():
+    return Web3(EthereumTesterProvider())
+
+
+@pytest.fixture
+def async_w3():
+    return AsyncWeb3(AsyncEthereumTesterProvider())
+
+
+def test_raw_requests_skip_result_formatting(w3, request_mocker):
+    with request_mocker(w3, mock_results=MOCK_RESULTS):
+        formatted = w3.eth.get_block(1)
+        assert isinstance(formatted, AttributeDict)
+        assert formatted["number"] == 20_000_000
+
+        with w3.manager.raw():
+            assert w3.manager.is_raw
+            raw_block = w3.eth.get_block(1)
+            raw_logs = w3.eth.get_logs({"fromBlock": 1})
+            assert w3.eth.chain_id == "0x1"
+
+        assert not w3.manager.is_raw
+        # formatting resumes outside of the context manager
+        assert w3.eth.chain_id == 1
+
+    assert raw_block == RAW_BLOCK
+    assert type(raw_block) is dict
+    assert raw_logs == RAW_LOGS
+    assert all(type(log) is dict for log in raw_logs)
+
+
+def test_raw_mode_is_per_manager_and_nests(w3):
+    other_w3 = Web3(EthereumTesterProvider())
+    with w3.manager.raw():
+        assert not other_w3.manager.is_raw
+        with other_w3.manager.raw():
+            assert w3.manager.is_raw and other_w3.manager.is_raw
+        assert w3.manager.is_raw
+        assert not other_w3.manager.is_raw
+    assert not w3.manager.is_raw
+
+
+def test_raw_requests_skip_pythonic_result_middleware(w3, request_mocker):
+    w3.middleware_onion.add(PythonicMiddleware, "pythonic")
+    w3.middleware_onion.inject(ExtraDataToPOAMiddleware, "poa", layer=0)
+
+    with request_mocker(w3, mock_results=MOCK_RESULTS):
+        with w3.manager.raw():
+            raw_block = w3.eth.get_block(1)
+        formatted = w3.eth.get_block(1)
+
+    assert raw_block == RAW_BLOCK
+    assert "proofOfAuthorityData" in formatted
+
+
+def test_raw_requests_still_apply_null_result_formatters(w3, request_mocker):
+    with request_mocker(w3, mock_results=MOCK_RESULTS):
+        with w3.manager.raw():
+            with pytest.raises(BlockNotFound):
+                w3.eth.get_block(1000)
+
+
+@pytest.mark.asyncio
+async def test_async_raw_requests_skip_result_formatting(async_w3, request_mocker):
+    async with request_mocker(async_w3, mock_results=MOCK_RESULTS):
+        formatted = await async_w3.eth.get_block(1)
+        assert isinstance(formatted, AttributeDict)
+
+        with async_w3.manager.raw():
+            raw_block = await async_w3.eth.get_block(1)
+            raw_logs = await async_w3.eth.get_logs({"fromBlock": 1})
+            with pytest.raises(BlockNotFound):
+                await async_w3.eth.get_block(1000)
+
+        assert await async_w3.eth.chain_id == 1
+
+    assert raw_block == RAW_BLOCK
+    assert type(raw_block) is dict
+    assert raw_logs == RAW_LOGS
+
+
+@pytest.mark.asyncio
+async def test_async_raw_mode_is_per_context(async_w3):
+    entered = asyncio.Event()
+    exited = asyncio.Event()
+
+    async def make_raw_requests():
+        with async_w3.manager.raw():
+            entered.set()
+            await exited.wait()
+
+    task = asyncio.create_task(make_raw_requests())
+    await entered.wait()
+    # raw mode entered by another task doesn't apply to this one
+    assert not async_w3.manager.is_raw
+    exited.set()
+    await task
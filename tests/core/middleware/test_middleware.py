@@ -1,6 +1,7 @@
 import pytest
 
 from web3 import (
+    AsyncWeb3,
     Web3,
 )
 from web3.exceptions import (
@@ -10,6 +11,12 @@ from web3.middleware import (
     FormattingMiddlewareBuilder,
     Web3Middleware,
 )
+from web3.providers.async_base import (
+    AsyncJSONBaseProvider,
+)
+from web3.providers.base import (
+    JSONBaseProvider,
+)
 
 
 class MockMiddleware(Web3Middleware):
@@ -79,3 +86,104 @@ def test_unnamed_class_middleware_are_given_unique_keys(w3):
     with pytest.raises(Web3ValueError):
         # adding the same middleware again should cause an error
         w3.middleware_onion.add(MockMiddleware)
+
+
+# -- method-scoped middleware -- #
+
+
+class CountingMiddleware(Web3Middleware):
+    handled_methods = ("eth_chainId",)
+    calls = []
+
+    def request_processor(self, method, params):
+        self.calls.append(method)
+        return method, params
+
+    async def async_request_processor(self, method, params):
+        self.calls.append(method)
+        return method, params
+
+
+class MethodScopedProvider(JSONBaseProvider):
+    def make_request(self, method, params):
+        return {"jsonrpc": "2.0", "id": 0, "result": "0x1"}
+
+    def make_batch_request(self, requests):
+        return [
+            {"jsonrpc": "2.0", "id": i, "result": "0x1"} for i in range(len(requests))
+        ]
+
+
+class AsyncMethodScopedProvider(AsyncJSONBaseProvider):
+    async def make_request(self, method, params):
+        return {"jsonrpc": "2.0", "id": 0, "result": "0x1"}
+
+
+@pytest.fixture
+def counting_middleware():
+    CountingMiddleware.calls = []
+    yield CountingMiddleware
+    CountingMiddleware.calls = []
+
+
+def test_method_scoped_middleware_only_runs_for_handled_methods(counting_middleware):
+    w3 = Web3(MethodScopedProvider(), middleware=[counting_middleware])
+
+    assert w3.eth.block_number == 1
+    assert w3.eth.gas_price == 1
+    assert counting_middleware.calls == []
+
+    assert w3.eth.chain_id == 1
+    assert counting_middleware.calls == ["eth_chainId"]
+
+
+def test_method_scoped_middleware_chain_is_rebuilt_when_onion_changes(
+    counting_middleware,
+):
+    w3 = Web3(MethodScopedProvider(), middleware=[])
+    assert w3.eth.chain_id == 1
+    assert counting_middleware.calls == []
+
+    w3.middleware_onion.add(counting_middleware)
+    assert w3.eth.chain_id == 1
+    assert counting_middleware.calls == ["eth_chainId"]
+
+
+def test_method_scoped_middleware_in_batch_requests(counting_middleware):
+    w3 = Web3(MethodScopedProvider(), middleware=[counting_middleware])
+
+    with w3.batch_requests() as batch:
+        batch.add(w3.eth.block_number)
+        batch.add(w3.eth.gas_price)
+        batch.execute()
+    assert counting_middleware.calls == []
+
+    with w3.batch_requests() as batch:
+        batch.add(w3.eth.block_number)
+        batch.add(w3.eth.chain_id)
+        batch.execute()
+    # layers handling any method in the batch process the whole batch
+    assert counting_middleware.calls == ["eth_blockNumber", "eth_chainId"]
+
+
+def test_formatting_middleware_handles_methods_with_formatters():
+    middleware = FormattingMiddlewareBuilder.build(
+        request_formatters={"eth_call": lambda x: x},
+        result_formatters={"eth_chainId": lambda x: x},
+    )(None)
+    assert middleware.handles_method("eth_call")
+    assert middleware.handles_method("eth_chainId")
+    assert not middleware.handles_method("eth_blockNumber")
+
+
+@pytest.mark.asyncio
+async def test_async_method_scoped_middleware_only_runs_for_handled_methods(
+    counting_middleware,
+):
+    async_w3 = AsyncWeb3(AsyncMethodScopedProvider(), middleware=[counting_middleware])
+
+    assert await async_w3.eth.block_number == 1
+    assert counting_middleware.calls == []
+
+    assert await async_w3.eth.chain_id == 1
+    assert counting_middleware.calls == ["eth_chainId"]
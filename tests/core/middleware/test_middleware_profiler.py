@@ -0,0 +1,162 @@
+import pytest
+import asyncio
+import time
+
+from web3 import (
+    AsyncWeb3,
+    Web3,
+)
+from web3.middleware import (
+    Web3Middleware,
+)
+from web3.providers.async_base import (
+    AsyncJSONBaseProvider,
+)
+from web3.providers.base import (
+    JSONBaseProvider,
+)
+from web3.utils import (
+    MiddlewareProfiler,
+)
+
+REQUEST_DELAY = 0.02
+RESPONSE_DELAY = 0.01
+PROVIDER_DELAY = 0.1
+
+
+class SlowProvider(JSONBaseProvider):
+    def make_request(self, method, params):
+        time.sleep(PROVIDER_DELAY)
+        return {"jsonrpc": "2.0", "id": 0, "result": "0x1"}
+
+    def make_batch_request(self, requests):
+        time.sleep(PROVIDER_DELAY)
+        return [
+            {"jsonrpc": "2.0", "id": i, "result": "0x1"} for i in range(len(requests))
+        ]
+
+
+class AsyncSlowProvider(AsyncJSONBaseProvider):
+    async def make_request(self, method, params):
+        await asyncio.sleep(PROVIDER_DELAY)
+        return {"jsonrpc": "2.0", "id": 0, "result": "0x1"}
+
+
+class SlowMiddleware(Web3Middleware):
+    def request_processor(self, method, params):
+        time.sleep(REQUEST_DELAY)
+        return method, params
+
+    def response_processor(self, method, response):
+        time.sleep(RESPONSE_DELAY)
+        return response
+
+    async def async_request_processor(self, method, params):
+        await asyncio.sleep(REQUEST_DELAY)
+        return method, params
+
+    async def async_response_processor(self, method, response):
+        await asyncio.sleep(RESPONSE_DELAY)
+        return response
+
+
+class PassThroughMiddleware(Web3Middleware):
+    pass
+
+
+def assert_slow_layers(rows, method, requests_per_call=1):
+    slow, provider = (
+        next(row for row in rows if row["layer"] == layer and row["method"] == method)
+        for layer in ("slow", "provider")
+    )
+    # the time in the next layers, and the provider, is left out of each layer's
+    # the processors of a batch are called for each of its requests
+    calls = slow["calls"] * requests_per_call
+    assert REQUEST_DELAY <= slow["request_seconds"] / calls < PROVIDER_DELAY
+    assert RESPONSE_DELAY <= slow["response_seconds"] / calls < PROVIDER_DELAY
+    assert provider["request_seconds"] / provider["calls"] >= PROVIDER_DELAY
+    assert provider["response_seconds"] == 0
+    totals = [row["total_seconds"] for row in rows]
+    assert totals == sorted(totals, reverse=True)
+
+
+def test_middleware_profiler():
+    w3 = Web3(
+        SlowProvider(),
+        middleware=[(SlowMiddleware, "slow"), (PassThroughMiddleware, "pass")],
+    )
+    assert w3.manager.middleware_profiler is None
+    w3.eth.chain_id  # the unprofiled chains are built, and cached, first
+
+    profiler = MiddlewareProfiler()
+    w3.manager.middleware_profiler = profiler
+    w3.eth.chain_id
+    w3.eth.chain_id
+
+    rows = profiler.snapshot()
+    assert {(row["layer"], row["method"], row["calls"]) for row in rows} == {
+        ("slow", "eth_chainId", 2),
+        ("pass", "eth_chainId", 2),
+        ("provider", "eth_chainId", 2),
+    }
+    assert_slow_layers(rows, "eth_chainId")
+
+    with w3.batch_requests() as batch:
+        batch.add(w3.eth.chain_id)
+        batch.add(w3.eth.block_number)
+        batch.execute()
+    assert_slow_layers(profiler.snapshot(), "batch", requests_per_call=2)
+    assert {row["layer"] for row in profiler.snapshot(by_method=False)} == {
+        "slow",
+        "pass",
+        "provider",
+    }
+
+    report = profiler.report()
+    assert report.splitlines()[0].split("|")[1:-1] == [
+        f"{heading:<32}" if i < 2 else f"{heading:>{14 if i > 2 else 10}}"
+        for i, heading in enumerate(
+            ("Layer", "Method", "Calls", "Request ms", "Response ms", "Total ms")
+        )
+    ]
+    assert len(report.splitlines()) == 2 + 6
+
+    profiler.reset()
+    assert profiler.snapshot() == []
+    w3.manager.middleware_profiler = None
+    w3.eth.chain_id
+    assert profiler.snapshot() == []
+
+
+def test_middleware_profiler_short_circuiting_middleware():
+    class CachedChainIdMiddleware(Web3Middleware):
+        def wrap_make_request(self, make_request):
+            def middleware(method, params):
+                if method == "eth_chainId":
+                    return {"jsonrpc": "2.0", "id": 0, "result": "0x1"}
+                return make_request(method, params)
+
+            return middleware
+
+    w3 = Web3(SlowProvider(), middleware=[(CachedChainIdMiddleware, "cached")])
+    profiler = MiddlewareProfiler()
+    w3.manager.middleware_profiler = profiler
+    w3.eth.chain_id
+
+    (row,) = profiler.snapshot()
+    assert row["layer"] == "cached"
+    assert row["request_seconds"] > 0
+    assert row["response_seconds"] == 0
+
+
+@pytest.mark.asyncio
+async def test_async_middleware_profiler():
+    async_w3 = AsyncWeb3(AsyncSlowProvider(), middleware=[(SlowMiddleware, "slow")])
+    profiler = MiddlewareProfiler()
+    async_w3.manager.middleware_profiler = profiler
+
+    await asyncio.gather(async_w3.eth.chain_id, async_w3.eth.chain_id)
+
+    rows = profiler.snapshot()
+    assert {row["calls"] for row in rows} == {2}
+    assert_slow_layers(rows, "eth_chainId")
@@ -1,4 +1,5 @@
 import pytest
+import json
 
 from eth.vm.forks.london.transactions import (
     DynamicFeeTransaction,
@@ -31,13 +32,21 @@ from hexbytes import (
 )
 import pytest_asyncio
 import rlp
+from websockets.asyncio.server import (
+    serve,
+)
 
 from web3 import (
     AsyncWeb3,
     Web3,
+    WebSocketProvider,
+)
+from web3._utils.transactions import (
+    fill_transaction_defaults,
 )
 from web3.exceptions import (
     InvalidAddress,
+    Web3RPCError,
 )
 from web3.middleware import (
     BufferedGasEstimateMiddleware,
@@ -54,6 +63,10 @@ from web3.providers.eth_tester import (
     AsyncEthereumTesterProvider,
     EthereumTesterProvider,
 )
+from web3.utils import (
+    AsyncNonceManager,
+    NonceManager,
+)
 
 PRIVATE_KEY_1 = to_bytes(
     hexstr="0x6a8b4de52b288e111c14e1c4b868bc125d325d40331d86d875a3467dd44bf829"
@@ -471,6 +484,55 @@ def test_sign_and_send_raw_middleware_with_buffered_gas_estimate_middleware(
     assert decoded_txn["gas"] == gas_estimate + gas_buffer
 
 
+def test_sign_and_send_raw_middleware_with_nonce_manager(w3, fund_account):
+    w3.middleware_onion.inject(
+        SignAndSendRawMiddlewareBuilder.build(PRIVATE_KEY_1), layer=0
+    )
+    nonce_manager = NonceManager()
+    w3.eth.set_nonce_manager(nonce_manager)
+
+    tx_hashes = [
+        w3.eth.send_transaction(
+            {"to": ADDRESS_2, "from": ADDRESS_1, "gas": 21000, "value": 1}
+        )
+        for _ in range(3)
+    ]
+
+    assert [w3.eth.get_transaction(tx_hash)["nonce"] for tx_hash in tx_hashes] == [
+        0,
+        1,
+        2,
+    ]
+    assert nonce_manager.pending_transactions(ADDRESS_1) == dict(enumerate(tx_hashes))
+
+    # the node has counted all sent transactions
+    assert nonce_manager.sync(w3, ADDRESS_1) == 3
+    assert nonce_manager.pending_transactions(ADDRESS_1) == {}
+
+
+def test_sign_and_send_raw_middleware_only_allocates_nonces_it_signs_with(
+    w3, fund_account
+):
+    w3.middleware_onion.inject(
+        SignAndSendRawMiddlewareBuilder.build(PRIVATE_KEY_1), layer=0
+    )
+    nonce_manager = NonceManager()
+    w3.eth.set_nonce_manager(nonce_manager)
+
+    # sent by the node, which fills in the nonce itself
+    w3.eth.send_transaction(
+        {"to": ADDRESS_2, "from": w3.eth.default_account, "gas": 21000, "value": 1}
+    )
+    assert not nonce_manager.is_synced(w3.eth.default_account)
+
+    # filling in the defaults, e.g. to build a transaction, doesn't allocate one
+    transaction = fill_transaction_defaults(
+        w3, {"to": ADDRESS_2, "from": ADDRESS_1, "value": 1}
+    )
+    assert "nonce" not in transaction
+    assert not nonce_manager.is_synced(ADDRESS_1)
+
+
 # -- async -- #
 
 
@@ -705,3 +767,76 @@ async def test_async_sign_and_send_raw_middleware_with_buffered_gas_estimate_mid
 
     decoded_txn = rlp.decode(HexBytes(raw_txn[4:]), sedes=DynamicFeeTransaction)
     assert decoded_txn["gas"] == gas_estimate + gas_buffer
+
+
+@pytest.mark.asyncio
+async def test_async_sign_and_send_raw_middleware_with_nonce_manager(
+    async_w3, async_fund_account
+):
+    async_w3.middleware_onion.inject(
+        SignAndSendRawMiddlewareBuilder.build(PRIVATE_KEY_1), layer=0
+    )
+    nonce_manager = AsyncNonceManager()
+    async_w3.eth.set_nonce_manager(nonce_manager)
+
+    tx_hashes = [
+        await async_w3.eth.send_transaction(
+            {"to": ADDRESS_2, "from": ADDRESS_1, "gas": 21000, "value": 1}
+        )
+        for _ in range(3)
+    ]
+
+    nonces = [(await async_w3.eth.get_transaction(h))["nonce"] for h in tx_hashes]
+    assert nonces == [0, 1, 2]
+    assert nonce_manager.pending_transactions(ADDRESS_1) == dict(enumerate(tx_hashes))
+    assert await nonce_manager.sync(async_w3, ADDRESS_1) == 3
+
+
+@pytest.mark.asyncio
+async def test_async_sign_and_send_raw_middleware_with_nonce_manager_over_websocket():
+    tx_hash = "0x" + "ab" * 32
+    sent_raw_transactions = []
+
+    async def node_handler(ws):
+        async for message in ws:
+            request = json.loads(message)
+            response = {"jsonrpc": "2.0", "id": request["id"]}
+            if request["method"] == "eth_getTransactionCount":
+                response["result"] = "0x5"
+            elif request["method"] == "eth_sendRawTransaction":
+                sent_raw_transactions.append(request["params"][0])
+                if len(sent_raw_transactions) == 1:
+                    response["error"] = {"code": -32000, "message": "rejected"}
+                else:
+                    response["result"] = tx_hash
+            else:
+                response["result"] = "0x1"
+            await ws.send(json.dumps(response))
+
+    transaction = {
+        "to": ADDRESS_2,
+        "from": ADDRESS_1,
+        "gas": 21000,
+        "gasPrice": 1,
+        "value": 1,
+        "chainId": 1,
+    }
+    nonce_manager = AsyncNonceManager()
+    async with serve(node_handler, "127.0.0.1", 0) as server:
+        port = server.sockets[0].getsockname()[1]
+        provider = WebSocketProvider(f"ws://127.0.0.1:{port}")
+        async with AsyncWeb3(provider, middleware=[]) as async_w3:
+            async_w3.middleware_onion.inject(
+                SignAndSendRawMiddlewareBuilder.build(PRIVATE_KEY_1), layer=0
+            )
+            async_w3.eth.set_nonce_manager(nonce_manager)
+
+            with pytest.raises(Web3RPCError, match="rejected"):
+                await async_w3.eth.send_transaction(transaction)
+            # the nonce of the rejected transaction is released and reused
+            assert await async_w3.eth.send_transaction(transaction) == HexBytes(tx_hash)
+
+    nonces = [rlp.decode(HexBytes(raw_tx))[0] for raw_tx in sent_raw_transactions]
+    assert nonces == [b"\x05", b"\x05"]
+    assert nonce_manager.pending_transactions(ADDRESS_1) == {5: HexBytes(tx_hash)}
+    assert nonce_manager._signed_nonces == {}
@@ -129,3 +129,22 @@ async def test_async_http_empty_batch_response(mock_async_post):
             await batch.async_execute()
 
     assert not async_w3.provider._is_batching
+
+
+@pytest.mark.asyncio
+async def test_async_http_stream_request():
+    response = b'{"jsonrpc":"2.0","id":0,"result":{"pending":{"0x1":{}},"queued":{}}}'
+
+    async def stream_post_request(*_args, **_kwargs):
+        for i in range(0, len(response), 5):
+            yield response[i : i + 5]
+
+    async_w3 = AsyncWeb3(AsyncHTTPProvider(URI))
+    with patch(
+        "web3._utils.http_session_manager.HTTPSessionManager.async_stream_post_request",
+        side_effect=stream_post_request,
+    ):
+        items = async_w3.manager.coro_request_stream(
+            "txpool_content", [], item_path=("result", "pending")
+        )
+        assert [item async for item in items] == [("0x1", {})]
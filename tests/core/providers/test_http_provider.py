@@ -23,6 +23,7 @@ from web3.eth import (
 from web3.exceptions import (
     ProviderConnectionError,
     Web3RPCError,
+    Web3TypeError,
 )
 from web3.geth import (
     Geth,
@@ -42,6 +43,9 @@ from web3.net import (
 from web3.providers import (
     HTTPProvider,
 )
+from web3.providers.eth_tester import (
+    EthereumTesterProvider,
+)
 
 URI = "http://mynode.local:8545"
 
@@ -225,3 +229,48 @@ def test_no_explicit_session_creates_per_thread_sessions():
             assert (
                 sessions[0] is not main_thread_session
             ), "Different threads should have different sessions"
+
+
+def _chunked(response, chunk_size=5):
+    return iter(
+        [response[i : i + chunk_size] for i in range(0, len(response), chunk_size)]
+    )
+
+
+@patch(
+    "web3._utils.http_session_manager.HTTPSessionManager.stream_post_request",
+    new_callable=Mock,
+)
+def test_http_stream_request(mock_stream_post):
+    mock_stream_post.return_value = _chunked(
+        b'{"jsonrpc":"2.0","id":0,"result":[{"action":{}},{"action":{"value":"0x1"}}]}'
+    )
+    w3 = Web3(HTTPProvider(URI))
+
+    items = w3.manager.request_stream("trace_replayBlockTransactions", ["0x1"])
+    assert next(items) == {"action": {}}
+    assert next(items) == {"action": {"value": "0x1"}}
+    assert list(items) == []
+
+    request_data = mock_stream_post.call_args.args[1]
+    assert b'"method": "trace_replayBlockTransactions"' in request_data
+
+
+@patch(
+    "web3._utils.http_session_manager.HTTPSessionManager.stream_post_request",
+    new_callable=Mock,
+)
+def test_http_stream_request_raises_error_response(mock_stream_post):
+    mock_stream_post.return_value = _chunked(
+        b'{"jsonrpc":"2.0","id":0,"error":{"code":-32000,"message":"not found"}}'
+    )
+    w3 = Web3(HTTPProvider(URI))
+
+    with pytest.raises(Web3RPCError, match="not found"):
+        list(w3.manager.request_stream("debug_traceTransaction", ["0x1"]))
+
+
+def test_stream_request_not_supported_by_provider():
+    w3 = Web3(EthereumTesterProvider())
+    with pytest.raises(Web3TypeError, match="Streaming responses are not supported"):
+        w3.manager.request_stream("eth_getLogs", [{}])
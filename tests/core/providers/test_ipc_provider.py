@@ -13,6 +13,9 @@ from unittest.mock import (
     patch,
 )
 
+from web3._utils.json_stream import (
+    JSONItemParser,
+)
 from web3.auto.gethdev import (
     w3,
 )
@@ -199,3 +202,70 @@ def test_ipc_provider_write_messages_end_with_new_line_delimiter(jsonrpc_ipc_pip
 
     request_data = b'{"jsonrpc": "2.0", "method": "method", "params": [], "id": 0}'
     provider._socket.sock.sendall.assert_called_with(request_data + b"\n")
+
+
+@pytest.fixture
+def serve_streamed_result(simple_ipc_server):
+    def reply():
+        connection, client_address = simple_ipc_server.accept()
+        try:
+            connection.recv(1024)
+            connection.sendall(b'{"id":0, "jsonrpc": "2.0", "result": [{"pc": 0}, ')
+            time.sleep(0.1)
+            connection.sendall(b'{"pc": 1}]}\n')
+        finally:
+            connection.close()
+            simple_ipc_server.close()
+
+    thd = Thread(target=reply, daemon=True)
+    thd.start()
+
+    try:
+        yield
+    finally:
+        thd.join()
+
+
+def test_sync_stream_request(jsonrpc_ipc_pipe_path, serve_streamed_result):
+    provider = IPCProvider(pathlib.Path(jsonrpc_ipc_pipe_path), timeout=3)
+    parser = JSONItemParser()
+
+    items = provider.make_stream_request("debug_traceBlockByNumber", ["0x1"], parser)
+    assert next(items) == {"pc": 0}
+    assert list(items) == [{"pc": 1}]
+    assert parser.document == {"id": 0, "jsonrpc": "2.0", "result": []}
+    # the stream's own connection is closed once it is consumed
+    assert provider._socket.sock is None
+
+
+def test_sync_stream_request_closed_early_closes_socket(jsonrpc_ipc_pipe_path):
+    provider = IPCProvider(pathlib.Path(jsonrpc_ipc_pipe_path), timeout=3)
+    stream_sock = Mock()
+    stream_sock.recv.return_value = b'{"id":0, "result": [1, 2, '
+
+    with patch("web3.providers.ipc.get_ipc_socket", return_value=stream_sock):
+        items = provider.make_stream_request("method", [], JSONItemParser())
+        assert next(items) == 1
+        items.close()
+
+    # the rest of the response is dropped along with the socket
+    stream_sock.close.assert_called_once_with()
+
+
+def test_sync_requests_can_be_made_while_a_stream_is_read(jsonrpc_ipc_pipe_path):
+    provider = IPCProvider(pathlib.Path(jsonrpc_ipc_pipe_path), timeout=3)
+    provider._socket.sock = Mock()
+    provider._socket.sock.recv.return_value = (
+        b'{"id":1, "jsonrpc": "2.0", "result": "0x1"}\n'
+    )
+    stream_sock = Mock()
+    stream_sock.recv.side_effect = [b'{"id":0, "result": [1, ', b"2]}"]
+
+    with patch("web3.providers.ipc.get_ipc_socket", return_value=stream_sock):
+        items = provider.make_stream_request("method", [], JSONItemParser())
+        assert next(items) == 1
+        # used to wait forever on the lock held by the stream
+        assert provider.make_request("eth_blockNumber", [])["result"] == "0x1"
+        assert list(items) == [2]
+
+    stream_sock.close.assert_called_once_with()
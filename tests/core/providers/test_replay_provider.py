@@ -0,0 +1,175 @@
+import pytest
+import json
+import time
+
+from web3 import (
+    AsyncWeb3,
+    Web3,
+)
+from web3.exceptions import (
+    Web3ValueError,
+)
+from web3.providers import (
+    AsyncRecordingProvider,
+    AsyncReplayProvider,
+    RecordingProvider,
+    ReplayProvider,
+)
+from web3.providers.async_base import (
+    AsyncJSONBaseProvider,
+)
+from web3.providers.base import (
+    JSONBaseProvider,
+)
+
+NODE_LATENCY = 0.05
+BLOCK = {
+    "number": "0x10",
+    "hash": "0x" + "ab" * 32,
+    "parentHash": "0x" + "cd" * 32,
+    "timestamp": "0x5f5e100",
+    "transactions": [],
+}
+
+
+class FakeNode:
+    def __init__(self):
+        self.block_number = 16
+
+    def response(self, request_id, method, params):
+        if method == "eth_blockNumber":
+            self.block_number += 1
+            result = hex(self.block_number)
+        elif method == "eth_getBlockByNumber":
+            result = {**BLOCK, "number": params[0]}
+        else:
+            result = "0x1"
+        return {"jsonrpc": "2.0", "id": request_id, "result": result}
+
+
+class NodeProvider(JSONBaseProvider):
+    def __init__(self):
+        super().__init__()
+        self.node = FakeNode()
+
+    def make_request(self, method, params):
+        time.sleep(NODE_LATENCY)
+        return self.node.response(next(self.request_counter), method, params)
+
+    def make_batch_request(self, requests):
+        return [
+            self.node.response(next(self.request_counter), method, params)
+            for method, params in requests
+        ]
+
+
+class AsyncNodeProvider(AsyncJSONBaseProvider):
+    def __init__(self):
+        super().__init__()
+        self.node = FakeNode()
+        self.connected = True
+
+    async def make_request(self, method, params):
+        return self.node.response(next(self.request_counter), method, params)
+
+    async def connect(self):
+        self.connected = True
+
+    async def disconnect(self):
+        self.connected = False
+
+
+@pytest.mark.parametrize("file_name", ("recording.jsonl", "recording.jsonl.gz"))
+def test_record_and_replay(tmp_path, file_name):
+    path = tmp_path / file_name
+    recording_provider = RecordingProvider(NodeProvider(), path)
+    w3 = Web3(recording_provider)
+    recorded_numbers = [w3.eth.block_number, w3.eth.block_number]
+    recorded_block = w3.eth.get_block(16)
+    with w3.batch_requests() as batch:
+        batch.add(w3.eth.chain_id)
+        batch.add(w3.eth.get_block(17))
+        recorded_batch = batch.execute()
+    recording_provider.close()
+
+    replay_w3 = Web3(ReplayProvider(path))
+    # repeated requests get their responses in the order they were recorded
+    assert [replay_w3.eth.block_number for _ in range(3)] == [
+        *recorded_numbers,
+        recorded_numbers[0],
+    ]
+    assert replay_w3.eth.get_block(16) == recorded_block
+    with replay_w3.batch_requests() as batch:
+        batch.add(replay_w3.eth.chain_id)
+        batch.add(replay_w3.eth.get_block(17))
+        assert batch.execute() == recorded_batch
+
+    with pytest.raises(Web3ValueError, match="No response to eth_getBlockByNumber"):
+        replay_w3.eth.get_block(18)
+
+
+def test_recording_format(tmp_path):
+    path = tmp_path / "recording.jsonl"
+    recording_provider = RecordingProvider(NodeProvider(), path)
+    Web3(recording_provider).eth.get_block(16)
+    recording_provider.close()
+
+    (entry,) = map(json.loads, path.read_text().splitlines())
+    assert entry["method"] == "eth_getBlockByNumber"
+    assert entry["params"] == ["0x10", False]
+    assert json.loads(entry["response"])["result"]["hash"] == BLOCK["hash"]
+    assert entry["elapsed"] >= NODE_LATENCY
+
+
+def test_replay_latency(tmp_path):
+    path = tmp_path / "recording.jsonl"
+    recording_provider = RecordingProvider(NodeProvider(), path)
+    Web3(recording_provider).eth.chain_id
+    recording_provider.close()
+
+    for latency_scale, expected in ((0, 0), (1, NODE_LATENCY), (2, 2 * NODE_LATENCY)):
+        w3 = Web3(ReplayProvider(path, latency_scale=latency_scale))
+        started = time.perf_counter()
+        w3.eth.chain_id
+        elapsed = time.perf_counter() - started
+        assert expected <= elapsed < expected + NODE_LATENCY
+
+
+def test_replay_with_request_caching(tmp_path):
+    path = tmp_path / "recording.jsonl"
+    recording_provider = RecordingProvider(NodeProvider(), path)
+    w3 = Web3(recording_provider)
+    first_number, second_number = w3.eth.block_number, w3.eth.block_number
+    recording_provider.close()
+
+    w3 = Web3(
+        ReplayProvider(
+            path,
+            cache_allowed_requests=True,
+            cacheable_requests={"eth_blockNumber"},
+        )
+    )
+    assert w3.eth.block_number == first_number
+    # the cached response, not the next recorded one
+    assert w3.eth.block_number == first_number != second_number
+
+
+@pytest.mark.asyncio
+async def test_async_record_and_replay(tmp_path):
+    path = tmp_path / "recording.jsonl"
+    node_provider = AsyncNodeProvider()
+    recording_provider = AsyncRecordingProvider(node_provider, path)
+    async_w3 = AsyncWeb3(recording_provider)
+    try:
+        recorded_number = await async_w3.eth.block_number
+        recorded_block = await async_w3.eth.get_block(16)
+    finally:
+        recording_provider.close()
+        await recording_provider.disconnect()
+    assert not node_provider.connected
+
+    async_w3 = AsyncWeb3(AsyncReplayProvider(path))
+    assert await async_w3.eth.block_number == recorded_number
+    assert await async_w3.eth.get_block(16) == recorded_block
+    # recordings are the same for sync and async providers
+    assert Web3(ReplayProvider(path)).eth.get_block(16) == recorded_block
@@ -0,0 +1,199 @@
+import pytest
+import asyncio
+from collections import (
+    Counter,
+)
+import itertools
+import json
+
+import pytest_asyncio
+from websockets.asyncio.server import (
+    serve,
+)
+
+from web3 import (
+    AsyncWeb3,
+)
+from web3.exceptions import (
+    Web3ValueError,
+)
+from web3.providers.persistent import (
+    WebSocketPoolProvider,
+)
+
+REQUEST_DELAY = 0.05
+SUBSCRIPTION_MESSAGES = 3
+TX_HASH = "0x" + "ab" * 32
+
+
+class PoolNode:
+    """
+    A websocket node that counts the requests it gets on each connection. As with a
+    real node, subscriptions only exist on the connection they were made on.
+    """
+
+    def __init__(self):
+        self.subscription_ids = itertools.count(1)
+        self.requests = Counter()
+
+    async def handler(self, ws):
+        # connections are told apart by the client's port
+        connection_id = ws.remote_address[1]
+        subscriptions = set()
+        async for message in ws:
+            request = json.loads(message)
+            if isinstance(request, list):
+                responses = [
+                    await self.respond(connection_id, subscriptions, batched)
+                    for batched in request
+                ]
+                await ws.send(json.dumps(responses))
+                continue
+
+            await ws.send(
+                json.dumps(await self.respond(connection_id, subscriptions, request))
+            )
+            if request["method"] == "eth_subscribe":
+                for _ in range(SUBSCRIPTION_MESSAGES):
+                    await ws.send(
+                        json.dumps(
+                            {
+                                "jsonrpc": "2.0",
+                                "method": "eth_subscription",
+                                "params": {
+                                    "subscription": hex(self.last_subscription_id),
+                                    "result": TX_HASH,
+                                },
+                            }
+                        )
+                    )
+
+    async def respond(self, connection_id, subscriptions, request):
+        method = request["method"]
+        self.requests[(connection_id, method)] += 1
+        if method == "eth_subscribe":
+            self.last_subscription_id = next(self.subscription_ids)
+            result = hex(self.last_subscription_id)
+            subscriptions.add(result)
+        elif method == "eth_unsubscribe":
+            result = request["params"][0] in subscriptions
+            subscriptions.discard(request["params"][0])
+        else:
+            await asyncio.sleep(REQUEST_DELAY)
+            result = "0x1"
+        return {"jsonrpc": "2.0", "id": request["id"], "result": result}
+
+    def connection_requests(self, method):
+        return Counter(
+            {
+                connection_id: count
+                for (connection_id, requested), count in self.requests.items()
+                if requested == method
+            }
+        )
+
+
+@pytest_asyncio.fixture
+async def pool_node():
+    node = PoolNode()
+    async with serve(node.handler, "127.0.0.1", 0) as server:
+        port = server.sockets[0].getsockname()[1]
+        node.uri = f"ws://127.0.0.1:{port}"
+        yield node
+
+
+def connection_ports(provider):
+    return {
+        connection.name: connection.ws.local_address[1]
+        for connection in provider._connections
+    }
+
+
+@pytest.mark.parametrize(
+    "pool_size,subscription_pool_size", ((0, 1), (1, -1)), ids=("no-pool", "negative")
+)
+def test_websocket_pool_provider_validates_pool_sizes(
+    pool_size, subscription_pool_size
+):
+    with pytest.raises(Web3ValueError):
+        WebSocketPoolProvider(
+            "ws://mocked",
+            pool_size=pool_size,
+            subscription_pool_size=subscription_pool_size,
+        )
+
+
+@pytest.mark.asyncio
+async def test_websocket_pool_provider_spreads_requests(pool_node):
+    provider = WebSocketPoolProvider(pool_node.uri, pool_size=4)
+    async with AsyncWeb3(provider) as w3:
+        assert await w3.is_connected()
+        ports = connection_ports(provider)
+        assert await asyncio.gather(*(w3.eth.chain_id for _ in range(8))) == [1] * 8
+        assert set(provider.in_flight().values()) == {0}
+
+        async with w3.batch_requests() as batch:
+            batch.add(w3.eth.chain_id)
+            batch.add(w3.eth.chain_id)
+            assert await batch.async_execute() == [1, 1]
+
+    # each request connection got two requests, and the first also got the batch
+    assert pool_node.connection_requests("eth_chainId") == Counter(
+        {
+            ports["request-0"]: 2 + 2,
+            ports["request-1"]: 2,
+            ports["request-2"]: 2,
+            ports["request-3"]: 2,
+        }
+    )
+    assert not await provider.is_connected()
+
+
+@pytest.mark.asyncio
+async def test_websocket_pool_provider_counts_each_batch_in_flight(mocker):
+    provider = WebSocketPoolProvider("ws://mocked", pool_size=1)
+    mocker.patch.object(provider, "_send_over")
+    connection = provider._request_connections[0]
+
+    await provider.send_batch_request([("eth_chainId", [])])
+    await provider.send_batch_request([("eth_blockNumber", [])])
+    assert provider.in_flight() == {"request-0": 2, "subscription-0": 0}
+
+    connection.settle([{"jsonrpc": "2.0", "id": 0, "result": "0x1"}])
+    assert provider.in_flight() == {"request-0": 1, "subscription-0": 0}
+    connection.settle([{"jsonrpc": "2.0", "id": 1, "result": "0x1"}])
+    assert provider.in_flight() == {"request-0": 0, "subscription-0": 0}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("subscription_pool_size", (1, 0))
+async def test_websocket_pool_provider_pins_subscriptions(
+    pool_node, subscription_pool_size
+):
+    provider = WebSocketPoolProvider(
+        pool_node.uri, pool_size=2, subscription_pool_size=subscription_pool_size
+    )
+    async with AsyncWeb3(provider) as w3:
+        ports = connection_ports(provider)
+        subscription_id = await w3.eth.subscribe("newPendingTransactions")
+        messages = []
+        async for message in w3.socket.process_subscriptions():
+            assert message["subscription"] == subscription_id
+            messages.append(message["result"])
+            if len(messages) == SUBSCRIPTION_MESSAGES:
+                break
+
+        # the subscription is cancelled on the connection that holds it, busy or not
+        slow_request = asyncio.create_task(w3.eth.chain_id)
+        await asyncio.sleep(0)
+        assert await w3.eth.unsubscribe(subscription_id)
+        await slow_request
+
+    subscribed_on = pool_node.connection_requests("eth_subscribe")
+    assert subscribed_on == pool_node.connection_requests("eth_unsubscribe")
+    if subscription_pool_size:
+        assert subscribed_on == Counter({ports["subscription-0"]: 1})
+        assert pool_node.connection_requests("eth_chainId").keys() <= {
+            ports["request-0"],
+            ports["request-1"],
+        }
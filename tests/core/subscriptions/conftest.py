@@ -0,0 +1,33 @@
+import pytest
+import itertools
+from unittest.mock import (
+    AsyncMock,
+)
+
+import pytest_asyncio
+
+from web3 import (
+    AsyncWeb3,
+    PersistentConnectionProvider,
+)
+
+
+class MockProvider(PersistentConnectionProvider):
+    socket_recv = AsyncMock()
+    socket_send = AsyncMock()
+
+
+@pytest.fixture
+def provider_kwargs():
+    return {}
+
+
+@pytest_asyncio.fixture
+async def subscription_manager(provider_kwargs):
+    counter = itertools.count()
+    w3 = AsyncWeb3(MockProvider(**provider_kwargs))
+    w3.eth._subscribe = AsyncMock()
+    w3.eth._subscribe.side_effect = lambda *_: f"0x{str(next(counter))}"
+    w3.eth._unsubscribe = AsyncMock()
+    w3.eth._unsubscribe.return_value = True
+    yield w3.subscription_manager
@@ -0,0 +1,131 @@
+import pytest
+from unittest.mock import (
+    AsyncMock,
+)
+
+import pytest_asyncio
+
+from web3.utils.subscriptions import (
+    BackpressurePolicy,
+    LogsSubscription,
+    NewHeadsSubscription,
+)
+
+ADDRESS = "0x" + "11" * 20
+
+
+@pytest_asyncio.fixture
+async def subscription_manager(subscription_manager):
+    subscription_manager.share_subscriptions = True
+    yield subscription_manager
+
+
+async def receive_message(manager, sub_id, result):
+    request_processor = manager._provider._request_processor
+    request_processor.cache_request_information(
+        request_id=sub_id,
+        method="eth_subscribe",
+        params=[],
+        response_formatters=((), (), ()),
+    )
+    await request_processor.cache_raw_response(
+        {
+            "jsonrpc": "2.0",
+            "method": "eth_subscription",
+            "params": {"subscription": sub_id, "result": result},
+        },
+        subscription=True,
+    )
+
+
+@pytest.mark.asyncio
+async def test_subscriptions_with_the_same_params_share_a_subscription(
+    subscription_manager,
+):
+    handled = []
+
+    def handler_for(name):
+        async def handler(context):
+            handled.append((name, context.result))
+            if len(handled) == 3:
+                await subscription_manager.unsubscribe_all()
+
+        return handler
+
+    heads_subs = [
+        NewHeadsSubscription(label=f"heads-{i}", handler=handler_for(f"heads-{i}"))
+        for i in range(2)
+    ]
+    logs_sub = LogsSubscription(address=ADDRESS, handler=handler_for("logs"))
+    other_logs_sub = LogsSubscription(address=[ADDRESS], handler=AsyncMock())
+
+    sub_ids = await subscription_manager.subscribe(
+        [*heads_subs, logs_sub, other_logs_sub]
+    )
+    assert sub_ids == ["0x0", "0x0", "0x1", "0x2"]
+    assert subscription_manager._w3.eth._subscribe.await_count == 3
+    assert subscription_manager.get_by_id("0x0") is heads_subs[0]
+
+    # one message for each subscription sharing it
+    await receive_message(subscription_manager, "0x0", "0xa")
+    await receive_message(subscription_manager, "0x1", "0xb")
+    await subscription_manager.handle_subscriptions()
+    assert handled == [("heads-0", "0xa"), ("heads-1", "0xa"), ("logs", "0xb")]
+
+
+@pytest.mark.asyncio
+async def test_subscriptions_with_different_backpressure_do_not_share(
+    subscription_manager,
+):
+    block_sub = NewHeadsSubscription(label="block")
+    drop_sub = NewHeadsSubscription(
+        label="drop", backpressure=BackpressurePolicy.DROP_NEWEST
+    )
+    other_block_sub = NewHeadsSubscription(
+        label="other block", backpressure=BackpressurePolicy.BLOCK
+    )
+
+    sub_ids = await subscription_manager.subscribe(
+        [drop_sub, block_sub, other_block_sub]
+    )
+    assert sub_ids == ["0x0", "0x1", "0x1"]
+    assert subscription_manager._w3.eth._subscribe.await_count == 2
+    assert subscription_manager.get_by_id("0x1") is block_sub
+
+
+@pytest.mark.asyncio
+async def test_shared_subscriptions_are_unsubscribed_from_by_the_last_one(
+    subscription_manager,
+):
+    subs = [NewHeadsSubscription(label=f"heads-{i}") for i in range(3)]
+    await subscription_manager.subscribe(subs)
+    unsubscribe = subscription_manager._w3.eth._unsubscribe
+
+    assert await subs[0].unsubscribe()
+    # the next subscription takes over the shared subscription
+    assert subscription_manager.get_by_id("0x0") is subs[1]
+    assert await subs[2].unsubscribe()
+    assert unsubscribe.await_count == 0
+
+    assert await subs[1].unsubscribe()
+    unsubscribe.assert_awaited_once_with("0x0")
+    sub_container = subscription_manager._subscription_container
+    assert sub_container.subscriptions_by_id == {}
+    assert sub_container.shared_subscriptions_by_id == {}
+
+    # a new subscription is made once none is left to share
+    assert await subscription_manager.subscribe(NewHeadsSubscription()) == "0x1"
+
+
+@pytest.mark.asyncio
+async def test_shared_subscription_messages_are_also_yielded_by_the_message_stream(
+    subscription_manager,
+):
+    handler_sub = NewHeadsSubscription(handler=AsyncMock())
+    stream_sub = NewHeadsSubscription(label="stream")
+    await subscription_manager.subscribe([handler_sub, stream_sub])
+
+    await receive_message(subscription_manager, "0x0", "0xa")
+    request_processor = subscription_manager._provider._request_processor
+    assert request_processor._handler_subscription_queue.qsize() == 1
+    assert request_processor._subscription_response_queue.qsize() == 1
@@ -0,0 +1,114 @@
+import pytest
+import asyncio
+
+from web3.utils.subscriptions import (
+    BackpressurePolicy,
+    NewHeadsSubscription,
+)
+
+QUEUE_SIZE = 3
+
+
+@pytest.fixture
+def provider_kwargs():
+    return {"subscription_response_queue_size": QUEUE_SIZE}
+
+
+def head_message(sub_id, number):
+    return {
+        "jsonrpc": "2.0",
+        "method": "eth_subscription",
+        "params": {"subscription": sub_id, "result": {"number": number}},
+    }
+
+
+async def cache_heads(manager, sub, numbers):
+    for number in numbers:
+        await manager._provider._request_processor.cache_raw_response(
+            head_message(sub.id, number), subscription=True
+        )
+
+
+def queued_heads(manager, sub):
+    queue = manager._provider._request_processor._subscription_response_queue
+    return [
+        message["params"]["result"]["number"]
+        for message in queue._queue
+        if message["params"]["subscription"] == sub.id
+    ]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "policy,expected_heads,expected_dropped",
+    (
+        (BackpressurePolicy.DROP_OLDEST, [3, 4, 5], 2),
+        (BackpressurePolicy.DROP_NEWEST, [1, 2, 3], 2),
+        (BackpressurePolicy.COALESCE, [5], 4),
+    ),
+)
+async def test_subscription_backpressure_policies(
+    subscription_manager, policy, expected_heads, expected_dropped
+):
+    sub = NewHeadsSubscription(backpressure=policy)
+    await subscription_manager.subscribe(sub)
+
+    # the queue is never waited on, so this doesn't block with a full queue
+    await asyncio.wait_for(cache_heads(subscription_manager, sub, range(1, 6)), 1)
+
+    assert queued_heads(subscription_manager, sub) == expected_heads
+    assert sub.dropped_message_count == expected_dropped
+    stats = subscription_manager.queue_stats()["subscription_response_queue"]
+    assert stats == {
+        "depth": len(expected_heads),
+        "max_depth": len(expected_heads),
+        "dropped": expected_dropped,
+    }
+
+
+@pytest.mark.asyncio
+async def test_subscription_backpressure_only_drops_the_subscriptions_messages(
+    subscription_manager,
+):
+    blocking_sub = NewHeadsSubscription(label="blocking")
+    dropping_sub = NewHeadsSubscription(
+        label="dropping", backpressure=BackpressurePolicy.DROP_OLDEST
+    )
+    await subscription_manager.subscribe([blocking_sub, dropping_sub])
+
+    await cache_heads(subscription_manager, dropping_sub, [1])
+    await cache_heads(subscription_manager, blocking_sub, [1, 2])
+    await cache_heads(subscription_manager, dropping_sub, [2])
+
+    assert queued_heads(subscription_manager, blocking_sub) == [1, 2]
+    assert queued_heads(subscription_manager, dropping_sub) == [2]
+
+    # with none of its own messages queued, a message can't make room for itself
+    coalescing_sub = NewHeadsSubscription(
+        label="coalescing", backpressure=BackpressurePolicy.COALESCE
+    )
+    await subscription_manager.subscribe(coalescing_sub)
+    await cache_heads(subscription_manager, coalescing_sub, [1])
+    assert queued_heads(subscription_manager, coalescing_sub) == []
+    assert coalescing_sub.dropped_message_count == 1
+    assert blocking_sub.dropped_message_count == 0
+
+
+@pytest.mark.asyncio
+async def test_subscription_queue_high_water_mark_handler(subscription_manager):
+    alerts = []
+    subscription_manager.high_water_mark = 2
+    subscription_manager.high_water_mark_handler = lambda *alert: alerts.append(alert)
+    sub = NewHeadsSubscription(backpressure=BackpressurePolicy.DROP_NEWEST)
+    await subscription_manager.subscribe(sub)
+
+    await cache_heads(subscription_manager, sub, [1, 2, 3, 4])
+    assert alerts == [("subscription_response_queue", 2)]
+
+    # called again once the queue drops below the mark and fills up again
+    request_processor = subscription_manager._provider._request_processor
+    queue = request_processor._subscription_response_queue
+    queue.get_nowait()
+    queue.get_nowait()
+    await cache_heads(subscription_manager, sub, [5, 6])
+    assert alerts == [("subscription_response_queue", 2)] * 2
@@ -0,0 +1,123 @@
+import pytest
+import asyncio
+from concurrent.futures import (
+    ThreadPoolExecutor,
+)
+import threading
+from unittest.mock import (
+    AsyncMock,
+)
+
+from web3.exceptions import (
+    SubscriptionHandlerTaskException,
+    SubscriptionProcessingFinished,
+    Web3ValueError,
+)
+from web3.utils.subscriptions import (
+    NewHeadsSubscription,
+)
+
+
+async def subscribe_and_queue_messages(manager, subs, messages_per_sub):
+    request_processor = manager._provider._request_processor
+    for sub in subs:
+        await manager.subscribe(sub)
+        request_processor.cache_request_information(
+            request_id=sub.id,
+            method="eth_subscribe",
+            params=[],
+            response_formatters=((), (), ()),
+        )
+    for number in range(messages_per_sub):
+        for sub in subs:
+            request_processor._handler_subscription_queue.put_nowait(
+                {
+                    "jsonrpc": "2.0",
+                    "method": "eth_subscription",
+                    "params": {"subscription": sub.id, "result": number},
+                }
+            )
+
+
+@pytest.mark.asyncio
+async def test_handler_lanes_keep_order_with_bounded_concurrency(
+    subscription_manager,
+):
+    subscription_manager.max_concurrent_handlers = 2
+    handled = {"slow": [], "medium": [], "fast": []}
+    delays = {"slow": 0.03, "medium": 0.02, "fast": 0.01}
+    running = 0
+    most_running = 0
+    stats = {}
+
+    async def handler(context):
+        nonlocal running, most_running
+        running += 1
+        most_running = max(most_running, running)
+        await asyncio.sleep(delays[context.subscription.label])
+        running -= 1
+        handled[context.subscription.label].append(context.result)
+
+        if sum(len(results) for results in handled.values()) == 9:
+            stats.update(subscription_manager.lane_stats())
+            await subscription_manager.unsubscribe_all()
+
+    subs = [NewHeadsSubscription(label=label, handler=handler) for label in handled]
+    await subscribe_and_queue_messages(subscription_manager, subs, 3)
+    await asyncio.wait_for(subscription_manager.handle_subscriptions(), 5)
+
+    assert handled == {"slow": [0, 1, 2], "medium": [0, 1, 2], "fast": [0, 1, 2]}
+    assert most_running == 2
+    assert stats.keys() == handled.keys()
+    for lane_stats in stats.values():
+        assert lane_stats["depth"] == 0
+        assert lane_stats["max_latency"] >= lane_stats["mean_latency"] > 0
+    # the lane of the last handler call hasn't recorded it yet
+    assert sum(lane_stats["handled"] for lane_stats in stats.values()) == 8
+    assert subscription_manager._tasks == set()
+    assert subscription_manager.lane_stats() == {}
+
+
+@pytest.mark.asyncio
+async def test_handler_lanes_raise_handler_exceptions(subscription_manager):
+    subscription_manager.max_concurrent_handlers = 1
+
+    async def handler(context):
+        if context.result == 1:
+            raise ValueError("handler failed")
+
+    await subscribe_and_queue_messages(
+        subscription_manager, [NewHeadsSubscription(handler=handler)], 5
+    )
+    with pytest.raises(SubscriptionHandlerTaskException, match="handler failed"):
+        await asyncio.wait_for(subscription_manager.handle_subscriptions(), 5)
+
+    assert subscription_manager._tasks == set()
+
+
+@pytest.mark.asyncio
+async def test_handler_lanes_validate_max_concurrent_handlers(subscription_manager):
+    subscription_manager.max_concurrent_handlers = 0
+    await subscription_manager.subscribe(NewHeadsSubscription(handler=AsyncMock()))
+    with pytest.raises(Web3ValueError):
+        await subscription_manager.handle_subscriptions()
+
+
+@pytest.mark.asyncio
+async def test_subscription_handler_runs_in_executor(subscription_manager):
+    results = []
+
+    def handler(result):
+        results.append((result, threading.current_thread().name))
+
+    with ThreadPoolExecutor(thread_name_prefix="handlers") as executor:
+        sub = NewHeadsSubscription(handler=handler, executor=executor)
+        await subscribe_and_queue_messages(subscription_manager, [sub], 2)
+        subscription_manager._provider._request_processor._handler_subscription_queue.put_nowait(  # noqa: E501
+            SubscriptionProcessingFinished()
+        )
+        await asyncio.wait_for(subscription_manager.handle_subscriptions(), 5)
+
+    assert [result for result, _thread in results] == [0, 1]
+    assert all(thread.startswith("handlers") for _result, thread in results)
+    assert sub.handler_call_count == 2
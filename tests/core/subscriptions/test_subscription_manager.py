@@ -1,23 +1,14 @@
 import pytest
 import asyncio
-import itertools
 import time
 from typing import (
     cast,
 )
-from unittest.mock import (
-    AsyncMock,
-)
 
 from eth_typing import (
     HexStr,
 )
-import pytest_asyncio
 
-from web3 import (
-    AsyncWeb3,
-    PersistentConnectionProvider,
-)
 from web3.exceptions import (
     SubscriptionHandlerTaskException,
     Web3ValueError,
@@ -35,22 +26,6 @@ from web3.utils.subscriptions import (
 )
 
 
-class MockProvider(PersistentConnectionProvider):
-    socket_recv = AsyncMock()
-    socket_send = AsyncMock()
-
-
-@pytest_asyncio.fixture
-async def subscription_manager():
-    countr = itertools.count()
-    w3 = AsyncWeb3(MockProvider())
-    w3.eth._subscribe = AsyncMock()
-    w3.eth._subscribe.side_effect = lambda *_: f"0x{str(next(countr))}"
-    w3.eth._unsubscribe = AsyncMock()
-    w3.eth._unsubscribe.return_value = True
-    yield w3.subscription_manager
-
-
 def create_subscription_message(sub_id):
     return cast(
         RPCResponse,
@@ -0,0 +1,277 @@
+import pytest
+import asyncio
+import json
+
+import pytest_asyncio
+from websockets.asyncio.server import (
+    serve,
+)
+
+from web3 import (
+    AsyncWeb3,
+    WebSocketProvider,
+)
+from web3.exceptions import (
+    ProviderConnectionError,
+)
+from web3.utils.subscriptions import (
+    LogsSubscription,
+    NewHeadsSubscription,
+)
+
+ADDRESS = "0x" + "11" * 20
+
+
+def block_hash(number):
+    return f"0x{number:064x}"
+
+
+class ChainNode:
+    """
+    A websocket node that mines a block, with one log, on demand. Its subscriptions
+    are lost when it drops its connections.
+    """
+
+    def __init__(self):
+        self.block_number = 0
+        self.subscriptions = {}
+        self.connections = set()
+
+    def header(self, number):
+        return {
+            "number": hex(number),
+            "hash": block_hash(number),
+            "parentHash": block_hash(number - 1),
+        }
+
+    def logs(self, from_block, to_block):
+        return [
+            {
+                "address": ADDRESS,
+                "blockNumber": hex(number),
+                "blockHash": block_hash(number),
+                "logIndex": "0x0",
+                "transactionHash": block_hash(number),
+                "transactionIndex": "0x0",
+                "data": "0x",
+                "topics": [],
+                "removed": False,
+            }
+            for number in range(from_block, min(to_block, self.block_number) + 1)
+        ]
+
+    def mine(self):
+        self.block_number += 1
+        for subscription_id, (ws, kind) in self.subscriptions.items():
+            result = (
+                self.header(self.block_number)
+                if kind == "newHeads"
+                else self.logs(self.block_number, self.block_number)[0]
+            )
+            message = {
+                "jsonrpc": "2.0",
+                "method": "eth_subscription",
+                "params": {"subscription": subscription_id, "result": result},
+            }
+            asyncio.create_task(ws.send(json.dumps(message)))
+
+    def drop_connections(self):
+        self.subscriptions.clear()
+        for ws in self.connections:
+            asyncio.create_task(ws.close())
+
+    def respond(self, ws, method, params):
+        if method == "eth_subscribe":
+            subscription_id = hex(len(self.subscriptions) + 100 * self.block_number)
+            self.subscriptions[subscription_id] = (ws, params[0])
+            return subscription_id
+        if method == "eth_unsubscribe":
+            return self.subscriptions.pop(params[0], None) is not None
+        if method == "eth_blockNumber":
+            return hex(self.block_number)
+        if method == "eth_getBlockByNumber":
+            return self.header(int(params[0], 16))
+        if method == "eth_getLogs":
+            return self.logs(
+                int(params[0]["fromBlock"], 16), int(params[0]["toBlock"], 16)
+            )
+        return None
+
+    async def handler(self, ws):
+        self.connections.add(ws)
+        try:
+            async for message in ws:
+                request = json.loads(message)
+                result = self.respond(ws, request["method"], request["params"])
+                await ws.send(
+                    json.dumps(
+                        {"jsonrpc": "2.0", "id": request["id"], "result": result}
+                    )
+                )
+        finally:
+            self.connections.discard(ws)
+
+
+@pytest_asyncio.fixture
+async def chain_node():
+    node = ChainNode()
+    async with serve(node.handler, "127.0.0.1", 0) as server:
+        port = server.sockets[0].getsockname()[1]
+        node.uri = f"ws://127.0.0.1:{port}"
+        node.server = server
+        yield node
+
+
+async def wait_until(condition, timeout=5):
+    async def _wait():
+        while not condition():
+            await asyncio.sleep(0.01)
+
+    await asyncio.wait_for(_wait(), timeout)
+
+
+@pytest.mark.asyncio
+async def test_subscriptions_are_resumed_and_backfilled_after_reconnecting(
+    chain_node,
+):
+    heads = []
+    logs = []
+
+    async def heads_handler(context):
+        heads.append(context.result["number"])
+
+    async def logs_handler(context):
+        logs.append(context.result["blockNumber"])
+
+    async with AsyncWeb3(WebSocketProvider(chain_node.uri, reconnect=True)) as w3:
+        manager = w3.subscription_manager
+        heads_sub = NewHeadsSubscription(label="heads", handler=heads_handler)
+        logs_sub = LogsSubscription(address=ADDRESS, label="logs", handler=logs_handler)
+        await manager.subscribe([heads_sub, logs_sub])
+        handling = asyncio.create_task(manager.handle_subscriptions())
+
+        chain_node.mine()
+        chain_node.mine()
+        await wait_until(lambda: len(heads) == len(logs) == 2)
+
+        previous_ids = heads_sub.id, logs_sub.id
+        chain_node.drop_connections()
+        # mined while disconnected
+        chain_node.mine()
+        chain_node.mine()
+        await wait_until(lambda: len(heads) == len(logs) == 4)
+
+        chain_node.mine()
+        await wait_until(lambda: len(heads) == len(logs) == 5)
+        assert heads == logs == [1, 2, 3, 4, 5]
+
+        # same subscriptions, found by their previous ids too
+        assert (heads_sub.id, logs_sub.id) != previous_ids
+        assert manager.subscriptions == [heads_sub, logs_sub]
+        assert manager.get_by_label("heads") is heads_sub
+        assert manager.get_by_id(previous_ids[0]) is heads_sub
+        assert set(w3.socket.subscriptions) == {heads_sub.id, logs_sub.id}
+
+        assert await w3.eth.unsubscribe(previous_ids[1])
+        assert await manager.unsubscribe_all()
+        assert manager._subscription_container.subscriptions_by_id == {}
+        await handling
+
+
+@pytest.mark.asyncio
+async def test_reconnecting_honors_max_connection_retries(chain_node):
+    provider = WebSocketProvider(
+        chain_node.uri, reconnect=True, max_connection_retries=1
+    )
+    await provider.connect()
+    chain_node.server.close()
+    chain_node.drop_connections()
+    with pytest.raises(ProviderConnectionError, match="Retries exceeded max of 1"):
+        await asyncio.wait_for(provider._message_listener_task, 5)
+
+
+@pytest.mark.asyncio
+async def test_shared_subscriptions_are_resumed_once(chain_node):
+    heads = {"first": [], "second": []}
+
+    def handler_for(label):
+        async def handler(context):
+            heads[label].append(context.result["number"])
+
+        return handler
+
+    async with AsyncWeb3(WebSocketProvider(chain_node.uri, reconnect=True)) as w3:
+        manager = w3.subscription_manager
+        manager.share_subscriptions = True
+        subs = [
+            NewHeadsSubscription(label=label, handler=handler_for(label))
+            for label in heads
+        ]
+        await manager.subscribe(subs)
+        assert len(chain_node.subscriptions) == 1
+        handling = asyncio.create_task(manager.handle_subscriptions())
+
+        chain_node.mine()
+        await wait_until(lambda: len(heads["second"]) == 1)
+        chain_node.drop_connections()
+        # mined while disconnected
+        chain_node.mine()
+        await wait_until(lambda: len(heads["second"]) == 2)
+        chain_node.mine()
+        await wait_until(lambda: len(heads["second"]) == 3)
+
+        assert heads == {"first": [1, 2, 3], "second": [1, 2, 3]}
+        assert len(chain_node.subscriptions) == 1
+        assert subs[0].id == subs[1].id == next(iter(chain_node.subscriptions))
+
+        assert await manager.unsubscribe_all()
+        assert chain_node.subscriptions == {}
+        await handling
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("share_subscriptions", (False, True))
+async def test_reconnecting_reuses_previous_ids_of_other_subscriptions(
+    chain_node, share_subscriptions
+):
+    heads = []
+    logs = []
+
+    async def heads_handler(context):
+        heads.append(context.result["number"])
+
+    async def logs_handler(context):
+        logs.append(context.result["blockNumber"])
+
+    async with AsyncWeb3(WebSocketProvider(chain_node.uri, reconnect=True)) as w3:
+        manager = w3.subscription_manager
+        manager.share_subscriptions = share_subscriptions
+        other_sub = LogsSubscription(address="0x" + "22" * 20, label="other")
+        logs_sub = LogsSubscription(address=ADDRESS, label="logs", handler=logs_handler)
+        heads_sub = NewHeadsSubscription(label="heads", handler=heads_handler)
+        await manager.subscribe(other_sub)
+        await manager.subscribe([logs_sub, heads_sub])
+        assert await other_sub.unsubscribe()
+        handling = asyncio.create_task(manager.handle_subscriptions())
+
+        # the node gives the heads subscription the previous id of the logs one
+        previous_logs_id = logs_sub.id
+        chain_node.drop_connections()
+        await wait_until(lambda: heads_sub.id == previous_logs_id)
+        assert manager.get_by_id(heads_sub.id) is heads_sub
+        assert manager.get_by_id(logs_sub.id) is logs_sub
+
+        chain_node.mine()
+        await wait_until(lambda: len(heads) == len(logs) == 1)
+        chain_node.drop_connections()
+        await wait_until(lambda: len(chain_node.subscriptions) == 2)
+        chain_node.mine()
+        await wait_until(lambda: len(heads) == len(logs) == 2)
+
+        assert heads == logs == [1, 2]
+        assert len(manager.subscriptions) == 2
+        assert set(chain_node.subscriptions) == {heads_sub.id, logs_sub.id}
+
+        assert await manager.unsubscribe_all()
+        assert chain_node.subscriptions == {}
+        await handling
@@ -0,0 +1,120 @@
+import pytest
+import subprocess
+import sys
+
+try:
+    import resource
+except ImportError:
+    # not available on Windows
+    resource = None
+
+# The budgets for ``import web3``. The number of modules loaded doesn't depend on the
+# machine, so it is kept tight. The time budget is on the CPU time of the importing
+# process rather than wall time, which grows with the other tests running in parallel.
+IMPORTED_MODULES_BUDGET = 450
+IMPORT_CPU_TIME_BUDGET_SECONDS = 1.0
+
+# dependencies that are only loaded when the feature that needs them is used
+DEFERRED_MODULES = (
+    "aiohttp",
+    "eth_account",
+    "eth_tester",
+    "requests",
+    "websockets.asyncio.client",
+    "web3.middleware.signing",
+    "web3.providers.eth_tester",
+    "web3.providers.ipc",
+    "web3.providers.rpc",
+)
+
+
+def _import_web3(*code_lines):
+    return subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "; ".join(("import web3",) + code_lines),
+        ],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+
+
+def _cpu_time_of(code):
+    before = resource.getrusage(resource.RUSAGE_CHILDREN)
+    subprocess.run([sys.executable, "-c", code], check=True)
+    after = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return (after.ru_utime + after.ru_stime) - (before.ru_utime + before.ru_stime)
+
+
+def test_import_web3_defers_optional_dependencies():
+    result = _import_web3(
+        "import sys",
+        f"print(','.join(m for m in {DEFERRED_MODULES!r} if m in sys.modules))",
+    )
+    assert result.stdout.strip() == ""
+
+
+def test_import_web3_module_budget():
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys; loaded = len(sys.modules); import web3; "
+            "print(len(sys.modules) - loaded)",
+        ],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    assert int(result.stdout) < IMPORTED_MODULES_BUDGET
+
+
+@pytest.mark.skipif(resource is None, reason="resource is not available")
+def test_import_web3_time_budget():
+    # best of a few runs, less the cost of starting the interpreter
+    import_time = min(_cpu_time_of("import web3") for _ in range(5)) - min(
+        _cpu_time_of("pass") for _ in range(5)
+    )
+    assert import_time < IMPORT_CPU_TIME_BUDGET_SECONDS
+
+
+@pytest.mark.parametrize(
+    "name",
+    (
+        "Account",
+        "AsyncHTTPProvider",
+        "AutoProvider",
+        "EthereumTesterProvider",
+        "HTTPProvider",
+        "IPCProvider",
+        "WebSocketProvider",
+    ),
+)
+def test_lazy_attributes_are_importable(name):
+    import web3
+
+    assert getattr(web3, name).__name__ == name
+    assert name in web3.__all__
+
+
+def test_lazy_provider_class_attributes():
+    from web3 import (
+        AsyncHTTPProvider,
+        AsyncWeb3,
+        HTTPProvider,
+        Web3,
+        WebSocketProvider,
+    )
+
+    assert Web3.HTTPProvider is HTTPProvider
+    assert AsyncWeb3.AsyncHTTPProvider is AsyncHTTPProvider
+    assert AsyncWeb3.WebSocketProvider is WebSocketProvider
+
+
+def test_unknown_attribute_raises_attribute_error():
+    import web3
+
+    with pytest.raises(AttributeError, match="has no attribute 'NotAProvider'"):
+        web3.NotAProvider
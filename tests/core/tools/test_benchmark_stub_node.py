@@ -0,0 +1,105 @@
+import pytest
+import asyncio
+import logging
+import socket
+
+import pytest_asyncio
+
+from web3 import (
+    AsyncHTTPProvider,
+    AsyncWeb3,
+    WebSocketProvider,
+)
+from web3.exceptions import (
+    MethodUnavailable,
+)
+from web3.tools.benchmark.reporting import (
+    compare_results,
+)
+from web3.tools.benchmark.stub_node import (
+    StubNode,
+)
+
+
+@pytest_asyncio.fixture
+async def stub_node_uri(tmp_path):
+    sock = socket.socket()
+    sock.bind(("127.0.0.1", 0))
+    port = sock.getsockname()[1]
+    sock.close()
+
+    node = StubNode(num_transactions=3, num_logs=5)
+    server = asyncio.create_task(
+        node.serve("127.0.0.1", port, str(tmp_path / "stub.ipc"))
+    )
+    for _ in range(100):
+        try:
+            _reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        except OSError:
+            await asyncio.sleep(0.01)
+        else:
+            writer.close()
+            break
+
+    yield f"127.0.0.1:{port}"
+    server.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await server
+
+
+@pytest.mark.asyncio
+async def test_stub_node_over_http(stub_node_uri):
+    async_w3 = AsyncWeb3(AsyncHTTPProvider(f"http://{stub_node_uri}"))
+    try:
+        block = await async_w3.eth.get_block("latest", True)
+        assert len(block["transactions"]) == 3
+        assert len(await async_w3.eth.get_logs({})) == 5
+
+        async with async_w3.batch_requests() as batch:
+            batch.add(async_w3.eth.chain_id)
+            batch.add(async_w3.eth.get_block_receipts(block["number"]))
+            chain_id, receipts = await batch.async_execute()
+        assert chain_id == 1
+        assert len(receipts) == 3
+
+        with pytest.raises(MethodUnavailable):
+            await async_w3.eth.syncing
+    finally:
+        await async_w3.provider.disconnect()
+
+
+@pytest.mark.asyncio
+async def test_stub_node_over_websocket(stub_node_uri):
+    async with AsyncWeb3(WebSocketProvider(f"ws://{stub_node_uri}/ws")) as async_w3:
+        block_numbers = await asyncio.gather(
+            *(async_w3.eth.block_number for _ in range(5))
+        )
+        assert set(block_numbers) == {20_000_000}
+
+
+@pytest.mark.asyncio
+async def test_stub_node_over_ipc(stub_node_uri, tmp_path):
+    reader, writer = await asyncio.open_unix_connection(str(tmp_path / "stub.ipc"))
+    # two requests, the second split across writes
+    writer.write(b'{"jsonrpc":"2.0","id":1,"method":"eth_chainId","params":[]}\n{"js')
+    await writer.drain()
+    writer.write(b'onrpc":"2.0","id":2,"method":"eth_blockNumber","params":[]}\n')
+    await writer.drain()
+
+    assert await reader.readline() == b'{"jsonrpc":"2.0","id":1,"result":"0x1"}\n'
+    assert await reader.readline() == (
+        b'{"jsonrpc":"2.0","id":2,"result":"0x1312d00"}\n'
+    )
+    writer.close()
+
+
+def test_compare_results(caplog):
+    logger = logging.getLogger("web3.tools.benchmark")
+    results = {"a": 110.0, "b": 120.0, "c": 50.0, "new": 1.0}
+    baseline = {"a": 100.0, "b": 100.0, "c": 100.0, "removed": 1.0}
+
+    with caplog.at_level(logging.INFO):
+        regressions = compare_results(logger, results, baseline, max_regression=0.15)
+
+    assert regressions == ["b"]
+    assert "+20.0%" in caplog.text
@@ -0,0 +1,215 @@
+import pytest
+import csv
+import json
+
+import pytest_asyncio
+
+from web3._utils.contract_sources.contract_data.emitter_contract import (
+    EMITTER_CONTRACT_DATA,
+)
+from web3.exceptions import (
+    Web3ValueError,
+)
+from web3.tools.export import (
+    BlockExporter,
+    CSVSink,
+    JSONLinesSink,
+    ParquetSink,
+)
+
+LOG_NO_ARGUMENTS = 1
+
+
+@pytest_asyncio.fixture
+async def exported_chain(async_w3):
+    """
+    A chain with a contract deployment, a value transfer and a transaction that
+    emits a log, each mined in its own block.
+    """
+    emitter = async_w3.eth.contract(**EMITTER_CONTRACT_DATA)
+    deploy_hash = await emitter.constructor().transact()
+    receipt = await async_w3.eth.wait_for_transaction_receipt(deploy_hash)
+    emitter = async_w3.eth.contract(
+        address=receipt["contractAddress"], **EMITTER_CONTRACT_DATA
+    )
+
+    accounts = await async_w3.eth.accounts
+    await async_w3.eth.send_transaction({"to": accounts[1], "value": 10**18})
+    await emitter.functions.logNoArgs(LOG_NO_ARGUMENTS).transact()
+    return async_w3
+
+
+def _read_jsonl(path):
+    with open(path) as file:
+        return [json.loads(line) for line in file]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("blocks_per_task,concurrency", ((1, 2), (2, 8), (10, 1)))
+async def test_export_to_jsonl(exported_chain, tmp_path, blocks_per_task, concurrency):
+    latest = await exported_chain.eth.block_number
+    with JSONLinesSink(str(tmp_path), row_group_size=2) as sink:
+        exporter = BlockExporter(
+            exported_chain,
+            sink,
+            blocks_per_task=blocks_per_task,
+            concurrency=concurrency,
+        )
+        stats = await exporter.export(0, latest)
+
+    assert (stats.blocks, stats.transactions, stats.receipts, stats.logs) == (
+        latest + 1,
+        3,
+        3,
+        1,
+    )
+    assert stats.failed_ranges == []
+    assert stats.blocks_per_second > 0
+
+    blocks = _read_jsonl(tmp_path / "blocks.jsonl")
+    assert [block["number"] for block in blocks] == list(range(latest + 1))
+    assert "transactions" not in blocks[0]
+    assert sum(block["transactionCount"] for block in blocks) == 3
+
+    transactions = _read_jsonl(tmp_path / "transactions.jsonl")
+    receipts = _read_jsonl(tmp_path / "receipts.jsonl")
+    assert [tx["hash"] for tx in transactions] == [
+        receipt["transactionHash"] for receipt in receipts
+    ]
+    assert transactions[1]["value"] == 10**18
+    assert all("logs" not in receipt for receipt in receipts)
+
+    (log,) = _read_jsonl(tmp_path / "logs.jsonl")
+    assert log["transactionHash"] == receipts[2]["transactionHash"]
+
+    # receipts were fetched per transaction, eth-tester has no eth_getBlockReceipts
+    assert exported_chain.eth._block_receipts_supported is False
+
+
+@pytest.mark.asyncio
+async def test_export_to_csv(exported_chain, tmp_path):
+    latest = await exported_chain.eth.block_number
+    with CSVSink(str(tmp_path)) as sink:
+        await BlockExporter(exported_chain, sink).export(0, latest)
+
+    with open(tmp_path / "blocks.csv", newline="") as file:
+        blocks = list(csv.DictReader(file))
+    assert [int(block["number"]) for block in blocks] == list(range(latest + 1))
+    assert blocks[-1]["hash"].startswith("0x")
+
+    with open(tmp_path / "logs.csv", newline="") as file:
+        (log,) = csv.DictReader(file)
+    assert json.loads(log["topics"])[0].startswith("0x")
+
+
+@pytest.mark.asyncio
+async def test_export_to_parquet(exported_chain, tmp_path):
+    parquet = pytest.importorskip("pyarrow.parquet")
+
+    latest = await exported_chain.eth.block_number
+    with ParquetSink(str(tmp_path), row_group_size=2) as sink:
+        await BlockExporter(exported_chain, sink, blocks_per_task=1).export(0, latest)
+
+    blocks = parquet.ParquetFile(tmp_path / "blocks.parquet")
+    assert blocks.metadata.num_rows == latest + 1
+    assert blocks.metadata.num_row_groups == (latest + 2) // 2
+
+    transactions = parquet.read_table(tmp_path / "transactions.parquet").to_pylist()
+    assert transactions[1]["value"] == str(10**18)
+
+
+LEGACY_TX = {"hash": "0x01", "gasPrice": 10, "value": 1}
+DYNAMIC_FEE_TX = {
+    "hash": "0x02",
+    "maxFeePerGas": 20,
+    "value": 2,
+    "accessList": [],
+    "yParity": 1,
+}
+
+
+def test_csv_sink_writes_fields_first_seen_in_later_row_groups(tmp_path):
+    with CSVSink(str(tmp_path), row_group_size=1) as sink:
+        sink.write("transactions", [LEGACY_TX])
+        sink.write("transactions", [DYNAMIC_FEE_TX])
+
+    with open(tmp_path / "transactions.csv", newline="") as file:
+        legacy_tx, dynamic_fee_tx = csv.DictReader(file)
+    assert legacy_tx["gasPrice"] == "10"
+    assert legacy_tx["maxFeePerGas"] == ""
+    assert dynamic_fee_tx["maxFeePerGas"] == "20"
+    assert dynamic_fee_tx["accessList"] == "[]"
+    assert dynamic_fee_tx["yParity"] == "1"
+    assert dynamic_fee_tx["blobVersionedHashes"] == ""
+
+
+def test_parquet_sink_writes_fields_first_seen_in_later_row_groups(tmp_path):
+    parquet = pytest.importorskip("pyarrow.parquet")
+
+    with ParquetSink(str(tmp_path), row_group_size=1) as sink:
+        sink.write("transactions", [LEGACY_TX])
+        sink.write("transactions", [DYNAMIC_FEE_TX])
+
+    legacy_tx, dynamic_fee_tx = parquet.read_table(
+        tmp_path / "transactions.parquet"
+    ).to_pylist()
+    assert legacy_tx["gasPrice"] == 10
+    assert legacy_tx["maxFeePerGas"] is None
+    assert dynamic_fee_tx["maxFeePerGas"] == "20"
+    assert dynamic_fee_tx["accessList"] == "[]"
+
+
+def test_sinks_raise_on_unknown_fields_in_later_row_groups(tmp_path):
+    with CSVSink(str(tmp_path), row_group_size=1) as sink:
+        sink.write("transactions", [LEGACY_TX])
+        with pytest.raises(Web3ValueError, match="l1Fee"):
+            sink.write("transactions", [{**LEGACY_TX, "l1Fee": 1}])
+
+
+@pytest.mark.asyncio
+async def test_failed_ranges_are_retried(exported_chain, tmp_path, mocker):
+    latest = await exported_chain.eth.block_number
+    get_block = exported_chain.eth.get_block
+    failures = {1: 1, 2: 10}
+
+    async def flaky_get_block(number, full_transactions=False):
+        if failures.get(number):
+            failures[number] -= 1
+            raise ConnectionError(f"dropped request for block {number}")
+        return await get_block(number, full_transactions)
+
+    mocker.patch.object(exported_chain.eth, "get_block", side_effect=flaky_get_block)
+    with JSONLinesSink(str(tmp_path)) as sink:
+        exporter = BlockExporter(
+            exported_chain, sink, blocks_per_task=1, max_retries=2, retry_backoff=0
+        )
+        stats = await exporter.export(0, latest)
+
+    # block 1 succeeded on being retried, block 2 failed every attempt
+    assert stats.failed_ranges == [(2, 2)]
+    assert stats.blocks == latest
+    blocks = _read_jsonl(tmp_path / "blocks.jsonl")
+    assert [block["number"] for block in blocks] == [0, 1, *range(3, latest + 1)]
+
+
+@pytest.mark.asyncio
+async def test_receipts_are_fetched_by_block_hash(exported_chain, tmp_path, mocker):
+    latest = await exported_chain.eth.block_number
+    spy = mocker.spy(exported_chain.eth, "get_block_receipts_bulk")
+    with JSONLinesSink(str(tmp_path)) as sink:
+        stats = await BlockExporter(exported_chain, sink).export(0, latest)
+
+    blocks = _read_jsonl(tmp_path / "blocks.jsonl")
+    receipts = _read_jsonl(tmp_path / "receipts.jsonl")
+    # so a block reorged out between the two fetches can't be paired with the
+    # receipts of the block replacing it
+    (block_hashes,) = spy.call_args.args
+    assert [bytes(block_hash).hex() for block_hash in block_hashes] == [
+        block["hash"].removeprefix("0x")
+        for block in blocks
+        if block["transactionCount"]
+    ]
+    assert [receipt["blockHash"] for receipt in receipts] == [
+        block["hash"] for block in blocks for _ in range(block["transactionCount"])
+    ]
+    assert stats.receipts == len(receipts)
@@ -0,0 +1,20 @@
+import pytest
+
+from web3.tools.benchmark.micro import (
+    micro_benchmarks,
+    peak_allocated_per_op,
+    time_per_op,
+)
+
+
+@pytest.mark.parametrize(
+    "benchmark", micro_benchmarks(), ids=lambda benchmark: benchmark.name
+)
+def test_micro_benchmarks_run(benchmark):
+    assert time_per_op(benchmark.call, num_calls=1, rounds=1) > 0
+
+
+def test_peak_allocated_per_op():
+    assert peak_allocated_per_op(lambda: bytearray(1024 * 1024)) >= 1024
+    # memory freed before the operation returns is still counted
+    assert peak_allocated_per_op(lambda: len(bytearray(1024 * 1024))) >= 1024
@@ -0,0 +1,258 @@
+import pytest
+import json
+from unittest.mock import (
+    patch,
+)
+
+from hexbytes import (
+    HexBytes,
+)
+
+from web3 import (
+    AsyncHTTPProvider,
+    AsyncWeb3,
+    HTTPProvider,
+    Web3,
+)
+from web3._utils.debug_traces import (
+    struct_log_trace_config,
+)
+from web3.exceptions import (
+    Web3RPCError,
+    Web3ValueError,
+)
+
+URI = "http://mynode.local:8545"
+TX_HASH = "0x" + "ab" * 32
+SENDER = "0xd3cda913deb6f67967b99d67acdfa1712c293601"
+CONTRACT = "0x5b2063246f2191f18f2675cedb8b28102e957458"
+
+STRUCT_LOGS = [
+    {
+        "pc": 0,
+        "op": "PUSH1",
+        "gas": 79000,
+        "gasCost": 3,
+        "depth": 1,
+        "stack": [],
+        "memory": [],
+        "storage": {},
+    },
+    {
+        "pc": 2,
+        "op": "SSTORE",
+        "gas": "0x13495",
+        "gasCost": 20000,
+        "depth": 1,
+        "stack": ["0x1", "0x0"],
+        "memory": ["00" * 32],
+        "storage": {"00" * 32: "00" * 31 + "01"},
+    },
+]
+OPCODE_TRACE = {"gas": 43000, "failed": False, "returnValue": "", "structLogs": []}
+CALL_TRACE = {
+    "type": "CALL",
+    "from": SENDER,
+    "to": CONTRACT,
+    "gas": "0x1388",
+    "gasUsed": "0x10",
+    "input": "0x01",
+    "calls": [
+        {
+            "type": "STATICCALL",
+            "from": CONTRACT,
+            "to": SENDER,
+            "gas": "0x100",
+            "gasUsed": "0x1",
+            "input": "0x02",
+            "calls": [
+                {
+                    "type": "CALL",
+                    "from": SENDER,
+                    "to": CONTRACT,
+                    "gas": "0x10",
+                    "gasUsed": "0x0",
+                    "input": "0x03",
+                    "value": "0x1",
+                }
+            ],
+        },
+        {
+            "type": "CALL",
+            "from": CONTRACT,
+            "to": SENDER,
+            "gas": "0x200",
+            "gasUsed": "0x2",
+            "input": "0x04",
+        },
+    ],
+    # the call tracer writes these after the calls made
+    "value": "0x0",
+    "output": "0x",
+}
+
+
+def _response(result):
+    return json.dumps({"jsonrpc": "2.0", "id": 0, "result": result}).encode()
+
+
+def _chunked(response, chunk_size=7):
+    return [response[i : i + chunk_size] for i in range(0, len(response), chunk_size)]
+
+
+def _mock_stream(response):
+    return patch(
+        "web3._utils.http_session_manager.HTTPSessionManager.stream_post_request",
+        return_value=iter(_chunked(response)),
+    )
+
+
+def _mock_async_stream(response):
+    async def stream_post_request(*_args, **_kwargs):
+        for chunk in _chunked(response):
+            yield chunk
+
+    return patch(
+        "web3._utils.http_session_manager.HTTPSessionManager.async_stream_post_request",
+        side_effect=stream_post_request,
+    )
+
+
+def _sent_trace_config(mock_stream):
+    return json.loads(mock_stream.call_args.args[1])["params"][1]
+
+
+def test_iter_struct_logs():
+    w3 = Web3(HTTPProvider(URI))
+    trace = {**OPCODE_TRACE, "structLogs": STRUCT_LOGS}
+    with _mock_stream(_response(trace)) as mock_stream:
+        struct_logs = list(w3.geth.debug.iter_struct_logs(TX_HASH))
+
+    assert struct_logs[0] == STRUCT_LOGS[0]
+    assert struct_logs[1]["gas"] == 0x13495
+    assert struct_logs[1]["storage"] == STRUCT_LOGS[1]["storage"]
+    assert _sent_trace_config(mock_stream) == {}
+
+
+def test_iter_struct_logs_keeps_only_the_requested_fields():
+    w3 = Web3(HTTPProvider(URI))
+    trace = {**OPCODE_TRACE, "structLogs": STRUCT_LOGS}
+    with _mock_stream(_response(trace)) as mock_stream:
+        struct_logs = list(
+            w3.geth.debug.iter_struct_logs(
+                TX_HASH, {"timeout": "10s"}, fields=("op", "gas", "memory")
+            )
+        )
+
+    assert struct_logs == [
+        {"op": "PUSH1", "gas": 79000, "memory": []},
+        {"op": "SSTORE", "gas": 0x13495, "memory": ["00" * 32]},
+    ]
+    # the node is asked to leave out the fields that aren't requested
+    assert _sent_trace_config(mock_stream) == {
+        "timeout": "10s",
+        "disableStack": True,
+        "disableStorage": True,
+        "enableMemory": True,
+        "enableReturnData": False,
+    }
+
+
+def test_iter_struct_logs_as_tuples():
+    w3 = Web3(HTTPProvider(URI))
+    trace = {**OPCODE_TRACE, "structLogs": STRUCT_LOGS}
+    with _mock_stream(_response(trace)) as mock_stream:
+        struct_logs = list(w3.geth.debug.iter_struct_logs(TX_HASH, as_tuples=True))
+    # the node is asked to leave out the fields that aren't in the tuples
+    assert _sent_trace_config(mock_stream) == {
+        "disableStack": True,
+        "disableStorage": True,
+        "enableMemory": False,
+        "enableReturnData": False,
+    }
+    with _mock_stream(_response(trace)):
+        struct_log_stacks = list(
+            w3.geth.debug.iter_struct_logs(
+                TX_HASH, fields=("op", "stack", "error"), as_tuples=True
+            )
+        )
+
+    assert struct_logs == [(0, "PUSH1", 79000, 3, 1), (2, "SSTORE", 0x13495, 20000, 1)]
+    assert struct_log_stacks == [("PUSH1", [], None), ("SSTORE", ["0x1", "0x0"], None)]
+
+
+def test_iter_struct_logs_rejects_tracers():
+    with pytest.raises(Web3ValueError, match="default opcode logger"):
+        struct_log_trace_config({"tracer": "callTracer"}, None)
+
+
+def test_iter_call_frames():
+    w3 = Web3(HTTPProvider(URI))
+    with _mock_stream(_response(CALL_TRACE)) as mock_stream:
+        frames = list(w3.geth.debug.iter_call_frames(TX_HASH))
+
+    assert _sent_trace_config(mock_stream) == {"tracer": "callTracer"}
+    # each call is yielded after the calls it made, without them
+    assert [(frame["input"], frame["depth"]) for frame in frames] == [
+        (HexBytes("0x03"), 2),
+        (HexBytes("0x02"), 1),
+        (HexBytes("0x04"), 1),
+        (HexBytes("0x01"), 0),
+    ]
+    assert all("calls" not in frame for frame in frames)
+    assert frames[0]["value"] == 1
+    assert frames[0]["from"] == Web3.to_checksum_address(SENDER)
+    assert frames[-1] == {
+        "type": "CALL",
+        "from": Web3.to_checksum_address(SENDER),
+        "to": Web3.to_checksum_address(CONTRACT),
+        "gas": 5000,
+        "gasUsed": 16,
+        "input": HexBytes("0x01"),
+        "value": 0,
+        "output": HexBytes("0x"),
+        "depth": 0,
+    }
+
+
+def test_iter_call_frames_rejects_other_tracers():
+    w3 = Web3(HTTPProvider(URI))
+    with pytest.raises(Web3ValueError, match="only returned by the call tracer"):
+        w3.geth.debug.iter_call_frames(TX_HASH, {"tracer": "prestateTracer"})
+
+
+def test_iter_call_frames_raises_error_response():
+    w3 = Web3(HTTPProvider(URI))
+    response = json.dumps(
+        {"jsonrpc": "2.0", "id": 0, "error": {"code": -32000, "message": "not found"}}
+    ).encode()
+    with _mock_stream(response):
+        with pytest.raises(Web3RPCError, match="not found"):
+            list(w3.geth.debug.iter_call_frames(TX_HASH))
+
+
+@pytest.mark.asyncio
+async def test_async_iter_struct_logs():
+    async_w3 = AsyncWeb3(AsyncHTTPProvider(URI))
+    trace = {**OPCODE_TRACE, "structLogs": STRUCT_LOGS}
+    with _mock_async_stream(_response(trace)):
+        struct_logs = [
+            struct_log
+            async for struct_log in async_w3.geth.debug.iter_struct_logs(
+                TX_HASH, fields=("pc", "gas"), as_tuples=True
+            )
+        ]
+
+    assert struct_logs == [(0, 79000), (2, 0x13495)]
+
+
+@pytest.mark.asyncio
+async def test_async_iter_call_frames():
+    async_w3 = AsyncWeb3(AsyncHTTPProvider(URI))
+    with _mock_async_stream(_response(CALL_TRACE)):
+        frames = [
+            frame async for frame in async_w3.geth.debug.iter_call_frames(TX_HASH)
+        ]
+
+    assert [frame["depth"] for frame in frames] == [2, 1, 1, 0]
+    assert frames[-1]["output"] == HexBytes("0x")
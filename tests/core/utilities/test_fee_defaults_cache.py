@@ -0,0 +1,173 @@
+import pytest
+
+from web3 import (
+    AsyncWeb3,
+    Web3,
+)
+from web3._utils.async_transactions import (
+    async_fill_transaction_defaults,
+)
+from web3._utils.transactions import (
+    fill_transaction_defaults,
+)
+from web3.providers.eth_tester import (
+    AsyncEthereumTesterProvider,
+    EthereumTesterProvider,
+)
+from web3.utils import (
+    AsyncFeeDefaultsCache,
+    FeeDefaultsCache,
+)
+
+TRANSACTION = {
+    "from": "0x634743b15C948820069a43f6B361D03EfbBBE5a8",
+    "to": "0x91eD14b5956DBcc1310E65DC4d7E82f02B95BA46",
+    "gas": 21000,
+    "value": 1,
+}
+
+
+class CountingResult:
+    def __init__(self, result):
+        self.result = result
+        self.calls = 0
+
+    def __call__(self, _method, _params):
+        self.calls += 1
+        return self.result(self.calls) if callable(self.result) else self.result
+
+
+def mock_fee_results(block_number=lambda _: "0x10"):
+    return {
+        "eth_getBlockByNumber": CountingResult(
+            lambda calls: {
+                "number": (
+                    block_number(calls) if callable(block_number) else block_number
+                ),
+                "baseFeePerGas": "0x64",
+            }
+        ),
+        "eth_maxPriorityFeePerGas": CountingResult("0x3"),
+        "eth_chainId": CountingResult("0x1"),
+    }
+
+
+def call_counts(mock_results):
+    return {method: result.calls for method, result in mock_results.items()}
+
+
+@pytest.fixture
+def w3():
+    return Web3(EthereumTesterProvider())
+
+
+def test_fill_transaction_defaults_without_fee_defaults_cache(w3, request_mocker):
+    mock_results = mock_fee_results()
+    with request_mocker(w3, mock_results=mock_results):
+        for _ in range(3):
+            fill_transaction_defaults(w3, TRANSACTION)
+
+    assert call_counts(mock_results) == {
+        "eth_getBlockByNumber": 3,
+        "eth_maxPriorityFeePerGas": 3,
+        "eth_chainId": 3,
+    }
+
+
+def test_fill_transaction_defaults_with_fee_defaults_cache(w3, request_mocker):
+    w3.eth.set_fee_defaults_cache(FeeDefaultsCache(ttl=60))
+    mock_results = mock_fee_results()
+
+    with request_mocker(w3, mock_results=mock_results):
+        filled = [fill_transaction_defaults(w3, TRANSACTION) for _ in range(3)]
+
+    assert call_counts(mock_results) == {
+        "eth_getBlockByNumber": 1,
+        "eth_maxPriorityFeePerGas": 1,
+        "eth_chainId": 1,
+    }
+    assert all(
+        tx["maxPriorityFeePerGas"] == 3
+        and tx["maxFeePerGas"] == 3 + 2 * 100
+        and tx["chainId"] == 1
+        for tx in filled
+    )
+
+
+def test_fee_defaults_cache_refetches_priority_fee_for_new_blocks(
+    w3, request_mocker, monkeypatch
+):
+    now = [0.0]
+    monkeypatch.setattr("web3.utils.fee_defaults_cache.time.monotonic", lambda: now[0])
+    w3.eth.set_fee_defaults_cache(FeeDefaultsCache(ttl=2))
+    # the node is on block 16 for the first two fetches and then on block 17
+    mock_results = mock_fee_results(
+        block_number=lambda calls: "0x10" if calls <= 2 else "0x11"
+    )
+
+    with request_mocker(w3, mock_results=mock_results):
+        for _ in range(3):
+            fill_transaction_defaults(w3, TRANSACTION)
+            now[0] += 3
+
+    assert call_counts(mock_results) == {
+        "eth_getBlockByNumber": 3,
+        "eth_maxPriorityFeePerGas": 2,
+        "eth_chainId": 1,
+    }
+
+
+def test_fee_defaults_cache_without_base_fee(w3, request_mocker):
+    fee_defaults_cache = FeeDefaultsCache(ttl=60)
+    mock_results = mock_fee_results()
+    mock_results["eth_getBlockByNumber"] = CountingResult({"number": "0x10"})
+
+    with request_mocker(w3, mock_results=mock_results):
+        assert fee_defaults_cache.max_priority_fee(w3) == 3
+        assert fee_defaults_cache.max_priority_fee(w3) == 3
+        with pytest.raises(KeyError, match="baseFeePerGas"):
+            fee_defaults_cache.base_fee(w3)
+
+        fee_defaults_cache.new_head({"number": 17})
+        assert fee_defaults_cache.max_priority_fee(w3) == 3
+
+    assert call_counts(mock_results)["eth_maxPriorityFeePerGas"] == 2
+
+
+def test_fee_defaults_cache_new_head_and_invalidate(w3, request_mocker):
+    fee_defaults_cache = FeeDefaultsCache(ttl=60)
+    mock_results = mock_fee_results()
+
+    with request_mocker(w3, mock_results=mock_results):
+        assert fee_defaults_cache.base_fee(w3) == 100
+
+        fee_defaults_cache.new_head({"number": 17, "baseFeePerGas": 200})
+        assert fee_defaults_cache.base_fee(w3) == 200
+        # stale headers are ignored
+        fee_defaults_cache.new_head({"number": 16, "baseFeePerGas": 50})
+        assert fee_defaults_cache.base_fee(w3) == 200
+        assert mock_results["eth_getBlockByNumber"].calls == 1
+
+        fee_defaults_cache.invalidate()
+        assert fee_defaults_cache.base_fee(w3) == 100
+        assert mock_results["eth_getBlockByNumber"].calls == 2
+
+
+@pytest.mark.asyncio
+async def test_async_fill_transaction_defaults_with_fee_defaults_cache(
+    request_mocker,
+):
+    async_w3 = AsyncWeb3(AsyncEthereumTesterProvider())
+    async_w3.eth.set_fee_defaults_cache(AsyncFeeDefaultsCache(ttl=60))
+    mock_results = mock_fee_results()
+
+    async with request_mocker(async_w3, mock_results=mock_results):
+        for _ in range(3):
+            filled = await async_fill_transaction_defaults(async_w3, TRANSACTION)
+
+    assert call_counts(mock_results) == {
+        "eth_getBlockByNumber": 1,
+        "eth_maxPriorityFeePerGas": 1,
+        "eth_chainId": 1,
+    }
+    assert filled["maxFeePerGas"] == 3 + 2 * 100
@@ -206,6 +206,24 @@ def test_session_manager_make_post_request_times_out_while_streaming(
     assert adapter._pool_maxsize == DEFAULT_POOLSIZE
 
 
+def test_session_manager_stream_post_request(mocker, http_session_manager):
+    response = MockedResponse()
+    response.iter_content = mocker.Mock(return_value=iter([b"chunk1", b"chunk2"]))
+    mocker.patch("requests.Session.post", return_value=response)
+
+    chunks = http_session_manager.stream_post_request(
+        TEST_URI, data=b"request", chunk_size=6
+    )
+    assert list(chunks) == [b"chunk1", b"chunk2"]
+
+    cache_key = generate_cache_key(f"{threading.get_ident()}:{TEST_URI}")
+    session = http_session_manager.session_cache.get_cache_entry(cache_key)
+    session.post.assert_called_once_with(
+        TEST_URI, data=b"request", timeout=30, stream=True
+    )
+    response.iter_content.assert_called_once_with(6)
+
+
 def test_session_manager_precached_session(mocker, http_session_manager):
     mocker.patch("requests.Session.post", return_value=MockedResponse())
 
@@ -404,6 +422,43 @@ async def test_session_manager_async_make_post_request(mocker, http_session_mana
     await session.close()
 
 
+class AsyncMockedStreamedResponse(AsyncMockedResponse):
+    def __init__(self, chunks):
+        self.content = self
+        self._chunks = chunks
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        pass
+
+    async def iter_chunked(self, chunk_size):
+        for chunk in self._chunks:
+            yield chunk
+
+
+@pytest.mark.asyncio
+async def test_session_manager_async_stream_post_request(mocker, http_session_manager):
+    mocker.patch(
+        "aiohttp.ClientSession.post",
+        return_value=AsyncMockedStreamedResponse([b"chunk1", b"chunk2"]),
+    )
+
+    chunks = http_session_manager.async_stream_post_request(TEST_URI, data=b"request")
+    assert [chunk async for chunk in chunks] == [b"chunk1", b"chunk2"]
+
+    cache_key = generate_cache_key(f"{id(asyncio.get_event_loop())}:{TEST_URI}")
+    session = http_session_manager.session_cache.get_cache_entry(cache_key)
+    # the timeout applies to each chunk rather than to the whole response
+    session.post.assert_called_once_with(
+        TEST_URI,
+        data=b"request",
+        timeout=ClientTimeout(total=None, sock_connect=30, sock_read=30),
+    )
+    await session.close()
+
+
 @pytest.mark.asyncio
 async def test_session_manager_async_precached_session(http_session_manager):
     # Add a session
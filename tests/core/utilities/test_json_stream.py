@@ -0,0 +1,172 @@
+import pytest
+import json
+
+from web3._utils.json_stream import (
+    JSONItemParser,
+)
+from web3.exceptions import (
+    BadResponseFormat,
+)
+
+STRUCT_LOGS = [
+    {"pc": 0, "op": "PUSH1", "gas": 79000, "stack": [], "memory": []},
+    {"pc": 2, "op": "MSTORE", "gas": 78997, "stack": ["0x80", "0x40"]},
+    {"pc": 3, "op": "LOG0", "gas": 78985, "storage": {"0x0": '"}]\\'}},
+]
+TRACE_RESPONSE = {
+    "jsonrpc": "2.0",
+    "id": 1,
+    "result": {
+        "gas": 21000,
+        "failed": False,
+        "structLogs": STRUCT_LOGS,
+        "returnValue": "0x",
+    },
+}
+
+
+def _parse_in_chunks(parser, document, chunk_size):
+    items = []
+    for i in range(0, len(document), chunk_size):
+        items.extend(parser.feed(document[i : i + chunk_size]))
+    items.extend(parser.close())
+    return items
+
+
+@pytest.mark.parametrize("chunk_size", (1, 2, 7, 64, 100_000))
+@pytest.mark.parametrize("indent", (None, 2))
+def test_items_are_parsed_from_chunks(chunk_size, indent):
+    document = json.dumps(TRACE_RESPONSE, indent=indent).encode()
+    parser = JSONItemParser(("result", "structLogs"))
+
+    assert _parse_in_chunks(parser, document, chunk_size) == STRUCT_LOGS
+    assert parser.done
+    # the rest of the document is kept, without the streamed items
+    assert parser.document == {
+        "jsonrpc": "2.0",
+        "id": 1,
+        "result": {
+            "gas": 21000,
+            "failed": False,
+            "structLogs": [],
+            "returnValue": "0x",
+        },
+    }
+
+
+def test_items_are_returned_as_soon_as_they_are_complete():
+    document = json.dumps({"result": [1, {"a": [2]}, "three"]}).encode()
+    parser = JSONItemParser()
+
+    # a number is only complete once the character after it is read
+    assert parser.feed(document[:13]) == []
+    assert parser.feed(document[13:25]) == [1, {"a": [2]}]
+    assert parser.feed(document[25:]) == ["three"]
+
+
+def test_object_items_are_parsed_as_key_value_pairs():
+    pending = {"0xabc": {"1": {"nonce": "0x1"}}, "0xdef": {"7": {"nonce": "0x7"}}}
+    document = json.dumps({"result": {"pending": pending, "queued": {}}}).encode()
+    parser = JSONItemParser(("result", "pending"))
+
+    assert _parse_in_chunks(parser, document, 5) == list(pending.items())
+    assert parser.document == {"result": {"pending": {}, "queued": {}}}
+
+
+@pytest.mark.parametrize("chunk_size", (1, 6, 100_000))
+def test_nested_items_are_parsed_at_every_level(chunk_size):
+    calls = [
+        {"to": "a", "calls": [{"to": "b", "calls": [{"to": "c"}]}, {"to": "d"}]},
+        {"to": "e", "calls": []},
+    ]
+    document = json.dumps({"result": {"to": "top", "calls": calls}}).encode()
+    parser = JSONItemParser(("result", "calls"), nested_item_key="calls")
+
+    # each item is returned after the items nested in it, without them
+    assert _parse_in_chunks(parser, document, chunk_size) == [
+        (2, {"to": "c"}),
+        (1, {"to": "b", "calls": []}),
+        (1, {"to": "d"}),
+        (0, {"to": "a", "calls": []}),
+        (0, {"to": "e", "calls": []}),
+    ]
+    assert parser.document == {"result": {"to": "top", "calls": []}}
+
+
+def test_nested_items_are_returned_before_the_items_they_are_nested_in_end():
+    document = json.dumps(
+        {"result": [{"calls": [{"to": "b"}, {"to": "c"}], "to": "a"}]}
+    ).encode()
+    parser = JSONItemParser(nested_item_key="calls")
+
+    end_of_b = document.index(b"}") + 1
+    assert parser.feed(document[:end_of_b]) == [(1, {"to": "b"})]
+    assert parser.feed(document[end_of_b:]) == [
+        (1, {"to": "c"}),
+        (0, {"to": "a", "calls": []}),
+    ]
+
+
+def test_numbers_split_at_every_offset():
+    values = [1e-7, 1.5e10, -2.25, 3e21, 0.5, -0.0, 12345, 6.02e23, 7]
+    document = json.dumps({"result": values}).encode()
+    assert b"e-07" in document and b"e+21" in document
+
+    for offset in range(1, len(document)):
+        parser = JSONItemParser()
+        items = parser.feed(document[:offset])
+        items.extend(parser.feed(document[offset:]))
+        items.extend(parser.close())
+        assert items == values, offset
+
+
+@pytest.mark.parametrize("chunk_size", (1, 3, 100))
+def test_values_split_across_chunks(chunk_size):
+    values = [123456789, -1.5e-7, True, None, "é☃\U0001F600", 'esc"aped\\']
+    document = json.dumps({"result": values}, ensure_ascii=False).encode()
+
+    assert _parse_in_chunks(JSONItemParser(), document, chunk_size) == values
+
+
+@pytest.mark.parametrize(
+    "document",
+    (
+        {"jsonrpc": "2.0", "id": 1, "error": {"code": -32000, "message": "no"}},
+        {"jsonrpc": "2.0", "id": 1, "result": None},
+        [{"jsonrpc": "2.0", "id": 1, "result": []}],
+    ),
+)
+def test_documents_without_items(document):
+    parser = JSONItemParser()
+
+    assert _parse_in_chunks(parser, json.dumps(document).encode(), 4) == []
+    assert parser.document == document
+
+
+@pytest.mark.parametrize(
+    "document",
+    (
+        b'{"result": [1, 2',
+        b'{"result": [1 2]}',
+        b'{"result" [1]}',
+        b'{"result": [tru]}',
+        b'{"result": [1]} {}',
+    ),
+)
+def test_malformed_documents_raise(document):
+    parser = JSONItemParser()
+    with pytest.raises(BadResponseFormat, match="Malformed response"):
+        parser.feed(document)
+        parser.close()
+
+
+def test_buffer_is_bounded_by_item_size():
+    item = {"stack": ["0x" + "ab" * 32] * 16}
+    parser = JSONItemParser()
+    parser.feed(b'{"result": [')
+    for _ in range(10_000):
+        assert parser.feed(json.dumps(item).encode() + b",") == [item]
+        assert len(parser._buffer) < 2 * 64 * 1024
+
+    parser.feed(b"1]}")
+    assert parser.close() == []
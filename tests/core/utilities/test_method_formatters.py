@@ -5,17 +5,30 @@ from eth_typing import (
 )
 
 from web3._utils.method_formatters import (
+    PYTHONIC_RESULT_FORMATTERS,
+    compile_formatter,
     get_error_formatters,
+    get_result_formatters,
     raise_contract_logic_error_on_revert,
     storage_key_to_hexstr,
 )
 from web3._utils.rpc_abi import (
     RPC,
 )
+from web3.datastructures import (
+    AttributeDict,
+)
 from web3.exceptions import (
     ContractLogicError,
     Web3ValueError,
 )
+from web3.tools.benchmark.payloads import (
+    build_block,
+    build_block_receipts,
+    build_logs,
+    build_receipt,
+    build_transaction,
+)
 from web3.types import (
     RPCResponse,
 )
@@ -236,3 +249,63 @@ def test_storage_key_to_hexstr(input_value, expected_output):
             storage_key_to_hexstr(input_value)
     else:
         assert storage_key_to_hexstr(input_value) == expected_output
+
+
+@pytest.mark.parametrize(
+    "method,payload",
+    (
+        (RPC.eth_getBlockByNumber, build_block(num_transactions=20)),
+        (RPC.eth_getBlockByHash, build_block(full_transactions=False)),
+        (RPC.eth_getBlockByNumber, None),
+        (RPC.eth_getLogs, build_logs(num_logs=50)),
+        (RPC.eth_getLogs, ["0x" + "ab" * 32]),
+        (RPC.eth_getBlockReceipts, build_block_receipts(num_transactions=10)),
+        (RPC.eth_getTransactionReceipt, build_receipt(1, 0)),
+        (RPC.eth_getTransactionByHash, build_transaction(1, 0)),
+        (RPC.eth_getTransactionByHash, AttributeDict(build_transaction(1, 0))),
+        (RPC.eth_chainId, "0x1"),
+        (RPC.eth_protocolVersion, "0x41"),
+    ),
+)
+def test_compiled_result_formatters_match_uncompiled(method, payload):
+    uncompiled = PYTHONIC_RESULT_FORMATTERS[method](payload)
+    compiled = get_result_formatters(method, None)(payload)
+    assert compiled == uncompiled
+    assert type(compiled) is type(uncompiled)
+
+
+def test_compiled_result_formatters_preserve_attrdict():
+    payload = AttributeDict(build_transaction(1, 0))
+    formatted = get_result_formatters(RPC.eth_getTransactionByHash, None)(payload)
+    assert isinstance(formatted, AttributeDict)
+    assert formatted.blockNumber == 1
+
+
+def test_compiled_result_formatters_raise_same_errors():
+    log = build_logs(num_logs=1)[0]
+    log["topics"] = ["0x" + "ab" * 33]
+    formatter = PYTHONIC_RESULT_FORMATTERS[RPC.eth_getLogs]
+    compiled = compile_formatter(formatter)
+
+    with pytest.raises(ValueError) as uncompiled_error:
+        formatter([log])
+    with pytest.raises(ValueError) as compiled_error:
+        compiled([log])
+    assert str(compiled_error.value) == str(uncompiled_error.value)
+
+
+def test_compile_formatter_is_cached():
+    formatter = PYTHONIC_RESULT_FORMATTERS[RPC.eth_getBlockByNumber]
+    assert compile_formatter(formatter) is compile_formatter(formatter)
+
+
+def test_result_formatters_are_cached_per_module(w3):
+    eth = w3.eth
+    formatters = get_result_formatters(RPC.eth_getLogs, eth)
+    assert get_result_formatters(RPC.eth_getLogs, eth) is formatters
+    assert RPC.eth_getLogs in eth._result_formatters_cache
+
+    # filter formatters are bound to the module they were retrieved for
+    filter_formatters = get_result_formatters(RPC.eth_newFilter, eth)
+    other_eth = type(eth)(w3)
+    assert get_result_formatters(RPC.eth_newFilter, other_eth) is not filter_formatters
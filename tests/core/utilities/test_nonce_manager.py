@@ -0,0 +1,173 @@
+import pytest
+from concurrent.futures import (
+    ThreadPoolExecutor,
+)
+
+from web3 import (
+    AsyncWeb3,
+    Web3,
+)
+from web3._utils.async_transactions import (
+    async_fill_nonce,
+)
+from web3._utils.transactions import (
+    fill_nonce,
+)
+from web3.providers.eth_tester import (
+    AsyncEthereumTesterProvider,
+    EthereumTesterProvider,
+)
+from web3.utils import (
+    AsyncNonceManager,
+    NonceManager,
+)
+
+SENDER = "0x634743b15C948820069a43f6B361D03EfbBBE5a8"
+
+
+class TransactionCountResponses:
+    def __init__(self, *counts):
+        self.counts = list(counts)
+        self.calls = 0
+
+    def __call__(self, _method, _params):
+        self.calls += 1
+        return hex(self.counts.pop(0) if len(self.counts) > 1 else self.counts[0])
+
+
+@pytest.fixture
+def w3():
+    return Web3(EthereumTesterProvider())
+
+
+def test_nonce_manager_allocates_locally_after_first_sync(w3, request_mocker):
+    nonce_manager = NonceManager()
+    node_count = TransactionCountResponses(5)
+
+    with request_mocker(w3, mock_results={"eth_getTransactionCount": node_count}):
+        assert not nonce_manager.is_synced(SENDER)
+        nonces = [nonce_manager.allocate(w3, SENDER) for _ in range(4)]
+
+    assert nonces == [5, 6, 7, 8]
+    assert node_count.calls == 1
+    assert nonce_manager.is_synced(SENDER.lower())
+
+
+def test_nonce_manager_allocation_is_thread_safe(w3, request_mocker):
+    nonce_manager = NonceManager()
+
+    with request_mocker(
+        w3, mock_results={"eth_getTransactionCount": TransactionCountResponses(0)}
+    ):
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            nonces = list(
+                executor.map(lambda _: nonce_manager.allocate(w3, SENDER), range(200))
+            )
+
+    assert sorted(nonces) == list(range(200))
+
+
+def test_nonce_manager_reuses_released_nonces(w3, request_mocker):
+    nonce_manager = NonceManager()
+
+    with request_mocker(
+        w3, mock_results={"eth_getTransactionCount": TransactionCountResponses(0)}
+    ):
+        for _ in range(4):
+            nonce_manager.allocate(w3, SENDER)
+
+        nonce_manager.release(SENDER, 1)
+        nonce_manager.release(SENDER, 3)
+        assert nonce_manager.allocate(w3, SENDER) == 1
+        assert nonce_manager.allocate(w3, SENDER) == 3
+        assert nonce_manager.allocate(w3, SENDER) == 4
+
+
+def test_nonce_manager_resyncs_on_nonce_errors(w3, request_mocker):
+    nonce_manager = NonceManager()
+    node_count = TransactionCountResponses(0, 10)
+
+    with request_mocker(w3, mock_results={"eth_getTransactionCount": node_count}):
+        assert nonce_manager.allocate(w3, SENDER) == 0
+
+        nonce_manager.handle_send_error(w3, SENDER, 0, "insufficient funds")
+        assert nonce_manager.allocate(w3, SENDER) == 0
+        assert node_count.calls == 1
+
+        nonce_manager.handle_send_error(w3, SENDER, 0, "nonce too low: next nonce 10")
+        assert node_count.calls == 2
+        assert nonce_manager.allocate(w3, SENDER) == 10
+
+
+def test_nonce_manager_detects_and_refills_gaps(w3, request_mocker):
+    nonce_manager = NonceManager()
+
+    with request_mocker(
+        w3, mock_results={"eth_getTransactionCount": TransactionCountResponses(0)}
+    ):
+        for nonce in range(4):
+            assert nonce_manager.allocate(w3, SENDER) == nonce
+        # nonce 1 never made it to the node
+        nonce_manager.release(SENDER, 1)
+        for nonce in (0, 2, 3):
+            nonce_manager.mark_sent(SENDER, nonce, b"\x01" * 32)
+
+    with request_mocker(w3, mock_results={"eth_getTransactionCount": "0x1"}):
+        assert nonce_manager.gaps(w3, SENDER) == [1]
+        assert list(nonce_manager.pending_transactions(SENDER)) == [0, 2, 3]
+
+        assert nonce_manager.sync(w3, SENDER) == 4
+        assert list(nonce_manager.pending_transactions(SENDER)) == [2, 3]
+        assert nonce_manager.allocate(w3, SENDER) == 1
+        assert nonce_manager.allocate(w3, SENDER) == 4
+
+
+def test_nonce_manager_resync_keeps_nonces_being_sent(w3, request_mocker):
+    nonce_manager = NonceManager()
+
+    with request_mocker(
+        w3, mock_results={"eth_getTransactionCount": TransactionCountResponses(0)}
+    ):
+        # nonces 0 and 1 are allocated, but not sent yet, when another send fails
+        for nonce in range(3):
+            assert nonce_manager.allocate(w3, SENDER) == nonce
+        nonce_manager.handle_send_error(w3, SENDER, 2, "nonce too high")
+
+        assert nonce_manager.gaps(w3, SENDER) == []
+        assert nonce_manager.allocate(w3, SENDER) == 2
+        nonce_manager.mark_sent(SENDER, 1, b"\x01" * 32)
+        nonce_manager.release(SENDER, 0)
+        assert nonce_manager.allocate(w3, SENDER) == 0
+
+
+def test_fill_nonce_uses_attached_nonce_manager(w3, request_mocker):
+    node_count = TransactionCountResponses(3)
+    w3.eth.set_nonce_manager(NonceManager())
+
+    with request_mocker(w3, mock_results={"eth_getTransactionCount": node_count}):
+        assert fill_nonce(w3, {"from": SENDER})["nonce"] == 3
+        assert fill_nonce(w3, {"from": SENDER})["nonce"] == 4
+        assert fill_nonce(w3, {"from": SENDER, "nonce": 1})["nonce"] == 1
+
+    assert node_count.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_async_nonce_manager(request_mocker):
+    async_w3 = AsyncWeb3(AsyncEthereumTesterProvider())
+    async_w3.eth.set_nonce_manager(AsyncNonceManager())
+    node_count = TransactionCountResponses(7, 20)
+
+    async with request_mocker(
+        async_w3, mock_results={"eth_getTransactionCount": node_count}
+    ):
+        filled = await async_fill_nonce(async_w3, {"from": SENDER})
+        assert filled["nonce"] == 7
+        assert await async_w3.eth.nonce_manager.allocate(async_w3, SENDER) == 8
+
+        await async_w3.eth.nonce_manager.handle_send_error(
+            async_w3, SENDER, 8, "nonce too high"
+        )
+        assert await async_w3.eth.nonce_manager.allocate(async_w3, SENDER) == 20
+
+    assert node_count.calls == 2
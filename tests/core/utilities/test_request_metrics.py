@@ -0,0 +1,221 @@
+import pytest
+import json
+from unittest.mock import (
+    AsyncMock,
+    Mock,
+    patch,
+)
+
+from websockets.asyncio.server import (
+    serve,
+)
+
+from web3 import (
+    AsyncHTTPProvider,
+    AsyncWeb3,
+    HTTPProvider,
+    Web3,
+    WebSocketProvider,
+)
+from web3.exceptions import (
+    Web3RPCError,
+)
+from web3.utils import (
+    RequestMetrics,
+    SimpleCache,
+)
+
+BLOCK_NUMBER_RESPONSE = b'{"jsonrpc":"2.0","id":0,"result":"0x10"}'
+ERROR_RESPONSE = (
+    b'{"jsonrpc":"2.0","id":0,"error":{"code":-32000,"message":"execution failed"}}'
+)
+BATCH_RESPONSE = (
+    b'[{"jsonrpc":"2.0","id":0,"result":"0x1"},'
+    b'{"jsonrpc":"2.0","id":1,"result":"0x10"}]'
+)
+
+
+def test_request_metrics_snapshot():
+    metrics = RequestMetrics(latency_buckets=(0.1, 1.0))
+    with metrics.track("eth_call"):
+        assert metrics.snapshot()["in_flight"] == {"eth_call": 1}
+    with metrics.track("eth_call") as tracked:
+        tracked.response({"jsonrpc": "2.0", "id": 1, "error": {"code": -32000}})
+    with pytest.raises(ConnectionError):
+        with metrics.track("eth_blockNumber"):
+            raise ConnectionError
+    metrics.record_bytes_sent("eth_call", 100)
+    metrics.record_bytes_received("eth_call", 50)
+    metrics.record_bytes_received("", 10)
+
+    snapshot = metrics.snapshot()
+    assert snapshot["in_flight"] == {}
+    assert set(snapshot["requests"]) == {"", "eth_blockNumber", "eth_call"}
+    eth_call = snapshot["requests"]["eth_call"]
+    assert eth_call["count"] == 2
+    assert eth_call["errors"] == 1
+    assert eth_call["latency"]["buckets"] == {0.1: 2, 1.0: 2, float("inf"): 2}
+    assert (eth_call["bytes_sent"], eth_call["bytes_received"]) == (100, 50)
+    assert snapshot["requests"]["eth_blockNumber"]["errors"] == 1
+    assert snapshot["requests"][""]["count"] == 0
+
+    metrics.reset()
+    assert metrics.snapshot()["requests"] == {}
+
+
+def test_request_metrics_cache_counts():
+    metrics = RequestMetrics()
+    cache = SimpleCache(2)
+    metrics.watch_cache("test", cache)
+
+    cache.cache("a", 1)
+    cache.cache("b", 2)
+    cache.cache("c", 3)
+    assert cache.get_cache_entry("c") == 3
+    assert cache.get_cache_entry("a") is None
+
+    assert metrics.snapshot()["caches"] == {
+        "test": {"hits": 1, "misses": 1, "evictions": 1, "size": 2}
+    }
+    metrics.reset()
+    assert metrics.snapshot()["caches"]["test"] == {
+        "hits": 0,
+        "misses": 0,
+        "evictions": 0,
+        "size": 2,
+    }
+
+
+def test_request_metrics_prometheus_text():
+    metrics = RequestMetrics(latency_buckets=(0.5,))
+    metrics.watch_cache("request", SimpleCache())
+    with metrics.track("eth_chainId"):
+        pass
+    metrics.record_bytes_sent("eth_chainId", 60)
+
+    text = metrics.prometheus_text(prefix="app")
+    lines = text.splitlines()
+    assert "# TYPE app_request_duration_seconds histogram" in lines
+    bucket = 'app_request_duration_seconds_bucket{method="eth_chainId"'
+    assert f'{bucket},le="0.5"}} 1' in lines
+    assert f'{bucket},le="+Inf"}} 1' in lines
+    assert 'app_request_duration_seconds_count{method="eth_chainId"} 1' in lines
+    assert 'app_request_errors_total{method="eth_chainId"} 0' in lines
+    assert 'app_request_bytes_total{method="eth_chainId"} 60' in lines
+    assert 'app_cache_misses_total{cache="request"} 0' in lines
+    assert 'app_cache_size{cache="request"} 0' in lines
+    assert text.endswith("\n")
+
+
+def test_providers_without_metrics():
+    assert Web3(HTTPProvider()).metrics is None
+    assert AsyncWeb3(AsyncHTTPProvider()).metrics is None
+
+
+@patch(
+    "web3._utils.http_session_manager.HTTPSessionManager.make_post_request",
+    new_callable=Mock,
+)
+def test_http_provider_metrics(mock_post):
+    metrics = RequestMetrics()
+    w3 = Web3(HTTPProvider(metrics=metrics, cache_allowed_requests=True))
+    assert w3.metrics is metrics
+
+    mock_post.return_value = BLOCK_NUMBER_RESPONSE
+    assert w3.eth.block_number == 16
+    mock_post.return_value = ERROR_RESPONSE
+    with pytest.raises(Web3RPCError):
+        w3.eth.call({"to": "0x" + "00" * 20})
+    mock_post.return_value = BATCH_RESPONSE
+    with w3.batch_requests() as batch:
+        batch.add(w3.eth.chain_id)
+        batch.add(w3.eth.block_number)
+        assert batch.execute() == [1, 16]
+
+    requests = metrics.snapshot()["requests"]
+    assert requests["eth_blockNumber"]["count"] == 1
+    assert requests["eth_blockNumber"]["bytes_sent"] > 0
+    assert requests["eth_blockNumber"]["bytes_received"] == len(BLOCK_NUMBER_RESPONSE)
+    assert requests["eth_call"]["errors"] == 1
+    assert requests["batch"]["count"] == 1
+    assert requests["batch"]["bytes_received"] == len(BATCH_RESPONSE)
+    assert set(metrics.snapshot()["caches"]) == {"request", "session"}
+
+
+@pytest.mark.asyncio
+@patch(
+    "web3._utils.http_session_manager.HTTPSessionManager.async_make_post_request",
+    new_callable=AsyncMock,
+)
+async def test_async_http_provider_metrics(mock_post):
+    metrics = RequestMetrics()
+    async_w3 = AsyncWeb3(AsyncHTTPProvider(metrics=metrics))
+    assert async_w3.metrics is metrics
+
+    mock_post.return_value = BLOCK_NUMBER_RESPONSE
+    assert await async_w3.eth.block_number == 16
+    mock_post.return_value = BATCH_RESPONSE
+    async with async_w3.batch_requests() as batch:
+        batch.add(async_w3.eth.chain_id)
+        batch.add(async_w3.eth.block_number)
+        assert await batch.async_execute() == [1, 16]
+
+    requests = metrics.snapshot()["requests"]
+    assert requests["eth_blockNumber"]["count"] == 1
+    assert requests["eth_blockNumber"]["bytes_received"] == len(BLOCK_NUMBER_RESPONSE)
+    assert requests["eth_chainId"]["bytes_sent"] > 0
+    assert requests["batch"]["count"] == 1
+
+
+async def _node_handler(ws):
+    async for message in ws:
+        request = json.loads(message)
+        if isinstance(request, list):
+            response = [
+                {"jsonrpc": "2.0", "id": item["id"], "result": hex(index + 1)}
+                for index, item in enumerate(request)
+            ]
+        elif request["method"] == "eth_call":
+            response = {
+                "jsonrpc": "2.0",
+                "id": request["id"],
+                "error": {"code": -32000, "message": "execution failed"},
+            }
+        else:
+            response = {"jsonrpc": "2.0", "id": request["id"], "result": "0x10"}
+        await ws.send(json.dumps(response))
+
+
+@pytest.mark.asyncio
+async def test_websocket_provider_metrics():
+    metrics = RequestMetrics()
+    async with serve(_node_handler, "127.0.0.1", 0) as server:
+        port = server.sockets[0].getsockname()[1]
+        provider = WebSocketProvider(f"ws://127.0.0.1:{port}", metrics=metrics)
+        async with AsyncWeb3(provider) as async_w3:
+            assert await async_w3.eth.block_number == 16
+            with pytest.raises(Web3RPCError):
+                await async_w3.eth.call({"to": "0x" + "00" * 20})
+            async with async_w3.batch_requests() as batch:
+                batch.add(async_w3.eth.chain_id)
+                batch.add(async_w3.eth.block_number)
+                assert await batch.async_execute() == [1, 2]
+
+            await async_w3.socket.send("eth_blockNumber", [])
+            assert metrics.snapshot()["in_flight"] == {"eth_blockNumber": 1}
+            assert (await async_w3.socket.recv())["result"] == "0x10"
+
+    snapshot = metrics.snapshot()
+    requests = snapshot["requests"]
+    assert snapshot["in_flight"] == {}
+    assert set(requests) == {"", "batch", "eth_blockNumber", "eth_call", "eth_chainId"}
+    assert requests["eth_blockNumber"]["count"] == 2
+    assert requests["eth_blockNumber"]["errors"] == 0
+    assert requests["eth_blockNumber"]["bytes_sent"] > 0
+    response_size = len(json.dumps(json.loads(BLOCK_NUMBER_RESPONSE)))
+    assert requests["eth_blockNumber"]["bytes_received"] == response_size
+    # the response to the raw request isn't matched to it
+    assert requests[""]["bytes_received"] == response_size
+    assert requests["eth_call"]["count"] == requests["eth_call"]["errors"] == 1
+    assert requests["batch"]["count"] == 1
+    assert requests["batch"]["bytes_received"] > 0
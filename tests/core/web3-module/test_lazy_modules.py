@@ -0,0 +1,105 @@
+import pytest
+from concurrent.futures import (
+    ThreadPoolExecutor,
+)
+from io import (
+    UnsupportedOperation,
+)
+
+from web3 import (
+    AsyncWeb3,
+    Web3,
+)
+from web3.eth import (
+    AsyncEth,
+    Eth,
+)
+from web3.exceptions import (
+    Web3AttributeError,
+    Web3ValidationError,
+)
+from web3.geth import (
+    GethAdmin,
+)
+from web3.providers.eth_tester import (
+    AsyncEthereumTesterProvider,
+    EthereumTesterProvider,
+)
+
+
+def test_modules_are_built_on_first_access():
+    w3 = Web3(EthereumTesterProvider())
+    assert "eth" not in vars(w3)
+    assert "geth" not in vars(w3)
+    assert "codec" not in vars(w3) and w3._codec is None
+
+    eth = w3.eth
+    assert isinstance(eth, Eth)
+    assert w3.eth is eth
+    assert vars(w3)["eth"] is eth
+    assert "geth" not in vars(w3)
+
+    # submodules are built along with their parent module
+    assert isinstance(vars(w3.geth)["admin"], GethAdmin)
+
+
+def test_async_modules_are_built_on_first_access():
+    async_w3 = AsyncWeb3(AsyncEthereumTesterProvider())
+    assert "eth" not in vars(async_w3)
+    assert isinstance(async_w3.eth, AsyncEth)
+
+
+def test_lazy_modules_are_listed(module1):
+    w3 = Web3(EthereumTesterProvider(), external_modules={"module1": module1})
+    assert {"eth", "net", "geth", "module1"} <= set(dir(w3))
+    assert hasattr(w3, "module1")
+    assert not hasattr(w3, "module2")
+
+
+def test_unknown_attribute_raises_attribute_error():
+    w3 = Web3(EthereumTesterProvider())
+    with pytest.raises(
+        Web3AttributeError, match="'Web3' object has no attribute 'not_a_module'"
+    ):
+        w3.not_a_module
+
+
+def test_invalid_module_definitions_raise_on_construction(
+    module1, module_many_init_args
+):
+    with pytest.raises(
+        Web3AttributeError,
+        match="The web3 object already has an attribute with that name",
+    ):
+        Web3(EthereumTesterProvider(), external_modules={"eth": module1})
+
+    with pytest.raises(
+        Web3ValidationError, match="Module definitions can only have 1 or 2 elements"
+    ):
+        Web3(
+            EthereumTesterProvider(),
+            external_modules={"module1": (module1, {}, {})},
+        )
+
+    with pytest.raises(UnsupportedOperation):
+        Web3(
+            EthereumTesterProvider(),
+            external_modules={"module1": (module1, {"sub": module_many_init_args})},
+        )
+
+
+def test_lazy_module_is_built_once_across_threads():
+    w3 = Web3(EthereumTesterProvider())
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        modules = list(executor.map(lambda _: w3.geth, range(32)))
+
+    assert all(module is modules[0] for module in modules)
+
+
+def test_method_callers_are_cached_per_module():
+    w3 = Web3(EthereumTesterProvider())
+    other_w3 = Web3(EthereumTesterProvider())
+
+    assert w3.eth.get_block_number is w3.eth.get_block_number
+    assert w3.eth.get_block_number is not other_w3.eth.get_block_number
+    assert w3.eth.get_block_number() == 0
@@ -0,0 +1,46 @@
+import json
+
+from ens import (
+    _normalization,
+)
+from ens._normalization_tables import (
+    NORMALIZATION_SPEC_PATH,
+    NORMALIZATION_TABLES_PATH,
+    CodepointRanges,
+    compile_normalization_tables,
+)
+
+
+def test_compiled_normalization_tables_are_up_to_date():
+    with open(NORMALIZATION_SPEC_PATH) as spec_file:
+        compiled_tables = compile_normalization_tables(json.load(spec_file))
+    with open(NORMALIZATION_TABLES_PATH, "rb") as tables_file:
+        assert tables_file.read() == compiled_tables
+
+
+def test_codepoint_ranges():
+    ranges = CodepointRanges.from_codepoints([5, 1, 2, 3, 7, 8, 3])
+
+    assert list(ranges.starts) == [1, 5, 7]
+    assert list(ranges.stops) == [4, 6, 9]
+    assert [cp for cp in range(11) if cp in ranges] == [1, 2, 3, 5, 7, 8]
+
+
+def test_normalization_tables_are_loaded_on_first_use(monkeypatch):
+    loads = []
+
+    def load_normalization_tables():
+        loads.append(None)
+        return load_tables()
+
+    load_tables = _normalization.load_normalization_tables
+    monkeypatch.setattr(_normalization, "_tables", None)
+    monkeypatch.setattr(
+        _normalization, "load_normalization_tables", load_normalization_tables
+    )
+
+    assert _normalization.normalize_name_ensip15("Vitalik.eth").as_text == (
+        "vitalik.eth"
+    )
+    assert _normalization.normalize_name_ensip15("nick.eth").as_text == "nick.eth"
+    assert len(loads) == 1
@@ -0,0 +1,143 @@
+import pytest
+from concurrent.futures import (
+    ThreadPoolExecutor,
+)
+
+from ens import (
+    base_ens as ens_base_module,
+)
+
+EXTENDED_RESOLVER_PARENT_ADDRESS = "0x000000000000000000000000000000000000bEEF"
+EXTENDED_RESOLVER_CHILD_ADDRESS = "0x000000000000000000000000000000000000dEaD"
+
+BULK_RESOLUTION_NAMES = (
+    "resolver.eth",
+    "extended-resolver.eth",
+    "sub1.extended-resolver.eth",
+    "SUB2.extended-resolver.eth",
+    "unknown-name.tester.eth",
+    "unknown-tld",
+    "resolver.eth",
+)
+
+
+def test_addresses_match_individual_lookups(ens):
+    addresses = ens.addresses(BULK_RESOLUTION_NAMES)
+
+    assert addresses == [ens.address(name) for name in BULK_RESOLUTION_NAMES]
+    assert addresses[0] == addresses[-1] == ens.resolver("resolver.eth").address
+    assert addresses[1] == EXTENDED_RESOLVER_PARENT_ADDRESS
+    assert addresses[2] == addresses[3] == EXTENDED_RESOLVER_CHILD_ADDRESS
+    assert addresses[4] is None
+    assert addresses[5] is None
+
+
+def test_addresses_round_trips_do_not_grow_with_the_number_of_names(ens, mocker):
+    call_all = mocker.spy(ens, "_call_all")
+
+    ens.addresses(["sub1.extended-resolver.eth"])
+    single_name_round_trips = call_all.call_count
+    call_all.reset_mock()
+
+    names = [f"sub{i}.extended-resolver.eth" for i in range(10)]
+    assert ens.addresses(names) == [EXTENDED_RESOLVER_CHILD_ADDRESS] * 10
+    assert call_all.call_count == single_name_round_trips
+
+
+def test_names_match_individual_lookups(ens):
+    address, unnamed_address = ens.w3.eth.accounts[5:7]
+    ens.setup_name("bulk.tester.eth", address)
+
+    assert ens.names([address, unnamed_address]) == [
+        ens.name(address),
+        ens.name(unnamed_address),
+    ]
+    assert ens.names([address, unnamed_address]) == ["bulk.tester.eth", None]
+
+    # the forward resolution must also return the address
+    ens.setup_address("bulk.tester.eth", unnamed_address)
+    assert ens.names([address]) == [None]
+
+    # teardown
+    ens.setup_name(None, address)
+    ens.setup_address("bulk.tester.eth", None)
+
+
+def test_resolution_cache(ens, mocker, monkeypatch):
+    monkeypatch.setattr(ens, "cache_ttl", 60)
+    address = ens.w3.eth.accounts[5]
+    call_all = mocker.spy(ens, "_call_all")
+
+    try:
+        assert ens.address("cached.tester.eth") is None
+        call_all.reset_mock()
+        assert ens.addresses(["cached.tester.eth", "cached.tester.eth"]) == [None, None]
+        assert call_all.call_count == 0
+
+        # changing a record drops the cache
+        ens.setup_address("cached.tester.eth", address)
+        assert ens.address("cached.tester.eth") == address
+
+        ens.setup_address("cached.tester.eth", None)
+        assert ens.address("cached.tester.eth") is None
+    finally:
+        ens.clear_cache()
+
+
+def test_resolution_memoizes_normalized_names(ens, mocker):
+    normalize_name = mocker.spy(ens_base_module, "normalize_name")
+
+    # memoized without a cache ttl, and kept after changes to records
+    assert ens.cache_ttl == 0
+    assert ens.addresses(["Memoized.tester.eth"]) == [None]
+    ens.clear_cache()
+    ens.address("Memoized.tester.eth")
+    ens.addresses(["Memoized.tester.eth", "memoized.tester.eth"])
+    assert [call.args for call in normalize_name.call_args_list] == [
+        ("Memoized.tester.eth",),
+        ("memoized.tester.eth",),
+    ]
+
+
+def test_resolution_cache_is_thread_safe(ens, monkeypatch):
+    monkeypatch.setattr(ens, "cache_ttl", 60)
+    monkeypatch.setattr(ens_base_module, "RESOLUTION_CACHE_SIZE", 8)
+
+    def use_cache(worker):
+        for i in range(2000):
+            key = f"key:{(worker + i) % 16}"
+            ens._set_cached(key, i)
+            ens._get_cached(key)
+
+    try:
+        with ThreadPoolExecutor(8) as executor:
+            list(executor.map(use_cache, range(8)))
+        assert len(ens._resolution_cache) == 8
+    finally:
+        ens.clear_cache()
+
+
+# -- async -- #
+
+
+@pytest.mark.asyncio
+async def test_async_addresses_and_names_match_individual_lookups(async_ens):
+    addresses = await async_ens.addresses(BULK_RESOLUTION_NAMES)
+    assert addresses == [
+        await async_ens.address(name) for name in BULK_RESOLUTION_NAMES
+    ]
+    assert addresses[1] == EXTENDED_RESOLVER_PARENT_ADDRESS
+    assert addresses[2] == EXTENDED_RESOLVER_CHILD_ADDRESS
+
+    accounts = await async_ens.w3.eth.accounts
+    address, unnamed_address = accounts[5:7]
+    await async_ens.setup_name("bulk.tester.eth", address)
+
+    assert await async_ens.names([address, unnamed_address]) == [
+        "bulk.tester.eth",
+        None,
+    ]
+
+    # teardown
+    await async_ens.setup_name(None, address)
+    await async_ens.setup_address("bulk.tester.eth", None)
@@ -1,36 +1,65 @@
-from eth_account import Account  # noqa: E402
-
 from importlib.metadata import version
+from typing import (
+    TYPE_CHECKING,
+)
 
 __version__ = version("web3")
 
 
+from web3._utils.lazy_imports import (
+    lazy_module_getattr,
+)
 from web3.main import (
     AsyncWeb3,
     Web3,
 )
 from web3.providers import (
     AsyncBaseProvider,
-    AutoProvider,
     BaseProvider,
     JSONBaseProvider,
-    PersistentConnection,
-)
-from web3.providers.persistent import (  # noqa: E402
-    AsyncIPCProvider,
-    PersistentConnectionProvider,
-    WebSocketProvider,
-)
-from web3.providers.eth_tester import (  # noqa: E402
-    AsyncEthereumTesterProvider,
-    EthereumTesterProvider,
 )
-from web3.providers.ipc import (  # noqa: E402
-    IPCProvider,
-)
-from web3.providers.rpc import (  # noqa: E402
-    AsyncHTTPProvider,
-    HTTPProvider,
+
+if TYPE_CHECKING:
+    from eth_account import Account  # noqa: F401
+
+    from web3.providers import (  # noqa: F401
+        AutoProvider,
+        PersistentConnection,
+    )
+    from web3.providers.persistent import (  # noqa: F401
+        AsyncIPCProvider,
+        PersistentConnectionProvider,
+        WebSocketProvider,
+    )
+    from web3.providers.eth_tester import (  # noqa: F401
+        AsyncEthereumTesterProvider,
+        EthereumTesterProvider,
+    )
+    from web3.providers.ipc import (  # noqa: F401
+        IPCProvider,
+    )
+    from web3.providers.rpc import (  # noqa: F401
+        AsyncHTTPProvider,
+        HTTPProvider,
+    )
+
+
+# imported on first access, to keep ``import web3`` fast
+__getattr__ = lazy_module_getattr(
+    __name__,
+    {
+        "Account": "eth_account",
+        "AsyncEthereumTesterProvider": "web3.providers.eth_tester",
+        "AsyncHTTPProvider": "web3.providers.rpc",
+        "AsyncIPCProvider": "web3.providers.persistent",
+        "AutoProvider": "web3.providers.auto",
+        "EthereumTesterProvider": "web3.providers.eth_tester",
+        "HTTPProvider": "web3.providers.rpc",
+        "IPCProvider": "web3.providers.ipc",
+        "PersistentConnection": "web3.providers.persistent",
+        "PersistentConnectionProvider": "web3.providers.persistent",
+        "WebSocketProvider": "web3.providers.persistent",
+    },
 )
 
 
@@ -7,6 +7,9 @@ from typing import (
 from eth_typing import (
     ChecksumAddress,
 )
+from eth_utils import (
+    is_address,
+)
 from eth_utils.toolz import (
     assoc,
     merge,
@@ -40,6 +43,12 @@ if TYPE_CHECKING:
     from web3.main import (  # noqa: F401
         AsyncWeb3,
     )
+    from web3.utils.fee_defaults_cache import (  # noqa: F401
+        AsyncFeeDefaultsCache,
+    )
+    from web3.utils.nonce_manager import (  # noqa: F401
+        AsyncNonceManager,
+    )
 
 
 # unused vars present in these funcs because they all need to have the same signature
@@ -49,25 +58,41 @@ async def _estimate_gas(
     return await async_w3.eth.estimate_gas(tx)
 
 
+# fee and chain id defaults are served by the fee defaults cache, when one is set
+def _fee_defaults_cache(async_w3: "AsyncWeb3[Any]") -> "AsyncFeeDefaultsCache | None":
+    return cast("AsyncFeeDefaultsCache | None", async_w3.eth.fee_defaults_cache)
+
+
 async def _max_fee_per_gas(
     async_w3: "AsyncWeb3[Any]", tx: TxParams, defaults: dict[str, bytes | int]
 ) -> Wei:
-    block = await async_w3.eth.get_block("latest")
+    fee_defaults_cache = _fee_defaults_cache(async_w3)
+    if fee_defaults_cache is not None:
+        base_fee = await fee_defaults_cache.base_fee(async_w3)
+    else:
+        block = await async_w3.eth.get_block("latest")
+        base_fee = block["baseFeePerGas"]
     max_priority_fee = tx.get(
         "maxPriorityFeePerGas", defaults.get("maxPriorityFeePerGas")
     )
-    return Wei(int(max_priority_fee) + (2 * int(block["baseFeePerGas"])))
+    return Wei(int(max_priority_fee) + (2 * int(base_fee)))
 
 
 async def _max_priority_fee_gas(
     async_w3: "AsyncWeb3[Any]", _tx: TxParams, _defaults: dict[str, bytes | int]
 ) -> Wei:
+    fee_defaults_cache = _fee_defaults_cache(async_w3)
+    if fee_defaults_cache is not None:
+        return await fee_defaults_cache.max_priority_fee(async_w3)
     return await async_w3.eth.max_priority_fee
 
 
 async def _chain_id(
     async_w3: "AsyncWeb3[Any]", _tx: TxParams, _defaults: dict[str, bytes | int]
 ) -> int:
+    fee_defaults_cache = _fee_defaults_cache(async_w3)
+    if fee_defaults_cache is not None:
+        return await fee_defaults_cache.chain_id(async_w3)
     return await async_w3.eth.chain_id
 
 
@@ -112,6 +137,12 @@ async def async_fill_nonce(
     async_w3: "AsyncWeb3[Any]", transaction: TxParams
 ) -> TxParams:
     if "from" in transaction and "nonce" not in transaction:
+        nonce_manager = cast("AsyncNonceManager | None", async_w3.eth.nonce_manager)
+        if nonce_manager is not None and is_address(transaction["from"]):
+            nonce = await nonce_manager.allocate(
+                async_w3, cast(str, transaction["from"])
+            )
+            return assoc(transaction, "nonce", nonce)
         tx_count = await async_w3.eth.get_transaction_count(
             cast(ChecksumAddress, transaction["from"]),
             block_identifier="pending",
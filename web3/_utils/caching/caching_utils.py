@@ -153,6 +153,7 @@ ALWAYS_CACHE = {
 }
 BLOCKNUM_IN_PARAMS = {
     RPC.eth_getBlockByNumber,
+    RPC.eth_getBlockReceipts,
     RPC.eth_getRawTransactionByBlockNumberAndIndex,
     RPC.eth_getBlockTransactionCountByNumber,
     RPC.eth_getUncleByBlockNumberAndIndex,
@@ -164,6 +165,7 @@ BLOCK_IN_RESULT = {
     RPC.eth_getTransactionByBlockNumberAndIndex,
     RPC.eth_getTransactionByBlockHashAndIndex,
     RPC.eth_getBlockTransactionCountByHash,
+    RPC.eth_getTransactionReceipt,
 }
 BLOCKHASH_IN_PARAMS = {
     RPC.eth_getRawTransactionByBlockHashAndIndex,
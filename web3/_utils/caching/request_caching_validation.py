@@ -6,6 +6,9 @@ from typing import (
     TypeVar,
 )
 
+from web3._utils.blocks import (
+    is_hex_encoded_block_hash,
+)
 from web3.types import (
     RPCEndpoint,
 )
@@ -91,6 +94,9 @@ def validate_from_block_id_in_params(
     if block_id == "earliest":
         # `earliest` should always be cacheable
         return True
+    elif is_hex_encoded_block_hash(block_id):
+        # e.g. ``eth_getBlockReceipts`` takes a block number or a block hash
+        return validate_from_blockhash_in_params(provider, params, _result)
 
     blocknum = int(block_id, 16)
     return is_beyond_validation_threshold(provider, blocknum=blocknum)
@@ -218,6 +224,9 @@ async def async_validate_from_block_id_in_params(
     if block_id == "earliest":
         # `earliest` should always be cacheable
         return True
+    elif is_hex_encoded_block_hash(block_id):
+        # e.g. ``eth_getBlockReceipts`` takes a block number or a block hash
+        return await async_validate_from_blockhash_in_params(provider, params, _result)
 
     blocknum = int(block_id, 16)
     return await async_is_beyond_validation_threshold(provider, blocknum=blocknum)
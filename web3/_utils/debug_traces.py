@@ -0,0 +1,144 @@
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Iterator,
+    Sequence,
+    cast,
+)
+
+from web3._utils.json_stream import (
+    JSONItemParser,
+)
+from web3._utils.method_formatters import (
+    OPCODE_TRACE_FORMATTERS,
+    debug_calltrace_result_formatter,
+)
+from web3.exceptions import (
+    Web3ValueError,
+)
+from web3.types import (
+    CallTrace,
+    StructLog,
+    TraceConfig,
+)
+
+# the fields of each struct log kept by default in the compact tuple representation
+STRUCT_LOG_FIELDS = ("pc", "op", "gas", "gasCost", "depth")
+
+# struct log fields the node leaves out when asked to
+_OPT_OUT_FIELDS = {"stack": "disableStack", "storage": "disableStorage"}
+# struct log fields the node only includes when asked to
+_OPT_IN_FIELDS = {"memory": "enableMemory", "returnData": "enableReturnData"}
+
+
+def struct_log_trace_config(
+    trace_config: TraceConfig | None, fields: Sequence[str] | None
+) -> TraceConfig:
+    """
+    The trace config for tracing struct logs with the default opcode logger. When
+    ``fields`` are given, the node is asked to leave out the stack, storage, memory
+    and return data of each struct log unless they are among them.
+    """
+    config = cast(TraceConfig, dict(trace_config or {}))
+    if "tracer" in config:
+        raise Web3ValueError(
+            "Struct logs are only returned by the default opcode logger, not by "
+            f"{config['tracer']!r}. Use `iter_call_frames` for the call tracer."
+        )
+
+    if fields is not None:
+        for field, option in _OPT_OUT_FIELDS.items():
+            config[option] = field not in fields  # type: ignore[literal-required]
+        for field, option in _OPT_IN_FIELDS.items():
+            config[option] = field in fields  # type: ignore[literal-required]
+    return config
+
+
+def struct_log_formatter(
+    fields: Sequence[str] | None, as_tuples: bool
+) -> Callable[[dict[str, Any]], StructLog | tuple[Any, ...]]:
+    """
+    Build the formatter for each streamed struct log, keeping only ``fields`` and,
+    if ``as_tuples``, returning their values as a tuple in the same order.
+    """
+    integer_fields = tuple(
+        (field, formatter)
+        for field, formatter in OPCODE_TRACE_FORMATTERS.items()
+        if fields is None or field in fields
+    )
+
+    def format_struct_log(log: dict[str, Any]) -> StructLog | tuple[Any, ...]:
+        for field, formatter in integer_fields:
+            value = log.get(field)
+            if isinstance(value, str):
+                log[field] = formatter(value)
+
+        if fields is None:
+            return cast(StructLog, log)
+        elif as_tuples:
+            return tuple(log.get(field) for field in fields)
+        else:
+            return cast(
+                StructLog, {field: log[field] for field in fields if field in log}
+            )
+
+    return format_struct_log
+
+
+async def async_format_items(
+    items: AsyncIterator[Any], formatter: Callable[[Any], Any]
+) -> AsyncIterator[Any]:
+    async for item in items:
+        yield formatter(item)
+
+
+def call_frame_trace_config(trace_config: TraceConfig | None) -> TraceConfig:
+    """
+    The trace config for tracing call frames with the call tracer.
+    """
+    config = cast(TraceConfig, dict(trace_config or {}))
+    tracer = config.setdefault("tracer", "callTracer")
+    if tracer != "callTracer":
+        raise Web3ValueError(
+            f"Call frames are only returned by the call tracer, not by {tracer!r}."
+        )
+    return config
+
+
+def format_call_frame(frame: dict[str, Any], depth: int) -> CallTrace:
+    """
+    Format a call frame without the frames of the calls it made, adding its
+    ``depth`` in the call tree, 0 for the transaction's top-level call.
+    """
+    frame.pop("calls", None)
+    formatted = debug_calltrace_result_formatter(frame)
+    formatted["depth"] = depth
+    return cast(CallTrace, formatted)
+
+
+def stream_call_frames(
+    calls: Iterator[tuple[int, Any]], parser: JSONItemParser
+) -> Iterator[CallTrace]:
+    """
+    Format the calls streamed at each level below the top-level call of a call
+    trace, each after the calls it made, followed by the top-level call itself once
+    the rest of the trace has been read.
+    """
+    for level, call in calls:
+        yield format_call_frame(call, level + 1)
+
+    top_level_call = parser.document["result"]
+    if top_level_call is not None:
+        yield format_call_frame(top_level_call, 0)
+
+
+async def async_stream_call_frames(
+    calls: AsyncIterator[tuple[int, Any]], parser: JSONItemParser
+) -> AsyncIterator[CallTrace]:
+    async for level, call in calls:
+        yield format_call_frame(call, level + 1)
+
+    top_level_call = parser.document["result"]
+    if top_level_call is not None:
+        yield format_call_frame(top_level_call, 0)
@@ -8,6 +8,8 @@ import threading
 import time
 from typing import (
     Any,
+    AsyncIterator,
+    Iterator,
 )
 
 from aiohttp import (
@@ -30,6 +32,9 @@ from web3._utils.caching import (
 from web3._utils.http import (
     DEFAULT_HTTP_TIMEOUT,
 )
+from web3._utils.json_stream import (
+    STREAM_CHUNK_SIZE,
+)
 from web3.exceptions import (
     TimeExhausted,
 )
@@ -167,6 +172,33 @@ class HTTPSessionManager:
                 raise TimeExhausted
         return response_body
 
+    def stream_post_request(
+        self,
+        endpoint_uri: URI,
+        data: bytes | dict[str, Any],
+        chunk_size: int = STREAM_CHUNK_SIZE,
+        **kwargs: Any,
+    ) -> Iterator[bytes]:
+        """
+        Yield the body of the response in chunks as it is received. The timeout
+        applies to the wait for each chunk, as the whole response may take longer
+        to consume than to receive.
+        """
+        kwargs["stream"] = True
+        with self.get_response_from_post_request(
+            endpoint_uri, data=data, **kwargs
+        ) as response:
+            response.raise_for_status()
+            yield from response.iter_content(chunk_size)
+
+    def stream_get_request(
+        self, endpoint_uri: URI, chunk_size: int = STREAM_CHUNK_SIZE, **kwargs: Any
+    ) -> Iterator[bytes]:
+        kwargs["stream"] = True
+        with self.get_response_from_get_request(endpoint_uri, **kwargs) as response:
+            response.raise_for_status()
+            yield from response.iter_content(chunk_size)
+
     def _close_evicted_sessions(self, evicted_sessions: list[requests.Session]) -> None:
         for evicted_session in evicted_sessions:
             evicted_session.close()
@@ -185,7 +217,8 @@ class HTTPSessionManager:
 
         evicted_items = None
         async with async_lock(self.session_pool, self._lock):
-            if cache_key not in self.session_cache:
+            cached_session = self.session_cache.get_cache_entry(cache_key)
+            if cached_session is None:
                 if session is None:
                     session = ClientSession(
                         raise_for_status=True,
@@ -202,8 +235,6 @@ class HTTPSessionManager:
                 )
 
             else:
-                # get the cached session
-                cached_session = self.session_cache.get_cache_entry(cache_key)
                 session_is_closed = cached_session.closed
                 session_loop_is_closed = cached_session._loop.is_closed()
 
@@ -322,6 +353,48 @@ class HTTPSessionManager:
         response.raise_for_status()
         return await response.read()
 
+    @staticmethod
+    def _streaming_timeout(timeout: ClientTimeout | float | None) -> ClientTimeout:
+        # time out waiting on each chunk rather than on the whole response, which
+        # may take longer to consume than to receive
+        if isinstance(timeout, ClientTimeout):
+            timeout = timeout.total or timeout.sock_read
+        if timeout is None:
+            timeout = DEFAULT_HTTP_TIMEOUT
+        return ClientTimeout(total=None, sock_connect=timeout, sock_read=timeout)
+
+    async def async_stream_post_request(
+        self,
+        endpoint_uri: URI,
+        data: bytes | dict[str, Any],
+        chunk_size: int = STREAM_CHUNK_SIZE,
+        **kwargs: Any,
+    ) -> AsyncIterator[bytes]:
+        """
+        Yield the body of the response in chunks as it is received. The timeout
+        applies to the wait for each chunk.
+        """
+        kwargs["timeout"] = self._streaming_timeout(kwargs.get("timeout"))
+        response = await self.async_get_response_from_post_request(
+            endpoint_uri, data=data, **kwargs
+        )
+        async with response:
+            response.raise_for_status()
+            async for chunk in response.content.iter_chunked(chunk_size):
+                yield chunk
+
+    async def async_stream_get_request(
+        self, endpoint_uri: URI, chunk_size: int = STREAM_CHUNK_SIZE, **kwargs: Any
+    ) -> AsyncIterator[bytes]:
+        kwargs["timeout"] = self._streaming_timeout(kwargs.get("timeout"))
+        response = await self.async_get_response_from_get_request(
+            endpoint_uri, **kwargs
+        )
+        async with response:
+            response.raise_for_status()
+            async for chunk in response.content.iter_chunked(chunk_size):
+                yield chunk
+
     async def _async_close_evicted_sessions(
         self, timeout: float, evicted_sessions: list[ClientSession]
     ) -> None:
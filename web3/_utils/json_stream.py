@@ -0,0 +1,413 @@
+import codecs
+import json
+import re
+from typing import (
+    Any,
+    Sequence,
+)
+
+from web3.exceptions import (
+    BadResponseFormat,
+)
+
+# characters that change the nesting depth, or start a string, outside of a string
+_STRUCTURAL = re.compile(r'[\[\]{}"]')
+# characters that end a string, or escape the next character, inside of a string
+_STRING_SPECIAL = re.compile(r'["\\]')
+# characters that end a number, ``true``, ``false`` or ``null``
+_SCALAR_END = re.compile(r"[\s,\]}]")
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+# characters that can follow the integer part of a number, within the number
+_NUMBER_CONTINUATION = ".eE+-"
+
+_DECODER = json.JSONDecoder()
+
+# the size of the chunks streamed responses are read in
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# what a container expects to find next
+_KEY_OR_END = 0
+_KEY = 1
+_COLON_NEXT = 2
+_VALUE_OR_END = 3
+_VALUE = 4
+_COMMA_OR_END = 5
+
+# the buffer is only compacted once this much of it has been consumed, so that
+# small chunks don't each cause a copy of the unconsumed text
+_COMPACT_AFTER = 64 * 1024
+
+
+class _Container:
+    """
+    An object or array the parser is inside of, on the way to, or at, the item path.
+    """
+
+    __slots__ = ("is_object", "value", "depth", "streamed", "level", "state", "key")
+
+    def __init__(
+        self,
+        is_object: bool,
+        value: Any,
+        depth: int,
+        streamed: bool,
+        level: int | None = None,
+    ) -> None:
+        self.is_object = is_object
+        # where the values read in this container are kept, None when streamed
+        self.value = value
+        # the number of item path keys leading to this container
+        self.depth = depth
+        self.streamed = streamed
+        # with nested items, the nesting level of the item this container is, or of
+        # the items in it, None otherwise
+        self.level = level
+        self.state = _KEY_OR_END if is_object else _VALUE_OR_END
+        self.key: str | None = None
+
+
+class JSONItemParser:
+    """
+    Incrementally parse a JSON document fed to it in chunks, returning the items of
+    the array found at ``item_path`` as soon as each is complete. If the value found
+    there is an object, ``(key, value)`` pairs are returned instead.
+
+    ``item_path`` is the sequence of object keys leading to the items, e.g.
+    ``("result",)`` for the result of a JSON-RPC response. The rest of the document
+    is kept in ``document``, with an empty array or object in place of the
+    streamed items. Only the unparsed part of the current item is buffered, so
+    memory use is bounded by the size of the largest item rather than the size of
+    the document.
+
+    If ``nested_item_key`` is given, each item is an object that may hold an array
+    of nested items at that key, e.g. the calls made from each call of a call trace.
+    Nested items are streamed too, at any depth: each item is returned as a
+    ``(level, item)`` pair once it is complete, after the items nested in it and
+    with an empty array in place of them. Items of the array at ``item_path`` are
+    at level 0, the items nested in them at level 1, and so on.
+
+    Values that are fully buffered are decoded in one go by ``json``. Only values
+    split across chunks are scanned for their end before being decoded.
+    """
+
+    def __init__(
+        self,
+        item_path: Sequence[str] = ("result",),
+        nested_item_key: str | None = None,
+    ) -> None:
+        self.item_path = tuple(item_path)
+        self.nested_item_key = nested_item_key
+        self.document: Any = None
+        self.done = False
+
+        self._text_decoder = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._pos = 0
+        self._containers: list[_Container] = []
+
+        # the value or key currently being scanned for its end, if any
+        self._scan_start: int | None = None
+        self._scan_is_key = False
+        self._scan_pos = 0
+        self._scan_depth = 0
+        self._scan_in_string = False
+
+    def feed(self, chunk: bytes) -> list[Any]:
+        """
+        Parse the next ``chunk`` of the document, returning the items it completes.
+        """
+        text = self._text_decoder.decode(chunk)
+        if self.done:
+            self._buffer = text
+            self._pos = 0
+            self._validate_trailing_data()
+            return []
+
+        self._compact()
+        self._buffer += text
+        items: list[Any] = []
+        self._parse(items)
+        if self.done:
+            self._validate_trailing_data()
+        return items
+
+    def close(self) -> list[Any]:
+        """
+        Signal the end of the document, returning any items still to be completed.
+        """
+        items: list[Any] = []
+        self._buffer += self._text_decoder.decode(b"", final=True)
+        self._parse(items)
+        if not self.done and self._scan_start is not None and not self._containers:
+            # a bare number, ``true``, ``false`` or ``null`` ends with the document
+            self._finish_value(len(self._buffer), items)
+            self._parse(items)
+
+        if not self.done:
+            raise BadResponseFormat(
+                "Malformed response: the JSON document ended before it was complete"
+            )
+        return items
+
+    # -- parsing -- #
+
+    def _compact(self) -> None:
+        consumed = self._pos if self._scan_start is None else self._scan_start
+        if consumed < _COMPACT_AFTER:
+            return
+
+        self._buffer = self._buffer[consumed:]
+        self._pos -= consumed
+        if self._scan_start is not None:
+            self._scan_start -= consumed
+            self._scan_pos -= consumed
+
+    def _parse(self, items: list[Any]) -> None:
+        buffer = self._buffer
+        while not self.done:
+            if self._scan_start is not None:
+                end = self._scan()
+                if end is None:
+                    return
+                self._finish_value(end, items)
+                continue
+
+            pos = _WHITESPACE.match(buffer, self._pos).end()
+            self._pos = pos
+            if pos == len(buffer):
+                return
+
+            char = buffer[pos]
+            if not self._containers:
+                self._start_value(pos, char, items)
+                continue
+
+            container = self._containers[-1]
+            state = container.state
+            if state == _VALUE:
+                self._start_value(pos, char, items)
+            elif state == _KEY or state == _KEY_OR_END:
+                if state == _KEY_OR_END and char == "}":
+                    self._close_container(pos, items)
+                elif char == '"':
+                    self._read_value(pos, is_key=True, items=items)
+                else:
+                    self._raise_unexpected(pos)
+            elif state == _VALUE_OR_END:
+                if char == "]":
+                    self._close_container(pos, items)
+                else:
+                    self._start_value(pos, char, items)
+            elif state == _COLON_NEXT:
+                if char != ":":
+                    self._raise_unexpected(pos)
+                container.state = _VALUE
+                self._pos = pos + 1
+            elif state == _COMMA_OR_END:
+                if char == ",":
+                    container.state = _KEY if container.is_object else _VALUE
+                    self._pos = pos + 1
+                elif char == ("}" if container.is_object else "]"):
+                    self._close_container(pos, items)
+                else:
+                    self._raise_unexpected(pos)
+
+    def _start_value(self, pos: int, char: str, items: list[Any]) -> None:
+        if self._containers:
+            parent = self._containers[-1]
+            parent.state = _COMMA_OR_END
+            if parent.level is not None:
+                if parent.streamed and char == "{":
+                    self._open_item(parent.level, pos)
+                    return
+                elif parent.key == self.nested_item_key and char == "[":
+                    self._open_nested_items(parent, parent.level + 1, pos)
+                    return
+
+            on_item_path = (
+                not parent.streamed
+                and parent.depth < len(self.item_path)
+                and parent.key == self.item_path[parent.depth]
+            )
+            depth = parent.depth + 1
+        else:
+            parent = None
+            on_item_path = True
+            depth = 0
+
+        if on_item_path:
+            if depth == len(self.item_path) and char in "{[":
+                self._open_container(parent, char == "{", depth, streamed=True, pos=pos)
+                return
+            elif depth < len(self.item_path) and char == "{":
+                self._open_container(parent, True, depth, streamed=False, pos=pos)
+                return
+
+        self._read_value(pos, is_key=False, items=items)
+
+    def _open_container(
+        self,
+        parent: _Container | None,
+        is_object: bool,
+        depth: int,
+        streamed: bool,
+        pos: int,
+    ) -> None:
+        # streamed items are returned rather than kept, so they are left out
+        value: dict[str, Any] | list[Any] = {} if is_object else []
+        if parent is None:
+            self.document = value
+        else:
+            parent.value[parent.key] = value
+
+        # the items of an array with nested items are at level 0
+        level = (
+            0
+            if streamed and not is_object and self.nested_item_key is not None
+            else None
+        )
+        self._containers.append(
+            _Container(is_object, None if streamed else value, depth, streamed, level)
+        )
+        self._pos = pos + 1
+
+    def _open_item(self, level: int, pos: int) -> None:
+        # an item whose nested items are streamed, kept until it is complete. Values
+        # in it are off the item path, so are read whole.
+        self._containers.append(
+            _Container(True, {}, len(self.item_path) + 1, False, level)
+        )
+        self._pos = pos + 1
+
+    def _open_nested_items(self, item: _Container, level: int, pos: int) -> None:
+        item.value[item.key] = []
+        self._containers.append(_Container(False, None, item.depth, True, level))
+        self._pos = pos + 1
+
+    def _close_container(self, pos: int, items: list[Any]) -> None:
+        container = self._containers.pop()
+        self._pos = pos + 1
+        if container.level is not None and not container.streamed:
+            items.append((container.level, container.value))
+        if not self._containers:
+            self.done = True
+
+    def _read_value(self, pos: int, is_key: bool, items: list[Any]) -> None:
+        buffer = self._buffer
+        try:
+            value, end = _DECODER.raw_decode(buffer, pos)
+        except ValueError:
+            # most likely split across chunks, scan for the end before decoding
+            pass
+        else:
+            # a number at the end of the buffer may continue in the next chunk, and
+            # one cut off in its fraction or exponent decodes as its integer part
+            if buffer[end - 1] in '"]}el' or (
+                end < len(buffer) and buffer[end] not in _NUMBER_CONTINUATION
+            ):
+                self._pos = end
+                self._add_value(value, is_key, items)
+                return
+
+        char = buffer[pos]
+        self._scan_start = pos
+        self._scan_is_key = is_key
+        self._scan_pos = pos + 1
+        self._scan_depth = 1 if char in "{[" else 0
+        self._scan_in_string = char == '"'
+
+    def _scan(self) -> int | None:
+        """
+        Continue scanning the current value, returning the position of its end, or
+        None if more of the document is needed.
+        """
+        buffer = self._buffer
+        pos = self._scan_pos
+        if self._scan_depth == 0 and not self._scan_in_string:
+            # a number, ``true``, ``false`` or ``null``
+            match = _SCALAR_END.search(buffer, pos)
+            if match is None:
+                self._scan_pos = len(buffer)
+                return None
+            return match.start()
+
+        while True:
+            if self._scan_in_string:
+                match = _STRING_SPECIAL.search(buffer, pos)
+                if match is None:
+                    self._scan_pos = len(buffer)
+                    return None
+                if match.group() == "\\":
+                    if match.end() == len(buffer):
+                        # the escaped byte isn't here yet
+                        self._scan_pos = match.start()
+                        return None
+                    pos = match.end() + 1
+                    continue
+
+                pos = match.end()
+                self._scan_in_string = False
+                if self._scan_depth == 0:
+                    return pos
+            else:
+                match = _STRUCTURAL.search(buffer, pos)
+                if match is None:
+                    self._scan_pos = len(buffer)
+                    return None
+
+                pos = match.end()
+                char = match.group()
+                if char == '"':
+                    self._scan_in_string = True
+                elif char in "{[":
+                    self._scan_depth += 1
+                else:
+                    self._scan_depth -= 1
+                    if self._scan_depth == 0:
+                        return pos
+
+    def _finish_value(self, end: int, items: list[Any]) -> None:
+        start = self._scan_start
+        self._scan_start = None
+        self._pos = end
+        try:
+            value = json.loads(self._buffer[start:end])
+        except ValueError as e:
+            raise BadResponseFormat(
+                f"Malformed response: invalid JSON value: {e}"
+            ) from e
+
+        self._add_value(value, self._scan_is_key, items)
+
+    def _add_value(self, value: Any, is_key: bool, items: list[Any]) -> None:
+        if not self._containers:
+            self.document = value
+            self.done = True
+            return
+
+        container = self._containers[-1]
+        if is_key:
+            container.key = value
+            container.state = _COLON_NEXT
+        elif not container.streamed:
+            container.value[container.key] = value
+        elif container.is_object:
+            items.append((container.key, value))
+        elif container.level is not None:
+            items.append((container.level, value))
+        else:
+            items.append(value)
+
+    def _validate_trailing_data(self) -> None:
+        trailing = self._buffer[self._pos :].strip()
+        if trailing:
+            raise BadResponseFormat(
+                "Malformed response: unexpected data after the end of the JSON "
+                f"document: {trailing[:64]!r}"
+            )
+
+    def _raise_unexpected(self, pos: int) -> None:
+        raise BadResponseFormat(
+            "Malformed response: unexpected "
+            f"{self._buffer[pos:pos + 1]!r} in JSON document"
+        )
@@ -0,0 +1,65 @@
+from importlib import (
+    import_module,
+)
+import sys
+from typing import (
+    Any,
+    Callable,
+    Generic,
+    TypeVar,
+)
+
+from web3.exceptions import (
+    Web3AttributeError,
+)
+
+T = TypeVar("T")
+
+
+def lazy_module_getattr(
+    module_name: str, lazy_attributes: dict[str, str]
+) -> Callable[[str], Any]:
+    """
+    Build a module level ``__getattr__`` for ``module_name`` that imports each of
+    ``lazy_attributes``, a mapping of attribute name to the module it is defined in,
+    on first access. Modules with costly imports are then only loaded when used.
+    """
+
+    def __getattr__(name: str) -> Any:
+        if name not in lazy_attributes:
+            raise Web3AttributeError(
+                f"module {module_name!r} has no attribute {name!r}"
+            )
+
+        value = getattr(import_module(lazy_attributes[name]), name)
+        # cache on the module so that __getattr__ isn't called again
+        setattr(sys.modules[module_name], name, value)
+        return value
+
+    return __getattr__
+
+
+def import_attribute(module_name: str, name: str) -> Callable[[], Any]:
+    """
+    A factory for ``LazyClassAttribute`` that imports ``name`` from ``module_name``.
+    """
+    return lambda: getattr(import_module(module_name), name)
+
+
+class LazyClassAttribute(Generic[T]):
+    """
+    A class attribute whose value is built by ``factory`` the first time it is
+    accessed, after which it is replaced with the value.
+    """
+
+    def __init__(self, factory: Callable[[], T]) -> None:
+        self.factory = factory
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.owner = owner
+        self.name = name
+
+    def __get__(self, instance: Any, owner: type | None = None) -> T:
+        value = self.factory()
+        setattr(self.owner, self.name, value)
+        return value
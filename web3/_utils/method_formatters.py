@@ -13,8 +13,10 @@ from typing import (
 )
 
 from eth_typing import (
+    ChecksumAddress,
     HexStr,
 )
+import eth_utils
 from eth_utils import (
     is_hexstr,
 )
@@ -200,7 +202,11 @@ def type_aware_apply_formatters_to_dict_keys_and_values(
 
 
 def apply_list_to_array_formatter(formatter: Any) -> Callable[..., Any]:
-    return to_list(apply_formatter_to_array(formatter))
+    list_formatter: Callable[..., Any] = to_list(apply_formatter_to_array(formatter))
+    # keep a reference to the item formatter so that ``compile_formatter`` can
+    # flatten the list formatter
+    list_formatter._item_formatter = formatter  # type: ignore[attr-defined]
+    return list_formatter
 
 
 def storage_key_to_hexstr(value: bytes | int | str) -> HexStr:
@@ -1242,18 +1248,247 @@ def apply_module_to_formatters(
         yield partial(f, module, method_name)
 
 
+# --- Compiled Result Formatters --- #
+
+# The result formatter tables are built from nested, curried applicators which are
+# re-dispatched for every field of every value they format. ``compile_formatter``
+# flattens a formatter once into specialized closures. Anything it does not
+# recognize is used as-is, so compiled output is identical to the original output.
+
+_apply_formatter_if = eth_utils.apply_formatter_if
+_apply_formatter_to_array = eth_utils.apply_formatter_to_array
+_apply_one_of_formatters = eth_utils.apply_one_of_formatters
+_type_aware_apply_formatters_to_dict = type_aware_apply_formatters_to_dict.func
+_to_hexbytes = to_hexbytes.func
+_Compose = type(compose(bool, bool))
+_Curry = type(curry(bool))
+
+# formatter id -> (formatter, compiled formatter); the original formatter is kept
+# alive so that its id cannot be reused by another object
+_COMPILED_FORMATTERS: dict[int, tuple[Any, Callable[..., Any]]] = {}
+_COMPILED_RESULT_FORMATTERS: dict[RPCEndpoint, tuple[Callable[..., Any], ...]] = {}
+
+_CHECKSUM_ADDRESS_CACHE_SIZE = 4096
+_checksum_address_cache: dict[str, ChecksumAddress] = {}
+
+
+def _cached_to_checksum_address(value: Any) -> ChecksumAddress:
+    if type(value) is not str:
+        return to_checksum_address(value)
+
+    try:
+        return _checksum_address_cache[value]
+    except KeyError:
+        checksum_address = to_checksum_address(value)
+        if len(_checksum_address_cache) >= _CHECKSUM_ADDRESS_CACHE_SIZE:
+            _checksum_address_cache.clear()
+        _checksum_address_cache[value] = checksum_address
+        return checksum_address
+
+
+def _compile_if(
+    condition: Callable[..., bool], formatter: Callable[..., Any]
+) -> Callable[..., Any]:
+    if condition is is_not_null:
+
+        def format_if_not_null(value: Any) -> Any:
+            return value if value is None else formatter(value)
+
+        return format_if_not_null
+
+    def format_if(value: Any) -> Any:
+        return formatter(value) if condition(value) else value
+
+    return format_if
+
+
+def _compile_array(formatter: Callable[..., Any]) -> Callable[..., Any]:
+    def format_array(value: Any) -> Any:
+        if type(value) is list:
+            return [formatter(item) for item in value]
+        return type(value)(formatter(item) for item in value)
+
+    return format_array
+
+
+def _compile_list(formatter: Callable[..., Any]) -> Callable[..., Any]:
+    def format_list(value: Any) -> list[Any]:
+        if type(value) is list:
+            return [formatter(item) for item in value]
+        return list(type(value)(formatter(item) for item in value))
+
+    return format_list
+
+
+def _compile_one_of(
+    formatter_condition_pairs: tuple[tuple[Callable[..., Any], Callable[..., Any]]],
+) -> Callable[..., Any]:
+    pairs = tuple(
+        (condition, compile_formatter(formatter))
+        for condition, formatter in formatter_condition_pairs
+    )
+
+    def format_one_of(value: Any) -> Any:
+        for condition, formatter in pairs:
+            if condition(value):
+                return formatter(value)
+        raise Web3ValueError(
+            "The provided value did not satisfy any of the formatter conditions"
+        )
+
+    return format_one_of
+
+
+def _compile_to_hexbytes(
+    num_bytes: int, variable_length: bool = False
+) -> Callable[..., HexBytes]:
+    def format_hexbytes(value: Any) -> HexBytes:
+        if isinstance(value, (str, int, bytes)):
+            result = HexBytes(value)
+            if len(result) == num_bytes:
+                return result
+        # padded, variable length, or invalid values take the uncompiled path
+        return _to_hexbytes(num_bytes, value, variable_length)
+
+    return format_hexbytes
+
+
+def _compile_dict(formatters: Formatters) -> Callable[..., Any]:
+    field_formatters: dict[str, Callable[..., Any]] = {
+        key: compile_formatter(formatter) for key, formatter in formatters.items()
+    }
+
+    def format_dict(
+        value: AttributeDict[str, Any] | dict[str, Any]
+    ) -> ReadableAttributeDict[str, Any] | dict[str, Any]:
+        if isinstance(value, BaseModel):
+            value = value.model_dump(by_alias=True)
+
+        items = value.items() if type(value) is dict else dict(value).items()
+        formatted_dict: dict[str, Any] = {}
+        for key, item in items:
+            field_formatter = field_formatters.get(key)
+            if field_formatter is None:
+                formatted_dict[key] = item
+                continue
+
+            try:
+                formatted_dict[key] = field_formatter(item)
+            except ValueError as exc:
+                raise Web3ValueError(
+                    f"Could not format invalid value {item!r} as field {key!r}"
+                ) from exc
+            except TypeError as exc:
+                raise Web3TypeError(
+                    f"Could not format invalid type {item!r} as field {key!r}"
+                ) from exc
+
+        return (
+            AttributeDict.recursive(formatted_dict)
+            if is_attrdict(value)
+            else formatted_dict
+        )
+
+    return format_dict
+
+
+def _compile_formatter(formatter: Any) -> Callable[..., Any]:
+    if formatter is to_checksum_address:
+        return _cached_to_checksum_address
+
+    if isinstance(formatter, _Compose):
+        funcs = tuple(
+            compile_formatter(func) for func in (formatter.first, *formatter.funcs)
+        )
+
+        def format_composed(value: Any) -> Any:
+            for func in funcs:
+                value = func(value)
+            return value
+
+        return format_composed
+
+    item_formatter = getattr(formatter, "_item_formatter", None)
+    if item_formatter is not None:
+        return _compile_list(compile_formatter(item_formatter))
+
+    if not isinstance(formatter, _Curry):
+        return formatter
+
+    func, args, kwargs = formatter.func, formatter.args, formatter.keywords or {}
+    if func is _apply_formatter_if and len(args) == 2 and not kwargs:
+        return _compile_if(args[0], compile_formatter(args[1]))
+    elif func is _apply_formatter_to_array and len(args) == 1 and not kwargs:
+        return _compile_array(compile_formatter(args[0]))
+    elif func is _apply_one_of_formatters and len(args) == 1 and not kwargs:
+        return _compile_one_of(args[0])
+    elif func is _type_aware_apply_formatters_to_dict and len(args) == 1:
+        return _compile_dict(args[0])
+    elif func is _to_hexbytes and len(args) == 1:
+        return _compile_to_hexbytes(args[0], **kwargs)
+
+    # unknown curried function: compile any formatters it was curried with
+    compiled_args = tuple(
+        compile_formatter(arg) if callable(arg) else arg for arg in args
+    )
+    if all(new is old for new, old in zip(compiled_args, args)):
+        return formatter
+    return curry(func, *compiled_args, **kwargs)
+
+
+def compile_formatter(formatter: Any) -> Callable[..., Any]:
+    """
+    Flatten a formatter built from the curried applicators in this module into
+    specialized closures, caching the result per formatter.
+    """
+    cached = _COMPILED_FORMATTERS.get(id(formatter))
+    if cached is not None and cached[0] is formatter:
+        return cached[1]
+
+    compiled = _compile_formatter(formatter)
+    _COMPILED_FORMATTERS[id(formatter)] = (formatter, compiled)
+    return compiled
+
+
+def get_compiled_result_formatters(
+    method_name: RPCEndpoint,
+) -> tuple[Callable[..., Any], ...]:
+    try:
+        return _COMPILED_RESULT_FORMATTERS[method_name]
+    except KeyError:
+        formatters = tuple(
+            compile_formatter(formatter)
+            for formatter in combine_formatters(
+                (PYTHONIC_RESULT_FORMATTERS,), method_name
+            )
+        )
+        _COMPILED_RESULT_FORMATTERS[method_name] = formatters
+        return formatters
+
+
 def get_result_formatters(
     method_name: RPCEndpoint,
     module: "Module",
 ) -> Callable[[RPCResponse], Any]:
-    formatters = combine_formatters((PYTHONIC_RESULT_FORMATTERS,), method_name)
+    # formatters are cached on the module since filter formatters are bound to it
+    cache: dict[str, Callable[[RPCResponse], Any]] | None = getattr(
+        module, "_result_formatters_cache", None
+    )
+    if cache is not None and method_name in cache:
+        return cache[method_name]
+
+    formatters = get_compiled_result_formatters(method_name)
     formatters_requiring_module = combine_formatters(
         (FILTER_RESULT_FORMATTERS,), method_name
     )
     partial_formatters = apply_module_to_formatters(
         formatters_requiring_module, module, method_name
     )
-    return compose(*partial_formatters, *formatters)
+    result_formatters = compose(*partial_formatters, *formatters)
+
+    if cache is not None:
+        cache[method_name] = result_formatters
+    return result_formatters
 
 
 def get_error_formatters(method_name: RPCEndpoint) -> Callable[[RPCResponse], Any]:
@@ -1,7 +1,11 @@
+from functools import (
+    lru_cache,
+)
 import inspect
 from io import (
     UnsupportedOperation,
 )
+import threading
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -21,22 +25,83 @@ if TYPE_CHECKING:
     from web3.main import BaseWeb3  # noqa: F401
 
 
-def _validate_init_params_and_return_if_found(module_class: Any) -> list[str]:
+# modules may be built on first access from more than one thread
+_lazy_modules_lock = threading.RLock()
+
+
+@lru_cache(maxsize=256)
+def _validate_init_params_and_return_if_found(module_class: Any) -> tuple[str, ...]:
     init_params_raw = list(inspect.signature(module_class.__init__).parameters)
-    module_init_params = [
+    module_init_params = tuple(
         param for param in init_params_raw if param not in ["self", "args", "kwargs"]
-    ]
+    )
 
     if len(module_init_params) > 1:
         raise UnsupportedOperation(
             "A module class may accept a single `Web3` instance as the first "
             "argument of its __init__() method. More than one argument found for "
-            f"{module_class.__name__}: {module_init_params}"
+            f"{module_class.__name__}: {list(module_init_params)}"
         )
 
     return module_init_params
 
 
+def _validate_module_definitions(module_definitions: dict[str, Any]) -> None:
+    for module_info in module_definitions.values():
+        if isinstance(module_info, Sequence):
+            if len(module_info) == 2:
+                _validate_module_definitions(module_info[1])
+            elif len(module_info) != 1:
+                raise Web3ValidationError(
+                    "Module definitions can only have 1 or 2 elements."
+                )
+            _validate_init_params_and_return_if_found(module_info[0])
+        else:
+            _validate_init_params_and_return_if_found(module_info)
+
+
+def attach_lazy_modules(w3: "BaseWeb3", module_definitions: dict[str, Any]) -> None:
+    """
+    Validate ``module_definitions`` and register them on the ``Web3`` instance, to be
+    built along with their submodules by ``build_lazy_module`` on first access.
+    """
+    _validate_module_definitions(module_definitions)
+
+    lazy_modules = w3.__dict__.setdefault("_lazy_modules", {})
+    for module_name, module_info in module_definitions.items():
+        if module_name in lazy_modules or hasattr(w3, module_name):
+            raise Web3AttributeError(
+                f"Cannot set {w3} module named '{module_name}'. "
+                " The web3 object already has an attribute with that name"
+            )
+        lazy_modules[module_name] = module_info
+
+
+def build_lazy_module(w3: "BaseWeb3", module_name: str) -> Any:
+    """
+    Build a module registered by ``attach_lazy_modules``, along with its submodules.
+    """
+    lazy_modules = w3.__dict__.get("_lazy_modules")
+    if lazy_modules is not None:
+        with _lazy_modules_lock:
+            # another thread may have built the module while waiting on the lock
+            if module_name in w3.__dict__:
+                return w3.__dict__[module_name]
+
+            if module_name in lazy_modules:
+                module_info = lazy_modules.pop(module_name)
+                try:
+                    attach_modules(w3, {module_name: module_info}, w3)
+                except BaseException:
+                    lazy_modules[module_name] = module_info
+                    raise
+                return w3.__dict__[module_name]
+
+    raise Web3AttributeError(
+        f"'{type(w3).__name__}' object has no attribute '{module_name}'"
+    )
+
+
 def attach_modules(
     parent_module: Union["BaseWeb3", "Module"],
     module_definitions: dict[str, Any],
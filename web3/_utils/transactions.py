@@ -10,6 +10,9 @@ from typing import (
 from eth_typing import (
     ChecksumAddress,
 )
+from eth_utils import (
+    is_address,
+)
 from eth_utils.toolz import (
     assoc,
     curry,
@@ -34,6 +37,7 @@ from web3.types import (
     BlockIdentifier,
     TxData,
     TxParams,
+    Wei,
     _Hash32,
 )
 
@@ -71,19 +75,48 @@ VALID_TRANSACTION_PARAMS: list[TX_PARAM_LITERALS] = [
     "blobVersionedHashes",
 ]
 
+
+# fee and chain id defaults are served by the fee defaults cache, when one is set
+def _fee_defaults_cache(w3: "Web3") -> "FeeDefaultsCache | None":
+    return cast("FeeDefaultsCache | None", w3.eth.fee_defaults_cache)
+
+
+def _max_priority_fee_gas(
+    w3: "Web3", _tx: TxParams, _defaults: dict[str, bytes | int]
+) -> Wei:
+    fee_defaults_cache = _fee_defaults_cache(w3)
+    if fee_defaults_cache is not None:
+        return fee_defaults_cache.max_priority_fee(w3)
+    return w3.eth.max_priority_fee
+
+
+def _max_fee_per_gas(w3: "Web3", tx: TxParams, defaults: dict[str, bytes | int]) -> Wei:
+    fee_defaults_cache = _fee_defaults_cache(w3)
+    if fee_defaults_cache is not None:
+        base_fee = fee_defaults_cache.base_fee(w3)
+    else:
+        base_fee = w3.eth.get_block("latest")["baseFeePerGas"]
+    max_priority_fee = tx.get(
+        "maxPriorityFeePerGas", defaults.get("maxPriorityFeePerGas")
+    )
+    return Wei(int(max_priority_fee) + (2 * base_fee))
+
+
+def _chain_id(w3: "Web3", _tx: TxParams, _defaults: dict[str, bytes | int]) -> int:
+    fee_defaults_cache = _fee_defaults_cache(w3)
+    if fee_defaults_cache is not None:
+        return fee_defaults_cache.chain_id(w3)
+    return w3.eth.chain_id
+
+
 TRANSACTION_DEFAULTS = {
     "value": 0,
     "data": b"",
     "gas": lambda w3, tx, _defaults: w3.eth.estimate_gas(tx),
     "gasPrice": lambda w3, tx, _defaults: w3.eth.generate_gas_price(tx),
-    "maxPriorityFeePerGas": lambda w3, _tx, _defaults: w3.eth.max_priority_fee,
-    "maxFeePerGas": (
-        lambda w3, tx, defaults: (
-            tx.get("maxPriorityFeePerGas", defaults.get("maxPriorityFeePerGas"))
-            + (2 * w3.eth.get_block("latest")["baseFeePerGas"])
-        )
-    ),
-    "chainId": lambda w3, _tx, _defaults: w3.eth.chain_id,
+    "maxPriorityFeePerGas": _max_priority_fee_gas,
+    "maxFeePerGas": _max_fee_per_gas,
+    "chainId": _chain_id,
 }
 
 if TYPE_CHECKING:
@@ -91,11 +124,24 @@ if TYPE_CHECKING:
         AsyncWeb3,
         Web3,
     )
+    from web3.utils.fee_defaults_cache import (  # noqa: F401
+        FeeDefaultsCache,
+    )
+    from web3.utils.nonce_manager import (  # noqa: F401
+        NonceManager,
+    )
 
 
 @curry
 def fill_nonce(w3: "Web3", transaction: TxParams) -> TxParams:
     if "from" in transaction and "nonce" not in transaction:
+        nonce_manager = cast("NonceManager | None", w3.eth.nonce_manager)
+        if nonce_manager is not None and is_address(transaction["from"]):
+            return assoc(
+                transaction,
+                "nonce",
+                nonce_manager.allocate(w3, cast(str, transaction["from"])),
+            )
         return assoc(
             transaction,
             "nonce",
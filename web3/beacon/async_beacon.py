@@ -1,5 +1,6 @@
 from typing import (
     Any,
+    AsyncIterator,
 )
 
 from aiohttp import (
@@ -13,6 +14,9 @@ from eth_typing import (
 from web3._utils.http_session_manager import (
     HTTPSessionManager,
 )
+from web3._utils.json_stream import (
+    JSONItemParser,
+)
 from web3.beacon.api_endpoints import (
     GET_ATTESTATIONS,
     GET_ATTESTATIONS_REWARDS,
@@ -88,6 +92,22 @@ class AsyncBeacon:
             uri, json=body, timeout=ClientTimeout(self.request_timeout)
         )
 
+    async def _async_stream_get_request(
+        self,
+        endpoint_uri: str,
+        item_path: tuple[str, ...] = ("data",),
+        params: dict[str, str] | None = None,
+    ) -> AsyncIterator[Any]:
+        uri = URI(self.base_url + endpoint_uri)
+        parser = JSONItemParser(item_path)
+        async for chunk in self._request_session_manager.async_stream_get_request(
+            uri, params=params, timeout=ClientTimeout(self.request_timeout)
+        ):
+            for item in parser.feed(chunk):
+                yield item
+        for item in parser.close():
+            yield item
+
     # [ BEACON endpoints ]
 
     # states
@@ -109,6 +129,13 @@ class AsyncBeacon:
     async def get_validators(self, state_id: str = "head") -> dict[str, Any]:
         return await self._async_make_get_request(GET_VALIDATORS.format(state_id))
 
+    def iter_validators(self, state_id: str = "head") -> AsyncIterator[dict[str, Any]]:
+        """
+        Yield the validators in ``data`` one at a time as the response is received,
+        rather than reading the whole response first.
+        """
+        return self._async_stream_get_request(GET_VALIDATORS.format(state_id))
+
     async def get_validator(
         self, validator_id: str, state_id: str = "head"
     ) -> dict[str, Any]:
@@ -1,5 +1,6 @@
 from typing import (
     Any,
+    Iterator,
 )
 
 from eth_typing import (
@@ -10,6 +11,9 @@ from eth_typing import (
 from web3._utils.http_session_manager import (
     HTTPSessionManager,
 )
+from web3._utils.json_stream import (
+    JSONItemParser,
+)
 from web3.beacon.api_endpoints import (
     GET_ATTESTATIONS,
     GET_ATTESTATIONS_REWARDS,
@@ -83,6 +87,20 @@ class Beacon:
             uri, json=body, timeout=self.request_timeout
         )
 
+    def _stream_get_request(
+        self,
+        endpoint_url: str,
+        item_path: tuple[str, ...] = ("data",),
+        params: dict[str, str] | None = None,
+    ) -> Iterator[Any]:
+        uri = URI(self.base_url + endpoint_url)
+        parser = JSONItemParser(item_path)
+        for chunk in self._request_session_manager.stream_get_request(
+            uri, params=params, timeout=self.request_timeout
+        ):
+            yield from parser.feed(chunk)
+        yield from parser.close()
+
     # [ BEACON endpoints ]
 
     # states
@@ -102,6 +120,13 @@ class Beacon:
     def get_validators(self, state_id: str = "head") -> dict[str, Any]:
         return self._make_get_request(GET_VALIDATORS.format(state_id))
 
+    def iter_validators(self, state_id: str = "head") -> Iterator[dict[str, Any]]:
+        """
+        Yield the validators in ``data`` one at a time as the response is received,
+        rather than reading the whole response first.
+        """
+        return self._stream_get_request(GET_VALIDATORS.format(state_id))
+
     def get_validator(
         self, validator_id: str, state_id: str = "head"
     ) -> dict[str, Any]:
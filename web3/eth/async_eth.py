@@ -1,7 +1,12 @@
 import asyncio
+from concurrent.futures import (
+    Executor,
+)
+import time
 from typing import (
     TYPE_CHECKING,
     Any,
+    AsyncIterator,
     Awaitable,
     Callable,
     Sequence,
@@ -59,6 +64,7 @@ from web3.eth.base_eth import (
 )
 from web3.exceptions import (
     MethodNotSupported,
+    MethodUnavailable,
     OffchainLookup,
     TimeExhausted,
     TooManyRequests,
@@ -74,6 +80,9 @@ from web3.method import (
 from web3.providers import (
     PersistentConnectionProvider,
 )
+from web3.providers.async_base import (
+    AsyncJSONBaseProvider,
+)
 from web3.types import (
     ENS,
     BlockData,
@@ -92,6 +101,7 @@ from web3.types import (
     StateOverride,
     SubscriptionType,
     SyncStatus,
+    TReturn,
     TxData,
     TxParams,
     TxReceipt,
@@ -103,6 +113,7 @@ from web3.utils import (
     async_handle_offchain_lookup,
 )
 from web3.utils.subscriptions import (
+    BackpressurePolicy,
     EthSubscriptionHandler,
 )
 
@@ -463,6 +474,63 @@ class AsyncEth(BaseEth):
     ) -> BlockReceipts:
         return await self._get_block_receipts(block_identifier)
 
+    async def get_block_receipts_bulk(
+        self, block_identifiers: Sequence[BlockIdentifier]
+    ) -> list[BlockReceipts]:
+        block_identifiers = list(block_identifiers)
+        if not block_identifiers:
+            return []
+
+        if self._block_receipts_supported is None:
+            # find out whether the node supports ``eth_getBlockReceipts`` once
+            try:
+                first_block_receipts = await self.get_block_receipts(
+                    block_identifiers[0]
+                )
+            except MethodUnavailable:
+                self._block_receipts_supported = False
+            else:
+                self._block_receipts_supported = True
+                return [
+                    first_block_receipts,
+                    *await self._batch_call(
+                        self.get_block_receipts, block_identifiers[1:]
+                    ),
+                ]
+
+        if self._block_receipts_supported:
+            return await self._batch_call(self.get_block_receipts, block_identifiers)
+
+        blocks = await self._batch_call(self.get_block, block_identifiers)
+        receipts = iter(
+            await self._batch_call(
+                self.get_transaction_receipt,
+                [tx_hash for block in blocks for tx_hash in block["transactions"]],
+            )
+        )
+        return [[next(receipts) for _ in block["transactions"]] for block in blocks]
+
+    async def _batch_call(
+        self, method: Callable[[Any], Awaitable[TReturn]], args: Sequence[Any]
+    ) -> list[TReturn]:
+        """
+        Call ``method`` with each of ``args`` in a single JSON-RPC batch. Requests
+        are made concurrently if the provider can't batch them, or caches requests,
+        so that they go through the request cache.
+        """
+        provider = self.w3.provider
+        if (
+            len(args) < 2
+            or not isinstance(provider, AsyncJSONBaseProvider)
+            or provider.cache_allowed_requests
+        ):
+            return list(await asyncio.gather(*(method(arg) for arg in args)))
+
+        async with self.w3.batch_requests() as batch:
+            for arg in args:
+                batch.add(method(arg))
+            return cast(list[TReturn], await batch.async_execute())
+
     # eth_getBalance
 
     _get_balance: Method[
@@ -568,6 +636,106 @@ class AsyncEth(BaseEth):
                 f"after {timeout} seconds"
             )
 
+    async def _transaction_receipt_or_none(
+        self, transaction_hash: _Hash32
+    ) -> TxReceipt | None:
+        try:
+            return await self._transaction_receipt(transaction_hash)
+        except (TransactionNotFound, TransactionIndexingInProgress):
+            return None
+
+    async def _receipts_in_new_blocks(
+        self,
+        pending: dict[HexBytes, _Hash32],
+        from_block: int,
+        to_block: int,
+        scan_blocks: bool,
+    ) -> tuple[list[TxReceipt], bool]:
+        """
+        Look for the pending receipts in the blocks ``from_block`` to ``to_block``,
+        returning the receipts found and whether blocks can still be scanned with
+        ``eth_getBlockReceipts``.
+        """
+        if scan_blocks and to_block - from_block < self._max_receipt_scan_blocks:
+            try:
+                blocks_receipts = await asyncio.gather(
+                    *(
+                        self.get_block_receipts(BlockNumber(block_number))
+                        for block_number in range(from_block, to_block + 1)
+                    )
+                )
+                return [
+                    receipt
+                    for block_receipts in blocks_receipts
+                    for receipt in block_receipts
+                    if HexBytes(receipt["transactionHash"]) in pending
+                ], True
+            except MethodUnavailable:
+                # ``eth_getBlockReceipts`` is not supported by the node
+                self._block_receipts_supported = False
+                scan_blocks = False
+            except Web3RPCError:
+                # other errors only fall back to requesting the receipts this time
+                pass
+
+        receipts = await asyncio.gather(
+            *(
+                self._transaction_receipt_or_none(transaction_hash)
+                for transaction_hash in pending.values()
+            )
+        )
+        return [receipt for receipt in receipts if receipt is not None], scan_blocks
+
+    async def wait_for_transaction_receipts(
+        self,
+        transaction_hashes: Sequence[_Hash32],
+        timeout: float = 120,
+        poll_latency: float = 0.1,
+    ) -> AsyncIterator[TxReceipt]:
+        pending = {
+            HexBytes(transaction_hash): transaction_hash
+            for transaction_hash in transaction_hashes
+        }
+        # the time the caller spends on each receipt doesn't count towards the
+        # timeout, so it applies to waiting for each transaction as it would with
+        # ``wait_for_transaction_receipt``
+        deadline = time.monotonic() + timeout
+        last_block = await self.block_number
+
+        receipts = await asyncio.gather(
+            *(
+                self._transaction_receipt_or_none(transaction_hash)
+                for transaction_hash in pending.values()
+            )
+        )
+        for tx_hash, receipt in zip(list(pending), receipts):
+            if receipt is not None:
+                del pending[tx_hash]
+                yielded_at = time.monotonic()
+                yield receipt
+                deadline += time.monotonic() - yielded_at
+
+        scan_blocks = self._block_receipts_supported is not False
+        while pending:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise self._receipts_time_exhausted(pending, timeout)
+            await asyncio.sleep(min(poll_latency, remaining))
+
+            # pending transactions are only checked again once a new block is mined
+            block_number = await self.block_number
+            if block_number <= last_block:
+                continue
+            new_receipts, scan_blocks = await self._receipts_in_new_blocks(
+                pending, last_block + 1, block_number, scan_blocks
+            )
+            last_block = block_number
+            for receipt in new_receipts:
+                del pending[HexBytes(receipt["transactionHash"])]
+                yielded_at = time.monotonic()
+                yield receipt
+                deadline += time.monotonic() - yielded_at
+
     # eth_getStorageAt
 
     _get_storage_at: Method[
@@ -729,6 +897,8 @@ class AsyncEth(BaseEth):
         handler_context: dict[str, Any] | None = None,
         label: str | None = None,
         parallelize: bool | None = None,
+        backpressure: BackpressurePolicy | None = None,
+        executor: Executor | None = None,
     ) -> HexStr:
         if not isinstance(self.w3.provider, PersistentConnectionProvider):
             raise MethodNotSupported(
@@ -742,6 +912,8 @@ class AsyncEth(BaseEth):
             handler_context=handler_context or {},
             label=label,
             parallelize=parallelize,
+            backpressure=backpressure,
+            executor=executor,
         )
         return await self.w3.subscription_manager.subscribe(sub)
 
@@ -757,9 +929,10 @@ class AsyncEth(BaseEth):
                 "persistent connections."
             )
 
-        for sub in self.w3.subscription_manager.subscriptions:
-            if sub._id == subscription_id:
-                return await sub.unsubscribe()
+        # found by a previous id too, if it was resubscribed to after reconnecting
+        sub = self.w3.subscription_manager.get_by_id(subscription_id)
+        if sub is not None:
+            return await sub.unsubscribe()
 
         raise Web3ValueError(
             f"Cannot unsubscribe subscription with id `{subscription_id}`. "
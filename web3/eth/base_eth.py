@@ -1,11 +1,10 @@
 from typing import (
+    TYPE_CHECKING,
     Any,
+    Collection,
     NoReturn,
 )
 
-from eth_account import (
-    Account,
-)
 from eth_typing import (
     Address,
     ChecksumAddress,
@@ -18,6 +17,9 @@ from eth_utils import (
 from eth_utils.toolz import (
     assoc,
 )
+from hexbytes import (
+    HexBytes,
+)
 
 from web3._utils.empty import (
     Empty,
@@ -26,7 +28,11 @@ from web3._utils.empty import (
 from web3._utils.encoding import (
     to_hex,
 )
+from web3._utils.lazy_imports import (
+    LazyClassAttribute,
+)
 from web3.exceptions import (
+    TimeExhausted,
     Web3TypeError,
     Web3ValueError,
 )
@@ -43,15 +49,44 @@ from web3.types import (
     Wei,
 )
 
+if TYPE_CHECKING:
+    from eth_account import (  # noqa: F401
+        Account,
+    )
+
+    from web3.utils.fee_defaults_cache import (  # noqa: F401
+        BaseFeeDefaultsCache,
+    )
+    from web3.utils.nonce_manager import (  # noqa: F401
+        BaseNonceManager,
+    )
+
+
+def _create_account() -> "Account":
+    # defer import, eth-account is slow to import
+    from eth_account import (
+        Account,
+    )
+
+    return Account()
+
 
 class BaseEth(Module):
     _default_account: ChecksumAddress | Empty = empty
     _default_block: BlockIdentifier = "latest"
     _default_contract_factory: Any = None
     _gas_price_strategy = None
+    _nonce_manager: "BaseNonceManager | None" = None
+    _fee_defaults_cache: "BaseFeeDefaultsCache | None" = None
+    # the most new blocks scanned with ``eth_getBlockReceipts`` in one round while
+    # waiting on receipts, beyond which the pending receipts are fetched directly
+    _max_receipt_scan_blocks = 16
+    # whether the node supports ``eth_getBlockReceipts``, once known
+    _block_receipts_supported: bool | None = None
 
     is_async = False
-    account = Account()
+    # created on first access, to keep ``import web3`` fast
+    account: LazyClassAttribute["Account"] = LazyClassAttribute(_create_account)
 
     def namereg(self) -> NoReturn:
         raise NotImplementedError()
@@ -93,6 +128,31 @@ class BaseEth(Module):
     ) -> None:
         self._gas_price_strategy = gas_price_strategy
 
+    @property
+    def nonce_manager(self) -> "BaseNonceManager | None":
+        return self._nonce_manager
+
+    def set_nonce_manager(self, nonce_manager: "BaseNonceManager | None") -> None:
+        self._nonce_manager = nonce_manager
+
+    @property
+    def fee_defaults_cache(self) -> "BaseFeeDefaultsCache | None":
+        return self._fee_defaults_cache
+
+    def set_fee_defaults_cache(
+        self, fee_defaults_cache: "BaseFeeDefaultsCache | None"
+    ) -> None:
+        self._fee_defaults_cache = fee_defaults_cache
+
+    @staticmethod
+    def _receipts_time_exhausted(
+        pending: Collection[HexBytes], timeout: float | None
+    ) -> TimeExhausted:
+        missing = ", ".join(repr(transaction_hash) for transaction_hash in pending)
+        return TimeExhausted(
+            f"Transactions {missing} are not in the chain after {timeout} seconds"
+        )
+
     def _eth_call_and_estimate_gas_munger(
         self,
         transaction: TxParams,
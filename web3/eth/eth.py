@@ -1,7 +1,9 @@
+import time
 from typing import (
     TYPE_CHECKING,
     Any,
     Callable,
+    Iterator,
     Sequence,
     cast,
     overload,
@@ -54,6 +56,7 @@ from web3.eth.base_eth import (
     BaseEth,
 )
 from web3.exceptions import (
+    MethodUnavailable,
     OffchainLookup,
     TimeExhausted,
     TooManyRequests,
@@ -67,6 +70,9 @@ from web3.method import (
     Method,
     default_root_munger,
 )
+from web3.providers import (
+    JSONBaseProvider,
+)
 from web3.types import (
     ENS,
     BlockData,
@@ -84,6 +90,7 @@ from web3.types import (
     SimulateV1Result,
     StateOverride,
     SyncStatus,
+    TReturn,
     TxData,
     TxParams,
     TxReceipt,
@@ -417,6 +424,59 @@ class Eth(BaseEth):
     def get_block_receipts(self, block_identifier: BlockIdentifier) -> BlockReceipts:
         return self._get_block_receipts(block_identifier)
 
+    def get_block_receipts_bulk(
+        self, block_identifiers: Sequence[BlockIdentifier]
+    ) -> list[BlockReceipts]:
+        block_identifiers = list(block_identifiers)
+        if not block_identifiers:
+            return []
+
+        if self._block_receipts_supported is None:
+            # find out whether the node supports ``eth_getBlockReceipts`` once
+            try:
+                first_block_receipts = self.get_block_receipts(block_identifiers[0])
+            except MethodUnavailable:
+                self._block_receipts_supported = False
+            else:
+                self._block_receipts_supported = True
+                return [
+                    first_block_receipts,
+                    *self._batch_call(self.get_block_receipts, block_identifiers[1:]),
+                ]
+
+        if self._block_receipts_supported:
+            return self._batch_call(self.get_block_receipts, block_identifiers)
+
+        blocks = self._batch_call(self.get_block, block_identifiers)
+        receipts = iter(
+            self._batch_call(
+                self.get_transaction_receipt,
+                [tx_hash for block in blocks for tx_hash in block["transactions"]],
+            )
+        )
+        return [[next(receipts) for _ in block["transactions"]] for block in blocks]
+
+    def _batch_call(
+        self, method: Callable[[Any], TReturn], args: Sequence[Any]
+    ) -> list[TReturn]:
+        """
+        Call ``method`` with each of ``args`` in a single JSON-RPC batch. Requests
+        are made one at a time if the provider can't batch them, or caches requests,
+        so that they go through the request cache.
+        """
+        provider = self.w3.provider
+        if (
+            len(args) < 2
+            or not isinstance(provider, JSONBaseProvider)
+            or provider.cache_allowed_requests
+        ):
+            return [method(arg) for arg in args]
+
+        with self.w3.batch_requests() as batch:
+            for arg in args:
+                batch.add(method(arg))
+            return cast(list[TReturn], batch.execute())
+
     # eth_getBalance
 
     _get_balance: Method[
@@ -504,6 +564,94 @@ class Eth(BaseEth):
                 f"after {timeout} seconds"
             )
 
+    def _transaction_receipt_or_none(
+        self, transaction_hash: _Hash32
+    ) -> TxReceipt | None:
+        try:
+            return self._transaction_receipt(transaction_hash)
+        except (TransactionNotFound, TransactionIndexingInProgress):
+            return None
+
+    def _receipts_in_new_blocks(
+        self,
+        pending: dict[HexBytes, _Hash32],
+        from_block: int,
+        to_block: int,
+        scan_blocks: bool,
+    ) -> tuple[list[TxReceipt], bool]:
+        """
+        Look for the pending receipts in the blocks ``from_block`` to ``to_block``,
+        returning the receipts found and whether blocks can still be scanned with
+        ``eth_getBlockReceipts``.
+        """
+        if scan_blocks and to_block - from_block < self._max_receipt_scan_blocks:
+            try:
+                return [
+                    receipt
+                    for block_number in range(from_block, to_block + 1)
+                    for receipt in self.get_block_receipts(BlockNumber(block_number))
+                    if HexBytes(receipt["transactionHash"]) in pending
+                ], True
+            except MethodUnavailable:
+                # ``eth_getBlockReceipts`` is not supported by the node
+                self._block_receipts_supported = False
+                scan_blocks = False
+            except Web3RPCError:
+                # other errors only fall back to requesting the receipts this time
+                pass
+
+        receipts = []
+        for transaction_hash in pending.values():
+            receipt = self._transaction_receipt_or_none(transaction_hash)
+            if receipt is not None:
+                receipts.append(receipt)
+        return receipts, scan_blocks
+
+    def wait_for_transaction_receipts(
+        self,
+        transaction_hashes: Sequence[_Hash32],
+        timeout: float = 120,
+        poll_latency: float = 0.1,
+    ) -> Iterator[TxReceipt]:
+        pending = {
+            HexBytes(transaction_hash): transaction_hash
+            for transaction_hash in transaction_hashes
+        }
+        # the time the caller spends on each receipt doesn't count towards the
+        # timeout, so it applies to waiting for each transaction as it would with
+        # ``wait_for_transaction_receipt``
+        deadline = time.monotonic() + timeout
+        last_block = self.block_number
+
+        for tx_hash, transaction_hash in list(pending.items()):
+            receipt = self._transaction_receipt_or_none(transaction_hash)
+            if receipt is not None:
+                del pending[tx_hash]
+                yielded_at = time.monotonic()
+                yield receipt
+                deadline += time.monotonic() - yielded_at
+
+        scan_blocks = self._block_receipts_supported is not False
+        while pending:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise self._receipts_time_exhausted(pending, timeout)
+            time.sleep(min(poll_latency, remaining))
+
+            # pending transactions are only checked again once a new block is mined
+            block_number = self.block_number
+            if block_number <= last_block:
+                continue
+            receipts, scan_blocks = self._receipts_in_new_blocks(
+                pending, last_block + 1, block_number, scan_blocks
+            )
+            last_block = block_number
+            for receipt in receipts:
+                del pending[HexBytes(receipt["transactionHash"])]
+                yielded_at = time.monotonic()
+                yield receipt
+                deadline += time.monotonic() - yielded_at
+
     # eth_getStorageAt
 
     _get_storage_at: Method[
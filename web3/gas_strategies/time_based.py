@@ -1,8 +1,10 @@
 import collections
 import math
 import operator
+import threading
 from typing import (
     Iterable,
+    NamedTuple,
     Sequence,
     cast,
 )
@@ -25,6 +27,9 @@ from hexbytes import (
 from web3 import (
     Web3,
 )
+from web3._utils.fee_utils import (
+    _fee_history_priority_fee_estimate,
+)
 from web3._utils.math import (
     percentile,
 )
@@ -32,9 +37,15 @@ from web3.exceptions import (
     InsufficientData,
     Web3ValidationError,
 )
+from web3.providers.base import (
+    JSONBaseProvider,
+)
 from web3.types import (
+    BlockData,
     BlockNumber,
+    FeeHistory,
     GasPriceStrategy,
+    Timestamp,
     TxData,
     TxParams,
     Wei,
@@ -65,17 +76,26 @@ def _get_weighted_avg_block_time(w3: Web3, sample_size: int) -> float:
     oldest_block = w3.eth.get_block(
         BlockNumber(latest_block_number - constrained_sample_size)
     )
-    oldest_block_number = oldest_block["number"]
-    prev_timestamp = oldest_block["timestamp"]
+    timestamps = [oldest_block["timestamp"]] + [
+        w3.eth.get_block(BlockNumber(i))["timestamp"]
+        for i in range(oldest_block["number"] + 1, latest_block_number + 1)
+    ]
+    return _compute_weighted_avg_block_time(timestamps)
+
+
+def _compute_weighted_avg_block_time(timestamps: Sequence[Timestamp]) -> float:
+    """
+    Averages the times between consecutive blocks, given their timestamps from
+    oldest to latest, weighting more recent blocks more heavily.
+    """
+    constrained_sample_size = len(timestamps) - 1
     weighted_sum = 0.0
     sum_of_weights = 0.0
-    for i in range(oldest_block_number + 1, latest_block_number + 1):
-        curr_timestamp = w3.eth.get_block(BlockNumber(i))["timestamp"]
-        time = curr_timestamp - prev_timestamp
-        weight = (i - oldest_block_number) / constrained_sample_size
+    for i in range(1, len(timestamps)):
+        time = timestamps[i] - timestamps[i - 1]
+        weight = i / constrained_sample_size
         weighted_sum += time * weight
         sum_of_weights += weight
-        prev_timestamp = curr_timestamp
     return weighted_sum / sum_of_weights
 
 
@@ -242,6 +262,208 @@ def construct_time_based_gas_price_strategy(
     return time_based_gas_price_strategy
 
 
+class BlockSample(NamedTuple):
+    number: BlockNumber
+    hash: HexBytes
+    parent_hash: HexBytes
+    miner: ChecksumAddress
+    timestamp: Timestamp
+    gas_prices: tuple[Wei, ...]
+
+
+def _block_sample(block: BlockData) -> BlockSample:
+    return BlockSample(
+        block["number"],
+        block["hash"],
+        block["parentHash"],
+        block["miner"],
+        block["timestamp"],
+        tuple(
+            cast(TxData, transaction)["gasPrice"]
+            for transaction in block["transactions"]
+        ),
+    )
+
+
+class TimeBasedFeeOracle:
+    """
+    A stateful version of the time based gas price strategy. It keeps a rolling
+    window of the gas prices and timestamps of the ``sample_size`` most recently
+    mined blocks, so that only blocks mined since the last call are fetched, and
+    the gas price is only recomputed once per new block.
+
+    An instance can be used directly as a gas price strategy:
+    ``w3.eth.set_gas_price_strategy(TimeBasedFeeOracle(max_wait_seconds=60))``.
+
+    :param max_wait_seconds: The desired maximum number of seconds the
+        transaction should take to mine.
+    :param sample_size: The number of recent blocks to sample
+    :param probability: An integer representation of the desired probability
+        that the transaction will be mined within ``max_wait_seconds``.  0 means 0%
+        and 100 means 100%.
+    :param weighted: Whether more recent block times are more heavily weighted.
+    :param reward_percentile: The ``eth_feeHistory`` reward percentile used to
+        estimate the priority fee.
+    """
+
+    def __init__(
+        self,
+        max_wait_seconds: int,
+        sample_size: int = 120,
+        probability: int = 98,
+        weighted: bool = False,
+        reward_percentile: float = 5.0,
+    ) -> None:
+        self.max_wait_seconds = max_wait_seconds
+        self.sample_size = sample_size
+        self.probability = probability
+        self.weighted = weighted
+        self.reward_percentile = reward_percentile
+
+        # the oldest block is only used for its timestamp
+        self._blocks: collections.deque[BlockSample] = collections.deque(
+            maxlen=sample_size + 1
+        )
+        self._gas_price: Wei | None = None
+        self._rewards: collections.deque[tuple[BlockNumber, Wei]] = collections.deque(
+            maxlen=max(sample_size, 1)
+        )
+        self._lock = threading.Lock()
+
+    def _fetch_blocks(self, w3: Web3, block_numbers: range) -> list[BlockSample]:
+        if len(block_numbers) > 1 and isinstance(w3.provider, JSONBaseProvider):
+            with w3.batch_requests() as batch:
+                for block_number in block_numbers:
+                    batch.add(
+                        w3.eth.get_block(
+                            BlockNumber(block_number), full_transactions=True
+                        )
+                    )
+                blocks = cast(list[BlockData], batch.execute())
+        else:
+            blocks = [
+                w3.eth.get_block(BlockNumber(block_number), full_transactions=True)
+                for block_number in block_numbers
+            ]
+        return [_block_sample(block) for block in blocks]
+
+    def _update_blocks(self, w3: Web3, latest_block_number: BlockNumber) -> None:
+        if self._blocks and self._blocks[-1].number == latest_block_number:
+            # a reorg can replace the latest block without changing the height
+            if w3.eth.get_block(latest_block_number)["hash"] == self._blocks[-1].hash:
+                return
+            self._blocks.clear()
+
+        oldest_block_number = max(latest_block_number - self.sample_size, 0)
+        if (
+            self._blocks
+            and oldest_block_number <= self._blocks[-1].number < latest_block_number
+        ):
+            new_blocks = self._fetch_blocks(
+                w3, range(self._blocks[-1].number + 1, latest_block_number + 1)
+            )
+            if new_blocks[0].parent_hash != self._blocks[-1].hash:
+                # the chain was reorganized, sample the whole window again
+                self._blocks.clear()
+                new_blocks = (
+                    self._fetch_blocks(
+                        w3, range(oldest_block_number, new_blocks[0].number)
+                    )
+                    + new_blocks
+                )
+        else:
+            self._blocks.clear()
+            new_blocks = self._fetch_blocks(
+                w3, range(oldest_block_number, latest_block_number + 1)
+            )
+
+        self._blocks.extend(new_blocks)
+        self._gas_price = None
+
+    def _compute_gas_price(self) -> Wei:
+        blocks = list(self._blocks)
+        constrained_sample_size = len(blocks) - 1
+        if constrained_sample_size == 0:
+            raise Web3ValidationError("Constrained sample size is 0")
+
+        if self.weighted:
+            avg_block_time = _compute_weighted_avg_block_time(
+                [block.timestamp for block in blocks]
+            )
+        else:
+            avg_block_time = (
+                blocks[-1].timestamp - blocks[0].timestamp
+            ) / constrained_sample_size
+
+        wait_blocks = int(math.ceil(self.max_wait_seconds / avg_block_time))
+        # sampled from the latest block backwards, like ``_get_raw_miner_data``
+        raw_miner_data = (
+            (block.miner, block.hash, gas_price)
+            for block in reversed(blocks[-self.sample_size :])
+            for gas_price in block.gas_prices
+        )
+        probabilities = _compute_probabilities(
+            _aggregate_miner_data(raw_miner_data),
+            wait_blocks=wait_blocks,
+            sample_size=self.sample_size,
+        )
+        return _compute_gas_price(probabilities, self.probability / 100)
+
+    def update(self, w3: Web3) -> BlockNumber:
+        """
+        Bring the sampled blocks up to date with the chain, fetching only the blocks
+        mined since the last update. Returns the latest block number.
+        """
+        latest_block_number = w3.eth.block_number
+        with self._lock:
+            self._update_blocks(w3, latest_block_number)
+        return latest_block_number
+
+    def generate_gas_price(
+        self, w3: Web3, transaction_params: TxParams | None = None
+    ) -> Wei:
+        # return gas price when no transactions available to sample
+        if self.update(w3) == 0:
+            return w3.eth.gas_price
+
+        with self._lock:
+            if self._gas_price is None:
+                self._gas_price = self._compute_gas_price()
+            return self._gas_price
+
+    __call__ = generate_gas_price
+
+    def max_priority_fee(self, w3: Web3) -> Wei:
+        """
+        Estimate a priority fee from the ``eth_feeHistory`` rewards of the sampled
+        blocks, fetching only the rewards of blocks mined since the last call.
+        """
+        latest_block_number = w3.eth.block_number
+        with self._lock:
+            last_block_number = self._rewards[-1][0] if self._rewards else None
+            if last_block_number != latest_block_number:
+                block_count = self._rewards.maxlen or 1
+                if (
+                    last_block_number is not None
+                    and 0 < latest_block_number - last_block_number < block_count
+                ):
+                    block_count = latest_block_number - last_block_number
+                else:
+                    self._rewards.clear()
+
+                fee_history = w3.eth.fee_history(
+                    block_count, latest_block_number, [self.reward_percentile]
+                )
+                self._rewards.extend(
+                    (BlockNumber(fee_history["oldestBlock"] + index), reward[0])
+                    for index, reward in enumerate(fee_history["reward"])
+                )
+
+            return _fee_history_priority_fee_estimate(
+                cast(FeeHistory, {"reward": [[reward] for _, reward in self._rewards]})
+            )
+
+
 # fast: mine within 1 minute
 fast_gas_price_strategy = construct_time_based_gas_price_strategy(
     max_wait_seconds=60,
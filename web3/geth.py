@@ -1,13 +1,29 @@
 from typing import (
+    Any,
+    AsyncIterator,
     Awaitable,
     Callable,
+    Iterator,
     Protocol,
+    Sequence,
 )
 
 from eth_typing.evm import (
     ChecksumAddress,
 )
 
+from web3._utils.debug_traces import (
+    STRUCT_LOG_FIELDS,
+    async_format_items,
+    async_stream_call_frames,
+    call_frame_trace_config,
+    stream_call_frames,
+    struct_log_formatter,
+    struct_log_trace_config,
+)
+from web3._utils.json_stream import (
+    JSONItemParser,
+)
 from web3._utils.rpc_abi import (
     RPC,
 )
@@ -27,6 +43,7 @@ from web3.types import (
     OpcodeTrace,
     Peer,
     PrestateTrace,
+    StructLog,
     TraceConfig,
     TxPoolContent,
     TxPoolInspect,
@@ -159,6 +176,47 @@ class GethDebug(Module):
         mungers=[trace_transaction_munger],
     )
 
+    def iter_struct_logs(
+        self,
+        transaction_hash: _Hash32,
+        trace_config: TraceConfig | None = None,
+        fields: Sequence[str] | None = None,
+        as_tuples: bool = False,
+    ) -> Iterator[StructLog | tuple[Any, ...]]:
+        """
+        Yield the struct logs of the transaction's opcode trace one at a time as the
+        response is received, rather than reading the whole trace first. If
+        ``fields`` are given, only those are kept. If ``as_tuples``, each struct log
+        is yielded as a tuple of the values of its ``fields``.
+        """
+        if as_tuples and fields is None:
+            fields = STRUCT_LOG_FIELDS
+        formatter = struct_log_formatter(fields, as_tuples)
+        struct_logs = self.w3.manager.request_stream(
+            RPC.debug_traceTransaction,
+            (transaction_hash, struct_log_trace_config(trace_config, fields)),
+            item_path=("result", "structLogs"),
+        )
+        return map(formatter, struct_logs)
+
+    def iter_call_frames(
+        self,
+        transaction_hash: _Hash32,
+        trace_config: TraceConfig | None = None,
+    ) -> Iterator[CallTrace]:
+        """
+        Yield the frames of the transaction's call trace one at a time as the
+        response is received, each without the frames of the calls it made and
+        after them, ending with the top-level call.
+        """
+        parser = JSONItemParser(("result", "calls"), nested_item_key="calls")
+        calls = self.w3.manager.request_stream(
+            RPC.debug_traceTransaction,
+            (transaction_hash, call_frame_trace_config(trace_config)),
+            parser=parser,
+        )
+        return stream_call_frames(calls, parser)
+
 
 class Geth(Module):
     admin: GethAdmin
@@ -318,6 +376,36 @@ class AsyncGethDebug(Module):
     ) -> CallTrace | PrestateTrace | OpcodeTrace | FourByteTrace | DiffModeTrace:
         return await self._trace_transaction(transaction_hash, trace_config)
 
+    def iter_struct_logs(
+        self,
+        transaction_hash: _Hash32,
+        trace_config: TraceConfig | None = None,
+        fields: Sequence[str] | None = None,
+        as_tuples: bool = False,
+    ) -> AsyncIterator[StructLog | tuple[Any, ...]]:
+        if as_tuples and fields is None:
+            fields = STRUCT_LOG_FIELDS
+        formatter = struct_log_formatter(fields, as_tuples)
+        struct_logs = self.w3.manager.coro_request_stream(
+            RPC.debug_traceTransaction,
+            (transaction_hash, struct_log_trace_config(trace_config, fields)),
+            item_path=("result", "structLogs"),
+        )
+        return async_format_items(struct_logs, formatter)
+
+    def iter_call_frames(
+        self,
+        transaction_hash: _Hash32,
+        trace_config: TraceConfig | None = None,
+    ) -> AsyncIterator[CallTrace]:
+        parser = JSONItemParser(("result", "calls"), nested_item_key="calls")
+        calls = self.w3.manager.coro_request_stream(
+            RPC.debug_traceTransaction,
+            (transaction_hash, call_frame_trace_config(trace_config)),
+            parser=parser,
+        )
+        return async_stream_call_frames(calls, parser)
+
 
 class AsyncGeth(Module):
     is_async = True
@@ -73,11 +73,17 @@ from web3._utils.encoding import (
     to_hex,
     to_json,
 )
+from web3._utils.lazy_imports import (
+    LazyClassAttribute,
+    import_attribute,
+)
 from web3._utils.rpc_abi import (
     RPC,
 )
 from web3._utils.module import (
+    attach_lazy_modules,
     attach_modules as _attach_modules,
+    build_lazy_module,
 )
 from web3._utils.normalizers import (
     abi_ens_resolver,
@@ -119,23 +125,9 @@ from web3.providers import (
     AsyncBaseProvider,
     BaseProvider,
 )
-from web3.providers.eth_tester import (
-    AsyncEthereumTesterProvider,
-    EthereumTesterProvider,
-)
-from web3.providers.ipc import (
-    IPCProvider,
-)
 from web3.providers.persistent.utils import (
     persistent_connection_provider_method,
 )
-from web3.providers.rpc import (
-    AsyncHTTPProvider,
-    HTTPProvider,
-)
-from web3.providers import (
-    WebSocketProvider,
-)
 from web3.providers.persistent import (
     PersistentConnection,
 )
@@ -155,7 +147,18 @@ from web3.providers.persistent.subscription_manager import (
 if TYPE_CHECKING:
     from web3._utils.batching import RequestBatcher  # noqa: F401
     from web3._utils.empty import Empty  # noqa: F401
+    from web3.providers.eth_tester import (  # noqa: F401
+        AsyncEthereumTesterProvider,
+        EthereumTesterProvider,
+    )
+    from web3.providers.ipc import IPCProvider  # noqa: F401
     from web3.providers.persistent import PersistentConnectionProvider  # noqa: F401
+    from web3.providers.persistent import WebSocketProvider  # noqa: F401
+    from web3.providers.rpc import (  # noqa: F401
+        AsyncHTTPProvider,
+        HTTPProvider,
+    )
+    from web3.utils.metrics import RequestMetrics  # noqa: F401
 
 
 def get_async_default_modules() -> dict[str, type[Module] | Sequence[Any]]:
@@ -192,6 +195,7 @@ def get_default_modules() -> dict[str, type[Module] | Sequence[Any]]:
 
 class BaseWeb3:
     _strict_bytes_type_checking = True
+    _codec: ABICodec | None = None
 
     # Managers
     RequestManager = DefaultRequestManager
@@ -206,6 +210,13 @@ class BaseWeb3:
     def middleware_onion(self) -> MiddlewareOnion:
         return cast(MiddlewareOnion, self.manager.middleware_onion)
 
+    @property
+    def metrics(self) -> Optional["RequestMetrics"]:
+        """
+        The metrics collected by the provider, if it was given a ``metrics``.
+        """
+        return self.manager.provider.metrics
+
     # Encoding and Decoding
     @staticmethod
     @wraps(to_bytes)
@@ -287,12 +298,23 @@ class BaseWeb3:
 
     @strict_bytes_type_checking.setter
     def strict_bytes_type_checking(self, strict_bytes_type_check: bool) -> None:
-        self.codec = (
-            ABICodec(build_strict_registry())
-            if strict_bytes_type_check
-            else ABICodec(build_non_strict_registry())
-        )
         self._strict_bytes_type_checking = strict_bytes_type_check
+        self._codec = None
+
+    @property
+    def codec(self) -> ABICodec:
+        # built on first use, as many instances never encode or decode anything
+        if self._codec is None:
+            self._codec = (
+                ABICodec(build_strict_registry())
+                if self._strict_bytes_type_checking
+                else ABICodec(build_non_strict_registry())
+            )
+        return self._codec
+
+    @codec.setter
+    def codec(self, codec: ABICodec) -> None:
+        self._codec = codec
 
     @staticmethod
     @apply_to_return_value(HexBytes)
@@ -353,6 +375,15 @@ class BaseWeb3:
         """
         _attach_modules(self, modules)
 
+    if not TYPE_CHECKING:
+        # Modules passed in on construction are built on first access. Hidden from
+        # type checkers so that unknown attributes are still reported.
+        def __getattr__(self, name: str) -> Any:
+            return build_lazy_module(self, name)
+
+    def __dir__(self) -> list[str]:
+        return [*super().__dir__(), *self.__dict__.get("_lazy_modules", ())]
+
     def is_encodable(self, _type: TypeStr, value: Any) -> bool:
         return self.codec.is_encodable(_type, value)
 
@@ -388,10 +419,21 @@ class Web3(BaseWeb3):
     net: Net
     geth: Geth
 
-    # Providers
-    HTTPProvider = HTTPProvider
-    IPCProvider = IPCProvider
-    EthereumTesterProvider = EthereumTesterProvider
+    # Providers, imported on first access
+    if TYPE_CHECKING:
+        HTTPProvider = HTTPProvider
+        IPCProvider = IPCProvider
+        EthereumTesterProvider = EthereumTesterProvider
+    else:
+        HTTPProvider = LazyClassAttribute(
+            import_attribute("web3.providers.rpc", "HTTPProvider")
+        )
+        IPCProvider = LazyClassAttribute(
+            import_attribute("web3.providers.ipc", "IPCProvider")
+        )
+        EthereumTesterProvider = LazyClassAttribute(
+            import_attribute("web3.providers.eth_tester", "EthereumTesterProvider")
+        )
 
     def __init__(
         self,
@@ -404,15 +446,14 @@ class Web3(BaseWeb3):
         _validate_provider(self, provider)
 
         self.manager = self.RequestManager(self, provider, middleware)
-        self.codec = ABICodec(build_strict_registry())
 
         if modules is None:
             modules = get_default_modules()
 
-        self.attach_modules(modules)
+        attach_lazy_modules(self, modules)
 
         if external_modules is not None:
-            self.attach_modules(external_modules)
+            attach_lazy_modules(self, external_modules)
 
         self.ens = ens
 
@@ -459,10 +500,21 @@ class AsyncWeb3(BaseWeb3, Generic[AsyncProviderT]):
     net: AsyncNet
     geth: AsyncGeth
 
-    # Providers
-    AsyncHTTPProvider = AsyncHTTPProvider
-    WebSocketProvider = WebSocketProvider
-    AsyncEthereumTesterProvider = AsyncEthereumTesterProvider
+    # Providers, imported on first access
+    if TYPE_CHECKING:
+        AsyncHTTPProvider = AsyncHTTPProvider
+        WebSocketProvider = WebSocketProvider
+        AsyncEthereumTesterProvider = AsyncEthereumTesterProvider
+    else:
+        AsyncHTTPProvider = LazyClassAttribute(
+            import_attribute("web3.providers.rpc", "AsyncHTTPProvider")
+        )
+        WebSocketProvider = LazyClassAttribute(
+            import_attribute("web3.providers.persistent", "WebSocketProvider")
+        )
+        AsyncEthereumTesterProvider = LazyClassAttribute(
+            import_attribute("web3.providers.eth_tester", "AsyncEthereumTesterProvider")
+        )
 
     def __init__(
         self,
@@ -475,14 +527,13 @@ class AsyncWeb3(BaseWeb3, Generic[AsyncProviderT]):
         _validate_provider(self, provider)
 
         self.manager = self.RequestManager(self, provider, middleware)
-        self.codec = ABICodec(build_strict_registry())
 
         self._modules = get_async_default_modules() if modules is None else modules
         self._external_modules = None if external_modules is None else external_modules
 
-        self.attach_modules(self._modules)
+        attach_lazy_modules(self, self._modules)
         if external_modules is not None:
-            self.attach_modules(external_modules)
+            attach_lazy_modules(self, external_modules)
 
         self.ens = ens
 
@@ -1,11 +1,17 @@
 import asyncio
+from contextlib import (
+    contextmanager,
+)
+import contextvars
 import logging
 from typing import (
     TYPE_CHECKING,
     Any,
     AsyncGenerator,
+    AsyncIterator,
     Callable,
     Coroutine,
+    Iterator,
     Sequence,
     Union,
     cast,
@@ -30,6 +36,9 @@ from web3._utils.compat import (
 from web3._utils.formatters import (
     apply_null_result_formatters,
 )
+from web3._utils.json_stream import (
+    JSONItemParser,
+)
 from web3._utils.validation import (
     raise_error_for_batch_response,
     validate_rpc_response_and_raise_if_error,
@@ -38,6 +47,7 @@ from web3.datastructures import (
     NamedElementOnion,
 )
 from web3.exceptions import (
+    BadResponseFormat,
     ProviderConnectionError,
     TaskNotRunning,
     Web3TypeError,
@@ -60,7 +70,6 @@ from web3.module import (
     apply_result_formatters,
 )
 from web3.providers import (
-    AutoProvider,
     JSONBaseProvider,
     PersistentConnectionProvider,
 )
@@ -70,9 +79,14 @@ from web3.providers.async_base import (
 from web3.types import (
     FormattedEthSubscriptionResponse,
     RPCEndpoint,
+    RPCId,
     RPCRequest,
     RPCResponse,
 )
+from web3.utils.metrics import (
+    BATCH_METHOD,
+    TrackedRequest,
+)
 
 if TYPE_CHECKING:
     from web3.main import (  # noqa: F401
@@ -89,15 +103,24 @@ if TYPE_CHECKING:
     from web3.providers.persistent.request_processor import (  # noqa: F401
         RequestProcessor,
     )
+    from web3.utils.profiling import (  # noqa: F401
+        MiddlewareProfiler,
+    )
 
 
 NULL_RESPONSES = [None, HexBytes("0x"), "0x"]
 
+# the ids of the request managers in raw mode in the current context
+_raw_managers: contextvars.ContextVar[frozenset[int]] = contextvars.ContextVar(
+    "raw_managers", default=frozenset()
+)
+
 
 class RequestManager:
     logger = logging.getLogger("web3.manager.RequestManager")
 
     middleware_onion: Union["MiddlewareOnion", NamedElementOnion[None, None]]
+    _middleware_profiler: "MiddlewareProfiler | None" = None
 
     def __init__(
         self,
@@ -108,6 +131,12 @@ class RequestManager:
         self.w3 = w3
 
         if provider is None:
+            # defer import so that the providers AutoProvider tries are only loaded
+            # when no provider is given
+            from web3.providers.auto import (
+                AutoProvider,
+            )
+
             self.provider = AutoProvider()
         else:
             self.provider = provider
@@ -116,6 +145,9 @@ class RequestManager:
             middleware = self.get_default_middleware()
 
         self.middleware_onion = NamedElementOnion(middleware)
+        # metrics of requests sent over a persistent connection, by request id, until
+        # their response is received
+        self._tracked_requests: dict[RPCId | None, TrackedRequest] = {}
 
         if isinstance(provider, PersistentConnectionProvider):
             # set up the request processor to be able to properly process ordered
@@ -131,6 +163,42 @@ class RequestManager:
     def provider(self, provider: Union["BaseProvider", "AsyncBaseProvider"]) -> None:
         self._provider = provider
 
+    @property
+    def middleware_profiler(self) -> "MiddlewareProfiler | None":
+        """
+        The profiler timing each middleware of the requests made through the
+        provider's ``request_func`` and ``batch_request_func``, if profiling.
+        """
+        return self._middleware_profiler
+
+    @middleware_profiler.setter
+    def middleware_profiler(self, profiler: "MiddlewareProfiler | None") -> None:
+        self._middleware_profiler = profiler
+        # the provider caches the middleware chains, rebuild them with the profiler
+        self._provider._request_func_cache = (None, None)
+        self._provider._batch_request_func_cache = (None, None)
+
+    @property
+    def is_raw(self) -> bool:
+        """
+        Check if requests are currently being made in raw mode.
+        """
+        return id(self) in _raw_managers.get()
+
+    @contextmanager
+    def raw(self) -> Iterator[None]:
+        """
+        Context manager within which requests return the decoded JSON-RPC result
+        directly. Result formatters and the middleware result formatting that makes
+        responses pythonic (e.g. ``AttributeDict`` wrapping) are skipped. Error and
+        null result formatters are still applied.
+        """
+        token = _raw_managers.set(_raw_managers.get() | {id(self)})
+        try:
+            yield
+        finally:
+            _raw_managers.reset(token)
+
     @staticmethod
     def get_default_middleware() -> list[tuple[Middleware, str]]:
         """
@@ -156,6 +224,9 @@ class RequestManager:
             cast("Web3", self.w3), cast("MiddlewareOnion", self.middleware_onion)
         )
         self.logger.debug("Making request. Method: %s", method)
+        if provider.metrics is not None:
+            with provider.metrics.track(str(method)) as tracked:
+                return tracked.response(request_func(method, params))
         return request_func(method, params)
 
     async def _coro_make_request(
@@ -167,6 +238,9 @@ class RequestManager:
             cast("MiddlewareOnion", self.middleware_onion),
         )
         self.logger.debug("Making request. Method: %s", method)
+        if provider.metrics is not None:
+            with provider.metrics.track(str(method)) as tracked:
+                return tracked.response(await request_func(method, params))
         return await request_func(method, params)
 
     #
@@ -185,6 +259,14 @@ class RequestManager:
         error_formatters: Callable[..., Any] | None = None,
         null_result_formatters: Callable[..., Any] | None = None,
     ) -> Any:
+        if not isinstance(response, dict):
+            # middleware may be skipped for the requested method, so the response
+            # object itself is validated here
+            raise BadResponseFormat(
+                "Malformed response: expected a valid JSON-RPC response object, "
+                f"got: `{response}`"
+            )
+
         is_subscription_response = (
             response.get("method") == "eth_subscription"
             and response.get("params") is not None
@@ -245,15 +327,99 @@ class RequestManager:
             response, params, error_formatters, null_result_formatters
         )
 
+    # -- streaming responses -- #
+
+    def request_stream(
+        self,
+        method: RPCEndpoint,
+        params: Any,
+        item_path: Sequence[str] = ("result",),
+        error_formatters: Callable[..., Any] | None = None,
+        null_result_formatters: Callable[..., Any] | None = None,
+        parser: JSONItemParser | None = None,
+    ) -> Iterator[Any]:
+        """
+        Make a synchronous request, yielding the items of the array at ``item_path``
+        in the response as they are parsed, rather than reading the whole response
+        first. Middleware and result formatters are not applied. An error response
+        is raised once the response has been read.
+
+        A ``parser`` may be given in place of ``item_path``, to read the rest of the
+        response from its ``document`` once the items have been read.
+        """
+        if not isinstance(self.provider, JSONBaseProvider):
+            raise Web3TypeError(
+                "Streaming responses are not supported by this provider."
+            )
+
+        if parser is None:
+            parser = JSONItemParser(item_path)
+        self.logger.debug("Making streaming request. Method: %s", method)
+        items = self.provider.make_stream_request(method, params, parser)
+        return self._validated_stream(
+            items, parser, params, error_formatters, null_result_formatters
+        )
+
+    def _validated_stream(
+        self,
+        items: Iterator[Any],
+        parser: JSONItemParser,
+        params: Any,
+        error_formatters: Callable[..., Any] | None,
+        null_result_formatters: Callable[..., Any] | None,
+    ) -> Iterator[Any]:
+        yield from items
+        self.formatted_response(
+            parser.document, params, error_formatters, null_result_formatters
+        )
+
+    def coro_request_stream(
+        self,
+        method: RPCEndpoint,
+        params: Any,
+        item_path: Sequence[str] = ("result",),
+        error_formatters: Callable[..., Any] | None = None,
+        null_result_formatters: Callable[..., Any] | None = None,
+        parser: JSONItemParser | None = None,
+    ) -> AsyncIterator[Any]:
+        """
+        Make an asynchronous request, yielding the items of the array at
+        ``item_path`` in the response as they are parsed. See ``request_stream``.
+        """
+        if not isinstance(self.provider, AsyncJSONBaseProvider):
+            raise Web3TypeError(
+                "Streaming responses are not supported by this provider."
+            )
+
+        if parser is None:
+            parser = JSONItemParser(item_path)
+        self.logger.debug("Making streaming request. Method: %s", method)
+        items = self.provider.make_stream_request(method, params, parser)
+        return self._async_validated_stream(
+            items, parser, params, error_formatters, null_result_formatters
+        )
+
+    async def _async_validated_stream(
+        self,
+        items: AsyncIterator[Any],
+        parser: JSONItemParser,
+        params: Any,
+        error_formatters: Callable[..., Any] | None,
+        null_result_formatters: Callable[..., Any] | None,
+    ) -> AsyncIterator[Any]:
+        async for item in items:
+            yield item
+        self.formatted_response(
+            parser.document, params, error_formatters, null_result_formatters
+        )
+
     # -- batch requests management -- #
 
     def _batch_requests(self) -> RequestBatcher[Method[Callable[..., Any]]]:
         """
         Context manager for making batch requests
         """
-        if not isinstance(
-            self.provider, (AsyncJSONBaseProvider, JSONBaseProvider, AutoProvider)
-        ):
+        if not isinstance(self.provider, (AsyncJSONBaseProvider, JSONBaseProvider)):
             raise Web3TypeError("Batch requests are not supported by this provider.")
         return RequestBatcher(self.w3)
 
@@ -267,12 +433,14 @@ class RequestManager:
         request_func = provider.batch_request_func(
             cast("Web3", self.w3), cast("MiddlewareOnion", self.middleware_onion)
         )
-        response = request_func(
-            [
-                (method, params)
-                for (method, params), _response_formatters in requests_info
-            ]
-        )
+        requests = [
+            (method, params) for (method, params), _response_formatters in requests_info
+        ]
+        if provider.metrics is not None:
+            with provider.metrics.track(BATCH_METHOD) as tracked:
+                response = tracked.response(request_func(requests))
+        else:
+            response = request_func(requests)
 
         if isinstance(response, list):
             # expected format
@@ -302,12 +470,15 @@ class RequestManager:
         # since we add items to the batch without awaiting, we unpack the coroutines
         # and await them all here
         unpacked_requests_info = await asyncio.gather(*requests_info)
-        response = await request_func(
-            [
-                (method, params)
-                for (method, params), _response_formatters in unpacked_requests_info
-            ]
-        )
+        requests = [
+            (method, params)
+            for (method, params), _response_formatters in unpacked_requests_info
+        ]
+        if provider.metrics is not None:
+            with provider.metrics.track(BATCH_METHOD) as tracked:
+                response = tracked.response(await request_func(requests))
+        else:
+            response = await request_func(requests)
 
         if isinstance(response, list):
             # expected format
@@ -380,17 +551,14 @@ class RequestManager:
         reqs = [req for req, _ in unpacked_requests_info]
         response_formatters = [resp_f for _, resp_f in unpacked_requests_info]
 
-        requests = await self._async_send_batch(reqs)
-
-        for i, request in enumerate(requests):
-            self._provider._request_processor.cache_request_information(
-                request["id"],
-                request["method"],
-                request["params"],
-                response_formatters=response_formatters[i],
-            )
+        if self._provider.metrics is not None:
+            with self._provider.metrics.track(BATCH_METHOD) as tracked:
+                responses = tracked.response(
+                    await self._async_send_and_recv_batch(reqs, response_formatters)
+                )
+        else:
+            responses = await self._async_send_and_recv_batch(reqs, response_formatters)
 
-        responses = await self._async_recv_batch(requests)
         if isinstance(responses, list):
             # expected format
             return [
@@ -401,6 +569,24 @@ class RequestManager:
             # expect a single response with an error
             raise_error_for_batch_response(responses, self.logger)
 
+    async def _async_send_and_recv_batch(
+        self,
+        requests: list[tuple["RPCEndpoint", Any]],
+        response_formatters: list[tuple[Any, ...]],
+    ) -> list[RPCResponse]:
+        rpc_requests = await self._async_send_batch(requests)
+
+        provider = cast(PersistentConnectionProvider, self._provider)
+        for i, request in enumerate(rpc_requests):
+            provider._request_processor.cache_request_information(
+                request["id"],
+                request["method"],
+                request["params"],
+                response_formatters=response_formatters[i],
+            )
+
+        return await self._async_recv_batch(rpc_requests)
+
     def _format_batched_response(
         self,
         requests_info: tuple[tuple[RPCEndpoint, Any], Sequence[Any]],
@@ -469,7 +655,30 @@ class RequestManager:
             method,
             params,
         )
-        return await send_func(method, params)
+        if provider.metrics is None:
+            return await send_func(method, params)
+
+        # finished once the response is received
+        tracked = provider.metrics.track(str(method)).start()
+        try:
+            rpc_request = await send_func(method, params)
+        except BaseException:
+            tracked.finish(failed=True)
+            raise
+        self._tracked_requests[rpc_request["id"]] = tracked
+        return rpc_request
+
+    def _finish_tracked_request(
+        self, request_id: RPCId | None, response: RPCResponse | None
+    ) -> None:
+        """
+        Record a request sent with ``send()`` as finished, as failed if no response
+        was received for it or the response is an error.
+        """
+        tracked = self._tracked_requests.pop(request_id, None)
+        if tracked is not None:
+            tracked.response(response)
+            tracked.finish(failed=response is None)
 
     async def recv_for_request(self, rpc_request: RPCRequest) -> RPCResponse:
         provider = cast(PersistentConnectionProvider, self._provider)
@@ -484,7 +693,13 @@ class RequestManager:
             "    request: %s",
             rpc_request,
         )
-        response = await recv_func(rpc_request)
+        try:
+            response = await recv_func(rpc_request)
+        except BaseException:
+            self._finish_tracked_request(rpc_request["id"], None)
+            raise
+        self._finish_tracked_request(rpc_request["id"], response)
+
         try:
             return cast(RPCResponse, await self._process_response(response))
         except Exception:
@@ -505,6 +720,7 @@ class RequestManager:
             last=False,
             timeout=provider.request_timeout,
         )
+        self._finish_tracked_request(response.get("id"), response)
         return await self._process_response(response)
 
     def _persistent_message_stream(self) -> "_AsyncPersistentMessageStream":
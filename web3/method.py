@@ -121,7 +121,7 @@ class Method(Generic[TFunc]):
     using the json rpc method string.
 
     4. After the parameter processing from steps 1-3 the request is made using
-    the calling function returned by the module attribute ``retrieve_caller_fn``
+    the calling function returned by the module method ``retrieve_caller_fn``
     and the response formatters are applied to the output.
     """
 
@@ -166,7 +166,11 @@ class Method(Generic[TFunc]):
                 )
             return module.retrieve_request_information(self)
         else:
-            return module.retrieve_caller_fn(self)
+            try:
+                return module._method_callers[self]
+            except KeyError:
+                caller = module._method_callers[self] = module.retrieve_caller_fn(self)
+                return caller
 
     def __call__(self, *args: Any, **kwargs: Any) -> Any:
         return self.__get__(self._module)(*args, **kwargs)
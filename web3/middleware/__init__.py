@@ -3,7 +3,10 @@ from typing import (
     Any,
     Callable,
     Coroutine,
+    Iterable,
+    Optional,
     Sequence,
+    Union,
 )
 
 from .attrdict import (
@@ -34,17 +37,19 @@ from .proof_of_authority import (
 from .pythonic import (
     PythonicMiddleware,
 )
-from .signing import (
-    SignAndSendRawMiddlewareBuilder,
-)
 from .stalecheck import (
     StalecheckMiddlewareBuilder,
 )
 from .validation import (
     ValidationMiddleware,
 )
+from .._utils.lazy_imports import (
+    lazy_module_getattr,
+)
 from ..types import (
+    AsyncMakeBatchRequestFn,
     AsyncMakeRequestFn,
+    MakeBatchRequestFn,
     MakeRequestFn,
 )
 
@@ -55,8 +60,58 @@ if TYPE_CHECKING:
         Web3,
     )
     from web3.types import (
+        RPCEndpoint,
         RPCResponse,
     )
+    from web3.utils.profiling import (
+        MiddlewareProfiler,
+    )
+
+    from .signing import (  # noqa: F401
+        SignAndSendRawMiddlewareBuilder,
+    )
+
+# imported on first access, so that ``eth-account`` is only loaded when signing
+__getattr__ = lazy_module_getattr(
+    __name__,
+    {"SignAndSendRawMiddlewareBuilder": "web3.middleware.signing"},
+)
+
+
+def _applicable_layers(
+    initialized: Sequence[Web3Middleware], methods: Iterable["RPCEndpoint"]
+) -> tuple[int, ...]:
+    """
+    Returns the indices of the initialized middleware that handle at least one of
+    the ``methods``, in onion order.
+    """
+    methods = tuple(methods)
+    return tuple(
+        index
+        for index, mw in enumerate(initialized)
+        if any(mw.handles_method(method) for method in methods)
+    )
+
+
+def _profiling(
+    w3: Union["AsyncWeb3[Any]", "Web3"],
+    middleware: Sequence[Middleware],
+    initialized: Sequence[Web3Middleware],
+) -> tuple[Optional["MiddlewareProfiler"], tuple[str, ...]]:
+    """
+    Returns the manager's middleware profiler, if any, with the names to profile
+    each middleware under: their names in the middleware onion, or their class
+    names for any that are not in it.
+    """
+    # ``w3`` may be left out when a provider is used without a ``Web3`` instance
+    profiler = getattr(getattr(w3, "manager", None), "middleware_profiler", None)
+    if profiler is None:
+        return None, ()
+    onion_names = {id(mw): name for mw, name in w3.middleware_onion.middleware}
+    return profiler, tuple(
+        str(onion_names.get(id(mw), type(initialized_mw).__name__))
+        for mw, initialized_mw in zip(middleware, initialized)
+    )
 
 
 def combine_middleware(
@@ -68,12 +123,91 @@ def combine_middleware(
     Returns a callable function which takes method and params as positional arguments
     and passes these args through the request processors, makes the request, and passes
     the response through the response processors.
+
+    The middleware chain is composed lazily, once per requested method, and only
+    includes the middleware that handle that method.
+    """
+    initialized = tuple(mw(w3) for mw in middleware)
+    profiler, names = _profiling(w3, middleware, initialized)
+    chains_by_layers: dict[tuple[int, ...], MakeRequestFn] = {}
+    chains: dict["RPCEndpoint", MakeRequestFn] = {}
+
+    def _build_chain(method: "RPCEndpoint") -> MakeRequestFn:
+        layers = _applicable_layers(initialized, (method,))
+        if layers not in chains_by_layers:
+            accumulator_fn = provider_request_fn
+            if profiler is not None:
+                accumulator_fn = profiler.profile_provider(accumulator_fn)
+            for index in reversed(layers):
+                # wrap the accumulator function down the stack
+                if profiler is None:
+                    accumulator_fn = initialized[index].wrap_make_request(
+                        accumulator_fn
+                    )
+                else:
+                    accumulator_fn = profiler.profile_layer(
+                        names[index],
+                        initialized[index].wrap_make_request,
+                        accumulator_fn,
+                    )
+            chains_by_layers[layers] = accumulator_fn
+        return chains_by_layers[layers]
+
+    def method_scoped_request(method: "RPCEndpoint", params: Any) -> "RPCResponse":
+        try:
+            chain = chains[method]
+        except KeyError:
+            chain = chains[method] = _build_chain(method)
+        return chain(method, params)
+
+    return method_scoped_request
+
+
+def combine_batch_middleware(
+    middleware: Sequence[Middleware],
+    w3: "Web3",
+    provider_batch_request_fn: MakeBatchRequestFn,
+) -> MakeBatchRequestFn:
+    """
+    Returns a callable function which takes a list of (method, params) tuples and
+    passes them through the middleware that handle at least one of the methods in the
+    batch. Chains are cached by the set of methods in the batch.
     """
-    accumulator_fn = provider_request_fn
-    for mw in reversed(middleware):
-        # initialize the middleware and wrap the accumulator function down the stack
-        accumulator_fn = mw(w3).wrap_make_request(accumulator_fn)
-    return accumulator_fn
+    initialized = tuple(mw(w3) for mw in middleware)
+    profiler, names = _profiling(w3, middleware, initialized)
+    chains: dict[frozenset["RPCEndpoint"], MakeBatchRequestFn] = {}
+
+    def _build_chain(methods: frozenset["RPCEndpoint"]) -> MakeBatchRequestFn:
+        accumulator_fn = provider_batch_request_fn
+        if profiler is not None:
+            accumulator_fn = profiler.profile_provider(accumulator_fn)
+        for index in reversed(_applicable_layers(initialized, methods)):
+            if profiler is None:
+                accumulator_fn = initialized[index].wrap_make_batch_request(
+                    accumulator_fn
+                )
+            else:
+                accumulator_fn = profiler.profile_layer(
+                    names[index],
+                    initialized[index].wrap_make_batch_request,
+                    accumulator_fn,
+                )
+        return accumulator_fn
+
+    def method_scoped_batch_request(
+        requests_info: list[tuple["RPCEndpoint", Any]],
+    ) -> Union[list["RPCResponse"], "RPCResponse"]:
+        methods = frozenset(method for method, _params in requests_info)
+        try:
+            chain = chains[methods]
+        except KeyError:
+            chain = chains[methods] = _build_chain(methods)
+        return chain(requests_info)
+
+    return method_scoped_batch_request
+
+
+# -- async -- #
 
 
 async def async_combine_middleware(
@@ -85,13 +219,92 @@ async def async_combine_middleware(
     Returns a callable function which takes method and params as positional arguments
     and passes these args through the request processors, makes the request, and passes
     the response through the response processors.
+
+    The middleware chain is composed lazily, once per requested method, and only
+    includes the middleware that handle that method.
     """
-    accumulator_fn = provider_request_fn
-    for mw in reversed(middleware):
-        # initialize the middleware and wrap the accumulator function down the stack
-        initialized = mw(async_w3)
-        accumulator_fn = await initialized.async_wrap_make_request(accumulator_fn)
-    return accumulator_fn
+    initialized = tuple(mw(async_w3) for mw in middleware)
+    profiler, names = _profiling(async_w3, middleware, initialized)
+    chains_by_layers: dict[tuple[int, ...], AsyncMakeRequestFn] = {}
+    chains: dict["RPCEndpoint", AsyncMakeRequestFn] = {}
+
+    async def _build_chain(method: "RPCEndpoint") -> AsyncMakeRequestFn:
+        layers = _applicable_layers(initialized, (method,))
+        if layers not in chains_by_layers:
+            accumulator_fn = provider_request_fn
+            if profiler is not None:
+                accumulator_fn = profiler.async_profile_provider(accumulator_fn)
+            for index in reversed(layers):
+                # wrap the accumulator function down the stack
+                if profiler is None:
+                    accumulator_fn = await initialized[index].async_wrap_make_request(
+                        accumulator_fn
+                    )
+                else:
+                    accumulator_fn = await profiler.async_profile_layer(
+                        names[index],
+                        initialized[index].async_wrap_make_request,
+                        accumulator_fn,
+                    )
+            chains_by_layers[layers] = accumulator_fn
+        return chains_by_layers[layers]
+
+    async def method_scoped_request(
+        method: "RPCEndpoint", params: Any
+    ) -> "RPCResponse":
+        try:
+            chain = chains[method]
+        except KeyError:
+            chain = chains[method] = await _build_chain(method)
+        return await chain(method, params)
+
+    return method_scoped_request
+
+
+async def async_combine_batch_middleware(
+    middleware: Sequence[Middleware],
+    async_w3: "AsyncWeb3[Any]",
+    provider_batch_request_fn: AsyncMakeBatchRequestFn,
+) -> AsyncMakeBatchRequestFn:
+    """
+    Returns a callable function which takes a list of (method, params) tuples and
+    passes them through the middleware that handle at least one of the methods in the
+    batch. Chains are cached by the set of methods in the batch.
+    """
+    initialized = tuple(mw(async_w3) for mw in middleware)
+    profiler, names = _profiling(async_w3, middleware, initialized)
+    chains: dict[frozenset["RPCEndpoint"], AsyncMakeBatchRequestFn] = {}
+
+    async def _build_chain(
+        methods: frozenset["RPCEndpoint"],
+    ) -> AsyncMakeBatchRequestFn:
+        accumulator_fn = provider_batch_request_fn
+        if profiler is not None:
+            accumulator_fn = profiler.async_profile_provider(accumulator_fn)
+        for index in reversed(_applicable_layers(initialized, methods)):
+            if profiler is None:
+                accumulator_fn = await initialized[index].async_wrap_make_batch_request(
+                    accumulator_fn
+                )
+            else:
+                accumulator_fn = await profiler.async_profile_layer(
+                    names[index],
+                    initialized[index].async_wrap_make_batch_request,
+                    accumulator_fn,
+                )
+        return accumulator_fn
+
+    async def method_scoped_batch_request(
+        requests_info: list[tuple["RPCEndpoint", Any]],
+    ) -> Union[list["RPCResponse"], "RPCResponse"]:
+        methods = frozenset(method for method, _params in requests_info)
+        try:
+            chain = chains[methods]
+        except KeyError:
+            chain = chains[methods] = await _build_chain(methods)
+        return await chain(requests_info)
+
+    return method_scoped_batch_request
 
 
 __all__ = [
@@ -51,7 +51,12 @@ class AttributeDictMiddleware(Web3Middleware, ABC):
         (e.g. my_attribute_dict.property1) will not preserve typing.
     """
 
+    skip_result_formatting_when_raw = True
+
     def response_processor(self, method: "RPCEndpoint", response: "RPCResponse") -> Any:
+        if self.should_skip_result_formatting():
+            return response
+
         if "result" in response:
             new_result = AttributeDict.recursive(response["result"])
             response = {**response, "result": new_result}
@@ -62,6 +67,9 @@ class AttributeDictMiddleware(Web3Middleware, ABC):
     async def async_response_processor(
         self, method: "RPCEndpoint", response: "RPCResponse"
     ) -> Any:
+        if self.should_skip_result_formatting():
+            return response
+
         if self._w3.provider.has_persistent_connection:
             provider = cast("PersistentConnectionProvider", self._w3.provider)
             provider._request_processor.append_middleware_response_processor(
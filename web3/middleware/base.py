@@ -4,6 +4,7 @@ from abc import (
 from typing import (
     TYPE_CHECKING,
     Any,
+    Collection,
     Union,
 )
 
@@ -33,6 +34,12 @@ class Web3Middleware:
     """
 
     _w3: Union["AsyncWeb3[Any]", "Web3"]
+    # result formatting that only makes responses more pythonic is skipped for
+    # requests made within ``RequestManager.raw()``
+    skip_result_formatting_when_raw: bool = False
+    # the RPC methods this middleware acts upon; ``None`` means every method. Layers
+    # that do not handle a method are left out of the request chain built for it.
+    handled_methods: Collection["RPCEndpoint"] | None = None
 
     def __init__(self, w3: Union["AsyncWeb3[Any]", "Web3"]) -> None:
         self._w3 = w3
@@ -45,6 +52,12 @@ class Web3Middleware:
             return False
         return self.__hash__() == other.__hash__()
 
+    def should_skip_result_formatting(self) -> bool:
+        return self.skip_result_formatting_when_raw and self._w3.manager.is_raw
+
+    def handles_method(self, method: "RPCEndpoint") -> bool:
+        return self.handled_methods is None or method in self.handled_methods
+
     # -- sync -- #
 
     def wrap_make_request(self, make_request: "MakeRequestFn") -> "MakeRequestFn":
@@ -33,6 +33,8 @@ class BufferedGasEstimateMiddleware(Web3Middleware):
     Includes a gas estimate for all transactions that do not already have a gas value.
     """
 
+    handled_methods = (RPCEndpoint("eth_sendTransaction"),)
+
     def request_processor(self, method: "RPCEndpoint", params: Any) -> Any:
         if method == "eth_sendTransaction":
             transaction = params[0]
@@ -2,6 +2,7 @@ from typing import (
     TYPE_CHECKING,
     Any,
     Callable,
+    Collection,
     Coroutine,
     Literal,
     Union,
@@ -121,6 +122,10 @@ class FormattingMiddlewareBuilder(Web3MiddlewareBuilder):
         # formatters builder option:
         sync_formatters_builder: SYNC_FORMATTERS_BUILDER | None = None,
         async_formatters_builder: ASYNC_FORMATTERS_BUILDER | None = None,
+        # raw requests option:
+        skip_result_formatting_when_raw: bool = False,
+        # method scoping option, derived from the formatters if not specified:
+        handled_methods: Collection[RPCEndpoint] | None = None,
     ) -> "FormattingMiddlewareBuilder":
         # if not both sync and async formatters are specified, raise error
         if (
@@ -146,8 +151,20 @@ class FormattingMiddlewareBuilder(Web3MiddlewareBuilder):
         middleware.error_formatters = error_formatters or {}
         middleware.sync_formatters_builder = sync_formatters_builder
         middleware.async_formatters_builder = async_formatters_builder
+        middleware.skip_result_formatting_when_raw = skip_result_formatting_when_raw
+        if handled_methods is None and sync_formatters_builder is None:
+            handled_methods = frozenset().union(
+                middleware.request_formatters,
+                middleware.result_formatters,
+                middleware.error_formatters,
+            )
+        middleware.handled_methods = handled_methods
         return middleware
 
+    def _result_formatters_for_request(self) -> Formatters:
+        # error formatters still apply to raw requests
+        return {} if self.should_skip_result_formatting() else self.result_formatters
+
     def request_processor(self, method: "RPCEndpoint", params: Any) -> Any:
         if self.sync_formatters_builder is not None:
             formatters = merge(
@@ -173,7 +190,7 @@ class FormattingMiddlewareBuilder(Web3MiddlewareBuilder):
 
         return _apply_response_formatters(
             method,
-            self.result_formatters,
+            self._result_formatters_for_request(),
             self.error_formatters,
             response,
         )
@@ -216,7 +233,7 @@ class FormattingMiddlewareBuilder(Web3MiddlewareBuilder):
                 response,
                 _apply_response_formatters(
                     method,
-                    self.result_formatters,
+                    self._result_formatters_for_request(),
                     self.error_formatters,
                 ),
             )
@@ -224,7 +241,7 @@ class FormattingMiddlewareBuilder(Web3MiddlewareBuilder):
         else:
             return _apply_response_formatters(
                 method,
-                self.result_formatters,
+                self._result_formatters_for_request(),
                 self.error_formatters,
                 response,
             )
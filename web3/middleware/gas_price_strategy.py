@@ -88,6 +88,8 @@ class GasPriceStrategyMiddleware(Web3Middleware):
     - Validates transaction params against legacy and dynamic fee txn values.
     """
 
+    handled_methods = (RPCEndpoint("eth_sendTransaction"),)
+
     def request_processor(self, method: RPCEndpoint, params: Any) -> Any:
         if method == "eth_sendTransaction":
             transaction = params[0]
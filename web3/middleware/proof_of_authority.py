@@ -65,4 +65,5 @@ ExtraDataToPOAMiddleware = FormattingMiddlewareBuilder.build(
             apply_formatter_if(is_dict, extradata_to_poa_cleanup),
         ),
     },
+    skip_result_formatting_when_raw=True,
 )
@@ -9,4 +9,5 @@ from web3.middleware.formatting import (
 PythonicMiddleware = FormattingMiddlewareBuilder.build(
     request_formatters=PYTHONIC_REQUEST_FORMATTERS,
     result_formatters=PYTHONIC_RESULT_FORMATTERS,
+    skip_result_formatting_when_raw=True,
 )
@@ -38,6 +38,9 @@ from eth_utils.curried import (
 from eth_utils.toolz import (
     compose,
 )
+from hexbytes import (
+    HexBytes,
+)
 from toolz import (
     curry,
 )
@@ -46,8 +49,12 @@ from web3._utils.async_transactions import (
     async_fill_nonce,
     async_fill_transaction_defaults,
 )
+from web3._utils.caching import (
+    generate_cache_key,
+)
 from web3._utils.method_formatters import (
     STANDARD_NORMALIZERS,
+    to_integer_if_hex,
 )
 from web3._utils.rpc_abi import (
     TRANSACTION_PARAMS_ABIS,
@@ -64,7 +71,10 @@ from web3.middleware.base import (
     Web3MiddlewareBuilder,
 )
 from web3.types import (
+    AsyncMakeRequestFn,
+    MakeRequestFn,
     RPCEndpoint,
+    RPCResponse,
     TxParams,
 )
 
@@ -73,6 +83,13 @@ if TYPE_CHECKING:
         AsyncWeb3,
         Web3,
     )
+    from web3.providers.persistent import (  # noqa: F401
+        PersistentConnectionProvider,
+    )
+    from web3.utils.nonce_manager import (  # noqa: F401
+        AsyncNonceManager,
+        NonceManager,
+    )
 
 T = TypeVar("T")
 
@@ -149,9 +166,20 @@ def format_transaction(transaction: TxParams) -> TxParams:
     )
 
 
+def _error_message(response: RPCResponse) -> str:
+    error = response["error"]
+    return error.get("message", "") if isinstance(error, dict) else str(error)
+
+
 class SignAndSendRawMiddlewareBuilder(Web3MiddlewareBuilder):
     _accounts = None
     format_and_fill_tx = None
+    # the responses to the raw transactions signed for ``eth_sendTransaction`` report
+    # the outcome of sending them to the nonce manager
+    handled_methods = (
+        RPCEndpoint("eth_sendTransaction"),
+        RPCEndpoint("eth_sendRawTransaction"),
+    )
 
     @staticmethod
     @curry
@@ -163,6 +191,63 @@ class SignAndSendRawMiddlewareBuilder(Web3MiddlewareBuilder):
         middleware._accounts = gen_normalized_accounts(private_key_or_account)
         return middleware
 
+    def _allocates_nonce(self, transaction: TxParams) -> bool:
+        return self._w3.eth.nonce_manager is not None and "nonce" not in transaction
+
+    def _sign_transaction(
+        self, transaction: TxParams, filled_transaction: TxParams
+    ) -> HexStr:
+        tx_from = to_checksum_address(filled_transaction["from"])
+        account = self._accounts[tx_from]
+        if not self._allocates_nonce(transaction):
+            return HexStr(
+                account.sign_transaction(
+                    cast(EthAccountTxParams, filled_transaction)
+                ).raw_transaction.to_0x_hex()
+            )
+
+        # the nonce may already be hex-encoded by ``format_transaction``
+        nonce = to_integer_if_hex(filled_transaction["nonce"])
+        nonce_manager = cast(
+            "NonceManager | AsyncNonceManager", self._w3.eth.nonce_manager
+        )
+        try:
+            raw_tx = HexStr(
+                account.sign_transaction(
+                    cast(EthAccountTxParams, filled_transaction)
+                ).raw_transaction.to_0x_hex()
+            )
+        except Exception:
+            nonce_manager.release(tx_from, nonce)
+            raise
+
+        # kept by the nonce manager, since persistent connection providers process
+        # requests and their responses with separate middleware instances
+        nonce_manager._signed_nonces[raw_tx] = (tx_from, nonce)
+        return raw_tx
+
+    def _pop_allocated_nonce(
+        self, method: "RPCEndpoint", params: Any
+    ) -> tuple[ChecksumAddress, int] | None:
+        nonce_manager = self._w3.eth.nonce_manager
+        if method != "eth_sendRawTransaction" or nonce_manager is None:
+            return None
+        return nonce_manager._signed_nonces.pop(params[0], None)
+
+    def _pop_allocated_nonce_for_response(
+        self, response: "RPCResponse"
+    ) -> tuple[ChecksumAddress, int] | None:
+        # the raw transaction is found with the request sent over the connection
+        provider = cast("PersistentConnectionProvider", self._w3.provider)
+        request_info = (
+            provider._request_processor._request_information_cache.get_cache_entry(
+                generate_cache_key(response.get("id"))
+            )
+        )
+        if request_info is None:
+            return None
+        return self._pop_allocated_nonce(request_info.method, request_info.params)
+
     def request_processor(self, method: "RPCEndpoint", params: Any) -> Any:
         if method != "eth_sendTransaction":
             return method, params
@@ -175,7 +260,13 @@ class SignAndSendRawMiddlewareBuilder(Web3MiddlewareBuilder):
                     fill_nonce(w3),
                 )
 
-            filled_transaction = self.format_and_fill_tx(params[0])
+            if self._allocates_nonce(params[0]):
+                # the nonce is allocated once the transaction is known to be signed
+                filled_transaction = fill_transaction_defaults(
+                    w3, format_transaction(params[0])
+                )
+            else:
+                filled_transaction = self.format_and_fill_tx(params[0])
             tx_from = filled_transaction.get("from", None)
 
             if tx_from is None or (
@@ -183,13 +274,36 @@ class SignAndSendRawMiddlewareBuilder(Web3MiddlewareBuilder):
             ):
                 return method, params
             else:
-                account = self._accounts[to_checksum_address(tx_from)]
-                raw_tx = account.sign_transaction(filled_transaction).raw_transaction
-
-                return (
-                    RPCEndpoint("eth_sendRawTransaction"),
-                    [raw_tx.to_0x_hex()],
+                if self._allocates_nonce(params[0]):
+                    filled_transaction = fill_nonce(w3, filled_transaction)
+                raw_tx = self._sign_transaction(params[0], filled_transaction)
+                return RPCEndpoint("eth_sendRawTransaction"), [raw_tx]
+
+    def wrap_make_request(self, make_request: MakeRequestFn) -> MakeRequestFn:
+        def middleware(method: "RPCEndpoint", params: Any) -> "RPCResponse":
+            method, params = self.request_processor(method, params)
+            allocated_nonce = self._pop_allocated_nonce(method, params)
+            if allocated_nonce is None:
+                return self.response_processor(method, make_request(method, params))
+
+            # keep the nonce manager in sync with what the node accepted
+            nonce_manager = cast("NonceManager", self._w3.eth.nonce_manager)
+            tx_from, nonce = allocated_nonce
+            try:
+                response = make_request(method, params)
+            except Exception:
+                nonce_manager.release(tx_from, nonce)
+                raise
+
+            if "error" in response:
+                nonce_manager.handle_send_error(
+                    cast("Web3", self._w3), tx_from, nonce, _error_message(response)
                 )
+            elif response.get("result") is not None:
+                nonce_manager.mark_sent(tx_from, nonce, HexBytes(response["result"]))
+            return self.response_processor(method, response)
+
+        return middleware
 
     # -- async -- #
 
@@ -204,7 +318,8 @@ class SignAndSendRawMiddlewareBuilder(Web3MiddlewareBuilder):
             filled_transaction = await async_fill_transaction_defaults(
                 w3, formatted_transaction
             )
-            filled_transaction = await async_fill_nonce(w3, filled_transaction)
+            if not self._allocates_nonce(params[0]):
+                filled_transaction = await async_fill_nonce(w3, filled_transaction)
             tx_from = filled_transaction.get("from", None)
 
             if tx_from is None or (
@@ -212,12 +327,60 @@ class SignAndSendRawMiddlewareBuilder(Web3MiddlewareBuilder):
             ):
                 return method, params
             else:
-                account = self._accounts[to_checksum_address(tx_from)]
-                raw_tx = account.sign_transaction(
-                    cast(EthAccountTxParams, filled_transaction)
-                ).raw_transaction
-
-                return (
-                    RPCEndpoint("eth_sendRawTransaction"),
-                    [raw_tx.to_0x_hex()],
+                if self._allocates_nonce(params[0]):
+                    # the nonce is allocated once the transaction is known to be signed
+                    filled_transaction = await async_fill_nonce(w3, filled_transaction)
+                raw_tx = self._sign_transaction(params[0], filled_transaction)
+                return RPCEndpoint("eth_sendRawTransaction"), [raw_tx]
+
+    async def async_wrap_make_request(
+        self, make_request: AsyncMakeRequestFn
+    ) -> AsyncMakeRequestFn:
+        async def middleware(method: "RPCEndpoint", params: Any) -> "RPCResponse":
+            method, params = await self.async_request_processor(method, params)
+            allocated_nonce = self._pop_allocated_nonce(method, params)
+            if allocated_nonce is None:
+                return await self.async_response_processor(
+                    method, await make_request(method, params)
                 )
+
+            try:
+                response = await make_request(method, params)
+            except Exception:
+                nonce_manager = cast("AsyncNonceManager", self._w3.eth.nonce_manager)
+                nonce_manager.release(*allocated_nonce)
+                raise
+
+            await self._async_report_send(allocated_nonce, response)
+            return await self.async_response_processor(method, response)
+
+        return middleware
+
+    async def _async_report_send(
+        self, allocated_nonce: tuple[ChecksumAddress, int], response: "RPCResponse"
+    ) -> None:
+        # keep the nonce manager in sync with what the node accepted
+        nonce_manager = cast("AsyncNonceManager", self._w3.eth.nonce_manager)
+        tx_from, nonce = allocated_nonce
+        if "error" in response:
+            await nonce_manager.handle_send_error(
+                cast("AsyncWeb3[Any]", self._w3),
+                tx_from,
+                nonce,
+                _error_message(response),
+            )
+        elif response.get("result") is not None:
+            nonce_manager.mark_sent(tx_from, nonce, HexBytes(response["result"]))
+
+    async def async_response_processor(
+        self, method: "RPCEndpoint", response: "RPCResponse"
+    ) -> "RPCResponse":
+        # persistent connection providers don't go through ``async_wrap_make_request``
+        if (
+            method == "eth_sendRawTransaction"
+            and self._w3.provider.has_persistent_connection
+        ):
+            allocated_nonce = self._pop_allocated_nonce_for_response(response)
+            if allocated_nonce is not None:
+                await self._async_report_send(allocated_nonce, response)
+        return response
@@ -162,4 +162,9 @@ async def async_build_method_validators(
 ValidationMiddleware = FormattingMiddlewareBuilder.build(
     sync_formatters_builder=build_method_validators,
     async_formatters_builder=async_build_method_validators,
+    handled_methods=(
+        *METHODS_TO_VALIDATE,
+        RPC.eth_getBlockByHash,
+        RPC.eth_getBlockByNumber,
+    ),
 )
@@ -53,6 +53,16 @@ def apply_result_formatters(
 
 
 TReturn = TypeVar("TReturn")
+TResponseFormatters = TypeVar("TResponseFormatters", bound=Sequence[Any])
+
+
+def _without_result_formatters_if_raw(
+    w3: Union["AsyncWeb3[Any]", "Web3"], response_formatters: TResponseFormatters
+) -> TResponseFormatters:
+    if w3.manager.is_raw:
+        # raw requests still apply the error and null result formatters
+        return cast(TResponseFormatters, ((), *response_formatters[1:]))
+    return response_formatters
 
 
 @curry
@@ -70,6 +80,7 @@ def retrieve_request_information_for_batching(
         (method_str, params), response_formatters = method.process_params(
             module, *args, **kwargs
         )
+        response_formatters = _without_result_formatters_if_raw(w3, response_formatters)
         if isinstance(w3.provider, PersistentConnectionProvider):
             w3.provider._request_processor.cache_request_information(
                 None, cast(RPCEndpoint, method_str), params, response_formatters
@@ -82,6 +93,7 @@ def retrieve_request_information_for_batching(
         (method_str, params), response_formatters = method.process_params(
             module, *args, **kwargs
         )
+        response_formatters = _without_result_formatters_if_raw(w3, response_formatters)
         return (cast(RPCEndpoint, method_str), params), response_formatters
 
     return async_inner if module.is_async else inner
@@ -105,7 +117,7 @@ def retrieve_blocking_method_call_fn(
             result_formatters,
             error_formatters,
             null_result_formatters,
-        ) = response_formatters
+        ) = _without_result_formatters_if_raw(w3, response_formatters)
         result = w3.manager.request_blocking(
             method_str, params, error_formatters, null_result_formatters
         )
@@ -137,6 +149,9 @@ def retrieve_async_method_call_fn(
         except _UseExistingFilter as err:
             return AsyncLogFilter(eth_module=module, filter_id=err.filter_id)
 
+        response_formatters = _without_result_formatters_if_raw(
+            async_w3, response_formatters
+        )
         if isinstance(async_w3.provider, PersistentConnectionProvider):
             return await async_w3.manager.socket_request(
                 cast(RPCEndpoint, method_str),
@@ -165,14 +180,18 @@ class Module:
     is_async = False
 
     def __init__(self, w3: Union["AsyncWeb3[Any]", "Web3"]) -> None:
-        if self.is_async:
-            self.retrieve_caller_fn = retrieve_async_method_call_fn(w3, self)
-        else:
-            self.retrieve_caller_fn = retrieve_blocking_method_call_fn(w3, self)
-        self.retrieve_request_information = retrieve_request_information_for_batching(
-            w3, self
-        )
         self.w3 = w3
+        self._result_formatters_cache: dict[RPCEndpoint, Callable[..., Any]] = {}
+        # callers bound to this module, built on first access of each ``Method``
+        self._method_callers: dict[Method[Any], Any] = {}
+
+    def retrieve_caller_fn(self, method: Method[Any]) -> Any:
+        if self.is_async:
+            return retrieve_async_method_call_fn(self.w3, self, method)
+        return retrieve_blocking_method_call_fn(self.w3, self, method)
+
+    def retrieve_request_information(self, method: Method[Any]) -> Any:
+        return retrieve_request_information_for_batching(self.w3, self, method)
 
     @property
     def codec(self) -> ABICodec:
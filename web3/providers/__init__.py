@@ -1,31 +1,68 @@
+from typing import (
+    TYPE_CHECKING,
+)
+
+from .._utils.lazy_imports import (
+    lazy_module_getattr,
+)
 from .async_base import (
     AsyncBaseProvider,
 )
-from .rpc import (
-    AsyncHTTPProvider,
-)
 from .base import (
     BaseProvider,
     JSONBaseProvider,
 )
-from .eth_tester import (
-    AsyncEthereumTesterProvider,
-    EthereumTesterProvider,
-)
-from .ipc import (
-    IPCProvider,
-)
-from .rpc import (
-    HTTPProvider,
-)
-from .persistent import (
-    AsyncIPCProvider,
-    PersistentConnection,
-    PersistentConnectionProvider,
-    WebSocketProvider,
-)
-from .auto import (
-    AutoProvider,
+
+if TYPE_CHECKING:
+    from .rpc import (  # noqa: F401
+        AsyncHTTPProvider,
+        HTTPProvider,
+    )
+    from .eth_tester import (  # noqa: F401
+        AsyncEthereumTesterProvider,
+        EthereumTesterProvider,
+    )
+    from .ipc import (  # noqa: F401
+        IPCProvider,
+    )
+    from .persistent import (  # noqa: F401
+        AsyncIPCProvider,
+        PersistentConnection,
+        PersistentConnectionProvider,
+        WebSocketPoolProvider,
+        WebSocketProvider,
+    )
+    from .auto import (  # noqa: F401
+        AutoProvider,
+    )
+    from .replay import (  # noqa: F401
+        AsyncRecordingProvider,
+        AsyncReplayProvider,
+        RecordingProvider,
+        ReplayProvider,
+    )
+
+# providers are imported on first access, so that the dependencies of the ones
+# that aren't used, like ``aiohttp``, ``websockets`` or ``eth-tester``, aren't loaded
+__getattr__ = lazy_module_getattr(
+    __name__,
+    {
+        "AsyncEthereumTesterProvider": "web3.providers.eth_tester",
+        "AsyncHTTPProvider": "web3.providers.rpc",
+        "AsyncIPCProvider": "web3.providers.persistent",
+        "AsyncRecordingProvider": "web3.providers.replay",
+        "AsyncReplayProvider": "web3.providers.replay",
+        "AutoProvider": "web3.providers.auto",
+        "EthereumTesterProvider": "web3.providers.eth_tester",
+        "HTTPProvider": "web3.providers.rpc",
+        "IPCProvider": "web3.providers.ipc",
+        "PersistentConnection": "web3.providers.persistent",
+        "PersistentConnectionProvider": "web3.providers.persistent",
+        "RecordingProvider": "web3.providers.replay",
+        "ReplayProvider": "web3.providers.replay",
+        "WebSocketPoolProvider": "web3.providers.persistent",
+        "WebSocketProvider": "web3.providers.persistent",
+    },
 )
 
 __all__ = [
@@ -33,6 +70,8 @@ __all__ = [
     "AsyncEthereumTesterProvider",
     "AsyncHTTPProvider",
     "AsyncIPCProvider",
+    "AsyncRecordingProvider",
+    "AsyncReplayProvider",
     "AutoProvider",
     "BaseProvider",
     "EthereumTesterProvider",
@@ -41,5 +80,8 @@ __all__ = [
     "JSONBaseProvider",
     "PersistentConnection",
     "PersistentConnectionProvider",
+    "RecordingProvider",
+    "ReplayProvider",
+    "WebSocketPoolProvider",
     "WebSocketProvider",
 ]
@@ -5,6 +5,7 @@ import logging
 from typing import (
     TYPE_CHECKING,
     Any,
+    AsyncIterator,
     Callable,
     Coroutine,
     Optional,
@@ -30,8 +31,10 @@ from web3._utils.encoding import (
 )
 from web3.exceptions import (
     ProviderConnectionError,
+    Web3TypeError,
 )
 from web3.middleware import (
+    async_combine_batch_middleware,
     async_combine_middleware,
 )
 from web3.middleware.base import (
@@ -47,6 +50,9 @@ from web3.utils import (
     RequestCacheValidationThreshold,
     SimpleCache,
 )
+from web3.utils.metrics import (
+    RequestMetrics,
+)
 
 if TYPE_CHECKING:
     from websockets.asyncio.client import (
@@ -60,6 +66,9 @@ if TYPE_CHECKING:
     from web3._utils.batching import (  # noqa: F401
         RequestBatcher,
     )
+    from web3._utils.json_stream import (  # noqa: F401
+        JSONItemParser,
+    )
     from web3.providers.persistent import (  # noqa: F401
         RequestProcessor,
     )
@@ -83,6 +92,7 @@ class AsyncBaseProvider:
     ccip_read_max_redirects: int = 4
     ccip_read_allow_http: bool = False
     ccip_read_url_validator: "AsyncCcipUrlValidator | None" = None
+    metrics: RequestMetrics | None = None
 
     def __init__(
         self,
@@ -90,9 +100,13 @@ class AsyncBaseProvider:
         cacheable_requests: set[RPCEndpoint] = None,
         request_cache_validation_threshold: None
         | (RequestCacheValidationThreshold | int | Empty) = empty,
+        metrics: RequestMetrics | None = None,
     ) -> None:
         self._request_cache = SimpleCache(1000)
         self._request_cache_lock: asyncio.Lock = asyncio.Lock()
+        if metrics is not None:
+            self.metrics = metrics
+            metrics.watch_cache("request", self._request_cache)
 
         self.cache_allowed_requests = cache_allowed_requests
         self.cacheable_requests = cacheable_requests or CACHEABLE_REQUESTS
@@ -134,15 +148,11 @@ class AsyncBaseProvider:
 
         cache_key = self._batch_request_func_cache[0]
         if cache_key != middleware:
-            accumulator_fn = self.make_batch_request
-            for mw in reversed(middleware):
-                initialized = mw(async_w3)
-                # type ignore bc in order to wrap the method, we have to call
-                # `async_wrap_make_batch_request` with the accumulator_fn as the
-                # argument which breaks the type hinting for this particular case.
-                accumulator_fn = await initialized.async_wrap_make_batch_request(  # type: ignore # noqa: E501
-                    accumulator_fn
-                )
+            accumulator_fn = await async_combine_batch_middleware(
+                middleware=middleware,
+                async_w3=async_w3,
+                provider_batch_request_fn=self.make_batch_request,
+            )
             self._batch_request_func_cache = (middleware, accumulator_fn)
         return self._batch_request_func_cache[-1]
 
@@ -205,7 +215,13 @@ class AsyncJSONBaseProvider(AsyncBaseProvider):
 
     def encode_rpc_request(self, method: RPCEndpoint, params: Any) -> bytes:
         rpc_dict = self.form_request(method, params)
-        return self.encode_rpc_dict(rpc_dict)
+        return self._encode_and_record_rpc_dict(rpc_dict)
+
+    def _encode_and_record_rpc_dict(self, rpc_dict: RPCRequest) -> bytes:
+        encoded = self.encode_rpc_dict(rpc_dict)
+        if self.metrics is not None:
+            self.metrics.record_bytes_sent(rpc_dict["method"], len(encoded))
+        return encoded
 
     @staticmethod
     def decode_rpc_response(raw_response: bytes) -> RPCResponse:
@@ -252,4 +268,21 @@ class AsyncJSONBaseProvider(AsyncBaseProvider):
         )
 
     def encode_batch_request_dicts(self, request_dicts: list[RPCRequest]) -> bytes:
-        return b"[" + b",".join(self.encode_rpc_dict(d) for d in request_dicts) + b"]"
+        return (
+            b"["
+            + b",".join(self._encode_and_record_rpc_dict(d) for d in request_dicts)
+            + b"]"
+        )
+
+    # -- streaming responses -- #
+
+    def make_stream_request(
+        self, method: RPCEndpoint, params: Any, parser: "JSONItemParser"
+    ) -> AsyncIterator[Any]:
+        """
+        Make a request, feeding the response to ``parser`` as it is received and
+        yielding the items it parses.
+        """
+        raise Web3TypeError(
+            f"Streaming responses are not supported by {self.__class__.__name__}."
+        )
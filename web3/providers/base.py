@@ -6,6 +6,7 @@ from typing import (
     TYPE_CHECKING,
     Any,
     Callable,
+    Iterator,
     Optional,
     cast,
 )
@@ -28,8 +29,10 @@ from web3._utils.encoding import (
 )
 from web3.exceptions import (
     ProviderConnectionError,
+    Web3TypeError,
 )
 from web3.middleware import (
+    combine_batch_middleware,
     combine_middleware,
 )
 from web3.middleware.base import (
@@ -44,12 +47,18 @@ from web3.utils import (
     RequestCacheValidationThreshold,
     SimpleCache,
 )
+from web3.utils.metrics import (
+    RequestMetrics,
+)
 
 if TYPE_CHECKING:
     from web3 import Web3  # noqa: F401
     from web3._utils.batching import (
         RequestBatcher,
     )
+    from web3._utils.json_stream import (
+        JSONItemParser,
+    )
     from web3.utils.ccip_url_validation import (
         CcipUrlValidator,
     )
@@ -70,6 +79,7 @@ class BaseProvider:
     ccip_read_max_redirects: int = 4
     ccip_read_allow_http: bool = False
     ccip_read_url_validator: "CcipUrlValidator | None" = None
+    metrics: RequestMetrics | None = None
 
     def __init__(
         self,
@@ -77,9 +87,13 @@ class BaseProvider:
         cacheable_requests: set[RPCEndpoint] = None,
         request_cache_validation_threshold: None
         | (RequestCacheValidationThreshold | int | Empty) = empty,
+        metrics: RequestMetrics | None = None,
     ) -> None:
         self._request_cache = SimpleCache(1000)
         self._request_cache_lock: threading.Lock = threading.Lock()
+        if metrics is not None:
+            self.metrics = metrics
+            metrics.watch_cache("request", self._request_cache)
 
         self.cache_allowed_requests = cache_allowed_requests
         self.cacheable_requests = cacheable_requests or CACHEABLE_REQUESTS
@@ -145,8 +159,12 @@ class JSONBaseProvider(BaseProvider):
             "params": params or [],
             "id": next(self.request_counter),
         }
-        encoded = FriendlyJsonSerde().json_encode(rpc_dict, Web3JsonEncoder)
-        return to_bytes(text=encoded)
+        encoded = to_bytes(
+            text=FriendlyJsonSerde().json_encode(rpc_dict, Web3JsonEncoder)
+        )
+        if self.metrics is not None:
+            self.metrics.record_bytes_sent(method, len(encoded))
+        return encoded
 
     @staticmethod
     def decode_rpc_response(raw_response: bytes) -> RPCResponse:
@@ -186,15 +204,11 @@ class JSONBaseProvider(BaseProvider):
 
         cache_key = self._batch_request_func_cache[0]
         if cache_key != middleware:
-            accumulator_fn = self.make_batch_request
-            for mw in reversed(middleware):
-                initialized = mw(w3)
-                # type ignore bc in order to wrap the method, we have to call
-                # `wrap_make_batch_request` with the accumulator_fn as the argument
-                # which breaks the type hinting for this particular case.
-                accumulator_fn = initialized.wrap_make_batch_request(  # type: ignore
-                    accumulator_fn
-                )
+            accumulator_fn = combine_batch_middleware(
+                middleware=middleware,
+                w3=w3,
+                provider_batch_request_fn=self.make_batch_request,
+            )
             self._batch_request_func_cache = (middleware, accumulator_fn)
 
         return self._batch_request_func_cache[-1]
@@ -214,3 +228,16 @@ class JSONBaseProvider(BaseProvider):
         self, requests: list[tuple[RPCEndpoint, Any]]
     ) -> list[RPCResponse] | RPCResponse:
         raise NotImplementedError("Providers must implement this method")
+
+    # -- streaming responses -- #
+
+    def make_stream_request(
+        self, method: RPCEndpoint, params: Any, parser: "JSONItemParser"
+    ) -> Iterator[Any]:
+        """
+        Make a request, feeding the response to ``parser`` as it is received and
+        yielding the items it parses.
+        """
+        raise Web3TypeError(
+            f"Streaming responses are not supported by {self.__class__.__name__}."
+        )
@@ -13,10 +13,15 @@ from types import (
     TracebackType,
 )
 from typing import (
+    TYPE_CHECKING,
     Any,
+    Iterator,
     cast,
 )
 
+from web3._utils.json_stream import (
+    STREAM_CHUNK_SIZE,
+)
 from web3._utils.threads import (
     Timeout,
 )
@@ -24,6 +29,9 @@ from web3.types import (
     RPCEndpoint,
     RPCResponse,
 )
+from web3.utils.metrics import (
+    BATCH_METHOD,
+)
 
 from .._utils.batching import (
     sort_batch_response_by_response_ids,
@@ -39,6 +47,11 @@ from .base import (
     JSONBaseProvider,
 )
 
+if TYPE_CHECKING:
+    from web3._utils.json_stream import (  # noqa: F401
+        JSONItemParser,
+    )
+
 
 def get_ipc_socket(ipc_path: str, timeout: float = 2.0) -> socket.socket:
     if sys.platform == "win32":
@@ -158,7 +171,7 @@ class IPCProvider(JSONBaseProvider):
     def __str__(self) -> str:
         return f"<{self.__class__.__name__} {self.ipc_path}>"
 
-    def _make_request(self, request: bytes) -> RPCResponse:
+    def _make_request(self, request: bytes, method: str = BATCH_METHOD) -> RPCResponse:
         with self._lock, self._socket as sock:
             try:
                 sock.sendall(request + b"\n")
@@ -184,6 +197,10 @@ class IPCProvider(JSONBaseProvider):
                             timeout.sleep(0)
                             continue
                         else:
+                            if self.metrics is not None:
+                                self.metrics.record_bytes_received(
+                                    method, len(raw_response)
+                                )
                             return response
                     else:
                         timeout.sleep(0)
@@ -195,7 +212,39 @@ class IPCProvider(JSONBaseProvider):
             "Making request IPC. Path: %s, Method: %s", self.ipc_path, method
         )
         request = self.encode_rpc_request(method, params)
-        return self._make_request(request)
+        return self._make_request(request, method)
+
+    def make_stream_request(
+        self, method: RPCEndpoint, params: Any, parser: "JSONItemParser"
+    ) -> Iterator[Any]:
+        """
+        The response is read from a connection of its own, closed once the stream is
+        consumed or closed, so that requests can be made while the stream is read.
+        """
+        self.logger.debug(
+            "Making streaming request IPC. Path: %s, Method: %s", self.ipc_path, method
+        )
+        request = self.encode_rpc_request(method, params)
+        sock = get_ipc_socket(self.ipc_path)
+        try:
+            sock.sendall(request + b"\n")
+            while not parser.done:
+                # the timeout applies to the wait for each chunk of the response
+                with Timeout(self.timeout) as timeout:
+                    while True:
+                        try:
+                            chunk = sock.recv(STREAM_CHUNK_SIZE)
+                        except TimeoutError:
+                            timeout.sleep(0)
+                            continue
+                        if chunk == b"":
+                            timeout.sleep(0)
+                        else:
+                            break
+                yield from parser.feed(chunk)
+            yield from parser.close()
+        finally:
+            sock.close()
 
     def make_batch_request(
         self, requests: list[tuple[RPCEndpoint, Any]]
@@ -1,3 +1,10 @@
+from typing import (
+    TYPE_CHECKING,
+)
+
+from ..._utils.lazy_imports import (
+    lazy_module_getattr,
+)
 from .persistent import (
     PersistentConnectionProvider,
 )
@@ -7,16 +14,32 @@ from .persistent_connection import (
 from .request_processor import (
     RequestProcessor,
 )
-from .async_ipc import (
-    AsyncIPCProvider,
-)
-from .websocket import (
-    WebSocketProvider,
+
+if TYPE_CHECKING:
+    from .async_ipc import (  # noqa: F401
+        AsyncIPCProvider,
+    )
+    from .websocket import (  # noqa: F401
+        WebSocketProvider,
+    )
+    from .websocket_pool import (  # noqa: F401
+        WebSocketPoolProvider,
+    )
+
+# imported on first access, so that ``websockets`` is only loaded when used
+__getattr__ = lazy_module_getattr(
+    __name__,
+    {
+        "AsyncIPCProvider": "web3.providers.persistent.async_ipc",
+        "WebSocketPoolProvider": "web3.providers.persistent.websocket_pool",
+        "WebSocketProvider": "web3.providers.persistent.websocket",
+    },
 )
 
 __all__ = [
     "PersistentConnectionProvider",
     "PersistentConnection",
     "AsyncIPCProvider",
+    "WebSocketPoolProvider",
     "WebSocketProvider",
 ]
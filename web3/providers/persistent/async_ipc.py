@@ -110,7 +110,9 @@ class AsyncIPCProvider(PersistentConnectionProvider):
             raise PersistentConnectionClosedOK(
                 user_message="Socket reader received end of stream."
             )
-        return self.decode_rpc_response(data)
+        response = self.decode_rpc_response(data)
+        self._request_processor.record_response_bytes(response, len(data))
+        return response
 
     # -- private methods -- #
 
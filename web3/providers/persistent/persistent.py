@@ -56,6 +56,9 @@ from web3.types import (
 if TYPE_CHECKING:
     from web3 import AsyncWeb3  # noqa: F401
     from web3.middleware.base import MiddlewareOnion  # noqa: F401
+    from web3.providers.persistent.subscription_manager import (  # noqa: F401
+        SubscriptionManager,
+    )
 
 
 DEFAULT_PERSISTENT_CONNECTION_TIMEOUT = 30.0
@@ -78,6 +81,9 @@ class PersistentConnectionProvider(AsyncJSONBaseProvider, ABC):
         int | None, Callable[..., Coroutine[Any, Any, list[RPCResponse]]] | None
     ] = (None, None)
 
+    # set by the subscription manager when it is initialized
+    _subscription_manager: Optional["SubscriptionManager"] = None
+
     def __init__(
         self,
         request_timeout: float = DEFAULT_PERSISTENT_CONNECTION_TIMEOUT,
@@ -85,6 +91,7 @@ class PersistentConnectionProvider(AsyncJSONBaseProvider, ABC):
         silence_listener_task_exceptions: bool = False,
         max_connection_retries: int = 5,
         request_information_cache_size: int = 500,
+        reconnect: bool = False,
         **kwargs: Any,
     ) -> None:
         super().__init__(**kwargs)
@@ -94,11 +101,13 @@ class PersistentConnectionProvider(AsyncJSONBaseProvider, ABC):
             request_information_cache_size=request_information_cache_size,
         )
         self._message_listener_task: Optional["asyncio.Task[None]"] = None
+        self._resubscription_task: Optional["asyncio.Task[None]"] = None
         self._listen_event: asyncio.Event = asyncio.Event()
         self._max_connection_retries = max_connection_retries
 
         self.request_timeout = request_timeout
         self.silence_listener_task_exceptions = silence_listener_task_exceptions
+        self.reconnect = reconnect
 
     # -- cached middleware request/response functions -- #
 
@@ -112,10 +121,13 @@ class PersistentConnectionProvider(AsyncJSONBaseProvider, ABC):
         cache_key = hash(tuple(id(mw) for mw in middleware))
 
         if cache_key != self._send_func_cache[0]:
+            initialized_middleware = tuple(mw(async_w3) for mw in middleware)
 
             async def send_function(method: RPCEndpoint, params: Any) -> RPCRequest:
-                for mw in middleware:
-                    initialized = mw(async_w3)
+                requested_method = method
+                for initialized in initialized_middleware:
+                    if not initialized.handles_method(requested_method):
+                        continue
                     method, params = await initialized.async_request_processor(
                         method, params
                     )
@@ -136,13 +148,15 @@ class PersistentConnectionProvider(AsyncJSONBaseProvider, ABC):
         cache_key = hash(tuple(id(mw) for mw in middleware))
 
         if cache_key != self._recv_func_cache[0]:
+            initialized_middleware = tuple(mw(async_w3) for mw in middleware)
 
             async def recv_function(rpc_request: RPCRequest) -> RPCResponse:
                 # first, retrieve the response
                 response = await self.recv_for_request(rpc_request)
                 method = rpc_request["method"]
-                for mw in reversed(middleware):
-                    initialized = mw(async_w3)
+                for initialized in reversed(initialized_middleware):
+                    if not initialized.handles_method(method):
+                        continue
                     response = await initialized.async_response_processor(
                         method, response
                     )
@@ -159,15 +173,22 @@ class PersistentConnectionProvider(AsyncJSONBaseProvider, ABC):
         cache_key = hash(tuple(id(mw) for mw in middleware))
 
         if cache_key != self._send_batch_func_cache[0]:
+            initialized_middleware = tuple(mw(async_w3) for mw in middleware)
 
             async def send_func(
                 requests: list[tuple[RPCEndpoint, Any]],
             ) -> list[RPCRequest]:
-                for mw in middleware:
-                    initialized = mw(async_w3)
+                requested_methods = [method for method, _params in requests]
+                for initialized in initialized_middleware:
                     requests = [
-                        await initialized.async_request_processor(method, params)
-                        for (method, params) in requests
+                        (
+                            await initialized.async_request_processor(method, params)
+                            if initialized.handles_method(requested_method)
+                            else (method, params)
+                        )
+                        for requested_method, (method, params) in zip(
+                            requested_methods, requests
+                        )
                     ]
                 return await self.send_batch_request(requests)
 
@@ -182,20 +203,24 @@ class PersistentConnectionProvider(AsyncJSONBaseProvider, ABC):
         cache_key = hash(tuple(id(mw) for mw in middleware))
 
         if cache_key != self._recv_batch_func_cache[0]:
+            initialized_middleware = tuple(mw(async_w3) for mw in middleware)
 
             async def recv_function(
                 rpc_requests: list[RPCRequest],
             ) -> list[RPCResponse]:
                 methods = [rpc_request["method"] for rpc_request in rpc_requests]
                 responses = await self.recv_for_batch_request(rpc_requests)
-                for mw in reversed(middleware):
+                for initialized in reversed(initialized_middleware):
                     if not isinstance(responses, list):
                         # RPC errors return only one response with the error object
                         return responses
 
-                    initialized = mw(async_w3)
                     responses = [
-                        await initialized.async_response_processor(m, r)
+                        (
+                            await initialized.async_response_processor(m, r)
+                            if initialized.handles_method(m)
+                            else r
+                        )
                         for m, r in zip(methods, responses)
                     ]
                 return responses
@@ -218,6 +243,11 @@ class PersistentConnectionProvider(AsyncJSONBaseProvider, ABC):
             )
 
     async def connect(self) -> None:
+        await self._connect_with_retries()
+        self._message_listener_task = asyncio.create_task(self._message_listener())
+        self._message_listener_task.add_done_callback(self._message_listener_callback)
+
+    async def _connect_with_retries(self) -> None:
         endpoint = self.get_endpoint_uri_or_ipc_path()
         _connection_attempts = 0
         _backoff_rate_change = 1.75
@@ -228,12 +258,6 @@ class PersistentConnectionProvider(AsyncJSONBaseProvider, ABC):
                 _connection_attempts += 1
                 self.logger.info("Connecting to: %s", endpoint)
                 await self._provider_specific_connect()
-                self._message_listener_task = asyncio.create_task(
-                    self._message_listener()
-                )
-                self._message_listener_task.add_done_callback(
-                    self._message_listener_callback
-                )
                 self.logger.info("Successfully connected to: %s", endpoint)
                 break
             except (WebSocketException, OSError) as e:
@@ -251,8 +275,42 @@ class PersistentConnectionProvider(AsyncJSONBaseProvider, ABC):
                 await asyncio.sleep(_backoff_time)
                 _backoff_time *= _backoff_rate_change
 
+    async def _reconnect(self, e: Exception) -> None:
+        """
+        Reconnect after the connection was lost, then resubscribe to the
+        subscriptions of the subscription manager, if any, in a task of their own
+        since the responses to the ``eth_subscribe`` requests are read by the
+        message listener task this is called from.
+        """
+        self.logger.warning(
+            "Connection to %s was lost, reconnecting: %s: %s",
+            self.get_endpoint_uri_or_ipc_path(),
+            e.__class__.__name__,
+            e,
+        )
+        await self._provider_specific_disconnect()
+        await self._connect_with_retries()
+
+        if self._subscription_manager is not None:
+            self._resubscription_task = asyncio.create_task(
+                self._subscription_manager._resubscribe()
+            )
+            self._resubscription_task.add_done_callback(self._resubscription_callback)
+
+    def _resubscription_callback(self, task: "asyncio.Task[None]") -> None:
+        if task.done() and not task.cancelled() and task.exception():
+            self.logger.error(
+                "Resubscribing after reconnecting failed. Subscriptions may be "
+                "missing messages.",
+                exc_info=task.exception(),
+            )
+
     async def disconnect(self) -> None:
         # this should remain idempotent
+        if self._resubscription_task and not self._resubscription_task.done():
+            self._resubscription_task.cancel()
+        self._resubscription_task = None
+
         try:
             if self._message_listener_task:
                 self._message_listener_task.cancel()
@@ -275,7 +333,7 @@ class PersistentConnectionProvider(AsyncJSONBaseProvider, ABC):
     @async_handle_send_caching
     async def send_request(self, method: RPCEndpoint, params: Any) -> RPCRequest:
         request_dict = self.form_request(method, params)
-        await self.socket_send(self.encode_rpc_dict(request_dict))
+        await self.socket_send(self._encode_and_record_rpc_dict(request_dict))
         return request_dict
 
     @async_handle_recv_caching
@@ -428,12 +486,22 @@ class PersistentConnectionProvider(AsyncJSONBaseProvider, ABC):
                 )
                 self._raise_stray_errors_from_cache()
             except PersistentConnectionClosedOK as e:
+                if self.reconnect:
+                    await self._reconnect(e)
+                    continue
                 self.logger.info(
                     "Message listener background task has ended gracefully: %s",
                     e.user_message,
                 )
                 # trigger a return to end the listener task and initiate the callback fn
                 return
+            except (WebSocketException, OSError) as e:
+                if self.reconnect:
+                    await self._reconnect(e)
+                elif not self.silence_listener_task_exceptions:
+                    raise e
+                else:
+                    self._error_log_listener_task_exception(e)
             except Exception as e:
                 if not self.silence_listener_task_exceptions:
                     raise e
@@ -1,9 +1,15 @@
 import asyncio
+from collections import (
+    Counter,
+    deque,
+)
 from typing import (
     TYPE_CHECKING,
     Any,
     Callable,
+    Optional,
     TypeVar,
+    cast,
 )
 
 from web3._utils.batching import (
@@ -29,11 +35,20 @@ from web3.types import (
 from web3.utils import (
     SimpleCache,
 )
+from web3.utils.metrics import (
+    BATCH_METHOD,
+)
+from web3.utils.subscriptions import (
+    BackpressurePolicy,
+)
 
 if TYPE_CHECKING:
     from web3.providers.persistent import (
         PersistentConnectionProvider,
     )
+    from web3.utils.subscriptions import (  # noqa: F401
+        EthSubscription,
+    )
 
 T = TypeVar("T")
 
@@ -52,6 +67,63 @@ class TaskReliantQueue(asyncio.Queue[T]):
         return item
 
 
+def _subscription_id(item: Any) -> Any:
+    return (
+        item.get("params", {}).get("subscription") if isinstance(item, dict) else None
+    )
+
+
+class SubscriptionQueue(TaskReliantQueue[T]):
+    """
+    A ``TaskReliantQueue`` of subscription messages, that keeps count of the
+    messages queued for each subscription so that they can be replaced or dropped
+    according to their backpressure policy.
+    """
+
+    def _init(self, maxsize: int) -> None:
+        self._queue: deque[T] = deque()
+        self.queued: Counter[Any] = Counter()
+
+    def _put(self, item: T) -> None:
+        self._queue.append(item)
+        self.queued[_subscription_id(item)] += 1
+
+    def _get(self) -> T:
+        item = self._queue.popleft()
+        self.queued[_subscription_id(item)] -= 1
+        return item
+
+    def _index_of_oldest(self, subscription_id: Any) -> int | None:
+        if self.queued[subscription_id] <= 0:
+            return None
+        for i, item in enumerate(self._queue):
+            if _subscription_id(item) == subscription_id:
+                return i
+        return None
+
+    def replace_oldest(self, subscription_id: Any, item: T) -> bool:
+        """
+        Replace the oldest message queued for the subscription, in place.
+        """
+        i = self._index_of_oldest(subscription_id)
+        if i is None:
+            return False
+        self._queue[i] = item
+        return True
+
+    def drop_oldest(self, subscription_id: Any) -> bool:
+        """
+        Drop the oldest message queued for the subscription, making room for
+        another.
+        """
+        i = self._index_of_oldest(subscription_id)
+        if i is None:
+            return False
+        del self._queue[i]
+        self.queued[subscription_id] -= 1
+        return True
+
+
 class RequestProcessor:
     _subscription_queue_synced_with_ws_stream: bool = False
 
@@ -71,10 +143,15 @@ class RequestProcessor:
         self._request_response_cache: SimpleCache = SimpleCache(500)
         self._subscription_response_queue: TaskReliantQueue[
             RPCResponse | TaskNotRunning
-        ] = TaskReliantQueue(maxsize=subscription_response_queue_size)
+        ] = SubscriptionQueue(maxsize=subscription_response_queue_size)
         self._handler_subscription_queue: TaskReliantQueue[
             RPCResponse | TaskNotRunning | SubscriptionProcessingFinished
-        ] = TaskReliantQueue(maxsize=subscription_response_queue_size)
+        ] = SubscriptionQueue(maxsize=subscription_response_queue_size)
+
+        # by queue name, kept across queue resets
+        self._max_queue_depths: Counter[str] = Counter()
+        self._dropped_messages: Counter[str] = Counter()
+        self._above_high_water_mark: set[str] = set()
 
     @property
     def active_subscriptions(self) -> dict[str, Any]:
@@ -235,6 +312,25 @@ class RequestProcessor:
                 response,
             )
 
+    def record_response_bytes(self, response: Any, num_bytes: int) -> None:
+        """
+        Record the size of a response read from the connection with the provider's
+        metrics, under the method of the request it is the response to.
+        """
+        if self._provider.metrics is None:
+            return
+
+        if self._is_batch_response(response):
+            method = BATCH_METHOD
+        elif response.get("method") == "eth_subscription":
+            method = "eth_subscription"
+        else:
+            request_info = self._request_information_cache.get_cache_entry(
+                generate_cache_key(response.get("id"))
+            )
+            method = request_info.method if request_info is not None else ""
+        self._provider.metrics.record_bytes_received(method, num_bytes)
+
     # raw response cache
 
     def _is_batch_response(self, raw_response: list[RPCResponse] | RPCResponse) -> bool:
@@ -248,28 +344,17 @@ class RequestProcessor:
         self, raw_response: Any, subscription: bool = False
     ) -> None:
         if subscription:
-            if self._subscription_response_queue.full():
-                self._provider.logger.debug(
-                    "Subscription queue is full. Waiting for provider to consume "
-                    "messages before caching."
+            if self._provider.reconnect and self._subscription_container:
+                sub = self._subscription_container.get_by_id(
+                    raw_response.get("params", {}).get("subscription")
                 )
-                self._provider._listen_event.clear()
-                await self._provider._listen_event.wait()
-
-            self._provider.logger.debug(
-                "Caching subscription response:\n    response=%s", raw_response
-            )
-            subscription_id = raw_response.get("params", {}).get("subscription")
-            sub_container = self._subscription_container
-            if sub_container and sub_container.get_handler_subscription_by_id(
-                subscription_id
-            ):
-                # if the subscription has a handler, put it in the handler queue
-                await self._handler_subscription_queue.put(raw_response)
-            else:
-                # otherwise, put it in the subscription response queue so a response
-                # can be yielded by the message stream
-                await self._subscription_response_queue.put(raw_response)
+                if sub is not None:
+                    if sub._held_messages is not None:
+                        # held while the subscription is being backfilled
+                        sub._held_messages.append(raw_response)
+                        return
+                    sub._track_position(raw_response["params"]["result"])
+            await self.cache_subscription_response(raw_response)
         elif self._is_batch_response(raw_response):
             # Since only one batch should be in the cache at all times, we use a
             # constant cache key for the batch response.
@@ -292,6 +377,122 @@ class RequestProcessor:
             )
             self._request_response_cache.cache(cache_key, raw_response)
 
+    async def cache_subscription_response(self, raw_response: Any) -> None:
+        subscription_id = raw_response.get("params", {}).get("subscription")
+        sub_container = self._subscription_container
+        sub = sub_container.get_by_id(subscription_id) if sub_container else None
+        # the subscriptions sharing the id, if it is shared
+        subs = sub_container.get_all_by_id(subscription_id) if sub_container else []
+        if any(shared_sub._handler is not None for shared_sub in subs):
+            # if the subscription has a handler, put it in the handler queue
+            await self._cache_in_queue(
+                "handler_subscription_queue",
+                self._handler_subscription_queue,
+                sub,
+                raw_response,
+            )
+        if not subs or any(shared_sub._handler is None for shared_sub in subs):
+            # otherwise, put it in the subscription response queue so a response
+            # can be yielded by the message stream
+            await self._cache_in_queue(
+                "subscription_response_queue",
+                self._subscription_response_queue,
+                sub,
+                raw_response,
+            )
+
+    async def _cache_in_queue(
+        self,
+        queue_name: str,
+        queue: TaskReliantQueue[Any],
+        sub: Optional["EthSubscription[Any]"],
+        raw_response: RPCResponse,
+    ) -> None:
+        previous_depth = queue.qsize()
+        if sub is None or sub.backpressure == BackpressurePolicy.BLOCK:
+            if self._subscription_response_queue.full():
+                self._provider.logger.debug(
+                    "Subscription queue is full. Waiting for provider to consume "
+                    "messages before caching."
+                )
+                self._provider._listen_event.clear()
+                await self._provider._listen_event.wait()
+
+            self._provider.logger.debug(
+                "Caching subscription response:\n    response=%s", raw_response
+            )
+            await queue.put(raw_response)
+        else:
+            self._cache_without_blocking(
+                queue_name, cast(SubscriptionQueue[Any], queue), sub, raw_response
+            )
+
+        depth = queue.qsize()
+        if depth > self._max_queue_depths[queue_name]:
+            self._max_queue_depths[queue_name] = depth
+        self._check_high_water_mark(queue_name, previous_depth, depth)
+
+    def _cache_without_blocking(
+        self,
+        queue_name: str,
+        queue: SubscriptionQueue[Any],
+        sub: "EthSubscription[Any]",
+        raw_response: RPCResponse,
+    ) -> None:
+        subscription_id = raw_response["params"]["subscription"]
+        policy = sub.backpressure
+        if policy == BackpressurePolicy.COALESCE and queue.replace_oldest(
+            subscription_id, raw_response
+        ):
+            # the queued message is superseded by this one
+            self._record_dropped_message(queue_name, sub)
+        elif not queue.full():
+            queue.put_nowait(raw_response)
+        elif policy == BackpressurePolicy.DROP_OLDEST and queue.drop_oldest(
+            subscription_id
+        ):
+            queue.put_nowait(raw_response)
+            self._record_dropped_message(queue_name, sub)
+        else:
+            self._provider.logger.debug(
+                "Subscription queue is full. Dropping subscription response:\n"
+                "    label=%s,\n    response=%s",
+                sub.label,
+                raw_response,
+            )
+            self._record_dropped_message(queue_name, sub)
+
+    def _record_dropped_message(
+        self, queue_name: str, sub: "EthSubscription[Any]"
+    ) -> None:
+        self._dropped_messages[queue_name] += 1
+        sub.dropped_message_count += 1
+
+    def _check_high_water_mark(
+        self, queue_name: str, previous_depth: int, depth: int
+    ) -> None:
+        manager = self._provider._subscription_manager
+        if manager is None or manager.high_water_mark is None:
+            return
+
+        if previous_depth < manager.high_water_mark:
+            # the queue was consumed below the mark since it was last reached
+            self._above_high_water_mark.discard(queue_name)
+        if (
+            depth >= manager.high_water_mark
+            and queue_name not in self._above_high_water_mark
+        ):
+            # called once each time the queue fills up to the mark
+            self._above_high_water_mark.add(queue_name)
+            self._provider.logger.warning(
+                "Subscription queue reached its high water mark:\n"
+                "    queue=%s,\n    depth=%s",
+                queue_name,
+                depth,
+            )
+            if manager.high_water_mark_handler is not None:
+                manager.high_water_mark_handler(queue_name, depth)
+
     async def pop_raw_response(
         self, cache_key: str = None, subscription: bool = False
     ) -> Any:
@@ -343,7 +544,7 @@ class RequestProcessor:
     # cache methods
 
     def _reset_handler_subscription_queue(self) -> None:
-        self._handler_subscription_queue = TaskReliantQueue(
+        self._handler_subscription_queue = SubscriptionQueue(
             maxsize=self._handler_subscription_queue.maxsize
         )
 
@@ -351,7 +552,7 @@ class RequestProcessor:
         """Clear the request processor caches."""
         self._request_information_cache.clear()
         self._request_response_cache.clear()
-        self._subscription_response_queue = TaskReliantQueue(
+        self._subscription_response_queue = SubscriptionQueue(
             maxsize=self._subscription_response_queue.maxsize
         )
         self._reset_handler_subscription_queue()
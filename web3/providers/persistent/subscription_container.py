@@ -17,6 +17,9 @@ class SubscriptionContainer:
         self.subscriptions: list[EthSubscription[Any]] = []
         self.subscriptions_by_id: dict[HexStr, EthSubscription[Any]] = {}
         self.subscriptions_by_label: dict[str, EthSubscription[Any]] = {}
+        # the subscriptions sharing each id, the first one being in
+        # ``subscriptions_by_id``
+        self.shared_subscriptions_by_id: dict[HexStr, list[EthSubscription[Any]]] = {}
 
     def __len__(self) -> int:
         return len(self.subscriptions)
@@ -26,14 +29,64 @@ class SubscriptionContainer:
 
     def add_subscription(self, subscription: EthSubscription[Any]) -> None:
         self.subscriptions.append(subscription)
-        self.subscriptions_by_id[subscription.id] = subscription
+        if self._is_current_id(subscription.id):
+            self.shared_subscriptions_by_id[subscription.id].append(subscription)
+        else:
+            self.subscriptions_by_id[subscription.id] = subscription
+            self.shared_subscriptions_by_id[subscription.id] = [subscription]
         self.subscriptions_by_label[subscription.label] = subscription
 
     def remove_subscription(self, subscription: EthSubscription[Any]) -> None:
         self.subscriptions.remove(subscription)
-        self.subscriptions_by_id.pop(subscription.id)
+        shared = self.shared_subscriptions_by_id[subscription.id]
+        shared.remove(subscription)
+        sub_ids = [
+            sub_id
+            for sub_id, sub in self.subscriptions_by_id.items()
+            if sub is subscription
+        ]
+        if shared and sub_ids:
+            # the next subscription takes over the shared subscription
+            shared[0]._last_position = subscription._last_position
+        for sub_id in sub_ids:
+            if shared:
+                self.subscriptions_by_id[sub_id] = shared[0]
+            else:
+                self.subscriptions_by_id.pop(sub_id)
+                self.shared_subscriptions_by_id.pop(sub_id)
         self.subscriptions_by_label.pop(subscription.label)
 
+    def update_subscription_id(
+        self, subscription: EthSubscription[Any], sub_id: HexStr
+    ) -> None:
+        # the previous ids still map to the subscription, for when it was resubscribed
+        # to after reconnecting
+        shared = self.shared_subscriptions_by_id[subscription.id]
+        subscription._id = sub_id
+        if not self._is_current_id(sub_id):
+            self.subscriptions_by_id[sub_id] = subscription
+        self.shared_subscriptions_by_id[sub_id] = shared
+
+    def _is_current_id(self, sub_id: HexStr) -> bool:
+        # an id may still map to the subscription it was a previous id of, in which
+        # case the subscription the node has now given it to takes it over
+        sub = self.subscriptions_by_id.get(sub_id)
+        return sub is not None and sub.id == sub_id
+
+    def get_shareable(
+        self, subscription: EthSubscription[Any]
+    ) -> EthSubscription[Any] | None:
+        # messages of a shared subscription are queued once, under the backpressure
+        # policy of the first subscription, so it must be the same for all of them
+        for sub_id, sub in self.subscriptions_by_id.items():
+            if (
+                sub.id == sub_id
+                and sub.subscription_params == subscription.subscription_params
+                and sub.backpressure == subscription.backpressure
+            ):
+                return sub
+        return None
+
     def get_by_id(self, sub_id: HexStr) -> EthSubscription[Any]:
         return self.subscriptions_by_id.get(sub_id)
 
@@ -44,6 +97,14 @@ class SubscriptionContainer:
     def handler_subscriptions(self) -> list[EthSubscription[Any]]:
         return [sub for sub in self.subscriptions if sub._handler is not None]
 
+    def get_all_by_id(self, sub_id: HexStr) -> list[EthSubscription[Any]]:
+        return list(self.shared_subscriptions_by_id.get(sub_id, ()))
+
+    def get_handler_subscriptions_by_id(
+        self, sub_id: HexStr
+    ) -> list[EthSubscription[Any]]:
+        return [sub for sub in self.get_all_by_id(sub_id) if sub._handler]
+
     def get_handler_subscription_by_id(
         self, sub_id: HexStr
     ) -> EthSubscription[Any] | None:
@@ -1,8 +1,11 @@
 import asyncio
 import logging
+import sys
+import time
 from typing import (
     TYPE_CHECKING,
     Any,
+    Callable,
     Sequence,
     cast,
     overload,
@@ -12,6 +15,9 @@ from eth_typing import (
     HexStr,
 )
 
+from web3._utils.caching import (
+    generate_cache_key,
+)
 from web3.exceptions import (
     SubscriptionHandlerTaskException,
     SubscriptionProcessingFinished,
@@ -24,6 +30,7 @@ from web3.providers.persistent.subscription_container import (
 )
 from web3.types import (
     FormattedEthSubscriptionResponse,
+    RPCEndpoint,
     RPCResponse,
 )
 from web3.utils.subscriptions import (
@@ -39,6 +46,28 @@ if TYPE_CHECKING:
     )
 
 
+class _HandlerLane:
+    """
+    The handler calls queued for one subscription, run in order by one task.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self.queue: asyncio.Queue[
+            EthSubscriptionContext[Any, Any] | None
+        ] = asyncio.Queue(maxsize=maxsize)
+        self.task: asyncio.Task[None] | None = None
+        # set once the subscription is removed, to stop after the queued calls
+        self.closing = False
+        self.handled = 0
+        self.total_latency = 0.0
+        self.max_latency = 0.0
+
+    def record_latency(self, latency: float) -> None:
+        self.handled += 1
+        self.total_latency += latency
+        self.max_latency = max(self.max_latency, latency)
+
+
 class SubscriptionManager:
     """
     The ``SubscriptionManager`` is responsible for subscribing, unsubscribing, and
@@ -60,11 +89,32 @@ class SubscriptionManager:
         self.task_timeout = 1
         self._tasks: set[asyncio.Task[None]] = set()
 
+        # when set, the handlers of subscriptions that aren't parallelized run in
+        # order in a lane per subscription, with at most this many running at once
+        self.max_concurrent_handlers: int | None = None
+        self._lanes: dict[str, _HandlerLane] = {}
+        self._handler_semaphore: asyncio.Semaphore | None = None
+
+        # share one subscription on the node between subscriptions with the same
+        # ``subscription_params`` and ``backpressure`` policy, passing its messages
+        # on to each of them
+        self.share_subscriptions = False
+
+        # the most blocks backfilled for a subscription after reconnecting
+        self.max_backfill_blocks = 1024
+
+        # called with the queue name and depth when a subscription queue fills up to
+        # the high water mark
+        self.high_water_mark: int | None = None
+        self.high_water_mark_handler: Callable[[str, int], Any] | None = None
+
         # share the subscription container with the request processor so it can separate
         # subscriptions into different queues based on ``sub._handler`` presence
         self._provider._request_processor._subscription_container = (
             self._subscription_container
         )
+        # resubscribe when a provider with ``reconnect=True`` reconnects
+        self._provider._subscription_manager = self
 
         self.total_handler_calls: int = 0
 
@@ -73,6 +123,12 @@ class SubscriptionManager:
 
     def _remove_subscription(self, subscription: EthSubscription[Any]) -> None:
         self._subscription_container.remove_subscription(subscription)
+        lane = self._lanes.get(subscription.label)
+        if lane is not None:
+            # let the lane finish the handler calls already queued
+            lane.closing = True
+            if not lane.queue.full():
+                lane.queue.put_nowait(None)
 
     def _validate_and_normalize_label(self, subscription: EthSubscription[Any]) -> None:
         if subscription.label == subscription._default_label:
@@ -109,6 +165,7 @@ class SubscriptionManager:
 
     async def _cleanup_remaining_tasks(self) -> None:
         """Cancel and clean up all remaining tasks."""
+        self._lanes.clear()
         if not self._tasks:
             return
 
@@ -119,6 +176,81 @@ class SubscriptionManager:
 
         self._tasks.clear()
 
+    def _lane_for(self, sub: EthSubscription[Any]) -> _HandlerLane:
+        lane = self._lanes.get(sub.label)
+        if lane is None or lane.closing:
+            lane = _HandlerLane(
+                self._provider._request_processor._handler_subscription_queue.maxsize
+            )
+            lane.task = asyncio.create_task(self._run_lane(sub, lane))
+            self._tasks.add(lane.task)
+            lane.task.add_done_callback(self._handler_task_callback)
+            self._lanes[sub.label] = lane
+        elif lane.task.done():
+            # the lane was stopped by an exception in the handler
+            raise SubscriptionHandlerTaskException(
+                lane.task, message=str(lane.task.exception())
+            )
+        return lane
+
+    async def _run_lane(self, sub: EthSubscription[Any], lane: _HandlerLane) -> None:
+        try:
+            while True:
+                sub_context = await lane.queue.get()
+                if sub_context is None:
+                    return
+
+                async with self._handler_semaphore:
+                    start = time.perf_counter()
+                    await sub._handler(sub_context)
+                    lane.record_latency(time.perf_counter() - start)
+
+                if lane.closing and lane.queue.empty():
+                    return
+        except Exception:
+            # don't leave ``handle_subscriptions`` waiting on a full lane
+            while not lane.queue.empty():
+                lane.queue.get_nowait()
+            raise
+
+    def lane_stats(self) -> dict[str, dict[str, float]]:
+        """
+        The number of handler calls queued and handled, and the mean and greatest
+        handler latency in seconds, of each subscription handler lane, by label.
+        """
+        return {
+            label: {
+                "depth": lane.queue.qsize(),
+                "handled": lane.handled,
+                "mean_latency": (
+                    lane.total_latency / lane.handled if lane.handled else 0.0
+                ),
+                "max_latency": lane.max_latency,
+            }
+            for label, lane in self._lanes.items()
+        }
+
+    def queue_stats(self) -> dict[str, dict[str, int]]:
+        """
+        The current and greatest depth of each subscription queue, and the number
+        of messages dropped from it by backpressure policies.
+        """
+        request_processor = self._provider._request_processor
+        queues: dict[str, asyncio.Queue[Any]] = {
+            "subscription_response_queue": (
+                request_processor._subscription_response_queue
+            ),
+            "handler_subscription_queue": request_processor._handler_subscription_queue,
+        }
+        return {
+            name: {
+                "depth": queue.qsize(),
+                "max_depth": request_processor._max_queue_depths[name],
+                "dropped": request_processor._dropped_messages[name],
+            }
+            for name, queue in queues.items()
+        }
+
     @property
     def subscriptions(self) -> list[EthSubscription[Any]]:
         return self._subscription_container.subscriptions
@@ -153,8 +285,29 @@ class SubscriptionManager:
         if isinstance(subscriptions, EthSubscription):
             subscriptions.manager = self
             self._validate_and_normalize_label(subscriptions)
+            shared = (
+                self._subscription_container.get_shareable(subscriptions)
+                if self.share_subscriptions
+                else None
+            )
+            if shared is not None:
+                subscriptions._id = shared.id
+                self._add_subscription(subscriptions)
+                self.logger.info(
+                    "Sharing subscription:\n    label: %s\n    id: %s\n"
+                    "    subscriptions sharing it: %s",
+                    subscriptions.label,
+                    shared.id,
+                    len(self._subscription_container.get_all_by_id(shared.id)),
+                )
+                return shared.id
+
             sub_id = await self._w3.eth._subscribe(*subscriptions.subscription_params)
             subscriptions._id = sub_id
+            if self._provider.reconnect and subscriptions._can_backfill:
+                # nothing up to the current block is missed if reconnecting before
+                # the first message
+                subscriptions._last_position = (await self._block_number(), sys.maxsize)
             self._add_subscription(subscriptions)
             self.logger.info(
                 "Successfully subscribed to subscription:\n    label: %s\n    id: %s",
@@ -220,7 +373,10 @@ class SubscriptionManager:
                     f"label: {subscriptions.label}\n    id: {subscriptions._id}"
                 )
 
-            if await self._w3.eth._unsubscribe(subscriptions.id):
+            # the subscription on the node is only cancelled once no other
+            # subscription shares it
+            sharing = len(self._subscription_container.get_all_by_id(subscriptions.id))
+            if sharing > 1 or await self._w3.eth._unsubscribe(subscriptions.id):
                 self._remove_subscription(subscriptions)
                 self.logger.info(
                     "Successfully unsubscribed from subscription:\n"
@@ -281,6 +437,95 @@ class SubscriptionManager:
                 )
             return False
 
+    async def _block_number(self) -> int:
+        response = await self._provider.make_request(RPCEndpoint("eth_blockNumber"), [])
+        return int(response["result"], 16)
+
+    async def _resubscribe(self) -> None:
+        """
+        Called by the provider after it reconnected, to resubscribe to all
+        subscriptions, keeping their labels and handlers. The messages that
+        subscriptions which can be backfilled missed while disconnected are fetched
+        and passed on before the ones received since.
+        """
+        request_processor = self._provider._request_processor
+        # one subscription on the node for each set of shared subscriptions
+        resubscribed: list[EthSubscription[Any]] = []
+        for sub in self.subscriptions.copy():
+            if any(sub is resubscribed_sub for resubscribed_sub in resubscribed):
+                continue
+            previous_id = sub.id
+            shared = self._subscription_container.get_all_by_id(previous_id)
+            resubscribed.extend(shared)
+            # the subscription is gone from the node, along with its previous id
+            request_processor.pop_cached_request_information(
+                generate_cache_key(previous_id)
+            )
+            sub._held_messages = []
+            try:
+                sub_id = await self._w3.eth._subscribe(*sub.subscription_params)
+                for shared_sub in shared:
+                    self._subscription_container.update_subscription_id(
+                        shared_sub, sub_id
+                    )
+                self.logger.info(
+                    "Resubscribed to subscription:\n    label: %s\n"
+                    "    previous id: %s\n    id: %s",
+                    sub.label,
+                    previous_id,
+                    sub_id,
+                )
+                if sub._can_backfill and sub._last_position is not None:
+                    await self._backfill(sub)
+            finally:
+                held_messages, sub._held_messages = sub._held_messages, None
+                for raw_response in held_messages:
+                    result = raw_response["params"]["result"]
+                    if sub._is_new(result):
+                        sub._track_position(result)
+                        await request_processor.cache_subscription_response(
+                            raw_response
+                        )
+
+    async def _backfill(self, sub: EthSubscription[Any]) -> None:
+        to_block = await self._block_number()
+        from_block = sub._backfill_from_block()
+        if to_block - from_block >= self.max_backfill_blocks:
+            self.logger.warning(
+                "Only backfilling the last %s of the blocks %s to %s for "
+                "subscription:\n    label: %s",
+                self.max_backfill_blocks,
+                from_block,
+                to_block,
+                sub.label,
+            )
+            from_block = to_block - self.max_backfill_blocks + 1
+        if from_block > to_block:
+            return
+
+        results = await sub._backfill_results(self._provider, from_block, to_block)
+        backfilled = 0
+        for result in results:
+            if not sub._is_new(result):
+                continue
+            sub._track_position(result)
+            await self._provider._request_processor.cache_subscription_response(
+                {
+                    "jsonrpc": "2.0",
+                    "method": "eth_subscription",
+                    "params": {"subscription": sub.id, "result": result},
+                }
+            )
+            backfilled += 1
+        self.logger.info(
+            "Backfilled %s messages from blocks %s to %s for subscription:\n"
+            "    label: %s",
+            backfilled,
+            from_block,
+            to_block,
+            sub.label,
+        )
+
     async def handle_subscriptions(self, run_forever: bool = False) -> None:
         """
         Used to handle all subscriptions that have handlers. The method will run until
@@ -297,6 +542,14 @@ class SubscriptionManager:
             )
             return
 
+        if self.max_concurrent_handlers is not None:
+            if self.max_concurrent_handlers < 1:
+                raise Web3ValueError(
+                    "max_concurrent_handlers must be at least 1, got "
+                    f"{self.max_concurrent_handlers}."
+                )
+            self._handler_semaphore = asyncio.Semaphore(self.max_concurrent_handlers)
+
         queue = self._provider._request_processor._handler_subscription_queue
         while run_forever or self._subscription_container.handler_subscriptions:
             try:
@@ -309,10 +562,10 @@ class SubscriptionManager:
                 # if the subscription was unsubscribed from, the response won't be
                 # formatted because we lost the request information
                 sub_id = formatted_sub_response.get("subscription")
-                sub = self._subscription_container.get_handler_subscription_by_id(
+                # each of the subscriptions sharing the id, if it is shared
+                for sub in self._subscription_container.get_handler_subscriptions_by_id(
                     sub_id
-                )
-                if sub:
+                ):
                     sub_context = EthSubscriptionContext(
                         self._w3,
                         sub,
@@ -326,6 +579,10 @@ class SubscriptionManager:
                         task = asyncio.create_task(sub._handler(sub_context))
                         self._tasks.add(task)
                         task.add_done_callback(self._handler_task_callback)
+                    elif self.max_concurrent_handlers is not None:
+                        # run the handler in the subscription's lane, after the
+                        # handler calls queued before it
+                        await self._lane_for(sub).queue.put(sub_context)
                     else:
                         # await the handler in the main loop to ensure order
                         await sub._handler(sub_context)
@@ -352,5 +609,9 @@ class SubscriptionManager:
         # no active handler subscriptions, clear the handler subscription queue
         self._provider._request_processor._reset_handler_subscription_queue()
 
-        if self._tasks:
-            await self._cleanup_remaining_tasks()
+        # give the lanes of removed subscriptions time to finish their handler calls
+        closing_lanes = [lane.task for lane in self._lanes.values() if lane.closing]
+        if closing_lanes:
+            await asyncio.wait(closing_lanes, timeout=self.task_timeout)
+
+        await self._cleanup_remaining_tasks()
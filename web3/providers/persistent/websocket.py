@@ -127,7 +127,9 @@ class WebSocketProvider(PersistentConnectionProvider):
 
     async def socket_recv(self) -> RPCResponse:
         raw_response = await self._ws.recv()
-        return json.loads(raw_response)
+        response = json.loads(raw_response)
+        self._request_processor.record_response_bytes(response, len(raw_response))
+        return response
 
     # -- private methods -- #
 
@@ -0,0 +1,338 @@
+import asyncio
+import json
+import logging
+from typing import (
+    Any,
+    Optional,
+    cast,
+)
+
+from eth_typing import (
+    URI,
+)
+from websockets.asyncio.client import (
+    ClientConnection,
+    connect,
+)
+from websockets.exceptions import (
+    ConnectionClosed,
+    ConnectionClosedOK,
+    WebSocketException,
+)
+from websockets.protocol import (
+    State,
+)
+
+from web3._utils.caching.caching_utils import (
+    async_handle_send_caching,
+)
+from web3.exceptions import (
+    PersistentConnectionClosedOK,
+    ProviderConnectionError,
+    Web3ValueError,
+)
+from web3.providers.persistent.websocket import (
+    WebSocketProvider,
+)
+from web3.types import (
+    RPCEndpoint,
+    RPCId,
+    RPCRequest,
+    RPCResponse,
+)
+
+SUBSCRIPTION_METHODS = {RPCEndpoint("eth_subscribe"), RPCEndpoint("eth_unsubscribe")}
+
+
+class _PooledConnection:
+    """
+    One websocket connection of a ``WebSocketPoolProvider``, with the requests in
+    flight on it and the subscriptions it holds.
+    """
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.ws: ClientConnection | None = None
+        self.reader_task: Optional["asyncio.Task[None]"] = None
+        # request id -> (method, params) of each request awaiting its response
+        self.in_flight: dict[RPCId, tuple[RPCEndpoint, Any]] = {}
+        # the number of batch requests awaiting their response
+        self.in_flight_batches = 0
+        self.subscription_ids: set[str] = set()
+
+    @property
+    def in_flight_count(self) -> int:
+        return len(self.in_flight) + self.in_flight_batches
+
+    @property
+    def subscription_count(self) -> int:
+        pending = sum(
+            method == "eth_subscribe" for method, _params in self.in_flight.values()
+        )
+        return len(self.subscription_ids) + pending
+
+    def settle(self, response: RPCResponse | list[RPCResponse]) -> None:
+        """
+        Mark the request ``response`` answers as no longer in flight, keeping track
+        of the subscriptions it made or cancelled.
+        """
+        if isinstance(response, list) or response.get("id") is None:
+            self.in_flight_batches = max(self.in_flight_batches - 1, 0)
+            return
+
+        method, params = self.in_flight.pop(response["id"], (None, None))
+        result = response.get("result")
+        if method == "eth_subscribe" and result:
+            self.subscription_ids.add(result)
+        elif method == "eth_unsubscribe" and result is True:
+            self.subscription_ids.discard(params[0])
+
+    def reset(self) -> None:
+        self.ws = None
+        self.reader_task = None
+        self.in_flight.clear()
+        self.in_flight_batches = 0
+        self.subscription_ids.clear()
+
+
+class WebSocketPoolProvider(WebSocketProvider):
+    """
+    A ``WebSocketProvider`` that opens ``pool_size`` connections to the endpoint and
+    sends each request over the one with the fewest requests in flight.
+    Subscriptions are held on ``subscription_pool_size`` more connections, dedicated
+    to them, so that their messages don't hold up the responses to requests. With no
+    dedicated connections, subscriptions share the request connections.
+
+    The messages from all connections are handled by one request processor, so the
+    ``subscription_manager`` and ``socket`` APIs are the same as for a single
+    connection.
+    """
+
+    logger = logging.getLogger("web3.providers.WebSocketPoolProvider")
+
+    def __init__(
+        self,
+        endpoint_uri: URI | str | None = None,
+        pool_size: int = 4,
+        subscription_pool_size: int = 1,
+        websocket_kwargs: dict[str, Any] | None = None,
+        use_text_frames: bool | None = False,
+        # `PersistentConnectionProvider` kwargs can be passed through
+        **kwargs: Any,
+    ) -> None:
+        if pool_size < 1:
+            raise Web3ValueError(f"pool_size must be at least 1, got {pool_size}.")
+        if subscription_pool_size < 0:
+            raise Web3ValueError(
+                "subscription_pool_size must not be negative, got "
+                f"{subscription_pool_size}."
+            )
+        super().__init__(
+            endpoint_uri,
+            websocket_kwargs=websocket_kwargs,
+            use_text_frames=use_text_frames,
+            **kwargs,
+        )
+        self.pool_size = pool_size
+        self.subscription_pool_size = subscription_pool_size
+        self._request_connections = [
+            _PooledConnection(f"request-{i}") for i in range(pool_size)
+        ]
+        self._subscription_connections = [
+            _PooledConnection(f"subscription-{i}")
+            for i in range(subscription_pool_size)
+        ]
+        # the messages read from all connections, for the message listener task
+        self._pooled_messages: asyncio.Queue[RPCResponse | Exception] = asyncio.Queue()
+
+    def __str__(self) -> str:
+        return (
+            f"WebSocket connection pool: {self.endpoint_uri} ({self.pool_size} "
+            f"request and {self.subscription_pool_size} subscription connections)"
+        )
+
+    @property
+    def _connections(self) -> list[_PooledConnection]:
+        return self._request_connections + self._subscription_connections
+
+    def in_flight(self) -> dict[str, int]:
+        """
+        The number of requests awaiting a response on each connection, by name.
+        """
+        return {
+            connection.name: connection.in_flight_count
+            for connection in self._connections
+        }
+
+    async def is_connected(self, show_traceback: bool = False) -> bool:
+        if not all(connection.ws for connection in self._connections):
+            return False
+
+        try:
+            for connection in self._connections:
+                await connection.ws.pong()
+            return True
+
+        except WebSocketException as e:
+            if show_traceback:
+                raise ProviderConnectionError(
+                    f"Error connecting to endpoint: '{self.endpoint_uri}'"
+                ) from e
+            return False
+
+    def is_open(self) -> bool:
+        return all(
+            connection.ws is not None and connection.ws.state == State.OPEN
+            for connection in self._connections
+        )
+
+    # -- routing -- #
+
+    def _least_busy_request_connection(self) -> _PooledConnection:
+        return min(
+            self._request_connections,
+            key=lambda connection: connection.in_flight_count,
+        )
+
+    def _connection_for(self, method: RPCEndpoint, params: Any) -> _PooledConnection:
+        if method == "eth_unsubscribe" and params:
+            # a subscription can only be cancelled on the connection that holds it
+            for connection in self._connections:
+                if params[0] in connection.subscription_ids:
+                    return connection
+        if method in SUBSCRIPTION_METHODS:
+            return min(
+                self._subscription_connections or self._request_connections,
+                key=lambda connection: (
+                    connection.subscription_count,
+                    connection.in_flight_count,
+                ),
+            )
+        return self._least_busy_request_connection()
+
+    async def _send_over(self, connection: _PooledConnection, data: bytes) -> None:
+        if connection.ws is None:
+            raise ProviderConnectionError(
+                "Connection to websocket has not been initiated for the provider."
+            )
+
+        payload: bytes | str = data
+        if self.use_text_frames:
+            payload = data.decode("utf-8")
+
+        await asyncio.wait_for(
+            connection.ws.send(payload), timeout=self.request_timeout
+        )
+
+    @async_handle_send_caching
+    async def send_request(self, method: RPCEndpoint, params: Any) -> RPCRequest:
+        request_dict = self.form_request(method, params)
+        connection = self._connection_for(method, params)
+        connection.in_flight[request_dict["id"]] = (method, request_dict["params"])
+        try:
+            await self._send_over(
+                connection, self._encode_and_record_rpc_dict(request_dict)
+            )
+        except Exception:
+            connection.in_flight.pop(request_dict["id"], None)
+            raise
+        return request_dict
+
+    async def send_batch_request(
+        self, requests: list[tuple[RPCEndpoint, Any]]
+    ) -> list[RPCRequest]:
+        request_dicts = [
+            self.form_request(method, params) for (method, params) in requests
+        ]
+        connection = self._least_busy_request_connection()
+        connection.in_flight_batches += 1
+        try:
+            await self._send_over(
+                connection, self.encode_batch_request_dicts(request_dicts)
+            )
+        except Exception:
+            connection.in_flight_batches -= 1
+            raise
+        return request_dicts
+
+    async def socket_send(self, request_data: bytes) -> None:
+        await self._send_over(self._least_busy_request_connection(), request_data)
+
+    async def socket_recv(self) -> RPCResponse:
+        message = await self._pooled_messages.get()
+        if isinstance(message, Exception):
+            raise message
+        return message
+
+    # -- private methods -- #
+
+    async def _read_connection(self, connection: _PooledConnection) -> None:
+        while True:
+            try:
+                raw_response = await connection.ws.recv()
+                response = json.loads(raw_response)
+                self._request_processor.record_response_bytes(
+                    response, len(raw_response)
+                )
+            except ConnectionClosedOK:
+                self._pooled_messages.put_nowait(
+                    PersistentConnectionClosedOK(
+                        user_message=(
+                            f"WebSocket connection {connection.name} received "
+                            "`ConnectionClosedOK`."
+                        )
+                    )
+                )
+                return
+            except Exception as e:
+                self._pooled_messages.put_nowait(e)
+                if isinstance(e, ConnectionClosed) or not (
+                    self.silence_listener_task_exceptions
+                ):
+                    return
+                await asyncio.sleep(0)
+                continue
+
+            if not (
+                isinstance(response, dict)
+                and response.get("method") == "eth_subscription"
+            ):
+                connection.settle(response)
+            self._pooled_messages.put_nowait(response)
+
+    async def _provider_specific_connect(self) -> None:
+        connections = self._connections
+        results = await asyncio.gather(
+            *(connect(self.endpoint_uri, **self.websocket_kwargs) for _ in connections),
+            return_exceptions=True,
+        )
+        errors = [result for result in results if isinstance(result, BaseException)]
+        if errors:
+            # close the connections that were made, so the pool is retried as a whole
+            for result in results:
+                if not isinstance(result, BaseException):
+                    await result.close()
+            raise errors[0]
+
+        self._pooled_messages = asyncio.Queue()
+        for connection, ws in zip(connections, results):
+            connection.ws = cast(ClientConnection, ws)
+            connection.reader_task = asyncio.create_task(
+                self._read_connection(connection)
+            )
+
+    async def _provider_specific_disconnect(self) -> None:
+        # this should remain idempotent
+        for connection in self._connections:
+            if connection.reader_task is not None:
+                connection.reader_task.cancel()
+                try:
+                    await connection.reader_task
+                except (asyncio.CancelledError, ConnectionClosed):
+                    pass
+            if connection.ws is not None and connection.ws.state == State.OPEN:
+                await connection.ws.close()
+            connection.reset()
+
+    async def _provider_specific_socket_reader(self) -> RPCResponse:
+        return await self.socket_recv()
@@ -0,0 +1,340 @@
+"""
+Providers to record the requests made to a node, with their responses, and to
+replay them later without one.
+
+A recording is a file of JSON lines, gzip compressed if its path ends in ``.gz``,
+with one line per request or batch of requests::
+
+    {"method": "eth_chainId", "params": [], "response": "{...}", "elapsed": 0.02}
+    {"batch": [["eth_chainId", []], ...], "response": "[...]", "elapsed": 0.05}
+
+where ``response`` is the raw JSON response and ``elapsed`` the time, in seconds, it
+took to get it.
+"""
+import asyncio
+from collections import (
+    defaultdict,
+)
+import gzip
+import json
+import logging
+import os
+import threading
+import time
+from typing import (
+    IO,
+    Any,
+    cast,
+)
+
+from web3._utils.caching import (
+    async_handle_request_caching,
+    handle_request_caching,
+)
+from web3._utils.encoding import (
+    Web3JsonEncoder,
+)
+from web3.exceptions import (
+    Web3ValueError,
+)
+from web3.providers.async_base import (
+    AsyncJSONBaseProvider,
+)
+from web3.providers.base import (
+    JSONBaseProvider,
+)
+from web3.types import (
+    RPCEndpoint,
+    RPCResponse,
+)
+
+
+def _to_json(value: Any, sort_keys: bool = False) -> str:
+    return json.dumps(
+        value, cls=Web3JsonEncoder, separators=(",", ":"), sort_keys=sort_keys
+    )
+
+
+def _request_key(method: str, params: Any) -> str:
+    return f"{method}:{_to_json(params or [], sort_keys=True)}"
+
+
+def _batch_key(requests: list[tuple[RPCEndpoint, Any]]) -> str:
+    return "|".join(_request_key(method, params) for method, params in requests)
+
+
+def _open_recording(path: str | os.PathLike[str], mode: str) -> IO[str]:
+    if str(path).endswith(".gz"):
+        return cast(IO[str], gzip.open(path, f"{mode}t", encoding="utf-8"))
+    return open(path, mode, encoding="utf-8")
+
+
+class _RecordingWriter:
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        self.path = path
+        self._file: IO[str] | None = None
+        self._lock = threading.Lock()
+
+    def write(self, entry: dict[str, Any], response: Any, elapsed: float) -> None:
+        line = _to_json({**entry, "response": _to_json(response), "elapsed": elapsed})
+        with self._lock:
+            if self._file is None:
+                # appended to, so that a recording can be made in several sessions
+                self._file = _open_recording(self.path, "a")
+            self._file.write(line + "\n")
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+class _Recording:
+    """
+    The responses of a recording, by request. A request that was recorded more than
+    once gets its responses in the order they were recorded, starting over from the
+    first once they have all been replayed.
+    """
+
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        self.path = path
+        self._responses: dict[str, list[tuple[str, float]]] = defaultdict(list)
+        self._next: dict[str, int] = defaultdict(int)
+        self._lock = threading.Lock()
+
+        with _open_recording(path, "r") as recording:
+            for line in recording:
+                if not line.strip():
+                    continue
+                entry = json.loads(line)
+                if "batch" in entry:
+                    key = _batch_key(entry["batch"])
+                else:
+                    key = _request_key(entry["method"], entry["params"])
+                self._responses[key].append((entry["response"], entry["elapsed"]))
+
+    def response(self, key: str, description: str) -> tuple[str, float]:
+        responses = self._responses.get(key)
+        if not responses:
+            raise Web3ValueError(
+                f"No response to {description} was recorded in {self.path}."
+            )
+        with self._lock:
+            index = self._next[key]
+            self._next[key] = (index + 1) % len(responses)
+        return responses[index]
+
+
+# -- sync -- #
+
+
+class RecordingProvider(JSONBaseProvider):
+    """
+    Make requests through ``provider``, recording them and their responses to
+    ``path``.
+    """
+
+    logger = logging.getLogger("web3.providers.RecordingProvider")
+
+    def __init__(
+        self,
+        provider: JSONBaseProvider,
+        path: str | os.PathLike[str],
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(**kwargs)
+        self.provider = provider
+        self._recording_writer = _RecordingWriter(path)
+
+    def __str__(self) -> str:
+        return f"<{self.__class__.__name__} of {self.provider}>"
+
+    def close(self) -> None:
+        """
+        Close the recording. Requests made afterwards are appended to it.
+        """
+        self._recording_writer.close()
+
+    def make_request(self, method: RPCEndpoint, params: Any) -> RPCResponse:
+        started = time.perf_counter()
+        response = self.provider.make_request(method, params)
+        self._recording_writer.write(
+            {"method": method, "params": params or []},
+            response,
+            time.perf_counter() - started,
+        )
+        return response
+
+    def make_batch_request(
+        self, requests: list[tuple[RPCEndpoint, Any]]
+    ) -> list[RPCResponse] | RPCResponse:
+        started = time.perf_counter()
+        response = self.provider.make_batch_request(requests)
+        self._recording_writer.write(
+            {"batch": [[method, params or []] for method, params in requests]},
+            response,
+            time.perf_counter() - started,
+        )
+        return response
+
+    def is_connected(self, show_traceback: bool = False) -> bool:
+        return self.provider.is_connected(show_traceback)
+
+
+class ReplayProvider(JSONBaseProvider):
+    """
+    Respond to requests with the responses recorded by a ``RecordingProvider`` at
+    ``path``. Responses are returned immediately by default, or after the time they
+    took to record multiplied by ``latency_scale``: ``1.0`` for the recorded latency,
+    ``0.5`` for half of it.
+    """
+
+    logger = logging.getLogger("web3.providers.ReplayProvider")
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        latency_scale: float = 0.0,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(**kwargs)
+        self.latency_scale = latency_scale
+        self._recording = _Recording(path)
+
+    def __str__(self) -> str:
+        return f"<{self.__class__.__name__} {self._recording.path}>"
+
+    def _replay(self, key: str, description: str) -> Any:
+        raw_response, elapsed = self._recording.response(key, description)
+        if self.latency_scale:
+            time.sleep(elapsed * self.latency_scale)
+        return self.decode_rpc_response(raw_response.encode())
+
+    @handle_request_caching
+    def make_request(self, method: RPCEndpoint, params: Any) -> RPCResponse:
+        return self._replay(
+            _request_key(method, params), f"{method} with params {params}"
+        )
+
+    def make_batch_request(
+        self, requests: list[tuple[RPCEndpoint, Any]]
+    ) -> list[RPCResponse] | RPCResponse:
+        return self._replay(_batch_key(requests), f"the batch {requests}")
+
+    def is_connected(self, show_traceback: bool = False) -> bool:
+        return True
+
+
+# -- async -- #
+
+
+class AsyncRecordingProvider(AsyncJSONBaseProvider):
+    """
+    Make requests through the async ``provider``, recording them and their
+    responses to ``path``. A persistent connection ``provider`` is connected and
+    disconnected with this one, but its subscriptions are not recorded.
+    """
+
+    logger = logging.getLogger("web3.providers.AsyncRecordingProvider")
+
+    def __init__(
+        self,
+        provider: AsyncJSONBaseProvider,
+        path: str | os.PathLike[str],
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(**kwargs)
+        self.provider = provider
+        self._recording_writer = _RecordingWriter(path)
+
+    def __str__(self) -> str:
+        return f"<{self.__class__.__name__} of {self.provider}>"
+
+    def close(self) -> None:
+        """
+        Close the recording. Requests made afterwards are appended to it.
+        """
+        self._recording_writer.close()
+
+    async def make_request(self, method: RPCEndpoint, params: Any) -> RPCResponse:
+        started = time.perf_counter()
+        response = await self.provider.make_request(method, params)
+        self._recording_writer.write(
+            {"method": method, "params": params or []},
+            response,
+            time.perf_counter() - started,
+        )
+        return response
+
+    async def make_batch_request(
+        self, requests: list[tuple[RPCEndpoint, Any]]
+    ) -> list[RPCResponse] | RPCResponse:
+        started = time.perf_counter()
+        response = await self.provider.make_batch_request(requests)
+        self._recording_writer.write(
+            {"batch": [[method, params or []] for method, params in requests]},
+            response,
+            time.perf_counter() - started,
+        )
+        return response
+
+    async def is_connected(self, show_traceback: bool = False) -> bool:
+        return await self.provider.is_connected(show_traceback)
+
+    async def connect(self) -> None:
+        await self.provider.connect()
+
+    async def disconnect(self) -> None:
+        await self.provider.disconnect()
+        self.close()
+
+
+class AsyncReplayProvider(AsyncJSONBaseProvider):
+    """
+    Respond to requests with the responses recorded by a ``RecordingProvider`` or
+    an ``AsyncRecordingProvider`` at ``path``, with the same ``latency_scale`` as
+    the ``ReplayProvider``. It replays the requests recorded from HTTP and
+    persistent connection providers alike.
+    """
+
+    logger = logging.getLogger("web3.providers.AsyncReplayProvider")
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        latency_scale: float = 0.0,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(**kwargs)
+        self.latency_scale = latency_scale
+        self._recording = _Recording(path)
+
+    def __str__(self) -> str:
+        return f"<{self.__class__.__name__} {self._recording.path}>"
+
+    async def _replay(self, key: str, description: str) -> Any:
+        raw_response, elapsed = self._recording.response(key, description)
+        if self.latency_scale:
+            await asyncio.sleep(elapsed * self.latency_scale)
+        return self.decode_rpc_response(raw_response.encode())
+
+    @async_handle_request_caching
+    async def make_request(self, method: RPCEndpoint, params: Any) -> RPCResponse:
+        return await self._replay(
+            _request_key(method, params), f"{method} with params {params}"
+        )
+
+    async def make_batch_request(
+        self, requests: list[tuple[RPCEndpoint, Any]]
+    ) -> list[RPCResponse] | RPCResponse:
+        return await self._replay(_batch_key(requests), f"the batch {requests}")
+
+    async def is_connected(self, show_traceback: bool = False) -> bool:
+        return True
+
+    async def connect(self) -> None:
+        pass
+
+    async def disconnect(self) -> None:
+        pass
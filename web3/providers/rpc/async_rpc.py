@@ -1,7 +1,9 @@
 import asyncio
 import logging
 from typing import (
+    TYPE_CHECKING,
     Any,
+    AsyncIterator,
     Iterable,
     cast,
 )
@@ -29,6 +31,9 @@ from web3.types import (
     RPCEndpoint,
     RPCResponse,
 )
+from web3.utils.metrics import (
+    BATCH_METHOD,
+)
 
 from ..._utils.batching import (
     sort_batch_response_by_response_ids,
@@ -47,6 +52,11 @@ from .utils import (
     check_if_retry_on_failure,
 )
 
+if TYPE_CHECKING:
+    from web3._utils.json_stream import (  # noqa: F401
+        JSONItemParser,
+    )
+
 
 class AsyncHTTPProvider(AsyncJSONBaseProvider):
     logger = logging.getLogger("web3.providers.AsyncHTTPProvider")
@@ -74,6 +84,10 @@ class AsyncHTTPProvider(AsyncJSONBaseProvider):
         self._exception_retry_configuration = exception_retry_configuration
 
         super().__init__(**kwargs)
+        if self.metrics is not None:
+            self.metrics.watch_cache(
+                "session", self._request_session_manager.session_cache
+            )
 
     async def cache_async_session(self, session: ClientSession) -> ClientSession:
         return await self._request_session_manager.async_cache_and_return_session(
@@ -153,6 +167,8 @@ class AsyncHTTPProvider(AsyncJSONBaseProvider):
         )
         request_data = self.encode_rpc_request(method, params)
         raw_response = await self._make_request(method, request_data)
+        if self.metrics is not None:
+            self.metrics.record_bytes_received(method, len(raw_response))
         response = self.decode_rpc_response(raw_response)
         self.logger.debug(
             "Getting response HTTP. URI: %s, Method: %s, Response: %s",
@@ -162,6 +178,23 @@ class AsyncHTTPProvider(AsyncJSONBaseProvider):
         )
         return response
 
+    async def make_stream_request(
+        self, method: RPCEndpoint, params: Any, parser: "JSONItemParser"
+    ) -> AsyncIterator[Any]:
+        self.logger.debug(
+            "Making streaming request HTTP. URI: %s, Method: %s",
+            self.endpoint_uri,
+            method,
+        )
+        request_data = self.encode_rpc_request(method, params)
+        async for chunk in self._request_session_manager.async_stream_post_request(
+            self.endpoint_uri, request_data, **self.get_request_kwargs()
+        ):
+            for item in parser.feed(chunk):
+                yield item
+        for item in parser.close():
+            yield item
+
     async def make_batch_request(
         self, batch_requests: list[tuple[RPCEndpoint, Any]]
     ) -> list[RPCResponse] | RPCResponse:
@@ -171,6 +204,8 @@ class AsyncHTTPProvider(AsyncJSONBaseProvider):
             self.endpoint_uri, request_data, **self.get_request_kwargs()
         )
         self.logger.debug("Received batch response HTTP.")
+        if self.metrics is not None:
+            self.metrics.record_bytes_received(BATCH_METHOD, len(raw_response))
         response = self.decode_rpc_response(raw_response)
         if not isinstance(response, list):
             # RPC errors return only one response with the error object
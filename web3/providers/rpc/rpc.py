@@ -4,6 +4,7 @@ from typing import (
     TYPE_CHECKING,
     Any,
     Iterable,
+    Iterator,
     cast,
 )
 
@@ -27,6 +28,9 @@ from web3.types import (
     RPCEndpoint,
     RPCResponse,
 )
+from web3.utils.metrics import (
+    BATCH_METHOD,
+)
 
 from ..._utils.batching import (
     sort_batch_response_by_response_ids,
@@ -46,6 +50,9 @@ from .utils import (
 )
 
 if TYPE_CHECKING:
+    from web3._utils.json_stream import (  # noqa: F401
+        JSONItemParser,
+    )
     from web3.middleware.base import (  # noqa: F401
         Middleware,
     )
@@ -69,6 +76,10 @@ class HTTPProvider(JSONBaseProvider):
         # Pass explicit session to manager so it's used for ALL requests,
         # regardless of which thread makes them
         self._request_session_manager = HTTPSessionManager(explicit_session=session)
+        if self.metrics is not None:
+            self.metrics.watch_cache(
+                "session", self._request_session_manager.session_cache
+            )
 
         if endpoint_uri is None:
             self.endpoint_uri = (
@@ -158,6 +169,8 @@ class HTTPProvider(JSONBaseProvider):
         )
         request_data = self.encode_rpc_request(method, params)
         raw_response = self._make_request(method, request_data)
+        if self.metrics is not None:
+            self.metrics.record_bytes_received(method, len(raw_response))
         response = self.decode_rpc_response(raw_response)
         self.logger.debug(
             "Getting response HTTP. URI: %s, Method: %s, Response: %s",
@@ -167,6 +180,21 @@ class HTTPProvider(JSONBaseProvider):
         )
         return response
 
+    def make_stream_request(
+        self, method: RPCEndpoint, params: Any, parser: "JSONItemParser"
+    ) -> Iterator[Any]:
+        self.logger.debug(
+            "Making streaming request HTTP. URI: %s, Method: %s",
+            self.endpoint_uri,
+            method,
+        )
+        request_data = self.encode_rpc_request(method, params)
+        for chunk in self._request_session_manager.stream_post_request(
+            self.endpoint_uri, request_data, **self.get_request_kwargs()
+        ):
+            yield from parser.feed(chunk)
+        yield from parser.close()
+
     def make_batch_request(
         self, batch_requests: list[tuple[RPCEndpoint, Any]]
     ) -> list[RPCResponse] | RPCResponse:
@@ -176,6 +204,8 @@ class HTTPProvider(JSONBaseProvider):
             self.endpoint_uri, request_data, **self.get_request_kwargs()
         )
         self.logger.debug("Received batch response HTTP.")
+        if self.metrics is not None:
+            self.metrics.record_bytes_received(BATCH_METHOD, len(raw_response))
         response = self.decode_rpc_response(raw_response)
         if not isinstance(response, list):
             # RPC errors return only one response with the error object
@@ -0,0 +1,105 @@
+import argparse
+import gc
+import logging
+import sys
+import timeit
+import tracemalloc
+from typing import (
+    Any,
+    Callable,
+)
+
+from web3 import (
+    AsyncHTTPProvider,
+    AsyncWeb3,
+    HTTPProvider,
+    Web3,
+)
+
+ENDPOINT_URI = "http://127.0.0.1:8545"
+
+parser = argparse.ArgumentParser()
+parser.add_argument(
+    "--num-instances",
+    type=int,
+    default=1000,
+    help="The number of instances to construct",
+)
+
+
+def benchmark_construction_time(build: Callable[[], Any], n: int) -> float:
+    """
+    The average time, in microseconds, to build an instance.
+    """
+    return timeit.timeit(build, number=n) / n * 1_000_000
+
+
+def benchmark_instance_memory(build: Callable[[], Any], n: int) -> float:
+    """
+    The average memory, in KiB, held by each of ``n`` live instances.
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before, _peak = tracemalloc.get_traced_memory()
+        instances = [build() for _ in range(n)]
+        after, _peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    del instances
+    return (after - before) / n / 1024
+
+
+def main(logger: logging.Logger, num_instances: int) -> None:
+    # providers are shared, so that only the ``Web3`` instances are measured
+    provider = HTTPProvider(ENDPOINT_URI)
+    async_provider = AsyncHTTPProvider(ENDPOINT_URI)
+
+    def build_and_use_eth() -> Web3:
+        w3 = Web3(provider)
+        w3.eth.get_block
+        return w3
+
+    def build_and_use_codec() -> Web3:
+        w3 = Web3(provider)
+        w3.codec
+        return w3
+
+    cases: list[tuple[str, Callable[[], Any]]] = [
+        ("Web3(HTTPProvider)", lambda: Web3(provider)),
+        ("AsyncWeb3(AsyncHTTPProvider)", lambda: AsyncWeb3(async_provider)),
+        ("Web3 + w3.eth.get_block", build_and_use_eth),
+        ("Web3 + w3.codec", build_and_use_codec),
+    ]
+
+    logger.info(
+        "|{:^32}|{:^20}|{:^20}|".format(
+            f"Construction ({num_instances} instances)",
+            "us / instance",
+            "KiB / instance",
+        )
+    )
+    logger.info("-" * 76)
+    for name, build in cases:
+        # warm up the caches shared between instances
+        build()
+
+        construction_time = benchmark_construction_time(build, num_instances)
+        instance_memory = benchmark_instance_memory(build, num_instances)
+        logger.info(
+            "|{:^32}|{:^20.2f}|{:^20.2f}|".format(
+                name, construction_time, instance_memory
+            )
+        )
+    logger.info("-" * 76)
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+
+    logger = logging.getLogger()
+    logger.setLevel(logging.INFO)
+    logger.addHandler(logging.StreamHandler(sys.stdout))
+
+    main(logger, args.num_instances)
@@ -0,0 +1,78 @@
+import argparse
+import logging
+import sys
+import timeit
+from typing import (
+    Any,
+    Callable,
+)
+
+from web3._utils.method_formatters import (
+    PYTHONIC_RESULT_FORMATTERS,
+    get_result_formatters,
+)
+from web3._utils.rpc_abi import (
+    RPC,
+)
+from web3.exceptions import (
+    Web3AssertionError,
+)
+from web3.tools.benchmark.payloads import (
+    build_block,
+    build_block_receipts,
+    build_logs,
+)
+from web3.types import (
+    RPCEndpoint,
+)
+
+parser = argparse.ArgumentParser()
+parser.add_argument(
+    "--num-calls",
+    type=int,
+    default=10,
+    help="The number of times to format each payload",
+)
+
+
+def benchmark_formatter(formatter: Callable[..., Any], payload: Any, n: int) -> float:
+    return timeit.timeit(lambda: formatter(payload), number=n)
+
+
+def main(logger: logging.Logger, num_calls: int) -> None:
+    cases: list[tuple[str, RPCEndpoint, Any]] = [
+        ("eth_getBlockByNumber(full)", RPC.eth_getBlockByNumber, build_block()),
+        ("eth_getLogs (10k logs)", RPC.eth_getLogs, build_logs()),
+        ("eth_getBlockReceipts", RPC.eth_getBlockReceipts, build_block_receipts()),
+    ]
+
+    logger.info(
+        "|{:^30}|{:^20}|{:^20}|{:^10}|".format(
+            f"Method ({num_calls} calls)", "uncompiled", "compiled", "speedup"
+        )
+    )
+    logger.info("-" * 85)
+    for name, method, payload in cases:
+        uncompiled = PYTHONIC_RESULT_FORMATTERS[method]
+        compiled = get_result_formatters(method, None)
+        if uncompiled(payload) != compiled(payload):
+            raise Web3AssertionError(f"Compiled formatter output differs for {name}")
+
+        before = benchmark_formatter(uncompiled, payload, num_calls)
+        after = benchmark_formatter(compiled, payload, num_calls)
+        logger.info(
+            "|{:^30}|{:^20.10}|{:^20.10}|{:^10}|".format(
+                name, before, after, f"{before / after:.2f}x"
+            )
+        )
+    logger.info("-" * 85)
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+
+    logger = logging.getLogger()
+    logger.setLevel(logging.INFO)
+    logger.addHandler(logging.StreamHandler(sys.stdout))
+
+    main(logger, args.num_calls)
@@ -0,0 +1,309 @@
+"""
+Benchmark each layer of a request, against a local ``StubNode`` so that no node is
+needed: the raw provider, the ``RequestManager``, the middleware onion, the result
+formatters and contract call encoding and decoding.
+"""
+import argparse
+import asyncio
+from dataclasses import (
+    dataclass,
+)
+import logging
+import statistics
+import sys
+import timeit
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+)
+
+from eth_typing import (
+    ChecksumAddress,
+    HexAddress,
+    HexStr,
+)
+
+from web3 import (
+    AsyncHTTPProvider,
+    AsyncWeb3,
+    HTTPProvider,
+    IPCProvider,
+    Web3,
+    WebSocketProvider,
+)
+from web3._utils.method_formatters import (
+    get_result_formatters,
+)
+from web3._utils.rpc_abi import (
+    RPC,
+)
+from web3.tools.benchmark.payloads import (
+    build_block,
+)
+from web3.tools.benchmark.reporting import (
+    add_results_arguments,
+    compare_to_baseline,
+    write_results,
+)
+from web3.tools.benchmark.stub_node import (
+    CALL_RESULT,
+    StubNodeProcess,
+)
+from web3.types import (
+    RPCEndpoint,
+)
+
+LAYERS = ("provider", "manager", "middleware", "formatters", "contract")
+
+ERC20_BALANCE_OF_ABI = [
+    {
+        "type": "function",
+        "name": "balanceOf",
+        "stateMutability": "view",
+        "inputs": [{"name": "owner", "type": "address"}],
+        "outputs": [{"name": "", "type": "uint256"}],
+    }
+]
+TOKEN_ADDRESS = ChecksumAddress(
+    HexAddress(HexStr("0x6B175474E89094C44Da98b954EedeAC495271d0F"))
+)
+OWNER_ADDRESS = ChecksumAddress(
+    HexAddress(HexStr("0xd3CdA913deB6f67967B99D67aCDFa1712C293601"))
+)
+# the calldata of ``balanceOf(0x0000000000000000000000000000000000000000)``
+BALANCE_OF_DATA = HexStr("0x70a08231" + "00" * 32)
+
+parser = argparse.ArgumentParser()
+parser.add_argument(
+    "--num-calls",
+    type=int,
+    default=100,
+    help="The number of calls to time for each benchmark, in each round",
+)
+parser.add_argument(
+    "--rounds",
+    type=int,
+    default=5,
+    help="The number of rounds to time each benchmark for, the median is reported",
+)
+parser.add_argument("--layers", nargs="+", choices=LAYERS, default=LAYERS)
+parser.add_argument(
+    "--latency",
+    type=float,
+    default=0.0,
+    help="The time, in seconds, the stub node waits before each response",
+)
+parser.add_argument(
+    "--num-transactions",
+    type=int,
+    default=200,
+    help="The number of transactions in each block served by the stub node",
+)
+add_results_arguments(parser)
+
+
+@dataclass
+class Benchmark:
+    layer: str
+    name: str
+    transport: str
+    # called without arguments, a coroutine function for async transports
+    call: Callable[[], Any]
+
+    @property
+    def key(self) -> str:
+        return f"{self.layer}/{self.name}/{self.transport}"
+
+
+def time_sync(call: Callable[[], Any], num_calls: int, rounds: int) -> float:
+    """
+    The median time of a call across ``rounds``, in microseconds.
+    """
+    call()  # warm up
+    return statistics.median(
+        timeit.timeit(call, number=num_calls) / num_calls * 1_000_000
+        for _ in range(rounds)
+    )
+
+
+async def time_async(
+    call: Callable[[], Awaitable[Any]], num_calls: int, rounds: int
+) -> float:
+    """
+    The median time of a call, awaited one at a time, across ``rounds``, in
+    microseconds.
+    """
+    await call()  # warm up
+    timings = []
+    for _ in range(rounds):
+        start = timeit.default_timer()
+        for _ in range(num_calls):
+            await call()
+        timings.append((timeit.default_timer() - start) / num_calls * 1_000_000)
+    return statistics.median(timings)
+
+
+def offline_benchmarks() -> list[Benchmark]:
+    """
+    The layers that don't make requests: result formatting and contract call
+    encoding and decoding.
+    """
+    w3 = Web3()
+    block: Any = build_block()
+    block_formatter = get_result_formatters(RPC.eth_getBlockByNumber, w3.eth)
+    token = w3.eth.contract(TOKEN_ADDRESS, abi=ERC20_BALANCE_OF_ABI)
+    call_result = bytes.fromhex(CALL_RESULT[2:])
+    return [
+        Benchmark(
+            "formatters",
+            "eth_getBlockByNumber(full)",
+            "none",
+            lambda: block_formatter(block),
+        ),
+        Benchmark(
+            "contract",
+            "encode balanceOf",
+            "none",
+            lambda: token.functions.balanceOf(OWNER_ADDRESS)._encode_transaction_data(),
+        ),
+        Benchmark(
+            "contract",
+            "decode uint256",
+            "none",
+            lambda: w3.codec.decode(["uint256"], call_result),
+        ),
+    ]
+
+
+def request_benchmarks(w3: Web3 | AsyncWeb3[Any], transport: str) -> list[Benchmark]:
+    """
+    The layers that make requests, through ``w3``. ``w3`` is expected to have the
+    default middleware, an instance without any is used to time the manager alone.
+    """
+    provider = w3.provider
+    bare_w3 = type(w3)(provider, middleware=[])
+    manager_request = (
+        bare_w3.manager.coro_request
+        if isinstance(bare_w3, AsyncWeb3)
+        else bare_w3.manager.request_blocking
+    )
+    token = w3.eth.contract(TOKEN_ADDRESS, abi=ERC20_BALANCE_OF_ABI)
+    get_block_params = ["latest", True]
+    return [
+        Benchmark(
+            "provider",
+            "eth_blockNumber",
+            transport,
+            lambda: provider.make_request(RPCEndpoint("eth_blockNumber"), []),
+        ),
+        Benchmark(
+            "provider",
+            "eth_getBlockByNumber(full)",
+            transport,
+            lambda: provider.make_request(RPC.eth_getBlockByNumber, get_block_params),
+        ),
+        Benchmark(
+            "manager",
+            "eth_getBlockByNumber(full)",
+            transport,
+            lambda: manager_request(RPC.eth_getBlockByNumber, get_block_params),
+        ),
+        Benchmark(
+            "middleware",
+            "eth_getBlockByNumber(full)",
+            transport,
+            lambda: w3.eth.get_block("latest", True),
+        ),
+        Benchmark(
+            "middleware",
+            "eth_call",
+            transport,
+            lambda: w3.eth.call({"to": TOKEN_ADDRESS, "data": BALANCE_OF_DATA}),
+        ),
+        Benchmark(
+            "contract",
+            "balanceOf().call()",
+            transport,
+            lambda: token.functions.balanceOf(OWNER_ADDRESS).call(),
+        ),
+    ]
+
+
+def run_benchmarks(
+    logger: logging.Logger, node: StubNodeProcess, args: argparse.Namespace
+) -> dict[str, float]:
+    results: dict[str, float] = {}
+    sync_benchmarks = [
+        *offline_benchmarks(),
+        *request_benchmarks(Web3(HTTPProvider(node.endpoint_uri)), "HTTPProvider"),
+        *request_benchmarks(Web3(IPCProvider(node.ipc_path)), "IPCProvider"),
+    ]
+    for benchmark in sync_benchmarks:
+        if benchmark.layer in args.layers:
+            results[benchmark.key] = time_sync(
+                benchmark.call, args.num_calls, args.rounds
+            )
+            log_result(logger, benchmark.key, results[benchmark.key])
+
+    async def run_async_benchmarks(async_benchmarks: list[Benchmark]) -> None:
+        for benchmark in async_benchmarks:
+            if benchmark.layer in args.layers:
+                results[benchmark.key] = await time_async(
+                    benchmark.call, args.num_calls, args.rounds
+                )
+                log_result(logger, benchmark.key, results[benchmark.key])
+
+    async def run_async_providers() -> None:
+        async_w3 = AsyncWeb3(AsyncHTTPProvider(node.endpoint_uri))
+        try:
+            await run_async_benchmarks(
+                request_benchmarks(async_w3, "AsyncHTTPProvider")
+            )
+        finally:
+            await async_w3.provider.disconnect()
+
+        async with AsyncWeb3(WebSocketProvider(node.ws_endpoint_uri)) as ws_w3:
+            await run_async_benchmarks(request_benchmarks(ws_w3, "WebSocketProvider"))
+
+    asyncio.run(run_async_providers())
+    return results
+
+
+def log_result(logger: logging.Logger, key: str, per_call: float) -> None:
+    logger.info("|{:<70}|{:>14.2f}|".format(key, per_call))
+
+
+def main(logger: logging.Logger, args: argparse.Namespace) -> int:
+    logger.info("|{:<70}|{:>14}|".format("Benchmark", "us / call"))
+    logger.info("-" * 87)
+    with StubNodeProcess(
+        latency=args.latency, num_transactions=args.num_transactions
+    ) as node:
+        results = run_benchmarks(logger, node, args)
+    logger.info("-" * 87)
+
+    if args.output:
+        write_results(
+            args.output,
+            results,
+            num_calls=args.num_calls,
+            rounds=args.rounds,
+            latency=args.latency,
+            num_transactions=args.num_transactions,
+        )
+    if args.compare and compare_to_baseline(
+        logger, results, args.compare, args.max_regression
+    ):
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+
+    logger = logging.getLogger()
+    logger.setLevel(logging.INFO)
+    logger.addHandler(logging.StreamHandler(sys.stdout))
+
+    sys.exit(main(logger, args))
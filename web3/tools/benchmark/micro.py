@@ -0,0 +1,304 @@
+"""
+CPU micro-benchmarks of the pure-Python hot paths of the client, on mainnet-shaped
+payloads. Each is reported in operations per second and in the memory allocated
+at the peak of an operation, as traced by ``tracemalloc``.
+"""
+import argparse
+from dataclasses import (
+    dataclass,
+)
+import gc
+import logging
+import statistics
+import sys
+import threading
+import timeit
+import tracemalloc
+from typing import (
+    Any,
+    Callable,
+)
+
+from eth_abi.codec import (
+    ABICodec,
+)
+from eth_utils import (
+    event_abi_to_log_topic,
+    to_checksum_address,
+)
+
+from ens._normalization import (
+    normalize_name_ensip15,
+)
+from web3 import (
+    Web3,
+)
+from web3._utils.abi import (
+    map_abi_data,
+)
+from web3._utils.caching import (
+    generate_cache_key,
+)
+from web3._utils.contracts import (
+    encode_transaction_data,
+)
+from web3._utils.events import (
+    get_event_data,
+)
+from web3._utils.method_formatters import (
+    get_result_formatters,
+)
+from web3._utils.normalizers import (
+    abi_address_to_hex,
+    abi_bytes_to_bytes,
+    abi_string_to_text,
+)
+from web3._utils.rpc_abi import (
+    RPC,
+)
+from web3.datastructures import (
+    AttributeDict,
+)
+from web3.tools.benchmark.payloads import (
+    build_block,
+    build_block_receipts,
+    build_log,
+    build_logs,
+)
+from web3.tools.benchmark.reporting import (
+    add_results_arguments,
+    compare_to_baseline,
+    write_results,
+)
+
+TRANSFER_EVENT_ABI: Any = {
+    "type": "event",
+    "name": "Transfer",
+    "anonymous": False,
+    "inputs": [
+        {"name": "from", "type": "address", "indexed": True},
+        {"name": "to", "type": "address", "indexed": True},
+        {"name": "value", "type": "uint256", "indexed": False},
+    ],
+}
+
+# ``submit((address,uint256,(bytes32,address[],(string,bool)[])[]))``
+ORDER_COMPONENTS: Any = [
+    {"name": "owner", "type": "address"},
+    {"name": "amount", "type": "uint256"},
+    {
+        "name": "legs",
+        "type": "tuple[]",
+        "components": [
+            {"name": "id", "type": "bytes32"},
+            {"name": "route", "type": "address[]"},
+            {
+                "name": "notes",
+                "type": "tuple[]",
+                "components": [
+                    {"name": "text", "type": "string"},
+                    {"name": "final", "type": "bool"},
+                ],
+            },
+        ],
+    },
+]
+NESTED_TUPLE_ABI: Any = [
+    {
+        "type": "function",
+        "name": "submit",
+        "stateMutability": "nonpayable",
+        "inputs": [{"name": "order", "type": "tuple", "components": ORDER_COMPONENTS}],
+        "outputs": [],
+    }
+]
+ORDER_TYPE = "(address,uint256,(bytes32,address[],(string,bool)[])[])"
+
+parser = argparse.ArgumentParser()
+parser.add_argument(
+    "--num-calls",
+    type=int,
+    default=20,
+    help="The number of operations to time for each benchmark, in each round",
+)
+parser.add_argument(
+    "--rounds",
+    type=int,
+    default=5,
+    help="The number of rounds to time each benchmark for, the median is reported",
+)
+parser.add_argument(
+    "--filter", help="Only run the benchmarks with this string in their name"
+)
+add_results_arguments(parser)
+
+
+@dataclass
+class MicroBenchmark:
+    name: str
+    call: Callable[[], Any]
+
+
+def time_per_op(call: Callable[[], Any], num_calls: int, rounds: int) -> float:
+    """
+    The median time of an operation across ``rounds``, in microseconds.
+    """
+    call()  # warm up
+    return statistics.median(
+        timeit.timeit(call, number=num_calls) / num_calls * 1_000_000
+        for _ in range(rounds)
+    )
+
+
+def peak_allocated_per_op(call: Callable[[], Any]) -> float:
+    """
+    The memory allocated at the peak of an operation, in KiB, including what is
+    freed before it returns.
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before, _peak = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        call()
+        _current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return (peak - before) / 1024
+
+
+def _order(seed: int, num_legs: int = 8) -> dict[str, Any]:
+    return {
+        "owner": to_checksum_address(f"0x{seed:040x}"),
+        "amount": seed * 10**18,
+        "legs": [
+            {
+                "id": f"0x{leg:064x}",
+                "route": [
+                    to_checksum_address(f"0x{leg + hop:040x}") for hop in range(4)
+                ],
+                "notes": [
+                    {"text": f"leg {leg} note {n}", "final": n == 2} for n in range(3)
+                ],
+            }
+            for leg in range(num_legs)
+        ],
+    }
+
+
+def _transfer_log(w3: Web3, seed: int) -> Any:
+    log_formatter = get_result_formatters(RPC.eth_getTransactionReceipt, w3.eth)
+    receipt: Any = build_block_receipts(num_transactions=1)[0]
+    log = build_log(20_000_000, seed)
+    log["topics"] = [
+        "0x" + event_abi_to_log_topic(TRANSFER_EVENT_ABI).hex(),
+        "0x" + f"{seed + 1:064x}",
+        "0x" + f"{seed + 2:064x}",
+    ]
+    log["data"] = "0x" + f"{seed * 10**18:064x}"
+    receipt["logs"] = [log]
+    return log_formatter(receipt)["logs"][0]
+
+
+def micro_benchmarks() -> list[MicroBenchmark]:
+    w3 = Web3()
+    codec: ABICodec = w3.codec
+
+    block: Any = build_block()
+    logs: Any = build_logs()
+    receipts: Any = build_block_receipts()
+    block_formatter = get_result_formatters(RPC.eth_getBlockByNumber, w3.eth)
+    logs_formatter = get_result_formatters(RPC.eth_getLogs, w3.eth)
+    receipts_formatter = get_result_formatters(RPC.eth_getBlockReceipts, w3.eth)
+    formatted_block = dict(block_formatter(block))
+    log_addresses = [log["address"] for log in logs]
+
+    transfer_log = _transfer_log(w3, 7)
+    order = _order(7)
+    input_normalizers = [abi_bytes_to_bytes, abi_address_to_hex, abi_string_to_text]
+    # keyed as by the request caching
+    request = ("eth_getBlockByNumber", [hex(20_000_000), True])
+    thread_id = threading.get_ident()
+
+    return [
+        MicroBenchmark(
+            "generate_cache_key(request)",
+            lambda: generate_cache_key(f"{thread_id}:{request}"),
+        ),
+        MicroBenchmark("generate_cache_key(block)", lambda: generate_cache_key(block)),
+        MicroBenchmark(
+            "get_event_data(Transfer)",
+            lambda: get_event_data(codec, TRANSFER_EVENT_ABI, transfer_log),
+        ),
+        MicroBenchmark(
+            "map_abi_data(nested tuple)",
+            lambda: map_abi_data(input_normalizers, [ORDER_TYPE], [order]),
+        ),
+        MicroBenchmark(
+            "encode_transaction_data(nested tuple)",
+            lambda: encode_transaction_data(
+                w3, "submit", NESTED_TUPLE_ABI, args=[order], kwargs={}
+            ),
+        ),
+        MicroBenchmark(
+            "format eth_getBlockByNumber(full)", lambda: block_formatter(block)
+        ),
+        MicroBenchmark("format eth_getLogs (10k logs)", lambda: logs_formatter(logs)),
+        MicroBenchmark(
+            "format eth_getBlockReceipts", lambda: receipts_formatter(receipts)
+        ),
+        MicroBenchmark(
+            "AttributeDict.recursive(block)",
+            lambda: AttributeDict.recursive(formatted_block),
+        ),
+        MicroBenchmark(
+            "to_checksum_address (10k log addresses)",
+            lambda: [to_checksum_address(address) for address in log_addresses],
+        ),
+        MicroBenchmark(
+            "normalize_name_ensip15",
+            lambda: normalize_name_ensip15("Sub.Domain-Name.Web3Py.ETH"),
+        ),
+    ]
+
+
+def main(logger: logging.Logger, args: argparse.Namespace) -> int:
+    logger.info(
+        "|{:^42}|{:^16}|{:^16}|{:^18}|".format(
+            f"Benchmark ({args.num_calls} ops)", "us / op", "ops / sec", "peak KiB / op"
+        )
+    )
+    logger.info("-" * 96)
+    results: dict[str, float] = {}
+    for benchmark in micro_benchmarks():
+        if args.filter and args.filter not in benchmark.name:
+            continue
+        per_op = time_per_op(benchmark.call, args.num_calls, args.rounds)
+        allocated = peak_allocated_per_op(benchmark.call)
+        results[benchmark.name] = per_op
+        logger.info(
+            "|{:<42}|{:>16.2f}|{:>16.1f}|{:>18.1f}|".format(
+                benchmark.name, per_op, 1_000_000 / per_op, allocated
+            )
+        )
+    logger.info("-" * 96)
+
+    if args.output:
+        write_results(
+            args.output, results, num_calls=args.num_calls, rounds=args.rounds
+        )
+    if args.compare and compare_to_baseline(
+        logger, results, args.compare, args.max_regression
+    ):
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+
+    logger = logging.getLogger()
+    logger.setLevel(logging.INFO)
+    logger.addHandler(logging.StreamHandler(sys.stdout))
+
+    sys.exit(main(logger, args))
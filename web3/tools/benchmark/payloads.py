@@ -0,0 +1,149 @@
+"""
+Deterministic, mainnet-shaped JSON-RPC result payloads for offline benchmarks.
+"""
+from typing import (
+    Any,
+)
+
+
+def _hex_data(seed: int, num_bytes: int) -> str:
+    return "0x" + (f"{seed:064x}" * (num_bytes // 32 + 1))[: num_bytes * 2]
+
+
+def _address(seed: int) -> str:
+    # lowercase, non-checksummed addresses as returned by a node
+    return "0x" + f"{seed:040x}"
+
+
+def build_transaction(
+    block_number: int, index: int, block_hash: str | None = None
+) -> dict[str, Any]:
+    seed = block_number * 1000 + index
+    return {
+        "blockHash": block_hash or _hex_data(block_number, 32),
+        "blockNumber": hex(block_number),
+        "from": _address(seed % 97 + 1),
+        "gas": hex(21000 + seed % 500000),
+        "gasPrice": hex(30_000_000_000 + seed),
+        "maxFeePerGas": hex(40_000_000_000 + seed),
+        "maxPriorityFeePerGas": hex(1_000_000_000),
+        "hash": _hex_data(seed + 7, 32),
+        "input": _hex_data(seed, 4 + 32 * (seed % 5)),
+        "nonce": hex(seed % 10000),
+        "to": _address(seed % 31 + 1),
+        "transactionIndex": hex(index),
+        "value": hex(seed * 10**12),
+        "type": "0x2",
+        "accessList": [],
+        "chainId": "0x1",
+        "v": "0x1",
+        "yParity": "0x1",
+        "r": _hex_data(seed + 1, 32),
+        "s": _hex_data(seed + 2, 32),
+    }
+
+
+def build_block(
+    block_number: int = 20_000_000,
+    num_transactions: int = 200,
+    full_transactions: bool = True,
+) -> dict[str, Any]:
+    block_hash = _hex_data(block_number, 32)
+    transactions: list[Any] = [
+        build_transaction(block_number, index, block_hash)
+        if full_transactions
+        else _hex_data(block_number * 1000 + index + 7, 32)
+        for index in range(num_transactions)
+    ]
+    return {
+        "baseFeePerGas": hex(7_000_000_000),
+        "blobGasUsed": "0x0",
+        "difficulty": "0x0",
+        "excessBlobGas": "0x0",
+        "extraData": _hex_data(block_number, 16),
+        "gasLimit": hex(30_000_000),
+        "gasUsed": hex(12_345_678),
+        "hash": block_hash,
+        "logsBloom": _hex_data(block_number, 256),
+        "miner": _address(block_number % 13 + 1),
+        "mixHash": _hex_data(block_number + 1, 32),
+        "nonce": "0x0000000000000000",
+        "number": hex(block_number),
+        "parentBeaconBlockRoot": _hex_data(block_number + 2, 32),
+        "parentHash": _hex_data(block_number - 1, 32),
+        "receiptsRoot": _hex_data(block_number + 3, 32),
+        "sha3Uncles": _hex_data(block_number + 4, 32),
+        "size": hex(150_000),
+        "stateRoot": _hex_data(block_number + 5, 32),
+        "timestamp": hex(1_700_000_000 + block_number * 12),
+        "transactions": transactions,
+        "transactionsRoot": _hex_data(block_number + 6, 32),
+        "uncles": [],
+        "withdrawals": [
+            {
+                "index": hex(index),
+                "validatorIndex": hex(100_000 + index),
+                "address": _address(index + 1),
+                "amount": hex(10**7 + index),
+            }
+            for index in range(16)
+        ],
+        "withdrawalsRoot": _hex_data(block_number + 8, 32),
+    }
+
+
+def build_log(block_number: int, log_index: int) -> dict[str, Any]:
+    seed = block_number * 1000 + log_index
+    return {
+        "address": _address(seed % 17 + 1),
+        "blockHash": _hex_data(block_number, 32),
+        "blockNumber": hex(block_number),
+        "data": _hex_data(seed, 64),
+        "logIndex": hex(log_index),
+        "removed": False,
+        "topics": [
+            "0xddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef",
+            _hex_data(seed + 1, 32),
+            _hex_data(seed + 2, 32),
+        ],
+        "transactionHash": _hex_data(seed + 7, 32),
+        "transactionIndex": hex(log_index % 200),
+    }
+
+
+def build_logs(
+    num_logs: int = 10_000, from_block: int = 20_000_000, logs_per_block: int = 250
+) -> list[dict[str, Any]]:
+    return [
+        build_log(from_block + index // logs_per_block, index % logs_per_block)
+        for index in range(num_logs)
+    ]
+
+
+def build_receipt(block_number: int, index: int, num_logs: int = 4) -> dict[str, Any]:
+    seed = block_number * 1000 + index
+    return {
+        "blockHash": _hex_data(block_number, 32),
+        "blockNumber": hex(block_number),
+        "contractAddress": None,
+        "cumulativeGasUsed": hex(21000 * (index + 1)),
+        "effectiveGasPrice": hex(30_000_000_000),
+        "from": _address(seed % 97 + 1),
+        "gasUsed": hex(21000 + seed % 100000),
+        "logs": [
+            build_log(block_number, index * num_logs + log_index)
+            for log_index in range(num_logs)
+        ],
+        "logsBloom": _hex_data(seed, 256),
+        "status": "0x1",
+        "to": _address(seed % 31 + 1),
+        "transactionHash": _hex_data(seed + 7, 32),
+        "transactionIndex": hex(index),
+        "type": "0x2",
+    }
+
+
+def build_block_receipts(
+    block_number: int = 20_000_000, num_transactions: int = 200
+) -> list[dict[str, Any]]:
+    return [build_receipt(block_number, index) for index in range(num_transactions)]
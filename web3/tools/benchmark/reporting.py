@@ -1,10 +1,15 @@
+import argparse
+import json
 from logging import (
     Logger,
 )
+import platform
 from typing import (
     Any,
 )
 
+import web3
+
 
 def print_header(logger: Logger, num_calls: int) -> None:
     logger.info(
@@ -36,3 +41,91 @@ def print_entry(
 
 def print_footer(logger: Logger) -> None:
     logger.info("-" * 112)
+
+
+def add_results_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--output", help="Write the results to this JSON file")
+    parser.add_argument(
+        "--compare",
+        help="Compare the results to those in this JSON file, written with --output",
+    )
+    parser.add_argument(
+        "--max-regression",
+        type=float,
+        default=0.1,
+        help="With --compare, exit with an error if any benchmark is slower than its "
+        "baseline by more than this fraction",
+    )
+
+
+def write_results(path: str, results: dict[str, float], **metadata: Any) -> None:
+    """
+    Write ``results``, the time per call in microseconds of each benchmark, to a
+    JSON file with ``metadata`` about the run.
+    """
+    with open(path, "w") as file:
+        json.dump(
+            {
+                "metadata": {
+                    "web3": web3.__version__,
+                    "python": platform.python_version(),
+                    "platform": platform.platform(),
+                    **metadata,
+                },
+                "results": results,
+            },
+            file,
+            indent=2,
+        )
+
+
+def compare_results(
+    logger: Logger,
+    results: dict[str, float],
+    baseline: dict[str, float],
+    max_regression: float,
+) -> list[str]:
+    """
+    Log each result next to its baseline, returning the keys of the results slower
+    than their baseline by more than ``max_regression``.
+    """
+    regressions = []
+    logger.info(
+        "|{:<70}|{:>14}|{:>14}|{:>9}|".format(
+            "Benchmark", "baseline (us)", "current (us)", "change"
+        )
+    )
+    logger.info("-" * 112)
+    for key, per_call in results.items():
+        if key not in baseline:
+            continue
+        change = per_call / baseline[key] - 1
+        regressed = change > max_regression
+        if regressed:
+            regressions.append(key)
+        logger.info(
+            "|{:<70}|{:>14.2f}|{:>14.2f}|{:>+8.1%}{}".format(
+                key, baseline[key], per_call, change, "!" if regressed else "|"
+            )
+        )
+    logger.info("-" * 112)
+    return regressions
+
+
+def compare_to_baseline(
+    logger: Logger, results: dict[str, float], path: str, max_regression: float
+) -> bool:
+    """
+    Compare ``results`` to those in the JSON file at ``path``, returning whether
+    any of them regressed by more than ``max_regression``.
+    """
+    with open(path) as file:
+        baseline = json.load(file)["results"]
+    regressions = compare_results(logger, results, baseline, max_regression)
+    if regressions:
+        logger.info(
+            "%d benchmark(s) regressed by more than %.0f%%",
+            len(regressions),
+            max_regression * 100,
+        )
+    return bool(regressions)
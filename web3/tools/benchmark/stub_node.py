@@ -0,0 +1,274 @@
+"""
+A local JSON-RPC node for offline benchmarks. It serves canned, mainnet-shaped
+responses over HTTP, WebSocket and IPC, after a configurable latency.
+"""
+import argparse
+import asyncio
+import json
+import os
+import socket
+from subprocess import (
+    PIPE,
+    Popen,
+)
+import sys
+from tempfile import (
+    TemporaryDirectory,
+)
+from types import (
+    TracebackType,
+)
+from typing import (
+    Any,
+)
+
+from aiohttp import (
+    WSMsgType,
+    web,
+)
+from typing_extensions import (
+    Self,
+)
+
+from web3.tools.benchmark.payloads import (
+    build_block,
+    build_block_receipts,
+    build_logs,
+)
+from web3.tools.benchmark.utils import (
+    kill_proc_gracefully,
+    wait_for_http,
+    wait_for_socket,
+)
+
+# the result of ``eth_call``, the ABI encoded ``uint256`` 500
+CALL_RESULT = "0x" + f"{500:064x}"
+
+parser = argparse.ArgumentParser()
+parser.add_argument("--host", default="127.0.0.1")
+parser.add_argument("--port", type=int, default=8545)
+parser.add_argument("--ipc-path", help="Also serve requests over this IPC socket")
+parser.add_argument(
+    "--latency",
+    type=float,
+    default=0.0,
+    help="The time, in seconds, to wait before responding to each request",
+)
+parser.add_argument(
+    "--num-transactions",
+    type=int,
+    default=200,
+    help="The number of transactions, and receipts, in each block",
+)
+parser.add_argument(
+    "--num-logs", type=int, default=1000, help="The number of logs from eth_getLogs"
+)
+
+
+def _encode(result: Any) -> bytes:
+    return json.dumps(result, separators=(",", ":")).encode()
+
+
+class StubNode:
+    """
+    Respond to JSON-RPC requests with canned results, encoded once up front so
+    that the node adds as little time as possible to each request besides
+    ``latency``. Methods without a canned result get a "method not found" error.
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        num_transactions: int = 200,
+        num_logs: int = 1000,
+    ) -> None:
+        self.latency = latency
+        block = build_block(num_transactions=num_transactions)
+        block_with_hashes = build_block(
+            num_transactions=num_transactions, full_transactions=False
+        )
+        self._results = {
+            method: _encode(result)
+            for method, result in (
+                ("web3_clientVersion", "StubNode/v1.0.0"),
+                ("net_version", "1"),
+                ("eth_chainId", "0x1"),
+                ("eth_blockNumber", block["number"]),
+                ("eth_gasPrice", hex(30_000_000_000)),
+                ("eth_maxPriorityFeePerGas", hex(1_000_000_000)),
+                ("eth_getBalance", hex(10**18)),
+                ("eth_getTransactionCount", "0x1"),
+                ("eth_estimateGas", hex(21000)),
+                ("eth_call", CALL_RESULT),
+                ("eth_getLogs", build_logs(num_logs=num_logs)),
+                (
+                    "eth_getBlockReceipts",
+                    build_block_receipts(num_transactions=num_transactions),
+                ),
+            )
+        }
+        self._block_results = {True: _encode(block), False: _encode(block_with_hashes)}
+
+    def result(self, method: str, params: Any) -> bytes | None:
+        if method in ("eth_getBlockByNumber", "eth_getBlockByHash"):
+            return self._block_results[bool(params[1])]
+        return self._results.get(method)
+
+    def _response(self, request: dict[str, Any]) -> bytes:
+        request_id = _encode(request.get("id"))
+        result = self.result(request["method"], request.get("params") or [])
+        if result is None:
+            message = f"the method {request['method']} does not exist/is not available"
+            error = _encode({"code": -32601, "message": message})
+            return b'{"jsonrpc":"2.0","id":' + request_id + b',"error":' + error + b"}"
+        return b'{"jsonrpc":"2.0","id":' + request_id + b',"result":' + result + b"}"
+
+    async def respond(self, payload: bytes | str) -> bytes:
+        """
+        The response to a request, or to a batch of requests, after ``latency``.
+        """
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        request = json.loads(payload)
+        if isinstance(request, list):
+            return b"[" + b",".join(self._response(r) for r in request) + b"]"
+        return self._response(request)
+
+    # -- transports -- #
+
+    async def _handle_http(self, request: web.Request) -> web.Response:
+        return web.Response(
+            body=await self.respond(await request.read()),
+            content_type="application/json",
+        )
+
+    async def _handle_websocket(self, request: web.Request) -> web.WebSocketResponse:
+        websocket = web.WebSocketResponse(max_msg_size=0)
+        await websocket.prepare(request)
+
+        async def send_response(payload: str) -> None:
+            await websocket.send_bytes(await self.respond(payload))
+
+        # respond to each request as it is answered, not in the order received
+        tasks = set()
+        async for message in websocket:
+            if message.type in (WSMsgType.TEXT, WSMsgType.BINARY):
+                task = asyncio.create_task(send_response(message.data))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+        return websocket
+
+    async def _handle_ipc(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        decoder = json.JSONDecoder()
+        buffer = ""
+        while chunk := await reader.read(65536):
+            buffer += chunk.decode()
+            while buffer := buffer.lstrip():
+                try:
+                    _request, end = decoder.raw_decode(buffer)
+                except json.JSONDecodeError:
+                    # wait for the rest of the request
+                    break
+                request, buffer = buffer[:end], buffer[end:]
+                writer.write(await self.respond(request) + b"\n")
+                await writer.drain()
+        writer.close()
+
+    def application(self) -> web.Application:
+        app = web.Application(client_max_size=0)
+        app.router.add_post("/", self._handle_http)
+        app.router.add_get("/ws", self._handle_websocket)
+        return app
+
+    async def serve(self, host: str, port: int, ipc_path: str | None = None) -> None:
+        """
+        Serve HTTP requests at ``http://{host}:{port}``, WebSocket requests at
+        ``ws://{host}:{port}/ws`` and, if ``ipc_path`` is given, IPC requests, until
+        cancelled.
+        """
+        runner = web.AppRunner(self.application(), access_log=None)
+        await runner.setup()
+        ipc_server = None
+        try:
+            await web.TCPSite(runner, host, port).start()
+            if ipc_path is not None:
+                ipc_server = await asyncio.start_unix_server(self._handle_ipc, ipc_path)
+            await asyncio.Event().wait()
+        finally:
+            if ipc_server is not None:
+                ipc_server.close()
+            await runner.cleanup()
+
+
+class StubNodeProcess:
+    """
+    Run a ``StubNode`` in its own process, so that it doesn't compete with the
+    benchmarks for the GIL, for as long as the context manager is open.
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        num_transactions: int = 200,
+        num_logs: int = 1000,
+    ) -> None:
+        self.latency = latency
+        self.num_transactions = num_transactions
+        self.num_logs = num_logs
+
+        sock = socket.socket()
+        sock.bind(("127.0.0.1", 0))
+        self.port = sock.getsockname()[1]
+        sock.close()
+        self.endpoint_uri = f"http://127.0.0.1:{self.port}"
+        self.ws_endpoint_uri = f"ws://127.0.0.1:{self.port}/ws"
+
+        self._tmp_dir = TemporaryDirectory()
+        self.ipc_path = os.path.join(self._tmp_dir.name, "stub.ipc")
+        self._proc: Popen[bytes] | None = None
+
+    def __enter__(self) -> Self:
+        self._proc = Popen(
+            (
+                sys.executable,
+                "-m",
+                "web3.tools.benchmark.stub_node",
+                "--port",
+                str(self.port),
+                "--ipc-path",
+                self.ipc_path,
+                "--latency",
+                str(self.latency),
+                "--num-transactions",
+                str(self.num_transactions),
+                "--num-logs",
+                str(self.num_logs),
+            ),
+            stdin=PIPE,
+            stdout=PIPE,
+            stderr=PIPE,
+        )
+        wait_for_http(self.endpoint_uri)
+        wait_for_socket(self.ipc_path)
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        if self._proc is not None:
+            kill_proc_gracefully(self._proc)
+        self._tmp_dir.cleanup()
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    node = StubNode(args.latency, args.num_transactions, args.num_logs)
+    try:
+        asyncio.run(node.serve(args.host, args.port, args.ipc_path))
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,19 @@
+from .exporter import (
+    BlockExporter,
+    ExportStats,
+)
+from .sinks import (
+    CSVSink,
+    ExportSink,
+    JSONLinesSink,
+    ParquetSink,
+)
+
+__all__ = [
+    "BlockExporter",
+    "CSVSink",
+    "ExportSink",
+    "ExportStats",
+    "JSONLinesSink",
+    "ParquetSink",
+]
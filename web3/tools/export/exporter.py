@@ -0,0 +1,244 @@
+import argparse
+import asyncio
+from collections import (
+    deque,
+)
+from dataclasses import (
+    dataclass,
+    field,
+)
+import logging
+import sys
+import time
+from typing import (
+    Any,
+    Sequence,
+)
+
+from web3 import (
+    AsyncHTTPProvider,
+    AsyncWeb3,
+)
+from web3.tools.export.sinks import (
+    CSVSink,
+    ExportSink,
+    JSONLinesSink,
+    ParquetSink,
+)
+from web3.types import (
+    BlockData,
+    TxReceipt,
+)
+
+
+@dataclass
+class ExportStats:
+    blocks: int = 0
+    transactions: int = 0
+    receipts: int = 0
+    logs: int = 0
+    elapsed: float = 0.0
+    # the (start, end) block ranges that still failed after being retried
+    failed_ranges: list[tuple[int, int]] = field(default_factory=list)
+
+    @property
+    def blocks_per_second(self) -> float:
+        return self.blocks / self.elapsed if self.elapsed else 0.0
+
+
+@dataclass
+class _ExportedRange:
+    start: int
+    end: int
+    # None if the range failed to be fetched
+    blocks: Sequence[BlockData] | None
+    receipts: Sequence[Sequence[TxReceipt]]
+
+
+class BlockExporter:
+    """
+    Export blocks, with their transactions, receipts and logs, to an ``ExportSink``.
+
+    Blocks are fetched in ranges of ``blocks_per_task`` blocks, with up to
+    ``concurrency`` ranges in flight, and written in block order. Receipts are
+    fetched with ``get_block_receipts_bulk``. A range that fails is retried up to
+    ``max_retries`` times before being recorded in the returned ``ExportStats`` and
+    skipped.
+    """
+
+    logger = logging.getLogger("web3.tools.export.BlockExporter")
+
+    def __init__(
+        self,
+        w3: "AsyncWeb3[Any]",
+        sink: ExportSink,
+        blocks_per_task: int = 10,
+        concurrency: int = 8,
+        max_retries: int = 3,
+        retry_backoff: float = 0.5,
+        include_receipts: bool = True,
+    ) -> None:
+        self.w3 = w3
+        self.sink = sink
+        self.blocks_per_task = blocks_per_task
+        self.concurrency = concurrency
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.include_receipts = include_receipts
+
+    async def export(self, start_block: int, end_block: int) -> ExportStats:
+        """
+        Export the blocks from ``start_block`` to ``end_block``, inclusive.
+        """
+        stats = ExportStats()
+        started_at = time.perf_counter()
+        pending: deque[asyncio.Task[_ExportedRange]] = deque()
+        try:
+            for start in range(start_block, end_block + 1, self.blocks_per_task):
+                end = min(start + self.blocks_per_task - 1, end_block)
+                if len(pending) >= self.concurrency:
+                    self._write(await pending.popleft(), stats, started_at)
+                pending.append(
+                    asyncio.create_task(self._fetch_range_with_retries(start, end))
+                )
+
+            while pending:
+                self._write(await pending.popleft(), stats, started_at)
+        finally:
+            for task in pending:
+                task.cancel()
+
+        self.sink.flush()
+        stats.elapsed = time.perf_counter() - started_at
+        for start, end in stats.failed_ranges:
+            self.logger.error("Failed to export blocks %d-%d", start, end)
+        return stats
+
+    # -- fetching -- #
+
+    async def _fetch_range_with_retries(self, start: int, end: int) -> _ExportedRange:
+        attempt = 0
+        while True:
+            try:
+                return await self._fetch_range(start, end)
+            except Exception as e:
+                if attempt == self.max_retries:
+                    self.logger.debug(
+                        "Giving up on blocks %d-%d: %r", start, end, e, exc_info=True
+                    )
+                    return _ExportedRange(start, end, None, ())
+
+                backoff = self.retry_backoff * 2**attempt
+                self.logger.debug(
+                    "Retrying blocks %d-%d in %.2fs after: %r", start, end, backoff, e
+                )
+                await asyncio.sleep(backoff)
+                attempt += 1
+
+    async def _fetch_range(self, start: int, end: int) -> _ExportedRange:
+        blocks = await asyncio.gather(
+            *(
+                self.w3.eth.get_block(number, full_transactions=True)
+                for number in range(start, end + 1)
+            )
+        )
+        if not self.include_receipts:
+            return _ExportedRange(start, end, blocks, [() for _ in blocks])
+
+        # blocks without transactions have no receipts to fetch. Receipts are fetched
+        # by hash so a reorg between the two fetches can't pair a block with the
+        # receipts of the block replacing it.
+        hashes = [block["hash"] for block in blocks if block["transactions"]]
+        receipts = dict(zip(hashes, await self.w3.eth.get_block_receipts_bulk(hashes)))
+        return _ExportedRange(
+            start, end, blocks, [receipts.get(block["hash"], ()) for block in blocks]
+        )
+
+    # -- writing -- #
+
+    def _write(
+        self, exported: _ExportedRange, stats: ExportStats, started_at: float
+    ) -> None:
+        if exported.blocks is None:
+            stats.failed_ranges.append((exported.start, exported.end))
+            return
+
+        for block, receipts in zip(exported.blocks, exported.receipts):
+            transactions = block["transactions"]
+            block_row = {
+                key: value for key, value in block.items() if key != "transactions"
+            }
+            block_row["transactionCount"] = len(transactions)
+            self.sink.write("blocks", (block_row,))
+            self.sink.write("transactions", transactions)  # type: ignore[arg-type]
+
+            logs = [log for receipt in receipts for log in receipt["logs"]]
+            self.sink.write(
+                "receipts",
+                (
+                    {key: value for key, value in receipt.items() if key != "logs"}
+                    for receipt in receipts
+                ),
+            )
+            self.sink.write("logs", logs)
+
+            stats.blocks += 1
+            stats.transactions += len(transactions)
+            stats.receipts += len(receipts)
+            stats.logs += len(logs)
+
+        elapsed = time.perf_counter() - started_at
+        self.logger.info(
+            "Exported blocks %d-%d (%d blocks, %.1f blocks/s)",
+            exported.start,
+            exported.end,
+            stats.blocks,
+            stats.blocks / elapsed if elapsed else 0.0,
+        )
+
+
+SINKS: dict[str, type[ExportSink]] = {
+    "jsonl": JSONLinesSink,
+    "csv": CSVSink,
+    "parquet": ParquetSink,
+}
+
+parser = argparse.ArgumentParser()
+parser.add_argument("start_block", type=int, help="The first block to export")
+parser.add_argument("end_block", type=int, help="The last block to export")
+parser.add_argument(
+    "--endpoint-uri",
+    default="http://127.0.0.1:8545",
+    help="The HTTP endpoint of the node to export from",
+)
+parser.add_argument(
+    "--output-dir", default="export", help="The directory to write tables to"
+)
+parser.add_argument("--format", choices=sorted(SINKS), default="jsonl")
+parser.add_argument("--row-group-size", type=int, default=10_000)
+parser.add_argument("--blocks-per-task", type=int, default=10)
+parser.add_argument("--concurrency", type=int, default=8)
+parser.add_argument("--max-retries", type=int, default=3)
+
+
+async def main(args: argparse.Namespace) -> ExportStats:
+    w3 = AsyncWeb3(AsyncHTTPProvider(args.endpoint_uri))
+    try:
+        with SINKS[args.format](args.output_dir, args.row_group_size) as sink:
+            exporter = BlockExporter(
+                w3,
+                sink,
+                blocks_per_task=args.blocks_per_task,
+                concurrency=args.concurrency,
+                max_retries=args.max_retries,
+            )
+            return await exporter.export(args.start_block, args.end_block)
+    finally:
+        await w3.provider.disconnect()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, stream=sys.stdout)
+    stats = asyncio.run(main(parser.parse_args()))
+    print(stats)
+    sys.exit(1 if stats.failed_ranges else 0)
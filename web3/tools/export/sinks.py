@@ -0,0 +1,273 @@
+from abc import (
+    ABC,
+    abstractmethod,
+)
+import csv
+import json
+import os
+from types import (
+    TracebackType,
+)
+from typing import (
+    IO,
+    Any,
+    Iterable,
+    Mapping,
+)
+
+from eth_utils import (
+    to_hex,
+)
+from typing_extensions import (
+    Self,
+)
+
+from web3._utils.encoding import (
+    Web3JsonEncoder,
+)
+from web3.exceptions import (
+    Web3ValueError,
+)
+from web3.types import (
+    BlockData,
+    LogReceipt,
+    TxData,
+    TxReceipt,
+)
+
+# integer fields that can exceed 64 bits, written as decimal strings to parquet
+LARGE_INTEGER_FIELDS = frozenset({"value", "totalDifficulty"})
+
+# the fields rows of the tables written by the ``BlockExporter`` can have, which are
+# all columns of those tables even if the first row group has none of them
+TABLE_FIELDS: dict[str, tuple[str, ...]] = {
+    "blocks": (
+        *(field for field in BlockData.__annotations__ if field != "transactions"),
+        "transactionCount",
+    ),
+    "transactions": tuple(TxData.__annotations__),
+    "receipts": tuple(field for field in TxReceipt.__annotations__ if field != "logs"),
+    "logs": tuple(LogReceipt.__annotations__),
+}
+
+
+def flat_value(value: Any) -> Any:
+    """
+    Convert a value of an exported row to one that fits in a single column: bytes
+    as hex strings, and lists and mappings as JSON strings.
+    """
+    if isinstance(value, (bytes, bytearray)):
+        return to_hex(value)
+    elif isinstance(value, (Mapping, list, tuple)):
+        return json.dumps(value, cls=Web3JsonEncoder, separators=(",", ":"))
+    return value
+
+
+class ExportSink(ABC):
+    """
+    Where exported rows are written, one file per table in ``output_dir``. Rows are
+    buffered per table and written in row groups of ``row_group_size`` rows.
+    """
+
+    extension: str
+
+    def __init__(self, output_dir: str, row_group_size: int = 10_000) -> None:
+        os.makedirs(output_dir, exist_ok=True)
+        self.output_dir = output_dir
+        self.row_group_size = row_group_size
+        self._buffers: dict[str, list[Mapping[str, Any]]] = {}
+
+    def path(self, table: str) -> str:
+        return os.path.join(self.output_dir, f"{table}.{self.extension}")
+
+    def write(self, table: str, rows: Iterable[Mapping[str, Any]]) -> None:
+        buffer = self._buffers.setdefault(table, [])
+        buffer.extend(rows)
+        if len(buffer) >= self.row_group_size:
+            self._flush_table(table)
+
+    def flush(self) -> None:
+        for table in self._buffers:
+            self._flush_table(table)
+
+    def close(self) -> None:
+        self.flush()
+        self._close()
+
+    def _flush_table(self, table: str) -> None:
+        rows = self._buffers[table]
+        if rows:
+            self._buffers[table] = []
+            self._write_row_group(table, rows)
+
+    @staticmethod
+    def _columns(table: str, rows: list[Mapping[str, Any]]) -> list[str]:
+        """
+        The columns of ``table``, from its first row group: the keys of its rows in
+        the order they're seen, followed by the other fields the table can have.
+        """
+        columns = dict.fromkeys(key for row in rows for key in row)
+        columns.update(dict.fromkeys(TABLE_FIELDS.get(table, ())))
+        return list(columns)
+
+    @staticmethod
+    def _validate_columns(
+        table: str, columns: Iterable[str], rows: list[Mapping[str, Any]]
+    ) -> None:
+        unknown = {key for row in rows for key in row}.difference(columns)
+        if unknown:
+            raise Web3ValueError(
+                f"Rows of table {table!r} have fields that are not columns of the "
+                f"table: {sorted(unknown)}"
+            )
+
+    @abstractmethod
+    def _write_row_group(self, table: str, rows: list[Mapping[str, Any]]) -> None:
+        raise NotImplementedError("Sinks must implement this method")
+
+    @abstractmethod
+    def _close(self) -> None:
+        raise NotImplementedError("Sinks must implement this method")
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+
+class JSONLinesSink(ExportSink):
+    """
+    Write each row as a JSON object on its own line, keeping nested values.
+    """
+
+    extension = "jsonl"
+
+    def __init__(self, output_dir: str, row_group_size: int = 10_000) -> None:
+        super().__init__(output_dir, row_group_size)
+        self._files: dict[str, IO[str]] = {}
+
+    def _write_row_group(self, table: str, rows: list[Mapping[str, Any]]) -> None:
+        if table not in self._files:
+            self._files[table] = open(self.path(table), "w")
+        self._files[table].write(
+            "".join(
+                json.dumps(row, cls=Web3JsonEncoder, separators=(",", ":")) + "\n"
+                for row in rows
+            )
+        )
+
+    def _close(self) -> None:
+        for file in self._files.values():
+            file.close()
+        self._files.clear()
+
+
+class CSVSink(ExportSink):
+    """
+    Write rows as CSV, with nested values as JSON strings. The columns of a table are
+    the keys of its first row group and the other fields it can have.
+    """
+
+    extension = "csv"
+
+    def __init__(self, output_dir: str, row_group_size: int = 10_000) -> None:
+        super().__init__(output_dir, row_group_size)
+        self._files: dict[str, IO[str]] = {}
+        self._writers: dict[str, "csv.DictWriter[str]"] = {}
+
+    def _write_row_group(self, table: str, rows: list[Mapping[str, Any]]) -> None:
+        writer = self._writers.get(table)
+        if writer is None:
+            self._files[table] = open(self.path(table), "w", newline="")
+            writer = csv.DictWriter(
+                self._files[table], self._columns(table, rows), restval=""
+            )
+            writer.writeheader()
+            self._writers[table] = writer
+
+        self._validate_columns(table, writer.fieldnames, rows)
+        writer.writerows(
+            {key: flat_value(value) for key, value in row.items()} for row in rows
+        )
+
+    def _close(self) -> None:
+        for file in self._files.values():
+            file.close()
+        self._files.clear()
+        self._writers.clear()
+
+
+class ParquetSink(ExportSink):
+    """
+    Write rows to parquet, each row group as a parquet row group, with nested values
+    as JSON strings. The schema of a table is inferred from its first row group, with
+    the other fields it can have as string columns. Requires ``pyarrow``.
+    """
+
+    extension = "parquet"
+
+    def __init__(self, output_dir: str, row_group_size: int = 10_000) -> None:
+        # do not import pyarrow until runtime, it is not a default dependency
+        import pyarrow  # noqa: F401
+
+        super().__init__(output_dir, row_group_size)
+        self._writers: dict[str, Any] = {}
+
+    def _write_row_group(self, table: str, rows: list[Mapping[str, Any]]) -> None:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        flat_rows = [
+            {
+                key: (
+                    str(value)
+                    if key in LARGE_INTEGER_FIELDS and isinstance(value, int)
+                    else flat_value(value)
+                )
+                for key, value in row.items()
+            }
+            for row in rows
+        ]
+
+        writer = self._writers.get(table)
+        if writer is None:
+            inferred_schema = pa.Table.from_pylist(flat_rows).schema
+            # columns without a value in the first row group are written as strings
+            schema = pa.schema(
+                (
+                    pa.field(name, pa.string())
+                    if name not in inferred_schema.names
+                    or pa.types.is_null(inferred_schema.field(name).type)
+                    else inferred_schema.field(name)
+                )
+                for name in self._columns(table, rows)
+            )
+            writer = pq.ParquetWriter(self.path(table), schema)
+            self._writers[table] = writer
+
+        self._validate_columns(table, writer.schema.names, rows)
+
+        string_columns = {
+            field.name for field in writer.schema if pa.types.is_string(field.type)
+        }
+        columns = {}
+        for name in writer.schema.names:
+            values = [row.get(name) for row in flat_rows]
+            if name in string_columns:
+                values = [
+                    value if value is None or isinstance(value, str) else str(value)
+                    for value in values
+                ]
+            columns[name] = values
+        writer.write_table(pa.Table.from_pydict(columns, schema=writer.schema))
+
+    def _close(self) -> None:
+        for writer in self._writers.values():
+            writer.close()
+        self._writers.clear()
@@ -12,9 +12,6 @@ from typing import (
     Union,
 )
 
-from eth_account.datastructures import (
-    SignedSetCodeAuthorization,
-)
 from eth_typing import (
     Address,
     BlockNumber,
@@ -35,6 +32,10 @@ from web3._utils.compat import (
 )
 
 if TYPE_CHECKING:
+    from eth_account.datastructures import (  # noqa: F401
+        SignedSetCodeAuthorization,
+    )
+
     from web3.contract.base_contract import (
         BaseContractEvent,
         BaseContractFunction,
@@ -163,7 +164,7 @@ TxParams = TypedDict(
     {
         "accessList": AccessList,
         "authorizationList": Sequence[
-            Union[SetCodeAuthorizationParams, SignedSetCodeAuthorization]
+            Union[SetCodeAuthorizationParams, "SignedSetCodeAuthorization"]
         ],
         "blobVersionedHashes": Sequence[Union[str, HexStr, bytes, HexBytes]],
         "chainId": int,
@@ -561,6 +562,8 @@ CallTrace = TypedDict(
         "revertReason": str,
         "calls": Sequence["CallTrace"],
         "logs": Sequence[CallTraceLog],
+        # only set on the flattened call frames yielded by ``iter_call_frames``
+        "depth": int,
     },
     total=False,
 )
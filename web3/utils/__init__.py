@@ -46,6 +46,20 @@ from .ccip_url_validation import (
 from .exception_handling import (
     handle_offchain_lookup,
 )
+from .fee_defaults_cache import (
+    AsyncFeeDefaultsCache,
+    FeeDefaultsCache,
+)
+from .metrics import (
+    RequestMetrics,
+)
+from .nonce_manager import (
+    AsyncNonceManager,
+    NonceManager,
+)
+from .profiling import (
+    MiddlewareProfiler,
+)
 from .subscriptions import (
     EthSubscription,
 )
@@ -81,4 +95,10 @@ __all__ = [
     "CcipUrlValidator",
     "EthSubscription",
     "handle_offchain_lookup",
+    "AsyncFeeDefaultsCache",
+    "FeeDefaultsCache",
+    "RequestMetrics",
+    "AsyncNonceManager",
+    "NonceManager",
+    "MiddlewareProfiler",
 ]
@@ -2,10 +2,6 @@ from typing import (
     Any,
 )
 
-from aiohttp import (
-    ClientSession,
-    ClientTimeout,
-)
 from eth_abi import (
     abi,
 )
@@ -49,6 +45,12 @@ async def async_handle_offchain_lookup(
             "`sender` value does not equal `to` address in transaction."
         )
 
+    # defer import, aiohttp is only needed to handle offchain lookups
+    from aiohttp import (
+        ClientSession,
+        ClientTimeout,
+    )
+
     session = ClientSession()
     for url in offchain_lookup_payload["urls"]:
         formatted_url = URI(
@@ -20,6 +20,11 @@ class SimpleCache:
     def __init__(self, size: int = 100):
         self._size = size
         self._data: OrderedDict[str, Any] = OrderedDict()
+        # lookups with ``get_cache_entry`` that found an entry, or didn't, and entries
+        # evicted to make room for new ones
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
 
     def __contains__(self, key: str) -> bool:
         return key in self._data
@@ -37,6 +42,7 @@ class SimpleCache:
             while len(self._data) >= self._size:
                 k, v = self._data.popitem(last=False)
                 evicted_items[k] = v
+            self.evictions += len(evicted_items)
         self._data[key] = value
 
         # Return the cached value along with the evicted items at the same time. No
@@ -44,7 +50,11 @@ class SimpleCache:
         return value, evicted_items or None
 
     def get_cache_entry(self, key: str) -> Any | None:
-        return self._data[key] if key in self._data else None
+        if key in self._data:
+            self.hits += 1
+            return self._data[key]
+        self.misses += 1
+        return None
 
     def clear(self) -> None:
         self._data.clear()
@@ -8,7 +8,6 @@ from eth_abi import (
 from eth_typing import (
     URI,
 )
-import requests
 
 from web3._utils.http import (
     DEFAULT_HTTP_TIMEOUT,
@@ -46,6 +45,9 @@ def handle_offchain_lookup(
             "Returned `sender` value does not equal `to` address in transaction."
         )
 
+    # defer import, requests is only needed to handle offchain lookups
+    import requests
+
     session = requests.Session()
     for url in offchain_lookup_payload["urls"]:
         formatted_url = URI(
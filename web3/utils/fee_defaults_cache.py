@@ -0,0 +1,190 @@
+import asyncio
+import threading
+import time
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    NamedTuple,
+)
+
+from web3.types import (
+    BlockData,
+    BlockNumber,
+    Wei,
+)
+
+if TYPE_CHECKING:
+    from web3.main import (  # noqa: F401
+        AsyncWeb3,
+        Web3,
+    )
+
+
+DEFAULT_FEE_DEFAULTS_TTL = 2.0
+
+
+class BlockFees(NamedTuple):
+    block_number: BlockNumber
+    # blocks from before the London fork have no base fee
+    base_fee: Wei | None
+    max_priority_fee: Wei | None
+    fetched_at: float
+
+
+class BaseFeeDefaultsCache:
+    """
+    Caches the fee values used to fill in transaction defaults for the current block.
+
+    The base fee and priority fee are reused until ``ttl`` seconds have passed, after
+    which the latest block is fetched again. The priority fee is only fetched again if
+    a new block was mined in the meantime. Pass new block headers, e.g. from a
+    ``newHeads`` subscription, to ``new_head()`` to invalidate the cache as soon as a
+    block is mined. The chain id is fetched once.
+    """
+
+    def __init__(self, ttl: float = DEFAULT_FEE_DEFAULTS_TTL) -> None:
+        self.ttl = ttl
+        self._block_fees: BlockFees | None = None
+        self._chain_id: int | None = None
+
+    def _is_fresh(self, block_fees: BlockFees) -> bool:
+        return time.monotonic() - block_fees.fetched_at < self.ttl
+
+    def _update_from_block(self, block: BlockData) -> BlockFees:
+        block_fees = self._block_fees
+        max_priority_fee = None
+        if block_fees is not None and block_fees.block_number == block["number"]:
+            # same block, the priority fee still applies
+            max_priority_fee = block_fees.max_priority_fee
+
+        self._block_fees = BlockFees(
+            block["number"],
+            block.get("baseFeePerGas"),
+            max_priority_fee,
+            time.monotonic(),
+        )
+        return self._block_fees
+
+    def new_head(self, block: BlockData) -> None:
+        """
+        Update the cached base fee from a new block header.
+        """
+        block_fees = self._block_fees
+        if block_fees is None or block["number"] > block_fees.block_number:
+            self._update_from_block(block)
+
+    def invalidate(self) -> None:
+        """
+        Drop the cached fees so that they are fetched again on next use.
+        """
+        self._block_fees = None
+
+
+class FeeDefaultsCache(BaseFeeDefaultsCache):
+    """
+    Thread-safe fee defaults cache for ``Web3`` instances. Attach it with
+    ``w3.eth.set_fee_defaults_cache(FeeDefaultsCache())``.
+    """
+
+    def __init__(self, ttl: float = DEFAULT_FEE_DEFAULTS_TTL) -> None:
+        super().__init__(ttl)
+        self._lock = threading.Lock()
+
+    def _block_fees_for(self, w3: "Web3") -> BlockFees:
+        block_fees = self._block_fees
+        if block_fees is not None and self._is_fresh(block_fees):
+            return block_fees
+
+        with self._lock:
+            # another thread may have refreshed the fees while waiting for the lock
+            block_fees = self._block_fees
+            if block_fees is None or not self._is_fresh(block_fees):
+                block_fees = self._update_from_block(w3.eth.get_block("latest"))
+            return block_fees
+
+    def base_fee(self, w3: "Web3") -> Wei:
+        base_fee = self._block_fees_for(w3).base_fee
+        if base_fee is None:
+            # fails on a block without a base fee, the same as without the cache
+            return w3.eth.get_block("latest")["baseFeePerGas"]
+        return base_fee
+
+    def max_priority_fee(self, w3: "Web3") -> Wei:
+        block_fees = self._block_fees_for(w3)
+        if block_fees.max_priority_fee is not None:
+            return block_fees.max_priority_fee
+
+        with self._lock:
+            if (
+                self._block_fees is not None
+                and self._block_fees.max_priority_fee is not None
+            ):
+                return self._block_fees.max_priority_fee
+
+            max_priority_fee = w3.eth.max_priority_fee
+            if self._block_fees is not None:
+                self._block_fees = self._block_fees._replace(
+                    max_priority_fee=max_priority_fee
+                )
+            return max_priority_fee
+
+    def chain_id(self, w3: "Web3") -> int:
+        if self._chain_id is None:
+            self._chain_id = w3.eth.chain_id
+        return self._chain_id
+
+
+class AsyncFeeDefaultsCache(BaseFeeDefaultsCache):
+    """
+    Task-safe fee defaults cache for ``AsyncWeb3`` instances. Attach it with
+    ``async_w3.eth.set_fee_defaults_cache(AsyncFeeDefaultsCache())``.
+    """
+
+    def __init__(self, ttl: float = DEFAULT_FEE_DEFAULTS_TTL) -> None:
+        super().__init__(ttl)
+        self._lock = asyncio.Lock()
+
+    async def _block_fees_for(self, async_w3: "AsyncWeb3[Any]") -> BlockFees:
+        block_fees = self._block_fees
+        if block_fees is not None and self._is_fresh(block_fees):
+            return block_fees
+
+        async with self._lock:
+            # another task may have refreshed the fees while waiting for the lock
+            block_fees = self._block_fees
+            if block_fees is None or not self._is_fresh(block_fees):
+                block_fees = self._update_from_block(
+                    await async_w3.eth.get_block("latest")
+                )
+            return block_fees
+
+    async def base_fee(self, async_w3: "AsyncWeb3[Any]") -> Wei:
+        base_fee = (await self._block_fees_for(async_w3)).base_fee
+        if base_fee is None:
+            # fails on a block without a base fee, the same as without the cache
+            return (await async_w3.eth.get_block("latest"))["baseFeePerGas"]
+        return base_fee
+
+    async def max_priority_fee(self, async_w3: "AsyncWeb3[Any]") -> Wei:
+        block_fees = await self._block_fees_for(async_w3)
+        if block_fees.max_priority_fee is not None:
+            return block_fees.max_priority_fee
+
+        async with self._lock:
+            if (
+                self._block_fees is not None
+                and self._block_fees.max_priority_fee is not None
+            ):
+                return self._block_fees.max_priority_fee
+
+            max_priority_fee = await async_w3.eth.max_priority_fee
+            if self._block_fees is not None:
+                self._block_fees = self._block_fees._replace(
+                    max_priority_fee=max_priority_fee
+                )
+            return max_priority_fee
+
+    async def chain_id(self, async_w3: "AsyncWeb3[Any]") -> int:
+        if self._chain_id is None:
+            self._chain_id = await async_w3.eth.chain_id
+        return self._chain_id
@@ -0,0 +1,285 @@
+from bisect import (
+    bisect_left,
+)
+from collections import (
+    Counter,
+)
+import threading
+import time
+from types import (
+    TracebackType,
+)
+from typing import (
+    Any,
+    Sequence,
+)
+
+from web3.utils.caching import (
+    SimpleCache,
+)
+
+# upper bounds, in seconds, of the buckets of the request latency histograms
+DEFAULT_LATENCY_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+# the method that batch requests and their responses are recorded under
+BATCH_METHOD = "batch"
+
+
+class LatencyHistogram:
+    """
+    A histogram of request latencies, with the number of requests that took at most
+    each of ``buckets`` seconds, and the total count and time.
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS) -> None:
+        self.buckets = tuple(sorted(buckets))
+        # the last count is for the requests that took longer than every bucket
+        self._bucket_counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, seconds: float) -> None:
+        self._bucket_counts[bisect_left(self.buckets, seconds)] += 1
+        self.count += 1
+        self.sum += seconds
+
+    def cumulative_counts(self) -> list[tuple[float, int]]:
+        """
+        The number of requests that took at most each bucket's upper bound, ending
+        with all of them in the ``inf`` bucket.
+        """
+        counts = []
+        total = 0
+        for bound, count in zip((*self.buckets, float("inf")), self._bucket_counts):
+            total += count
+            counts.append((bound, total))
+        return counts
+
+
+class TrackedRequest:
+    """
+    Records a request with ``RequestMetrics`` while the context manager is open, as
+    an error if it raises or if the response passed to ``response()`` is an error.
+    Requests whose response is received apart from sending them are recorded from
+    ``start()`` to ``finish()`` instead.
+    """
+
+    def __init__(self, metrics: "RequestMetrics", method: str) -> None:
+        self.metrics = metrics
+        self.method = method
+        self.error = False
+
+    def response(self, response: Any) -> Any:
+        """
+        Note the response to the request, returning it.
+        """
+        if isinstance(response, dict):
+            self.error = "error" in response
+        elif isinstance(response, list):
+            self.error = any("error" in item for item in response)
+        return response
+
+    def start(self) -> "TrackedRequest":
+        self.metrics._request_started(self.method)
+        self._started_at = time.perf_counter()
+        return self
+
+    def finish(self, failed: bool = False) -> None:
+        self.metrics._request_finished(
+            self.method, time.perf_counter() - self._started_at, self.error or failed
+        )
+
+    def __enter__(self) -> "TrackedRequest":
+        return self.start()
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        self.finish(exc_type is not None)
+
+
+class RequestMetrics:
+    """
+    Collects metrics about the requests made through a provider: the latency,
+    error count and request and response sizes of each JSON-RPC method, the
+    requests in flight, and the hits, misses and evictions of the provider's caches.
+
+    Pass an instance to a provider's ``metrics`` argument to collect them, and read
+    them with ``snapshot()`` or, in the Prometheus text format, with
+    ``prometheus_text()``.
+    """
+
+    def __init__(self, latency_buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS):
+        self.latency_buckets = latency_buckets
+        self._lock = threading.Lock()
+        self._caches: dict[str, SimpleCache] = {}
+        self._in_flight: Counter[str] = Counter()
+        self.reset()
+
+    def reset(self) -> None:
+        """
+        Reset all the metrics, except for the requests in flight.
+        """
+        with self._lock:
+            self._latencies: dict[str, LatencyHistogram] = {}
+            self._errors: Counter[str] = Counter()
+            self._bytes_sent: Counter[str] = Counter()
+            self._bytes_received: Counter[str] = Counter()
+            for cache in self._caches.values():
+                cache.hits = cache.misses = cache.evictions = 0
+
+    # -- recording -- #
+
+    def track(self, method: str) -> TrackedRequest:
+        return TrackedRequest(self, method)
+
+    def _request_started(self, method: str) -> None:
+        with self._lock:
+            self._in_flight[method] += 1
+
+    def _request_finished(self, method: str, seconds: float, error: bool) -> None:
+        with self._lock:
+            self._in_flight[method] -= 1
+            histogram = self._latencies.get(method)
+            if histogram is None:
+                histogram = self._latencies[method] = LatencyHistogram(
+                    self.latency_buckets
+                )
+            histogram.observe(seconds)
+            if error:
+                self._errors[method] += 1
+
+    def record_bytes_sent(self, method: str, num_bytes: int) -> None:
+        with self._lock:
+            self._bytes_sent[method] += num_bytes
+
+    def record_bytes_received(self, method: str, num_bytes: int) -> None:
+        """
+        Record the size of a response. Responses that can't be matched to a request
+        are recorded with an empty ``method``.
+        """
+        with self._lock:
+            self._bytes_received[method] += num_bytes
+
+    def watch_cache(self, name: str, cache: SimpleCache) -> None:
+        """
+        Include the hits, misses and evictions of ``cache`` in the metrics.
+        """
+        self._caches[name] = cache
+
+    # -- reading -- #
+
+    def snapshot(self) -> dict[str, Any]:
+        """
+        A copy of the current metrics, as plain data.
+        """
+        with self._lock:
+            methods = sorted(
+                {
+                    *self._latencies,
+                    *self._bytes_sent,
+                    *self._bytes_received,
+                }
+            )
+            requests = {}
+            for method in methods:
+                histogram = self._latencies.get(method) or LatencyHistogram(())
+                requests[method] = {
+                    "count": histogram.count,
+                    "errors": self._errors[method],
+                    "latency": {
+                        "sum": histogram.sum,
+                        "buckets": dict(histogram.cumulative_counts()),
+                    },
+                    "bytes_sent": self._bytes_sent[method],
+                    "bytes_received": self._bytes_received[method],
+                }
+            return {
+                "requests": requests,
+                "in_flight": {
+                    method: count for method, count in self._in_flight.items() if count
+                },
+                "caches": {
+                    name: {
+                        "hits": cache.hits,
+                        "misses": cache.misses,
+                        "evictions": cache.evictions,
+                        "size": len(cache),
+                    }
+                    for name, cache in self._caches.items()
+                },
+            }
+
+    def prometheus_text(self, prefix: str = "web3") -> str:
+        """
+        The current metrics in the Prometheus text exposition format.
+        """
+        snapshot = self.snapshot()
+        requests = snapshot["requests"]
+        lines: list[str] = []
+
+        def metric(name: str, kind: str, description: str) -> str:
+            full_name = f"{prefix}_{name}"
+            lines.append(f"# HELP {full_name} {description}")
+            lines.append(f"# TYPE {full_name} {kind}")
+            return full_name
+
+        name = metric(
+            "request_duration_seconds", "histogram", "JSON-RPC request latency."
+        )
+        for method, stats in requests.items():
+            if not stats["count"]:
+                continue
+            for bound, count in stats["latency"]["buckets"].items():
+                le = "+Inf" if bound == float("inf") else repr(float(bound))
+                lines.append(f'{name}_bucket{{method="{method}",le="{le}"}} {count}')
+            lines.append(f'{name}_sum{{method="{method}"}} {stats["latency"]["sum"]}')
+            lines.append(f'{name}_count{{method="{method}"}} {stats["count"]}')
+
+        for key, metric_name, description in (
+            ("errors", "request_errors_total", "JSON-RPC requests that failed."),
+            ("bytes_sent", "request_bytes_total", "Bytes of JSON-RPC requests sent."),
+            (
+                "bytes_received",
+                "response_bytes_total",
+                "Bytes of JSON-RPC responses received.",
+            ),
+        ):
+            name = metric(metric_name, "counter", description)
+            for method, stats in requests.items():
+                lines.append(f'{name}{{method="{method}"}} {stats[key]}')
+
+        name = metric("requests_in_flight", "gauge", "JSON-RPC requests in flight.")
+        for method, count in snapshot["in_flight"].items():
+            lines.append(f'{name}{{method="{method}"}} {count}')
+
+        for key, kind, description in (
+            ("hits", "counter", "Cache lookups that found an entry."),
+            ("misses", "counter", "Cache lookups that found no entry."),
+            ("evictions", "counter", "Entries evicted from a full cache."),
+            ("size", "gauge", "Entries in a cache."),
+        ):
+            name = metric(
+                f"cache_{key}_total" if kind == "counter" else f"cache_{key}",
+                kind,
+                description,
+            )
+            for cache_name, stats in snapshot["caches"].items():
+                lines.append(f'{name}{{cache="{cache_name}"}} {stats[key]}')
+
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,285 @@
+import asyncio
+import re
+import threading
+from typing import (
+    TYPE_CHECKING,
+    Any,
+)
+
+from eth_typing import (
+    ChecksumAddress,
+    HexStr,
+)
+from eth_utils import (
+    to_checksum_address,
+)
+from hexbytes import (
+    HexBytes,
+)
+
+from web3.types import (
+    Nonce,
+)
+
+if TYPE_CHECKING:
+    from web3.main import (  # noqa: F401
+        AsyncWeb3,
+        Web3,
+    )
+
+
+NONCE_ERROR_PATTERN = re.compile(r"nonce too (low|high)", re.IGNORECASE)
+
+
+def is_nonce_error(message: str) -> bool:
+    """
+    Whether an RPC error message signals that the node disagrees with a nonce that
+    was allocated locally.
+    """
+    return NONCE_ERROR_PATTERN.search(message) is not None
+
+
+class BaseNonceManager:
+    """
+    Keeps track of the next nonce to use for each sender so that nonces can be
+    allocated locally, without an ``eth_getTransactionCount`` round trip per
+    transaction.
+
+    Nonces that were allocated but never made it to the node are released and
+    handed out again before any new nonce, so that no gap is left behind.
+    """
+
+    def __init__(self) -> None:
+        self._next_nonce: dict[ChecksumAddress, int] = {}
+        self._released: dict[ChecksumAddress, set[int]] = {}
+        self._pending: dict[ChecksumAddress, dict[int, HexBytes]] = {}
+        # allocated nonces that are neither marked as sent nor released yet
+        self._outstanding: dict[ChecksumAddress, set[int]] = {}
+        # (sender, nonce) of the transactions signed by the signing middleware with
+        # an allocated nonce and not sent yet, keyed by the raw transaction
+        self._signed_nonces: dict[HexStr, tuple[ChecksumAddress, int]] = {}
+
+    @staticmethod
+    def _normalize(address: str) -> ChecksumAddress:
+        return to_checksum_address(address)
+
+    def _set_node_nonce(self, address: ChecksumAddress, node_nonce: int) -> None:
+        """
+        Reset the local state for ``address`` from the node's pending transaction
+        count. Pending transactions the node has already counted are dropped, and any
+        gap left below the remaining pending transactions is refilled first.
+        Nonces that are still being sent are never handed out again.
+        """
+        pending = {
+            nonce: tx_hash
+            for nonce, tx_hash in self._pending.get(address, {}).items()
+            if nonce >= node_nonce
+        }
+        self._pending[address] = pending
+        in_use = set(pending) | self._outstanding.get(address, set())
+        # transactions the node hasn't counted yet may still be queued behind a gap
+        self._next_nonce[address] = max(
+            (nonce + 1 for nonce in in_use if nonce >= node_nonce), default=node_nonce
+        )
+        self._released[address] = set(self._gaps(address, node_nonce))
+
+    def _take_nonce(self, address: ChecksumAddress) -> Nonce:
+        released = self._released.get(address)
+        if released:
+            nonce = min(released)
+            released.remove(nonce)
+        else:
+            nonce = self._next_nonce[address]
+            self._next_nonce[address] = nonce + 1
+        self._outstanding.setdefault(address, set()).add(nonce)
+        return Nonce(nonce)
+
+    def _gaps(self, address: ChecksumAddress, node_nonce: int) -> list[Nonce]:
+        next_nonce = self._next_nonce.get(address, node_nonce)
+        pending = self._pending.get(address, {})
+        outstanding = self._outstanding.get(address, set())
+        return [
+            Nonce(nonce)
+            for nonce in range(node_nonce, next_nonce)
+            if nonce not in pending and nonce not in outstanding
+        ]
+
+    def is_synced(self, address: str) -> bool:
+        return self._normalize(address) in self._next_nonce
+
+    def _mark_sent(
+        self, address: ChecksumAddress, nonce: int, transaction_hash: bytes
+    ) -> None:
+        self._outstanding.get(address, set()).discard(nonce)
+        self._pending.setdefault(address, {})[nonce] = HexBytes(transaction_hash)
+
+    def _release(self, address: ChecksumAddress, nonce: int) -> None:
+        self._outstanding.get(address, set()).discard(nonce)
+        self._pending.get(address, {}).pop(nonce, None)
+        next_nonce = self._next_nonce.get(address, 0)
+        if nonce == next_nonce - 1:
+            self._next_nonce[address] = nonce
+        elif nonce < next_nonce:
+            self._released.setdefault(address, set()).add(nonce)
+
+    def pending_transactions(self, address: str) -> dict[Nonce, HexBytes]:
+        """
+        The transactions sent from ``address`` that the node had not yet counted as
+        of the last synchronization, keyed by nonce.
+        """
+        pending = self._pending.get(self._normalize(address), {})
+        return {Nonce(nonce): tx_hash for nonce, tx_hash in sorted(pending.items())}
+
+
+class NonceManager(BaseNonceManager):
+    """
+    Thread-safe nonce manager for ``Web3`` instances. Attach it with
+    ``w3.eth.set_nonce_manager(NonceManager())``.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._lock = threading.Lock()
+        self._address_locks: dict[ChecksumAddress, threading.Lock] = {}
+
+    def _address_lock(self, address: ChecksumAddress) -> threading.Lock:
+        with self._lock:
+            return self._address_locks.setdefault(address, threading.Lock())
+
+    def mark_sent(self, address: str, nonce: int, transaction_hash: bytes) -> None:
+        """
+        Record that the transaction using ``nonce`` was accepted by the node.
+        """
+        address = self._normalize(address)
+        with self._address_lock(address):
+            self._mark_sent(address, nonce, transaction_hash)
+
+    def release(self, address: str, nonce: int) -> None:
+        """
+        Give back a nonce that was allocated but never accepted by the node, so that
+        it is reused by the next allocation.
+        """
+        address = self._normalize(address)
+        with self._address_lock(address):
+            self._release(address, nonce)
+
+    def _node_nonce(self, w3: "Web3", address: ChecksumAddress) -> int:
+        return w3.eth.get_transaction_count(address, block_identifier="pending")
+
+    def sync(self, w3: "Web3", address: str) -> Nonce:
+        """
+        Synchronize the local state for ``address`` with the node and return the next
+        nonce that will be allocated.
+        """
+        address = self._normalize(address)
+        with self._address_lock(address):
+            self._set_node_nonce(address, self._node_nonce(w3, address))
+            return Nonce(self._next_nonce[address])
+
+    def allocate(self, w3: "Web3", address: str) -> Nonce:
+        """
+        Allocate the next nonce for ``address``, synchronizing with the node the first
+        time the sender is seen.
+        """
+        address = self._normalize(address)
+        with self._address_lock(address):
+            if address not in self._next_nonce:
+                self._set_node_nonce(address, self._node_nonce(w3, address))
+            return self._take_nonce(address)
+
+    def handle_send_error(
+        self, w3: "Web3", address: str, nonce: int, message: str
+    ) -> None:
+        """
+        Handle a failed send of the transaction using ``nonce``. The nonce is
+        released, and the local state is resynchronized with the node on nonce errors.
+        """
+        self.release(address, nonce)
+        if is_nonce_error(message):
+            self.sync(w3, address)
+
+    def gaps(self, w3: "Web3", address: str) -> list[Nonce]:
+        """
+        Nonces between the node's pending transaction count and the next local nonce
+        that were allocated but never accepted by the node.
+        """
+        address = self._normalize(address)
+        with self._address_lock(address):
+            return self._gaps(address, self._node_nonce(w3, address))
+
+
+class AsyncNonceManager(BaseNonceManager):
+    """
+    Task-safe nonce manager for ``AsyncWeb3`` instances. Attach it with
+    ``async_w3.eth.set_nonce_manager(AsyncNonceManager())``.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._address_locks: dict[ChecksumAddress, asyncio.Lock] = {}
+
+    def _address_lock(self, address: ChecksumAddress) -> asyncio.Lock:
+        return self._address_locks.setdefault(address, asyncio.Lock())
+
+    # no awaits happen while the local state is updated, so these don't need a lock
+
+    def mark_sent(self, address: str, nonce: int, transaction_hash: bytes) -> None:
+        """
+        Record that the transaction using ``nonce`` was accepted by the node.
+        """
+        self._mark_sent(self._normalize(address), nonce, transaction_hash)
+
+    def release(self, address: str, nonce: int) -> None:
+        """
+        Give back a nonce that was allocated but never accepted by the node, so that
+        it is reused by the next allocation.
+        """
+        self._release(self._normalize(address), nonce)
+
+    async def _node_nonce(
+        self, async_w3: "AsyncWeb3[Any]", address: ChecksumAddress
+    ) -> int:
+        return await async_w3.eth.get_transaction_count(
+            address, block_identifier="pending"
+        )
+
+    async def sync(self, async_w3: "AsyncWeb3[Any]", address: str) -> Nonce:
+        """
+        Synchronize the local state for ``address`` with the node and return the next
+        nonce that will be allocated.
+        """
+        address = self._normalize(address)
+        async with self._address_lock(address):
+            self._set_node_nonce(address, await self._node_nonce(async_w3, address))
+            return Nonce(self._next_nonce[address])
+
+    async def allocate(self, async_w3: "AsyncWeb3[Any]", address: str) -> Nonce:
+        """
+        Allocate the next nonce for ``address``, synchronizing with the node the first
+        time the sender is seen.
+        """
+        address = self._normalize(address)
+        async with self._address_lock(address):
+            if address not in self._next_nonce:
+                self._set_node_nonce(address, await self._node_nonce(async_w3, address))
+            return self._take_nonce(address)
+
+    async def handle_send_error(
+        self, async_w3: "AsyncWeb3[Any]", address: str, nonce: int, message: str
+    ) -> None:
+        """
+        Handle a failed send of the transaction using ``nonce``. The nonce is
+        released, and the local state is resynchronized with the node on nonce errors.
+        """
+        self.release(address, nonce)
+        if is_nonce_error(message):
+            await self.sync(async_w3, address)
+
+    async def gaps(self, async_w3: "AsyncWeb3[Any]", address: str) -> list[Nonce]:
+        """
+        Nonces between the node's pending transaction count and the next local nonce
+        that were allocated but never accepted by the node.
+        """
+        address = self._normalize(address)
+        async with self._address_lock(address):
+            return self._gaps(address, await self._node_nonce(async_w3, address))
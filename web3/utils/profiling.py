@@ -0,0 +1,241 @@
+from contextvars import (
+    ContextVar,
+)
+import threading
+import time
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Coroutine,
+)
+
+from web3.utils.metrics import (
+    BATCH_METHOD,
+)
+
+# the name the provider's own time is recorded under
+PROVIDER_LAYER = "provider"
+
+
+class _LayerCall:
+    __slots__ = ("started", "inner_started", "inner_seconds")
+
+    def __init__(self) -> None:
+        self.started = time.perf_counter()
+        self.inner_started: float | None = None
+        self.inner_seconds = 0.0
+
+
+# the middleware layer call in progress, in this thread or task
+_current_call: ContextVar[_LayerCall | None] = ContextVar(
+    "middleware_layer_call", default=None
+)
+
+
+def _method_of(args: tuple[Any, ...]) -> str:
+    # requests are called with ``(method, params)``, batches with ``(requests,)``
+    return str(args[0]) if len(args) == 2 else BATCH_METHOD
+
+
+class _LayerStats:
+    __slots__ = ("calls", "request_seconds", "response_seconds")
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.request_seconds = 0.0
+        self.response_seconds = 0.0
+
+
+class MiddlewareProfiler:
+    """
+    Times each layer of the middleware onion, and the provider, for each method.
+
+    The time of a layer is split between its request phase, from when it is called
+    until it calls the next layer, and its response phase, from when the next layer
+    returns until it returns. The time spent in the next layers is left out, but any
+    requests a middleware makes itself, like the ENS lookups of the
+    ``ENSNameToAddressMiddleware``, count towards its own time. A middleware that
+    returns without calling the next layer spends all its time in the request phase.
+
+    Set an instance as a manager's ``middleware_profiler`` to start profiling:
+
+    .. code-block:: python
+
+        w3.manager.middleware_profiler = MiddlewareProfiler()
+        ...
+        print(w3.manager.middleware_profiler.report())
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._stats: dict[tuple[str, str], _LayerStats] = {}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats = {}
+
+    def _record(self, layer: str, method: str, call: _LayerCall) -> None:
+        total = time.perf_counter() - call.started
+        if call.inner_started is None:
+            request_seconds = total
+        else:
+            request_seconds = call.inner_started - call.started
+        with self._lock:
+            stats = self._stats.get((layer, method))
+            if stats is None:
+                stats = self._stats[(layer, method)] = _LayerStats()
+            stats.calls += 1
+            stats.request_seconds += request_seconds
+            stats.response_seconds += total - call.inner_seconds - request_seconds
+
+    # -- sync -- #
+
+    def profile_layer(
+        self,
+        layer: str,
+        wrap: Callable[[Callable[..., Any]], Callable[..., Any]],
+        make_request: Callable[..., Any],
+    ) -> Callable[..., Any]:
+        """
+        Wrap ``make_request`` with a middleware ``wrap`` method, such as
+        ``wrap_make_request``, timing the layer it adds.
+        """
+
+        def next_layer(*args: Any) -> Any:
+            call = _current_call.get()
+            started = time.perf_counter()
+            try:
+                return make_request(*args)
+            finally:
+                if call is not None:
+                    if call.inner_started is None:
+                        call.inner_started = started
+                    call.inner_seconds += time.perf_counter() - started
+
+        wrapped = wrap(next_layer)
+
+        def profiled_layer(*args: Any) -> Any:
+            call = _LayerCall()
+            token = _current_call.set(call)
+            try:
+                return wrapped(*args)
+            finally:
+                _current_call.reset(token)
+                self._record(layer, _method_of(args), call)
+
+        return profiled_layer
+
+    def profile_provider(self, make_request: Callable[..., Any]) -> Callable[..., Any]:
+        def profiled_provider(*args: Any) -> Any:
+            call = _LayerCall()
+            try:
+                return make_request(*args)
+            finally:
+                self._record(PROVIDER_LAYER, _method_of(args), call)
+
+        return profiled_provider
+
+    # -- async -- #
+
+    async def async_profile_layer(
+        self,
+        layer: str,
+        wrap: Callable[
+            [Callable[..., Coroutine[Any, Any, Any]]],
+            Awaitable[Callable[..., Coroutine[Any, Any, Any]]],
+        ],
+        make_request: Callable[..., Coroutine[Any, Any, Any]],
+    ) -> Callable[..., Coroutine[Any, Any, Any]]:
+        """
+        Wrap ``make_request`` with a middleware ``async_wrap`` method, such as
+        ``async_wrap_make_request``, timing the layer it adds.
+        """
+
+        async def next_layer(*args: Any) -> Any:
+            call = _current_call.get()
+            started = time.perf_counter()
+            try:
+                return await make_request(*args)
+            finally:
+                if call is not None:
+                    if call.inner_started is None:
+                        call.inner_started = started
+                    call.inner_seconds += time.perf_counter() - started
+
+        wrapped = await wrap(next_layer)
+
+        async def profiled_layer(*args: Any) -> Any:
+            call = _LayerCall()
+            token = _current_call.set(call)
+            try:
+                return await wrapped(*args)
+            finally:
+                _current_call.reset(token)
+                self._record(layer, _method_of(args), call)
+
+        return profiled_layer
+
+    def async_profile_provider(
+        self, make_request: Callable[..., Coroutine[Any, Any, Any]]
+    ) -> Callable[..., Coroutine[Any, Any, Any]]:
+        async def profiled_provider(*args: Any) -> Any:
+            call = _LayerCall()
+            try:
+                return await make_request(*args)
+            finally:
+                self._record(PROVIDER_LAYER, _method_of(args), call)
+
+        return profiled_provider
+
+    # -- reading -- #
+
+    def snapshot(self, by_method: bool = True) -> list[dict[str, Any]]:
+        """
+        The time spent in each layer, for each method unless ``by_method`` is
+        ``False``, from the most time to the least.
+        """
+        with self._lock:
+            totals: dict[tuple[str, str], _LayerStats] = {}
+            for (layer, method), stats in self._stats.items():
+                key = (layer, method if by_method else "")
+                total = totals.get(key)
+                if total is None:
+                    total = totals[key] = _LayerStats()
+                total.calls += stats.calls
+                total.request_seconds += stats.request_seconds
+                total.response_seconds += stats.response_seconds
+
+        rows = [
+            {
+                "layer": layer,
+                **({"method": method} if by_method else {}),
+                "calls": stats.calls,
+                "request_seconds": stats.request_seconds,
+                "response_seconds": stats.response_seconds,
+                "total_seconds": stats.request_seconds + stats.response_seconds,
+            }
+            for (layer, method), stats in totals.items()
+        ]
+        return sorted(rows, key=lambda row: row["total_seconds"], reverse=True)
+
+    def report(self, by_method: bool = True) -> str:
+        """
+        The ``snapshot()`` as a table, in milliseconds.
+        """
+        header = "|{:<32}|{:<32}|{:>10}|{:>14}|{:>14}|{:>14}|".format(
+            "Layer", "Method", "Calls", "Request ms", "Response ms", "Total ms"
+        )
+        lines = [header, "-" * len(header)]
+        for row in self.snapshot(by_method):
+            lines.append(
+                "|{:<32}|{:<32}|{:>10}|{:>14.3f}|{:>14.3f}|{:>14.3f}|".format(
+                    row["layer"],
+                    row.get("method", "*"),
+                    row["calls"],
+                    row["request_seconds"] * 1000,
+                    row["response_seconds"] * 1000,
+                    row["total_seconds"] * 1000,
+                )
+            )
+        return "\n".join(lines)
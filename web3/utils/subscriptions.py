@@ -1,3 +1,10 @@
+import asyncio
+from concurrent.futures import (
+    Executor,
+)
+from enum import (
+    Enum,
+)
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -7,6 +14,7 @@ from typing import (
     Sequence,
     TypeVar,
     Union,
+    cast,
 )
 
 from eth_typing import (
@@ -26,6 +34,8 @@ from web3.types import (
     BlockData,
     FilterParams,
     LogReceipt,
+    RPCEndpoint,
+    RPCResponse,
     SyncProgress,
     TopicFilter,
     TxData,
@@ -35,6 +45,9 @@ if TYPE_CHECKING:
     from web3 import (
         AsyncWeb3,
     )
+    from web3.providers.persistent import (
+        PersistentConnectionProvider,
+    )
     from web3.providers.persistent.subscription_manager import (
         SubscriptionManager,
     )
@@ -73,8 +86,12 @@ EthSubscriptionHandler = Callable[
 
 def handler_wrapper(
     handler: EthSubscriptionHandler | None,
+    executor: Executor | None = None,
 ) -> EthSubscriptionHandler | None:
-    """Wrap the handler to add bookkeeping and context creation."""
+    """
+    Wrap the handler to add bookkeeping and context creation. With an ``executor``,
+    the handler is a regular function, called in the executor with the result.
+    """
     if handler is None:
         return None
 
@@ -93,15 +110,42 @@ def handler_wrapper(
             sub.handler_call_count,
             sub.manager.total_handler_calls,
         )
-        await handler(context)
+        if executor is None:
+            await handler(context)
+        else:
+            await asyncio.get_running_loop().run_in_executor(
+                executor, cast(Callable[[Any], Any], handler), context.result
+            )
 
     return wrapped_handler
 
 
+class BackpressurePolicy(Enum):
+    """
+    What to do with the messages of a subscription when its queue is full.
+    """
+
+    # wait for the queue to be consumed, holding up the message listener
+    BLOCK = "block"
+    # drop the oldest queued message of the subscription to make room
+    DROP_OLDEST = "drop_oldest"
+    # drop the incoming message
+    DROP_NEWEST = "drop_newest"
+    # keep only the latest message of the subscription queued, e.g. for `newHeads`
+    COALESCE = "coalesce"
+
+
 class EthSubscription(Generic[TSubscriptionResult]):
     _id: HexStr = None
     manager: "SubscriptionManager" = None
 
+    # whether the messages missed while reconnecting can be fetched afterwards
+    _can_backfill: bool = False
+    # the (block number, index in the block) of the last message, when tracked
+    _last_position: tuple[int, int] | None = None
+    # the messages received while the subscription is being backfilled
+    _held_messages: list[RPCResponse] | None = None
+
     def __init__(
         self: TSubscription,
         subscription_params: Sequence[Any] | None = None,
@@ -109,14 +153,18 @@ class EthSubscription(Generic[TSubscriptionResult]):
         handler_context: dict[str, Any] | None = None,
         label: str | None = None,
         parallelize: bool | None = None,
+        backpressure: BackpressurePolicy | None = None,
+        executor: Executor | None = None,
     ) -> None:
         self._subscription_params = subscription_params
-        self._handler = handler_wrapper(handler)
+        self._handler = handler_wrapper(handler, executor)
         self._handler_context = handler_context or {}
         self._label = label
 
         self.parallelize = parallelize
+        self.backpressure = backpressure or BackpressurePolicy.BLOCK
         self.handler_call_count = 0
+        self.dropped_message_count = 0
 
     @property
     def _default_label(self) -> str:
@@ -130,6 +178,8 @@ class EthSubscription(Generic[TSubscriptionResult]):
         handler_context: dict[str, Any] | None = None,
         label: str | None = None,
         parallelize: bool | None = None,
+        backpressure: BackpressurePolicy | None = None,
+        executor: Executor | None = None,
     ) -> "EthSubscription[Any]":
         subscription_type = subscription_params[0]
         subscription_arg = (
@@ -141,6 +191,8 @@ class EthSubscription(Generic[TSubscriptionResult]):
                 handler_context=handler_context,
                 label=label,
                 parallelize=parallelize,
+                backpressure=backpressure,
+                executor=executor,
             )
         elif subscription_type == "logs":
             subscription_arg = subscription_arg or {}
@@ -150,6 +202,8 @@ class EthSubscription(Generic[TSubscriptionResult]):
                 handler_context=handler_context,
                 label=label,
                 parallelize=parallelize,
+                backpressure=backpressure,
+                executor=executor,
             )
         elif subscription_type == "newPendingTransactions":
             subscription_arg = subscription_arg or False
@@ -159,6 +213,8 @@ class EthSubscription(Generic[TSubscriptionResult]):
                 handler_context=handler_context,
                 label=label,
                 parallelize=parallelize,
+                backpressure=backpressure,
+                executor=executor,
             )
         elif subscription_type == "syncing":
             return SyncingSubscription(
@@ -166,6 +222,8 @@ class EthSubscription(Generic[TSubscriptionResult]):
                 handler_context=handler_context,
                 label=label,
                 parallelize=parallelize,
+                backpressure=backpressure,
+                executor=executor,
             )
         else:
             params = (
@@ -179,6 +237,8 @@ class EthSubscription(Generic[TSubscriptionResult]):
                 handler_context=handler_context,
                 label=label,
                 parallelize=parallelize,
+                backpressure=backpressure,
+                executor=executor,
             )
 
     @property
@@ -200,6 +260,39 @@ class EthSubscription(Generic[TSubscriptionResult]):
     async def unsubscribe(self) -> bool:
         return await self.manager.unsubscribe(self)
 
+    # -- backfilling -- #
+
+    def _position(self, result: Any) -> tuple[int, int] | None:
+        """
+        The position in the chain of a raw message result, for subscriptions that
+        can be backfilled.
+        """
+        return None
+
+    def _track_position(self, result: Any) -> None:
+        position = self._position(result)
+        if position is not None:
+            self._last_position = position
+
+    def _is_new(self, result: Any) -> bool:
+        position = self._position(result)
+        return (
+            position is None
+            or self._last_position is None
+            or position > self._last_position
+        )
+
+    async def _backfill_results(
+        self, provider: "PersistentConnectionProvider", from_block: int, to_block: int
+    ) -> list[Any]:
+        """
+        The raw message results missed from ``from_block`` to ``to_block``.
+        """
+        raise NotImplementedError("Must be implemented by subclasses")
+
+    def _backfill_from_block(self) -> int:
+        raise NotImplementedError("Must be implemented by subclasses")
+
 
 LogsSubscriptionContext = EthSubscriptionContext[
     "LogsSubscription", "EthSubscriptionResult"
@@ -208,6 +301,8 @@ LogsSubscriptionHandler = Callable[[LogsSubscriptionContext], Coroutine[Any, Any
 
 
 class LogsSubscription(EthSubscription[LogReceipt]):
+    _can_backfill = True
+
     def __init__(
         self,
         address: None
@@ -217,6 +312,8 @@ class LogsSubscription(EthSubscription[LogReceipt]):
         handler_context: dict[str, Any] | None = None,
         label: str | None = None,
         parallelize: bool | None = None,
+        backpressure: BackpressurePolicy | None = None,
+        executor: Executor | None = None,
     ) -> None:
         self.address = address
         self.topics = topics
@@ -234,8 +331,35 @@ class LogsSubscription(EthSubscription[LogReceipt]):
             handler_context=handler_context,
             label=label,
             parallelize=parallelize,
+            backpressure=backpressure,
+            executor=executor,
         )
 
+    def _position(self, result: Any) -> tuple[int, int] | None:
+        if result.get("removed"):
+            # logs removed by a reorg are always passed on
+            return None
+        return int(result["blockNumber"], 16), int(result["logIndex"], 16)
+
+    def _backfill_from_block(self) -> int:
+        # the rest of the logs of the block of the last log
+        return self._last_position[0]
+
+    async def _backfill_results(
+        self, provider: "PersistentConnectionProvider", from_block: int, to_block: int
+    ) -> list[Any]:
+        response = await provider.make_request(
+            RPCEndpoint("eth_getLogs"),
+            [
+                {
+                    **self.logs_filter,
+                    "fromBlock": hex(from_block),
+                    "toBlock": hex(to_block),
+                }
+            ],
+        )
+        return response.get("result") or []
+
 
 NewHeadsSubscriptionContext = EthSubscriptionContext["NewHeadsSubscription", BlockData]
 NewHeadsSubscriptionHandler = Callable[
@@ -244,12 +368,16 @@ NewHeadsSubscriptionHandler = Callable[
 
 
 class NewHeadsSubscription(EthSubscription[BlockData]):
+    _can_backfill = True
+
     def __init__(
         self,
         label: str | None = None,
         handler: NewHeadsSubscriptionHandler | None = None,
         handler_context: dict[str, Any] | None = None,
         parallelize: bool | None = None,
+        backpressure: BackpressurePolicy | None = None,
+        executor: Executor | None = None,
     ) -> None:
         super().__init__(
             subscription_params=("newHeads",),
@@ -257,7 +385,28 @@ class NewHeadsSubscription(EthSubscription[BlockData]):
             handler_context=handler_context,
             label=label,
             parallelize=parallelize,
+            backpressure=backpressure,
+            executor=executor,
+        )
+
+    def _position(self, result: Any) -> tuple[int, int] | None:
+        return int(result["number"], 16), 0
+
+    def _backfill_from_block(self) -> int:
+        return self._last_position[0] + 1
+
+    async def _backfill_results(
+        self, provider: "PersistentConnectionProvider", from_block: int, to_block: int
+    ) -> list[Any]:
+        responses = await asyncio.gather(
+            *(
+                provider.make_request(
+                    RPCEndpoint("eth_getBlockByNumber"), [hex(number), False]
+                )
+                for number in range(from_block, to_block + 1)
+            )
         )
+        return [response["result"] for response in responses if response.get("result")]
 
 
 PendingTxSubscriptionContext = EthSubscriptionContext[
@@ -276,6 +425,8 @@ class PendingTxSubscription(EthSubscription[Union[HexBytes, TxData]]):
         handler: PendingTxSubscriptionHandler | None = None,
         handler_context: dict[str, Any] | None = None,
         parallelize: bool | None = None,
+        backpressure: BackpressurePolicy | None = None,
+        executor: Executor | None = None,
     ) -> None:
         self.full_transactions = full_transactions
         super().__init__(
@@ -284,6 +435,8 @@ class PendingTxSubscription(EthSubscription[Union[HexBytes, TxData]]):
             handler_context=handler_context,
             label=label,
             parallelize=parallelize,
+            backpressure=backpressure,
+            executor=executor,
         )
 
 
@@ -300,6 +453,8 @@ class SyncingSubscription(EthSubscription[SyncProgress]):
         handler: SyncingSubscriptionHandler | None = None,
         handler_context: dict[str, Any] | None = None,
         parallelize: bool | None = None,
+        backpressure: BackpressurePolicy | None = None,
+        executor: Executor | None = None,
     ) -> None:
         super().__init__(
             subscription_params=("syncing",),
@@ -307,4 +462,6 @@ class SyncingSubscription(EthSubscription[SyncProgress]):
             handler_context=handler_context,
             label=label,
             parallelize=parallelize,
+            backpressure=backpressure,
+            executor=executor,
         )